@@ -13,5 +13,6 @@ from .study_session import StudySession
 from .vocabulary import Vocabulary
 from .user_vocabulary import UserVocabulary
 from .daily_goal import DailyGoal
+from .import_job import ImportJob
 
-__all__ = ["User", "Question", "Test", "Result", "AnswerDetail", "LearningHistory", "UserPerformance", "StudySession", "Vocabulary", "UserVocabulary", "DailyGoal"]
+__all__ = ["User", "Question", "Test", "Result", "AnswerDetail", "LearningHistory", "UserPerformance", "StudySession", "Vocabulary", "UserVocabulary", "DailyGoal", "ImportJob"]
@@ -0,0 +1,216 @@
+"""
+ImportJob 도메인 엔티티
+백그라운드 파일 임포트 작업의 진행 상황과 체크포인트를 표현
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+from backend.domain.value_objects.jlpt import ImportJobStatus, ImportJobType
+
+
+class ImportJob:
+    """
+    임포트 작업 엔티티
+
+    DDD에서 Entity로 분류되며, 고유 식별자를 가짐
+    업로드된 파일을 청크 단위로 임포트하는 작업의 상태, 처리 건수, 체크포인트를 관리합니다.
+    rows_processed는 저장(또는 거부)까지 끝난 레코드 수이며, 작업이 중단되면 여기서부터 재개합니다.
+    """
+
+    FILE_TYPES = ('json', 'csv')
+
+    def __init__(
+        self,
+        id: Optional[int],
+        job_type: ImportJobType,
+        file_path: str,
+        file_type: str,
+        status: ImportJobStatus = ImportJobStatus.PENDING,
+        original_filename: Optional[str] = None,
+        created_by: Optional[int] = None,
+        rows_processed: int = 0,
+        rows_imported: int = 0,
+        rows_duplicates: int = 0,
+        rows_rejected: int = 0,
+        errors: Optional[List[Dict[str, Any]]] = None,
+        error_message: Optional[str] = None,
+        elapsed_seconds: float = 0.0,
+        attempts: int = 0,
+        created_at: Optional[datetime] = None,
+        started_at: Optional[datetime] = None,
+        heartbeat_at: Optional[datetime] = None,
+        finished_at: Optional[datetime] = None
+    ):
+        """
+        ImportJob 엔티티 초기화
+
+        Args:
+            id: 고유 식별자
+            job_type: 임포트 대상 (문제/단어)
+            file_path: 업로드 파일이 보관된 경로
+            file_type: 파일 형식 (json, csv)
+            status: 작업 상태
+            original_filename: 업로드한 원본 파일명 (선택적)
+            created_by: 작업을 생성한 어드민 사용자 ID (선택적)
+            rows_processed: 처리 완료된 레코드 수 (체크포인트)
+            rows_imported: 새로 저장된 레코드 수
+            rows_duplicates: 기존 데이터와 중복되어 갱신된 레코드 수
+            rows_rejected: 검증 또는 저장에 실패한 레코드 수
+            errors: 실패한 레코드의 {row, error} 목록
+            error_message: 작업 실패 사유
+            elapsed_seconds: 누적 처리 시간 (초)
+            attempts: 실행 시도 횟수 (재개 포함)
+            created_at: 생성 일시 (미제공 시 현재 시간)
+            started_at: 최초 실행 시작 일시
+            heartbeat_at: 마지막 진행 기록 일시 (중단된 작업 감지용)
+            finished_at: 완료/실패 일시
+
+        Raises:
+            ValueError: 유효성 검증 실패 시
+        """
+        self._validate_id(id)
+        self._validate_file_path(file_path)
+        self._validate_file_type(file_type)
+
+        self.id = id
+        self.job_type = job_type
+        self.file_path = file_path
+        self.file_type = file_type
+        self.status = status
+        self.original_filename = original_filename
+        self.created_by = created_by
+        self.rows_processed = rows_processed
+        self.rows_imported = rows_imported
+        self.rows_duplicates = rows_duplicates
+        self.rows_rejected = rows_rejected
+        self.errors = list(errors) if errors else []
+        self.error_message = error_message
+        self.elapsed_seconds = elapsed_seconds
+        self.attempts = attempts
+        self.created_at = created_at or datetime.now()
+        self.started_at = started_at
+        self.heartbeat_at = heartbeat_at
+        self.finished_at = finished_at
+
+    def _validate_id(self, id: Optional[int]) -> None:
+        """ID 검증"""
+        if id is not None and (not isinstance(id, int) or id <= 0):
+            raise ValueError("id는 양의 정수여야 합니다")
+
+    def _validate_file_path(self, file_path: str) -> None:
+        """파일 경로 검증"""
+        if not file_path or not isinstance(file_path, str):
+            raise ValueError("파일 경로는 필수 항목입니다")
+
+    def _validate_file_type(self, file_type: str) -> None:
+        """파일 형식 검증"""
+        if file_type not in self.FILE_TYPES:
+            raise ValueError(f"지원하지 않는 파일 형식입니다: {file_type}")
+
+    @property
+    def is_finished(self) -> bool:
+        """완료 또는 실패 여부"""
+        return self.status in (ImportJobStatus.COMPLETED, ImportJobStatus.FAILED)
+
+    @property
+    def throughput(self) -> float:
+        """초당 처리 레코드 수 (처리 시간이 없으면 0)"""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return round(self.rows_processed / self.elapsed_seconds, 2)
+
+    def is_stale(self, now: datetime, timeout: timedelta) -> bool:
+        """
+        진행 중이지만 timeout 동안 진행 기록이 없는 작업인지 확인 (워커 비정상 종료)
+
+        Args:
+            now: 기준 시각
+            timeout: 진행 기록이 없어도 되는 최대 시간
+        """
+        if self.status != ImportJobStatus.RUNNING:
+            return False
+        last_seen = self.heartbeat_at or self.started_at
+        return last_seen is None or now - last_seen > timeout
+
+    def start(self, now: Optional[datetime] = None) -> None:
+        """
+        작업 실행 시작 (대기 중 작업 시작 또는 중단된 작업 재개)
+
+        Raises:
+            ValueError: 이미 완료/실패한 작업인 경우
+        """
+        if self.is_finished:
+            raise ValueError("이미 종료된 임포트 작업입니다")
+        now = now or datetime.now()
+        self.status = ImportJobStatus.RUNNING
+        self.attempts += 1
+        if self.started_at is None:
+            self.started_at = now
+        self.heartbeat_at = now
+
+    def record_progress(
+        self,
+        rows_processed: int,
+        rows_imported: int,
+        rows_duplicates: int,
+        rows_rejected: int,
+        errors: List[Dict[str, Any]],
+        elapsed_seconds: float,
+        now: Optional[datetime] = None
+    ) -> None:
+        """
+        체크포인트 기록 (누적값으로 갱신)
+
+        Args:
+            rows_processed: 처리 완료된 레코드 수
+            rows_imported: 누적 신규 저장 수
+            rows_duplicates: 누적 중복 수
+            rows_rejected: 누적 거부 수
+            errors: 누적 오류 보고서
+            elapsed_seconds: 누적 처리 시간 (초)
+            now: 기록 시각
+        """
+        self.rows_processed = rows_processed
+        self.rows_imported = rows_imported
+        self.rows_duplicates = rows_duplicates
+        self.rows_rejected = rows_rejected
+        self.errors = list(errors)
+        self.elapsed_seconds = round(elapsed_seconds, 3)
+        self.heartbeat_at = now or datetime.now()
+
+    def release(self, now: Optional[datetime] = None) -> None:
+        """실행 중단 후 대기 상태로 되돌림 (체크포인트는 유지되어 다음 실행에서 재개)"""
+        self.status = ImportJobStatus.PENDING
+        self.heartbeat_at = now or datetime.now()
+
+    def complete(self, now: Optional[datetime] = None) -> None:
+        """작업 완료 처리"""
+        now = now or datetime.now()
+        self.status = ImportJobStatus.COMPLETED
+        self.heartbeat_at = now
+        self.finished_at = now
+
+    def fail(self, error_message: str, now: Optional[datetime] = None) -> None:
+        """작업 실패 처리"""
+        now = now or datetime.now()
+        self.status = ImportJobStatus.FAILED
+        self.error_message = error_message
+        self.heartbeat_at = now
+        self.finished_at = now
+
+    def __eq__(self, other) -> bool:
+        """ID 기반 동등성 비교"""
+        if not isinstance(other, ImportJob):
+            return False
+        return self.id == other.id
+
+    def __hash__(self) -> int:
+        """ID 기반 해시"""
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        """문자열 표현"""
+        return (
+            f"ImportJob(id={self.id}, job_type={self.job_type.value}, "
+            f"status={self.status.value}, rows_processed={self.rows_processed})"
+        )
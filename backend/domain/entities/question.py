@@ -25,7 +25,10 @@ class Question:
         correct_answer: str,
         explanation: str,
         difficulty: int,
-        audio_url: Optional[str] = None
+        audio_url: Optional[str] = None,
+        audio_size_bytes: Optional[int] = None,
+        audio_duration_ms: Optional[int] = None,
+        audio_etag: Optional[str] = None
     ):
         """
         Question 엔티티 초기화
@@ -40,6 +43,9 @@ class Question:
             explanation: 해설
             difficulty: 난이도 (1-5)
             audio_url: 오디오 파일 URL (선택적, 리스닝 문제용)
+            audio_size_bytes: 오디오 파일 크기 (바이트)
+            audio_duration_ms: 오디오 재생 시간 (밀리초)
+            audio_etag: 오디오 콘텐츠 해시 (SHA-256, HTTP ETag로 사용)
 
         Raises:
             ValueError: 유효성 검증 실패 시
@@ -58,6 +64,9 @@ class Question:
         self.explanation = explanation
         self.difficulty = difficulty
         self.audio_url = audio_url
+        self.audio_size_bytes = audio_size_bytes
+        self.audio_duration_ms = audio_duration_ms
+        self.audio_etag = audio_etag
 
     def _validate_question_text(self, question_text: str) -> None:
         """문제 내용 검증"""
@@ -110,6 +119,27 @@ class Question:
         if difficulty < 1 or difficulty > 5:
             raise ValueError("난이도는 1-5 사이여야 합니다")
 
+    def attach_audio(
+        self,
+        audio_url: Optional[str],
+        audio_size_bytes: Optional[int] = None,
+        audio_duration_ms: Optional[int] = None,
+        audio_etag: Optional[str] = None
+    ) -> None:
+        """
+        오디오 설정 (이전 오디오의 메타데이터가 남지 않도록 URL과 메타데이터를 함께 교체)
+
+        Args:
+            audio_url: 오디오 파일 URL (None이면 오디오 제거)
+            audio_size_bytes: 오디오 파일 크기 (바이트)
+            audio_duration_ms: 오디오 재생 시간 (밀리초)
+            audio_etag: 오디오 콘텐츠 해시
+        """
+        self.audio_url = audio_url
+        self.audio_size_bytes = audio_size_bytes
+        self.audio_duration_ms = audio_duration_ms
+        self.audio_etag = audio_etag
+
     def is_correct_answer(self, answer: str) -> bool:
         """
         사용자의 답안이 정답인지 검증
@@ -120,6 +120,49 @@ class UserPerformance:
 
         self.updated_at = datetime.now()
 
+    def record_level_score(self, level: str, score: float) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        레벨별 성취도 요약에 시험 점수 하나 반영
+
+        level_progression은 레벨마다 시험 수와 평균 점수만 유지하므로 시험을 볼 때마다 커지지 않습니다
+        (점수 이력은 level_scores 테이블에 저장). 예전 형식의 점수 목록은 요약으로 바꾼 뒤 반영하므로,
+        반환된 원래 목록은 이 성능 데이터를 저장하는 트랜잭션에서 level_scores에 함께 저장해야 합니다.
+
+        Args:
+            level: JLPT 레벨 (예: 'N5')
+            score: 점수 (0~100)
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: 요약으로 바꾼 레벨의 원래 점수 목록 (없으면 빈 딕셔너리)
+        """
+        legacy = self.compact_level_progression()
+        summary = self.level_progression.get(level) or {'tests': 0, 'average_score': 0.0}
+        tests = summary.get('tests', 0) + 1
+        average_score = summary.get('average_score', 0.0) + (score - summary.get('average_score', 0.0)) / tests
+        self.level_progression[level] = {'tests': tests, 'average_score': round(average_score, 2)}
+        self.updated_at = datetime.now()
+        return legacy
+
+    def compact_level_progression(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        예전 형식(레벨별 {date, score} 목록)의 level_progression을 요약으로 변환
+
+        Returns:
+            Dict[str, List[Dict[str, Any]]]: 변환한 레벨의 원래 점수 목록 (level_scores 이관용, 없으면 빈 딕셔너리)
+        """
+        legacy = {
+            level: entries
+            for level, entries in self.level_progression.items()
+            if isinstance(entries, list)
+        }
+        for level, entries in legacy.items():
+            scores = [entry['score'] for entry in entries if isinstance(entry, dict) and 'score' in entry]
+            self.level_progression[level] = {
+                'tests': len(scores),
+                'average_score': round(sum(scores) / len(scores), 2) if scores else 0.0
+            }
+        return legacy
+
     def __eq__(self, other) -> bool:
         """ID 기반 동등성 비교"""
         if not isinstance(other, UserPerformance):
@@ -0,0 +1,294 @@
+"""
+적응형 시험(CAT) 도메인 서비스
+미리 보정한 IRT 문항 모수로 레벨별 문제 은행을 메모리에 올려 두고, 현재 능력치 추정값에서
+Fisher 정보량이 가장 큰 문제를 다음 문제로 선택
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from backend.domain.services.level_recommendation_service import LevelRecommendationService
+from backend.domain.value_objects.jlpt import JLPTLevel
+from backend.infrastructure.repositories.adaptive_test_repository import SqliteAdaptiveTestRepository
+from backend.infrastructure.repositories.irt_parameter_repository import SqliteIrtParameterRepository
+
+
+class AdaptiveItemPool:
+    """
+    레벨별 적응형 시험 문제 은행
+
+    문항 모수를 난이도(b) 순으로 정렬한 배열로 보관합니다. 2PL 문항의 정보량은
+    I(θ) = a² · P(θ) · (1 - P(θ))이며, 변별도가 모두 같으면(1PL) 정보량이 가장 큰 문제는
+    난이도가 θ에 가장 가까운 문제이므로 이진 탐색으로 찾습니다.
+    """
+
+    def __init__(self, question_ids: np.ndarray, discrimination: np.ndarray, difficulty: np.ndarray):
+        """
+        AdaptiveItemPool 초기화
+
+        Args:
+            question_ids: 문제 ID
+            discrimination: 변별도 (a)
+            difficulty: 난이도 (b)
+        """
+        order = np.argsort(difficulty, kind='stable')
+        self.question_ids = np.asarray(question_ids, dtype=np.int64)[order]
+        self.discrimination = np.asarray(discrimination, dtype=np.float64)[order]
+        self.difficulty = np.asarray(difficulty, dtype=np.float64)[order]
+        self.information_scale = self.discrimination ** 2
+        self.uniform_discrimination = bool(len(self) == 0 or np.ptp(self.discrimination) < 1e-12)
+        self.positions = {question_id: i for i, question_id in enumerate(self.question_ids.tolist())}
+
+    def __len__(self) -> int:
+        return len(self.question_ids)
+
+    def administered_mask(self, question_ids: List[int]) -> np.ndarray:
+        """이미 출제한 문제 위치 마스크 (문제 은행에서 빠진 문제는 무시)"""
+        mask = np.zeros(len(self), dtype=bool)
+        positions = [self.positions[qid] for qid in question_ids if qid in self.positions]
+        mask[positions] = True
+        return mask
+
+    def probabilities(self, theta: float) -> np.ndarray:
+        """능력치 theta에서 각 문제의 정답 확률"""
+        return 1.0 / (1.0 + np.exp(-self.discrimination * (theta - self.difficulty)))
+
+    def select(self, theta: float, administered: np.ndarray) -> Optional[int]:
+        """
+        출제하지 않은 문제 중 theta에서 정보량이 가장 큰 문제의 위치
+
+        Args:
+            theta: 현재 능력치 추정값
+            administered: 이미 출제한 문제 위치 마스크
+
+        Returns:
+            Optional[int]: 문제 위치 (남은 문제가 없으면 None)
+        """
+        if self.uniform_discrimination:
+            return self._nearest_difficulty(theta, administered)
+
+        p = self.probabilities(theta)
+        information = self.information_scale * p * (1.0 - p)
+        information[administered] = -1.0
+        position = int(np.argmax(information))
+        return None if administered[position] else position
+
+    def _nearest_difficulty(self, theta: float, administered: np.ndarray) -> Optional[int]:
+        """난이도가 theta에 가장 가까운 미출제 문제의 위치 (정렬 배열 이진 탐색)"""
+        right = int(np.searchsorted(self.difficulty, theta))
+        left = right - 1
+        while left >= 0 and administered[left]:
+            left -= 1
+        while right < len(self) and administered[right]:
+            right += 1
+        if left < 0:
+            return right if right < len(self) else None
+        if right >= len(self):
+            return left
+        return left if theta - self.difficulty[left] <= self.difficulty[right] - theta else right
+
+
+class AdaptiveTestService:
+    """
+    적응형 시험 도메인 서비스
+
+    세션마다 (1) 현재 능력치에서 정보량 최대 문제 선택, (2) 응답 후 N(0, 1) 사전분포의
+    EAP(사후 평균)로 능력치와 표준오차 재추정을 반복하고, 표준오차가 목표 이하가 되거나
+    최대 문제 수에 도달하면 종료합니다. 문제 은행은 레벨별로 짧은 시간 동안 캐시되고
+    문제 저장/삭제와 IRT 보정 시 무효화되며,
+    보정되지 않은 문제는 문제 난이도(1-5)를 b = 난이도 - 3, a = 1로 환산해 포함합니다.
+    """
+
+    DEFAULT_MAX_QUESTIONS = 20
+    MIN_QUESTIONS = 5  # 표준오차가 목표에 도달해도 이 수만큼은 출제
+    MAX_QUESTIONS = 50
+    DEFAULT_TARGET_SE = 0.3
+    CACHE_TTL_SECONDS = 600  # 문제 은행 캐시 유효 시간 (초)
+    START_THETA_LIMIT = 3.0  # 저장된 능력치로 시작할 때의 범위 제한
+
+    # EAP 적분 격자
+    ABILITY_GRID = np.linspace(-4.0, 4.0, 81)
+
+    # (데이터베이스 경로, 레벨) -> (저장 시각, 문제 은행)
+    _pools: Dict[Tuple[str, str], Tuple[float, AdaptiveItemPool]] = {}
+
+    def __init__(
+        self,
+        irt_repo: SqliteIrtParameterRepository,
+        adaptive_test_repo: SqliteAdaptiveTestRepository,
+        recommendation_service: Optional[LevelRecommendationService] = None
+    ):
+        """
+        AdaptiveTestService 초기화
+
+        Args:
+            irt_repo: IRT 모수 Repository (문제 은행, 사용자 능력치)
+            adaptive_test_repo: 적응형 시험 세션 Repository
+            recommendation_service: 레벨 추천 서비스
+        """
+        self.irt_repo = irt_repo
+        self.adaptive_test_repo = adaptive_test_repo
+        self.recommendation_service = recommendation_service or LevelRecommendationService()
+
+    def start(
+        self,
+        user_id: int,
+        level: str,
+        max_questions: int = DEFAULT_MAX_QUESTIONS,
+        target_se: float = DEFAULT_TARGET_SE
+    ) -> Dict[str, Any]:
+        """
+        적응형 시험 세션 시작
+
+        보정된 능력치가 있으면 그 값에서, 없으면 0에서 첫 문제를 고릅니다.
+
+        Args:
+            user_id: 사용자 ID
+            level: JLPT 레벨 (예: 'N5')
+            max_questions: 최대 문제 수 (MIN_QUESTIONS ~ MAX_QUESTIONS)
+            target_se: 종료 기준 표준오차 (0 초과)
+
+        Returns:
+            Dict[str, Any]: 생성된 세션 (current_question_id가 첫 문제)
+
+        Raises:
+            ValueError: 인자가 범위를 벗어났거나 레벨에 문제가 없는 경우
+        """
+        if max_questions < self.MIN_QUESTIONS or max_questions > self.MAX_QUESTIONS:
+            raise ValueError(f"최대 문제 수는 {self.MIN_QUESTIONS}~{self.MAX_QUESTIONS}개여야 합니다")
+        if target_se <= 0:
+            raise ValueError("목표 표준오차는 0보다 커야 합니다")
+
+        pool = self.get_pool(level)
+        if len(pool) == 0:
+            raise ValueError(f"{level} 레벨에 출제할 문제가 없습니다")
+
+        ability = self.irt_repo.find_by_user_id(user_id)
+        theta = 0.0
+        if ability is not None:
+            theta = float(np.clip(ability['theta'], -self.START_THETA_LIMIT, self.START_THETA_LIMIT))
+
+        position = pool.select(theta, pool.administered_mask([]))
+        return self.adaptive_test_repo.create(
+            user_id, level, theta, 1.0, int(pool.question_ids[position]), max_questions, target_se
+        )
+
+    def answer(self, session: Dict[str, Any], question_id: int, answer: str, is_correct: bool) -> Dict[str, Any]:
+        """
+        현재 문제 응답 처리
+
+        응답을 기록하고 능력치를 다시 추정한 뒤, 종료 조건을 만족하면 세션을 완료하고
+        아니면 다음 문제를 선택합니다.
+
+        Args:
+            session: 진행 중인 세션
+            question_id: 응답한 문제 ID (세션의 현재 문제여야 함)
+            answer: 사용자 답안
+            is_correct: 정답 여부
+
+        Returns:
+            Dict[str, Any]: 저장된 세션
+
+        Raises:
+            ValueError: 이미 완료된 세션이거나 현재 문제가 아닌 경우
+            StaleAdaptiveSessionError: 세션을 읽은 뒤 다른 요청이 같은 문제에 먼저 응답한 경우
+        """
+        if session['status'] != 'in_progress':
+            raise ValueError("이미 완료된 적응형 시험입니다")
+        if question_id != session['current_question_id']:
+            raise ValueError("현재 출제된 문제에만 답할 수 있습니다")
+
+        pool = self.get_pool(session['level'])
+        position = pool.positions.get(question_id)
+        if position is None:
+            raise ValueError("문제 은행에 없는 문제입니다")
+
+        responses = session['responses'] + [{
+            'question_id': question_id,
+            'answer': answer,
+            'correct': bool(is_correct),
+            'discrimination': float(pool.discrimination[position]),
+            'difficulty': float(pool.difficulty[position]),
+        }]
+        theta, theta_se = self.estimate_ability(
+            np.array([r['discrimination'] for r in responses]),
+            np.array([r['difficulty'] for r in responses]),
+            np.array([r['correct'] for r in responses], dtype=np.float64)
+        )
+
+        next_position = None
+        answered = len(responses)
+        if answered < session['max_questions'] and not (
+            answered >= self.MIN_QUESTIONS and theta_se <= session['target_se']
+        ):
+            administered = pool.administered_mask([r['question_id'] for r in responses])
+            next_position = pool.select(theta, administered)
+
+        session = dict(session, responses=responses, theta=round(theta, 4), theta_se=round(theta_se, 4))
+        if next_position is None:
+            estimated_score = round(100.0 * float(pool.probabilities(theta).mean()), 2)
+            level = JLPTLevel(session['level'])
+            session.update(
+                status='completed',
+                current_question_id=None,
+                estimated_score=estimated_score,
+                recommended_level=self.recommendation_service.recommend_level(level, estimated_score).value
+            )
+        else:
+            session['current_question_id'] = int(pool.question_ids[next_position])
+        return self.adaptive_test_repo.save(session, expected_question_id=question_id)
+
+    def get_pool(self, level: str) -> AdaptiveItemPool:
+        """레벨의 문제 은행 (캐시 유효 시간 안에서는 메모리에서 반환)"""
+        key = (self.irt_repo.db.db_path, level)
+        cached = self._pools.get(key)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL_SECONDS:
+            return cached[1]
+
+        rows = self.irt_repo.find_item_pool(level)
+        question_ids = np.array([row[0] for row in rows], dtype=np.int64)
+        discrimination = np.array([1.0 if row[1] is None else row[1] for row in rows], dtype=np.float64)
+        difficulty = np.array([row[3] - 3.0 if row[2] is None else row[2] for row in rows], dtype=np.float64)
+        pool = AdaptiveItemPool(question_ids, discrimination, difficulty)
+        self._pools[key] = (time.monotonic(), pool)
+        return pool
+
+    @classmethod
+    def invalidate(cls, level: Optional[str] = None) -> None:
+        """
+        문제 은행 캐시 무효화
+
+        Args:
+            level: 문제나 문항 모수가 변경된 레벨 (None이면 모든 레벨)
+        """
+        for key in list(cls._pools):
+            if level is None or key[1] == level:
+                cls._pools.pop(key, None)
+
+    @classmethod
+    def estimate_ability(
+        cls, discrimination: np.ndarray, difficulty: np.ndarray, is_correct: np.ndarray
+    ) -> Tuple[float, float]:
+        """
+        EAP 능력치 추정 (N(0, 1) 사전분포, 격자 적분)
+
+        모두 정답이거나 모두 오답이어도 유한한 값을 반환합니다.
+
+        Args:
+            discrimination: 응답한 문제의 변별도
+            difficulty: 응답한 문제의 난이도
+            is_correct: 정답 여부 (0/1)
+
+        Returns:
+            Tuple[float, float]: (능력치, 표준오차)
+        """
+        grid = cls.ABILITY_GRID
+        logits = discrimination[:, None] * (grid[None, :] - difficulty[:, None])
+        # log P = -log(1 + e^-z), log(1 - P) = -log(1 + e^z)
+        log_likelihood = -np.logaddexp(0.0, np.where(is_correct[:, None] > 0, -logits, logits)).sum(axis=0)
+        log_posterior = log_likelihood - grid ** 2 / 2
+        weights = np.exp(log_posterior - log_posterior.max())
+        weights /= weights.sum()
+        theta = float(weights @ grid)
+        theta_se = float(np.sqrt(weights @ (grid - theta) ** 2))
+        return theta, theta_se
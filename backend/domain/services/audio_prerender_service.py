@@ -0,0 +1,143 @@
+"""
+청해 오디오 사전 렌더링 도메인 서비스
+오디오가 없는 청해 문제를 배치 단위로 조회해 TTS 렌더링 풀로 오디오를 만들고 audio_url을 저장
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterator, Optional
+from backend.domain.services.tts_service import TTSService
+from backend.domain.value_objects.jlpt import JLPTLevel
+from backend.infrastructure.adapters.audio_metadata import AudioMetadata
+from backend.infrastructure.adapters.tts_render_pool import TTSRenderPool
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+
+
+class AudioPrerenderService:
+    """
+    청해 오디오 사전 렌더링 도메인 서비스
+
+    batch_size개씩 ID 순으로 조회하고, 배치 안의 오디오 텍스트를 TTSRenderPool로 병렬 렌더링한 뒤
+    audio_url과 오디오 메타데이터(크기, 재생 시간, ETag)를 한 트랜잭션으로 저장합니다.
+    렌더링에 실패한 문제는 audio_url이 비어 있는 채로 남으므로 다시 실행하면 실패한 문제만 다시 시도합니다.
+    """
+
+    DEFAULT_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        question_repo: SqliteQuestionRepository,
+        pool: Optional[TTSRenderPool] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE
+    ):
+        """
+        AudioPrerenderService 초기화
+
+        Args:
+            question_repo: Question Repository
+            pool: TTS 렌더링 풀 (None이면 기본 설정)
+            batch_size: 한 번에 조회/저장할 문제 수
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size는 1 이상이어야 합니다")
+        self.question_repo = question_repo
+        self.pool = pool or TTSRenderPool()
+        self.batch_size = batch_size
+
+    def iter_batches(self, level: Optional[JLPTLevel] = None) -> Iterator[Dict[str, Any]]:
+        """
+        오디오가 없는 청해 문제를 배치 단위로 렌더링/저장
+
+        Args:
+            level: JLPT 레벨 (None이면 전체)
+
+        Yields:
+            처리한 배치 {questions, updated, results}
+            (results는 오디오 텍스트 -> TTSRenderResult)
+        """
+        last_id = 0
+        while True:
+            questions = self.question_repo.find_missing_audio(last_id, self.batch_size, level)
+            if not questions:
+                return
+            last_id = questions[-1].id
+
+            texts = {q.id: TTSService.listening_audio_text(q.question_text) for q in questions}
+            results = self.pool.render(texts.values())
+            updated = self.question_repo.update_audio_urls(
+                {
+                    question_id: results[text].audio_url
+                    for question_id, text in texts.items()
+                    if results[text].ok
+                },
+                {r.audio_url: r.metadata for r in results.values() if r.ok and r.metadata}
+            )
+            yield {'questions': questions, 'updated': updated, 'results': results}
+
+    def run(
+        self,
+        level: Optional[JLPTLevel] = None,
+        on_batch: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        오디오가 없는 청해 문제 전체 사전 렌더링
+
+        Args:
+            level: JLPT 레벨 (None이면 전체)
+            on_batch: 배치를 저장할 때마다 (배치, 현재 요약)으로 호출되는 콜백
+
+        Returns:
+            Dict[str, Any]: 렌더링 요약
+                - questions: 오디오가 없던 문제 수
+                - updated: audio_url을 저장한 문제 수
+                - rendered: 새로 렌더링한 텍스트 수
+                - cached: 이미 파일이 있어 렌더링하지 않은 텍스트 수
+                - failed: 재시도 후에도 렌더링하지 못한 텍스트 수
+                - elapsed_seconds: 소요 시간 (초)
+        """
+        started = time.monotonic()
+        summary: Dict[str, Any] = {
+            'questions': 0,
+            'updated': 0,
+            'rendered': 0,
+            'cached': 0,
+            'failed': 0,
+        }
+        for batch in self.iter_batches(level):
+            counts = TTSRenderPool.summarize(batch['results'])
+            summary['questions'] += len(batch['questions'])
+            summary['updated'] += batch['updated']
+            for key in ('rendered', 'cached', 'failed'):
+                summary[key] += counts[key]
+            if on_batch:
+                on_batch(batch, summary)
+
+        summary['elapsed_seconds'] = round(time.monotonic() - started, 3)
+        return summary
+
+    def backfill_metadata(self) -> Dict[str, int]:
+        """
+        audio_url은 있지만 메타데이터가 없는 문제(가져오기, 이전 버전에서 만든 문제)의 메타데이터 채우기
+
+        오디오 URL마다 파일을 한 번 읽어 크기/재생 시간/ETag를 계산하고, 같은 오디오를 쓰는 문제를
+        한 번에 갱신합니다. 파일이 없는 URL은 건너뜁니다.
+
+        Returns:
+            Dict[str, int]: {urls: 처리한 URL 수, updated: 갱신된 문제 수, missing: 파일이 없는 URL 수}
+        """
+        summary = {'urls': 0, 'updated': 0, 'missing': 0}
+        last_url = ''
+        while True:
+            urls = self.question_repo.find_audio_urls_missing_metadata(last_url, self.batch_size)
+            if not urls:
+                return summary
+            last_url = urls[-1]
+
+            metadata = {}
+            for url in urls:
+                meta = AudioMetadata.from_url(url)
+                if meta is None:
+                    summary['missing'] += 1
+                else:
+                    metadata[url] = meta
+            summary['urls'] += len(urls)
+            summary['updated'] += self.question_repo.update_audio_metadata(metadata)
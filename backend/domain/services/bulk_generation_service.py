@@ -0,0 +1,232 @@
+"""
+대량 생성 도메인 서비스
+문제/단어를 청크 단위로 생성하고, 청크마다 한 트랜잭션으로 업서트하는 생성 파이프라인
+"""
+
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+from backend.domain.entities.question import Question
+from backend.domain.entities.vocabulary import Vocabulary
+from backend.domain.services.question_generator_service import QuestionGeneratorService
+from backend.domain.services.vocabulary_generator_service import VocabularyGeneratorService
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+
+
+class BulkQuestionGenerationService:
+    """
+    문제 대량 생성 도메인 서비스
+
+    chunk_size개씩 문제를 생성해 save_all로 저장합니다. 이미 같은 내용의 문제가 있으면
+    콘텐츠 해시 업서트로 새 행을 만들지 않으므로, 요청한 수만큼 새 문제가 저장될 때까지 생성을 반복합니다.
+    샘플 데이터로 만들 수 있는 조합을 모두 소진한 유형(MAX_IDLE_ROUNDS번 연속으로 새 문제가 없는 유형)은
+    제외하고, 남은 유형으로 나머지 수를 채웁니다.
+    """
+
+    DEFAULT_CHUNK_SIZE = 1000
+    MAX_IDLE_ROUNDS = 3  # 새 문제가 없는 라운드가 이만큼 이어지면 해당 유형은 소진된 것으로 판단
+
+    def __init__(
+        self,
+        question_repo: SqliteQuestionRepository,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        with_audio: bool = False
+    ):
+        """
+        BulkQuestionGenerationService 초기화
+
+        Args:
+            question_repo: Question Repository
+            chunk_size: 라운드당 생성/저장 건수
+            with_audio: True이면 청해 문제의 TTS 오디오를 생성 시점에 만듦 (기본값: False, 나중에 일괄 생성)
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size는 1 이상이어야 합니다")
+        self.question_repo = question_repo
+        self.chunk_size = chunk_size
+        self.with_audio = with_audio
+
+    def iter_chunks(
+        self,
+        level: JLPTLevel,
+        question_type: Optional[QuestionType] = None,
+        count: int = 10,
+        difficulty: Optional[int] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        문제를 청크 단위로 생성/저장
+
+        유형을 지정하지 않으면 라운드마다 남은 유형에 균등하게 나누어 생성합니다.
+
+        Args:
+            level: JLPT 레벨
+            question_type: 문제 유형 (None이면 모든 유형)
+            count: 새로 저장할 문제 수
+            difficulty: 난이도 (None이면 전체)
+
+        Yields:
+            저장된 청크 {question_type, questions, inserted}
+            (questions는 ID가 설정된 문제 목록이며 기존 문제와 같은 내용이면 기존 ID)
+        """
+        types = [question_type] if question_type else list(QuestionType)
+        idle_rounds = {t: 0 for t in types}
+        remaining = count
+
+        while remaining > 0 and idle_rounds:
+            active = list(idle_rounds)
+            size = min(self.chunk_size, remaining)
+            for qtype, share in zip(active, self._split(size, len(active))):
+                if share == 0:
+                    continue
+                questions = self._generate(level, qtype, share, difficulty)
+                if not questions:
+                    # 샘플 데이터가 없는 유형
+                    del idle_rounds[qtype]
+                    continue
+
+                inserted = self.question_repo.save_all(questions)
+                remaining -= inserted
+                if inserted:
+                    idle_rounds[qtype] = 0
+                else:
+                    idle_rounds[qtype] += 1
+                    if idle_rounds[qtype] >= self.MAX_IDLE_ROUNDS:
+                        del idle_rounds[qtype]
+
+                yield {'question_type': qtype, 'questions': questions, 'inserted': inserted}
+                if remaining <= 0:
+                    return
+
+    def generate(
+        self,
+        level: JLPTLevel,
+        question_type: Optional[QuestionType] = None,
+        count: int = 10,
+        on_chunk: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None,
+        difficulty: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        문제 대량 생성
+
+        Args:
+            level: JLPT 레벨
+            question_type: 문제 유형 (None이면 모든 유형)
+            count: 새로 저장할 문제 수
+            on_chunk: 청크를 저장할 때마다 (청크, 현재 요약)으로 호출되는 콜백
+            difficulty: 난이도 (None이면 전체)
+
+        Returns:
+            Dict[str, Any]: 생성 요약
+                - requested: 요청한 문제 수
+                - imported: 새로 저장된 문제 수
+                - duplicates: 이미 같은 내용이 있어 새로 만들지 않은 문제 수
+                - by_type: 유형별 새로 저장된 문제 수
+                - exhausted: 샘플 데이터 조합을 소진해 요청한 수를 채우지 못했는지 여부
+                - elapsed_seconds: 소요 시간 (초)
+        """
+        started = time.monotonic()
+        summary: Dict[str, Any] = {
+            'requested': count,
+            'imported': 0,
+            'duplicates': 0,
+            'by_type': {},
+        }
+        for chunk in self.iter_chunks(level, question_type, count, difficulty):
+            qtype = chunk['question_type'].value
+            summary['imported'] += chunk['inserted']
+            summary['duplicates'] += len(chunk['questions']) - chunk['inserted']
+            summary['by_type'][qtype] = summary['by_type'].get(qtype, 0) + chunk['inserted']
+            if on_chunk:
+                on_chunk(chunk, summary)
+
+        summary['exhausted'] = summary['imported'] < count
+        summary['elapsed_seconds'] = round(time.monotonic() - started, 3)
+        return summary
+
+    def _generate(
+        self,
+        level: JLPTLevel,
+        question_type: QuestionType,
+        count: int,
+        difficulty: Optional[int] = None
+    ) -> List[Question]:
+        """유형별 문제 생성"""
+        return QuestionGeneratorService.generate_questions(
+            level=level,
+            question_type=question_type,
+            count=count,
+            with_audio=self.with_audio,
+            difficulty=difficulty
+        )
+
+    @staticmethod
+    def _split(size: int, parts: int) -> List[int]:
+        """size를 parts개로 균등 분할 (나머지는 앞쪽부터 1씩)"""
+        base, extra = divmod(size, parts)
+        return [base + (1 if i < extra else 0) for i in range(parts)]
+
+
+class BulkVocabularyGenerationService:
+    """
+    단어 대량 생성 도메인 서비스
+
+    샘플 단어를 chunk_size개씩 나누어 save_all로 저장합니다.
+    이미 같은 단어가 있으면 새 행을 만들지 않고 기존 단어를 갱신합니다.
+    """
+
+    DEFAULT_CHUNK_SIZE = 1000
+
+    def __init__(
+        self,
+        vocabulary_repo: SqliteVocabularyRepository,
+        chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        """
+        BulkVocabularyGenerationService 초기화
+
+        Args:
+            vocabulary_repo: Vocabulary Repository
+            chunk_size: 트랜잭션당 저장 건수
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size는 1 이상이어야 합니다")
+        self.vocabulary_repo = vocabulary_repo
+        self.chunk_size = chunk_size
+
+    def iter_chunks(self, level: JLPTLevel, count: int = 10) -> Iterator[Dict[str, Any]]:
+        """
+        단어를 청크 단위로 생성/저장
+
+        Yields:
+            저장된 청크 {vocabularies, inserted}
+        """
+        vocabularies = VocabularyGeneratorService.generate_vocabularies(level=level, count=count)
+        for start in range(0, len(vocabularies), self.chunk_size):
+            chunk: List[Vocabulary] = vocabularies[start:start + self.chunk_size]
+            inserted = self.vocabulary_repo.save_all(chunk)
+            yield {'vocabularies': chunk, 'inserted': inserted}
+
+    def generate(
+        self,
+        level: JLPTLevel,
+        count: int = 10,
+        on_chunk: Optional[Callable[[Dict[str, Any], Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        단어 대량 생성
+
+        Returns:
+            Dict[str, Any]: 생성 요약 (requested, imported, duplicates, exhausted, elapsed_seconds)
+        """
+        started = time.monotonic()
+        summary: Dict[str, Any] = {'requested': count, 'imported': 0, 'duplicates': 0}
+        for chunk in self.iter_chunks(level, count):
+            summary['imported'] += chunk['inserted']
+            summary['duplicates'] += len(chunk['vocabularies']) - chunk['inserted']
+            if on_chunk:
+                on_chunk(chunk, summary)
+
+        summary['exhausted'] = summary['imported'] < count
+        summary['elapsed_seconds'] = round(time.monotonic() - started, 3)
+        return summary
@@ -0,0 +1,238 @@
+"""
+벡터화된 간격 반복 학습(SRS) 도메인 서비스
+대량의 카드에 SpacedRepetitionService와 동일한 스케줄링 규칙을 한 번에 적용
+"""
+
+from datetime import date
+from typing import Dict, List, Optional, Sequence, Union
+import numpy as np
+from backend.domain.entities.user_vocabulary import UserVocabulary
+from backend.domain.services.spaced_repetition_service import SpacedRepetitionService
+from backend.domain.value_objects.jlpt import MemorizationStatus
+
+
+class BulkSpacedRepetitionService:
+    """
+    벡터화된 간격 반복 학습(SRS) 도메인 서비스
+
+    SpacedRepetitionService.calculate_next_review를 NumPy 배열 연산으로 구현합니다.
+    전체 사용자 재스케줄링, Ease 상수 재조정, 복습량 예측처럼 수백만 장의 카드를
+    한 번에 계산해야 하는 배치 작업에서 사용하며, 결과는 스칼라 버전과 정확히 일치합니다.
+    """
+
+    # 복습 난이도 코드
+    EASY = 0
+    NORMAL = 1
+    HARD = 2
+    DIFFICULTY_CODES = {"easy": EASY, "normal": NORMAL, "hard": HARD}
+
+    # 암기 상태 코드 (MemorizationStatus 선언 순서)
+    STATUSES = list(MemorizationStatus)
+    STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+    def __init__(self, srs_service: Optional[SpacedRepetitionService] = None):
+        """
+        BulkSpacedRepetitionService 초기화
+
+        Args:
+            srs_service: 스케줄링 상수를 제공하는 SpacedRepetitionService
+                (기본값: None이면 기본 상수 사용, 상수를 재조정하려면 속성을 변경한 인스턴스 전달)
+        """
+        self.srs_service = srs_service or SpacedRepetitionService()
+
+    @classmethod
+    def encode_difficulties(cls, difficulties: Sequence[str]) -> np.ndarray:
+        """
+        난이도 문자열 목록을 난이도 코드 배열로 변환
+
+        Args:
+            difficulties: 난이도 목록 ("easy", "normal", "hard")
+
+        Returns:
+            난이도 코드 배열 (EASY, NORMAL, HARD)
+
+        Raises:
+            ValueError: 알 수 없는 난이도가 포함된 경우
+        """
+        try:
+            return np.array([cls.DIFFICULTY_CODES[d] for d in difficulties], dtype=np.int8)
+        except KeyError as e:
+            raise ValueError(f"알 수 없는 난이도입니다: {e.args[0]}")
+
+    @classmethod
+    def to_arrays(cls, user_vocabs: Sequence[UserVocabulary]) -> Dict[str, np.ndarray]:
+        """
+        UserVocabulary 목록을 스케줄링용 배열로 변환
+
+        Args:
+            user_vocabs: 사용자 단어 학습 상태 목록
+
+        Returns:
+            interval_days, ease_factor, review_count, consecutive_correct,
+            consecutive_incorrect, status 배열을 담은 딕셔너리
+        """
+        return {
+            'interval_days': np.array([uv.interval_days for uv in user_vocabs], dtype=np.int64),
+            'ease_factor': np.array([uv.ease_factor for uv in user_vocabs], dtype=np.float64),
+            'review_count': np.array([uv.review_count for uv in user_vocabs], dtype=np.int64),
+            'consecutive_correct': np.array(
+                [uv.consecutive_correct for uv in user_vocabs], dtype=np.int64
+            ),
+            'consecutive_incorrect': np.array(
+                [uv.consecutive_incorrect for uv in user_vocabs], dtype=np.int64
+            ),
+            'status': np.array(
+                [cls.STATUS_CODES[uv.memorization_status] for uv in user_vocabs], dtype=np.int8
+            ),
+        }
+
+    def calculate_next_review(
+        self,
+        interval_days: np.ndarray,
+        ease_factor: np.ndarray,
+        consecutive_correct: np.ndarray,
+        consecutive_incorrect: np.ndarray,
+        difficulties: np.ndarray,
+        today: Union[date, np.ndarray, None] = None,
+        review_count: Optional[np.ndarray] = None,
+        status: Optional[np.ndarray] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        복습 결과 배열에 따라 다음 복습 일정을 일괄 계산
+
+        입력 배열은 변경하지 않고 새 배열을 반환합니다.
+
+        Args:
+            interval_days: 현재 복습 간격 (일)
+            ease_factor: 현재 Ease Factor
+            consecutive_correct: 현재 연속 정답 횟수
+            consecutive_incorrect: 현재 연속 오답 횟수
+            difficulties: 복습 난이도 코드 배열 (EASY, NORMAL, HARD)
+            today: 복습 날짜 (date 또는 카드별 datetime64[D] 배열, 기본값: 현재 날짜)
+            review_count: 현재 복습 횟수 (선택적)
+            status: 현재 암기 상태 코드 배열 (선택적, 기본값: NOT_MEMORIZED)
+
+        Returns:
+            interval_days, ease_factor, consecutive_correct, consecutive_incorrect,
+            review_count, status, next_review_date(datetime64[D]) 배열을 담은 딕셔너리
+
+        Raises:
+            ValueError: difficulties에 EASY, NORMAL, HARD가 아닌 코드가 포함된 경우
+        """
+        srs = self.srs_service
+        if today is None:
+            today = date.today()
+
+        interval_days = np.asarray(interval_days, dtype=np.int64)
+        ease_factor = np.asarray(ease_factor, dtype=np.float64)
+        consecutive_correct = np.asarray(consecutive_correct, dtype=np.int64)
+        consecutive_incorrect = np.asarray(consecutive_incorrect, dtype=np.int64)
+        difficulties = np.asarray(difficulties)
+        unknown = ~np.isin(difficulties, (self.EASY, self.NORMAL, self.HARD))
+        if unknown.any():
+            raise ValueError(f"알 수 없는 난이도 코드입니다: {difficulties[unknown].flat[0]}")
+        if review_count is None:
+            review_count = np.zeros_like(interval_days)
+        if status is None:
+            status = np.full(
+                interval_days.shape,
+                self.STATUS_CODES[MemorizationStatus.NOT_MEMORIZED],
+                dtype=np.int8
+            )
+
+        easy = difficulties == self.EASY
+        hard = difficulties == self.HARD
+        correct = ~hard
+
+        # 연속 정답/오답 카운터
+        new_correct = np.where(correct, consecutive_correct + 1, 0)
+        new_incorrect = np.where(hard, consecutive_incorrect + 1, 0)
+
+        # Ease Factor (쉬움: 증가, 어려움: 감소, 보통: 유지)
+        new_ease = ease_factor.copy()
+        new_ease[easy] = np.minimum(
+            ease_factor[easy] + srs.EASE_FACTOR_INCREASE, srs.MAX_EASE_FACTOR
+        )
+        new_ease[hard] = np.maximum(
+            ease_factor[hard] - srs.EASE_FACTOR_DECREASE, srs.MIN_EASE_FACTOR
+        )
+
+        # 간격 계산 (스칼라 버전과 같은 연산 순서: interval * ease * multiplier)
+        multiplier = np.where(
+            easy, srs.EASY_MULTIPLIER,
+            np.where(hard, srs.HARD_MULTIPLIER, srs.NORMAL_MULTIPLIER)
+        )
+        scaled = np.trunc(interval_days * new_ease * multiplier).astype(np.int64)
+        new_interval = np.where(
+            interval_days == 0,
+            srs.INITIAL_INTERVAL,
+            np.clip(scaled, srs.MIN_INTERVAL, srs.MAX_INTERVAL)
+        )
+
+        # 암기 상태
+        new_status = np.where(
+            new_correct >= 3, self.STATUS_CODES[MemorizationStatus.MEMORIZED],
+            np.where(
+                new_correct >= 1, self.STATUS_CODES[MemorizationStatus.LEARNING],
+                np.where(
+                    new_incorrect >= 2, self.STATUS_CODES[MemorizationStatus.NOT_MEMORIZED],
+                    status
+                )
+            )
+        ).astype(np.int8)
+
+        today_days = np.asarray(today, dtype='datetime64[D]')
+
+        return {
+            'interval_days': new_interval,
+            'ease_factor': new_ease,
+            'consecutive_correct': new_correct,
+            'consecutive_incorrect': new_incorrect,
+            'review_count': np.asarray(review_count, dtype=np.int64) + 1,
+            'status': new_status,
+            'next_review_date': today_days + new_interval.astype('timedelta64[D]'),
+        }
+
+    def apply(
+        self,
+        user_vocabs: List[UserVocabulary],
+        difficulties: Sequence[str],
+        today: Optional[date] = None
+    ) -> List[UserVocabulary]:
+        """
+        UserVocabulary 목록에 복습 결과를 일괄 적용
+
+        Args:
+            user_vocabs: 사용자 단어 학습 상태 목록
+            difficulties: 카드별 복습 난이도 ("easy", "normal", "hard")
+            today: 복습 날짜 (기본값: None이면 현재 날짜)
+
+        Returns:
+            업데이트된 UserVocabulary 목록 (입력 객체를 직접 갱신)
+        """
+        if today is None:
+            today = date.today()
+
+        arrays = self.to_arrays(user_vocabs)
+        result = self.calculate_next_review(
+            arrays['interval_days'],
+            arrays['ease_factor'],
+            arrays['consecutive_correct'],
+            arrays['consecutive_incorrect'],
+            self.encode_difficulties(difficulties),
+            today=today,
+            review_count=arrays['review_count'],
+            status=arrays['status']
+        )
+
+        for i, user_vocab in enumerate(user_vocabs):
+            user_vocab.interval_days = int(result['interval_days'][i])
+            user_vocab.ease_factor = float(result['ease_factor'][i])
+            user_vocab.consecutive_correct = int(result['consecutive_correct'][i])
+            user_vocab.consecutive_incorrect = int(result['consecutive_incorrect'][i])
+            user_vocab.review_count = int(result['review_count'][i])
+            user_vocab.memorization_status = self.STATUSES[result['status'][i]]
+            user_vocab.last_review_date = today
+            user_vocab.next_review_date = result['next_review_date'][i].astype(date)
+
+        return user_vocabs
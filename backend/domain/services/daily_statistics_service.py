@@ -6,21 +6,20 @@
 from datetime import date, datetime
 from typing import Optional, Dict, Any
 from backend.domain.entities.daily_goal import DailyGoal
-from backend.domain.entities.learning_history import LearningHistory
-from backend.infrastructure.repositories.learning_history_repository import SqliteLearningHistoryRepository
+from backend.infrastructure.repositories.user_daily_rollup_repository import SqliteUserDailyRollupRepository
 
 
 class DailyStatisticsService:
     """일일 학습 통계 서비스"""
 
-    def __init__(self, learning_history_repo: SqliteLearningHistoryRepository):
+    def __init__(self, daily_rollup_repo: SqliteUserDailyRollupRepository):
         """
         DailyStatisticsService 초기화
 
         Args:
-            learning_history_repo: LearningHistory Repository
+            daily_rollup_repo: 사용자 일별 학습 롤업 Repository
         """
-        self.learning_history_repo = learning_history_repo
+        self.daily_rollup_repo = daily_rollup_repo
 
     def get_daily_statistics(
         self,
@@ -36,26 +35,27 @@ class DailyStatisticsService:
 
         Returns:
             Dict[str, Any]: 일일 학습 통계
-                - total_questions: 오늘 푼 문제 수
+                - total_questions: 오늘 푼 문제 수 (시험 + 학습 모드)
+                - correct_count: 오늘 맞힌 문제 수
                 - total_minutes: 오늘 학습 시간 (분)
-                - study_sessions: 학습 세션 수
+                - study_sessions: 학습 세션 수 (시험 + 학습 모드)
+                - tests_completed: 완료한 시험 수
+                - vocabulary_reviews: 단어 복습 횟수
         """
         if target_date is None:
             target_date = date.today()
 
-        # 해당 날짜의 학습 이력 조회
-        histories = self.learning_history_repo.find_by_study_date(target_date)
-        user_histories = [h for h in histories if h.user_id == user_id]
-
-        total_questions = sum(h.total_questions for h in user_histories)
-        total_minutes = sum(h.time_spent_minutes for h in user_histories)
-        study_sessions = len(user_histories)
+        # 쓰기 시점에 갱신된 (user_id, 날짜) 롤업 한 행만 조회
+        rollup = self.daily_rollup_repo.find_by_user_and_date(user_id, target_date)
 
         return {
             'date': target_date.isoformat(),
-            'total_questions': total_questions,
-            'total_minutes': total_minutes,
-            'study_sessions': study_sessions
+            'total_questions': rollup['questions_answered'],
+            'correct_count': rollup['correct_count'],
+            'total_minutes': rollup['time_spent_minutes'],
+            'study_sessions': rollup['tests_completed'] + rollup['study_sessions'],
+            'tests_completed': rollup['tests_completed'],
+            'vocabulary_reviews': rollup['vocabulary_reviews']
         }
 
     def calculate_goal_achievement(
@@ -0,0 +1,173 @@
+"""
+학습 이력 분석 서비스
+일별 롤업과 학습 시간대 집계로 달력 히트맵/기간별 추이/시간대별 패턴을 서버에서 계산
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+from backend.infrastructure.repositories.learning_history_repository import SqliteLearningHistoryRepository
+from backend.infrastructure.repositories.study_session_repository import SqliteStudySessionRepository
+from backend.infrastructure.repositories.user_daily_rollup_repository import SqliteUserDailyRollupRepository
+
+
+class HistoryAnalyticsService:
+    """
+    학습 이력 분석 서비스
+
+    기간 단위(일/주/월) 합계는 일별 롤업에서, 시간대별 합계는 학습 이력(시험)과 학습 세션의
+    study_hour 집계에서 가져옵니다. 응답 크기는 학습 횟수가 아니라 기간 수(최대 max_buckets)와
+    24개 시간대로 제한됩니다.
+    """
+
+    # 세밀한 순서 (요청한 단위로 max_buckets를 넘으면 다음 단위로 다운샘플링)
+    GRANULARITIES = ('day', 'week', 'month')
+    # 기간별 합계 항목 (롤업 기본 카운터 + 학습한 날 수)
+    COUNTERS = SqliteUserDailyRollupRepository.BASE_COUNTERS + ('active_days',)
+    DEFAULT_DAYS = 365
+    DEFAULT_MAX_BUCKETS = 400
+    MAX_BUCKETS = 1000
+
+    def __init__(
+        self,
+        daily_rollup_repo: SqliteUserDailyRollupRepository,
+        learning_history_repo: SqliteLearningHistoryRepository,
+        study_session_repo: SqliteStudySessionRepository
+    ):
+        """
+        HistoryAnalyticsService 초기화
+
+        Args:
+            daily_rollup_repo: 사용자 일별 학습 롤업 Repository
+            learning_history_repo: LearningHistory Repository
+            study_session_repo: StudySession Repository
+        """
+        self.daily_rollup_repo = daily_rollup_repo
+        self.learning_history_repo = learning_history_repo
+        self.study_session_repo = study_session_repo
+
+    def get_summary(
+        self,
+        user_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        granularity: str = 'day',
+        max_buckets: int = DEFAULT_MAX_BUCKETS
+    ) -> Dict[str, Any]:
+        """
+        기간별/시간대별 학습 요약
+
+        Args:
+            user_id: 사용자 ID
+            start_date: 시작일 (None이면 종료일 기준 DEFAULT_DAYS일 전부터)
+            end_date: 종료일 (None이면 오늘)
+            granularity: 기간 단위 ('day', 'week', 'month')
+            max_buckets: 최대 기간 수 (넘으면 더 큰 단위로 다운샘플링)
+
+        Returns:
+            Dict[str, Any]: start_date, end_date, granularity(실제 사용한 단위), buckets(빈 기간 포함),
+                hours(0~23시), totals
+
+        Raises:
+            ValueError: 기간 단위, 날짜 범위, max_buckets가 올바르지 않거나 월 단위로도 max_buckets를 넘는 경우
+        """
+        if granularity not in self.GRANULARITIES:
+            raise ValueError(f"지원하지 않는 기간 단위입니다: {granularity} (day, week, month)")
+        if not 1 <= max_buckets <= self.MAX_BUCKETS:
+            raise ValueError(f"max_buckets는 1 이상 {self.MAX_BUCKETS} 이하여야 합니다")
+        if end_date is None:
+            end_date = date.today()
+        if start_date is None:
+            start_date = end_date - timedelta(days=self.DEFAULT_DAYS - 1)
+        if start_date > end_date:
+            raise ValueError("시작일은 종료일보다 늦을 수 없습니다")
+
+        used_granularity = self._choose_granularity(start_date, end_date, granularity, max_buckets)
+        rows = {
+            row['period_start']: row
+            for row in self.daily_rollup_repo.aggregate_by_period(user_id, start_date, end_date, used_granularity)
+        }
+        buckets = []
+        for period_start in self._period_starts(start_date, end_date, used_granularity):
+            row = rows.get(period_start.isoformat(), {})
+            bucket = {'period_start': period_start.isoformat()}
+            for name in self.COUNTERS:
+                bucket[name] = row.get(name) or 0
+            bucket['accuracy_percentage'] = self._accuracy(bucket['correct_count'], bucket['questions_answered'])
+            buckets.append(bucket)
+
+        totals = {name: sum(bucket[name] for bucket in buckets) for name in self.COUNTERS}
+        totals['accuracy_percentage'] = self._accuracy(totals['correct_count'], totals['questions_answered'])
+
+        return {
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'granularity': used_granularity,
+            'buckets': buckets,
+            'hours': self._hours(user_id, start_date, end_date),
+            'totals': totals
+        }
+
+    def _hours(self, user_id: int, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """0~23시 시간대별 합계 (시험 + 학습 모드)"""
+        hours = [
+            {'hour': hour, 'sessions': 0, 'questions_answered': 0, 'correct_count': 0, 'time_spent_minutes': 0}
+            for hour in range(24)
+        ]
+        for repo in (self.learning_history_repo, self.study_session_repo):
+            for row in repo.aggregate_by_hour(user_id, start_date, end_date):
+                if not 0 <= row['study_hour'] <= 23:
+                    continue
+                hour = hours[row['study_hour']]
+                hour['sessions'] += row['sessions']
+                hour['questions_answered'] += row['total_questions'] or 0
+                hour['correct_count'] += row['correct_count'] or 0
+                hour['time_spent_minutes'] += row['time_spent_minutes'] or 0
+        for hour in hours:
+            hour['accuracy_percentage'] = self._accuracy(hour['correct_count'], hour['questions_answered'])
+        return hours
+
+    @classmethod
+    def _choose_granularity(cls, start_date: date, end_date: date, granularity: str, max_buckets: int) -> str:
+        """요청한 단위부터 기간 수가 max_buckets 이하가 되는 가장 세밀한 단위 선택"""
+        for candidate in cls.GRANULARITIES[cls.GRANULARITIES.index(granularity):]:
+            if cls._count_periods(start_date, end_date, candidate) <= max_buckets:
+                return candidate
+        raise ValueError(f"기간이 너무 깁니다 (월 단위로도 {max_buckets}개를 넘습니다)")
+
+    @classmethod
+    def _count_periods(cls, start_date: date, end_date: date, granularity: str) -> int:
+        """기간 수 (부분 기간 포함)"""
+        if granularity == 'day':
+            return (end_date - start_date).days + 1
+        if granularity == 'week':
+            return (cls._period_start(end_date, 'week') - cls._period_start(start_date, 'week')).days // 7 + 1
+        return (end_date.year - start_date.year) * 12 + end_date.month - start_date.month + 1
+
+    @staticmethod
+    def _period_start(day: date, granularity: str) -> date:
+        """날짜가 속한 기간의 시작일 (주는 월요일 시작)"""
+        if granularity == 'week':
+            return day - timedelta(days=day.weekday())
+        if granularity == 'month':
+            return day.replace(day=1)
+        return day
+
+    @classmethod
+    def _period_starts(cls, start_date: date, end_date: date, granularity: str) -> List[date]:
+        """범위에 걸치는 모든 기간의 시작일"""
+        starts = []
+        current = cls._period_start(start_date, granularity)
+        while current <= end_date:
+            starts.append(current)
+            if granularity == 'day':
+                current += timedelta(days=1)
+            elif granularity == 'week':
+                current += timedelta(days=7)
+            else:
+                current = (current.replace(day=28) + timedelta(days=4)).replace(day=1)
+        return starts
+
+    @staticmethod
+    def _accuracy(correct: int, total: int) -> float:
+        """정답률 (%)"""
+        return round(correct / total * 100, 1) if total else 0.0
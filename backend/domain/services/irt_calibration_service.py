@@ -0,0 +1,289 @@
+"""
+IRT 보정 도메인 서비스
+answer_details의 (사용자, 문항, 정답 여부) 응답으로 1PL/2PL 문항 모수와 사용자 능력치를 오프라인 추정
+"""
+
+import time
+from typing import Any, Dict, Tuple
+import numpy as np
+from backend.domain.services.adaptive_test_service import AdaptiveTestService
+from backend.infrastructure.repositories.irt_parameter_repository import SqliteIrtParameterRepository
+
+
+class IrtCalibrationService:
+    """
+    IRT 보정 도메인 서비스
+
+    P(정답) = sigmoid(a_i * (theta_u - b_i)) 모델을 정규 사전분포를 둔 결합 최대사후추정(JMAP)으로
+    맞춥니다. 응답은 사용자×문항 희소 행렬의 COO 배열(사용자 인덱스, 문항 인덱스, 정답 여부)로만
+    보관하고, 미니배치마다 np.bincount로 모수별 기울기를 모아 Adam으로 갱신합니다.
+    1PL은 변별도 a를 1로 고정합니다.
+
+    사전분포는 만점/영점 사용자나 모두 맞힌 문항의 모수가 발산하지 않게 하고,
+    theta ~ N(0, 1)로 척도를 고정합니다.
+    """
+
+    MODELS = ('1pl', '2pl')
+    # 사전분포 표준편차: theta ~ N(0, 1), b ~ N(0, 2), log(a) ~ N(0, 0.5)
+    THETA_PRIOR_SD = 1.0
+    DIFFICULTY_PRIOR_SD = 2.0
+    LOG_DISCRIMINATION_PRIOR_SD = 0.5
+    LOGIT_CLIP = 30.0
+
+    def __init__(self, irt_repo: SqliteIrtParameterRepository):
+        """
+        IrtCalibrationService 초기화
+
+        Args:
+            irt_repo: IRT 모수 Repository
+        """
+        self.irt_repo = irt_repo
+
+    def calibrate(
+        self,
+        model: str = '2pl',
+        epochs: int = 30,
+        batch_size: int = 65536,
+        learning_rate: float = 0.05,
+        warm_start: bool = True,
+        min_item_responses: int = 5,
+        chunk_size: int = 100_000,
+        seed: int = 0
+    ) -> Dict[str, Any]:
+        """
+        전체 응답으로 문항 모수와 사용자 능력치를 추정해 저장
+
+        Args:
+            model: '1pl' 또는 '2pl'
+            epochs: 전체 응답을 도는 횟수
+            batch_size: 미니배치 응답 수
+            learning_rate: Adam 학습률
+            warm_start: 저장된 이전 보정값에서 시작 (없는 문항/사용자는 정답률로 초기화)
+            min_item_responses: 이보다 응답이 적은 문항은 보정에서 제외
+            chunk_size: DB에서 한 번에 읽는 응답 수
+            seed: 미니배치 순서 난수 시드
+
+        Returns:
+            Dict[str, Any]: model, responses, users, items, epochs, warm_started(이전 값으로 시작한 문항 수),
+                mean_log_likelihood, elapsed_seconds
+
+        Raises:
+            ValueError: 모델, epochs, batch_size, learning_rate가 올바르지 않은 경우
+        """
+        if model not in self.MODELS:
+            raise ValueError(f"지원하지 않는 IRT 모델입니다: {model} (1pl, 2pl)")
+        if epochs < 1 or batch_size < 1 or learning_rate <= 0:
+            raise ValueError("epochs, batch_size는 1 이상, learning_rate는 0보다 커야 합니다")
+
+        started = time.monotonic()
+        user_ids, item_ids, users, items, y = self._load_responses(chunk_size)
+        if len(y):
+            item_counts = np.bincount(items, minlength=len(item_ids))
+            keep = item_counts[items] >= min_item_responses
+            user_ids, item_ids, users, items, y = self._reindex(user_ids, item_ids, users[keep], items[keep], y[keep])
+
+        if len(y) == 0:
+            return {
+                'model': model, 'responses': 0, 'users': 0, 'items': 0, 'epochs': epochs,
+                'warm_started': 0, 'mean_log_likelihood': None,
+                'elapsed_seconds': round(time.monotonic() - started, 3)
+            }
+
+        theta, b, log_a, warm_started = self._initial_params(
+            user_ids, item_ids, users, items, y, model, warm_start
+        )
+        theta, b, log_a = self.fit(
+            users, items, y, theta, b, log_a,
+            fit_discrimination=(model == '2pl'),
+            epochs=epochs, batch_size=batch_size, learning_rate=learning_rate, seed=seed
+        )
+        theta_se, b_se = self.standard_errors(users, items, theta, b, log_a)
+        user_counts = np.bincount(users, minlength=len(user_ids))
+        item_counts = np.bincount(items, minlength=len(item_ids))
+        a = np.exp(log_a)
+
+        self.irt_repo.save_calibration(
+            model,
+            [
+                (int(item_ids[i]), round(float(a[i]), 4), round(float(b[i]), 4), round(float(b_se[i]), 4),
+                 int(item_counts[i]))
+                for i in range(len(item_ids))
+            ],
+            [
+                (int(user_ids[u]), round(float(theta[u]), 4), round(float(theta_se[u]), 4), int(user_counts[u]))
+                for u in range(len(user_ids))
+            ]
+        )
+        # 적응형 시험 문제 은행이 새 문항 모수를 쓰도록 캐시 무효화
+        AdaptiveTestService.invalidate()
+
+        return {
+            'model': model,
+            'responses': int(len(y)),
+            'users': int(len(user_ids)),
+            'items': int(len(item_ids)),
+            'epochs': epochs,
+            'warm_started': warm_started,
+            'mean_log_likelihood': round(self.mean_log_likelihood(users, items, y, theta, b, log_a), 4),
+            'elapsed_seconds': round(time.monotonic() - started, 3)
+        }
+
+    def _load_responses(
+        self, chunk_size: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """응답을 청크로 읽어 COO 배열로 변환 (사용자/문항 ID는 0부터의 인덱스로)"""
+        chunks = [
+            np.array(rows, dtype=np.int64).reshape(-1, 3)
+            for rows in self.irt_repo.iter_responses(chunk_size)
+        ]
+        if not chunks:
+            empty = np.array([], dtype=np.int64)
+            return empty, empty, empty, empty, np.array([], dtype=np.float64)
+        responses = np.concatenate(chunks)
+        user_ids, users = np.unique(responses[:, 0], return_inverse=True)
+        item_ids, items = np.unique(responses[:, 1], return_inverse=True)
+        return user_ids, item_ids, users, items, responses[:, 2].astype(np.float64)
+
+    @staticmethod
+    def _reindex(user_ids, item_ids, users, items, y):
+        """필터링 후 남은 사용자/문항만으로 인덱스 다시 부여"""
+        kept_users, users = np.unique(users, return_inverse=True)
+        kept_items, items = np.unique(items, return_inverse=True)
+        return user_ids[kept_users], item_ids[kept_items], users, items, y
+
+    def _initial_params(self, user_ids, item_ids, users, items, y, model: str, warm_start: bool):
+        """초기값: 이전 보정값(warm start), 없으면 보정한 정답률의 로짓"""
+        user_rate = (np.bincount(users, weights=y, minlength=len(user_ids)) + 0.5) / (
+            np.bincount(users, minlength=len(user_ids)) + 1.0
+        )
+        item_rate = (np.bincount(items, weights=y, minlength=len(item_ids)) + 0.5) / (
+            np.bincount(items, minlength=len(item_ids)) + 1.0
+        )
+        theta = np.log(user_rate / (1 - user_rate))
+        b = -np.log(item_rate / (1 - item_rate))
+        log_a = np.zeros(len(item_ids))
+
+        warm_started = 0
+        if warm_start:
+            previous_items = self.irt_repo.find_item_params()
+            previous_users = self.irt_repo.find_user_abilities()
+            for i, question_id in enumerate(item_ids.tolist()):
+                if question_id in previous_items:
+                    a_value, b_value = previous_items[question_id]
+                    b[i] = b_value
+                    if model == '2pl':
+                        log_a[i] = np.log(max(a_value, 1e-3))
+                    warm_started += 1
+            for u, user_id in enumerate(user_ids.tolist()):
+                if user_id in previous_users:
+                    theta[u] = previous_users[user_id]
+        return theta, b, log_a, warm_started
+
+    @classmethod
+    def fit(
+        cls,
+        users: np.ndarray,
+        items: np.ndarray,
+        y: np.ndarray,
+        theta: np.ndarray,
+        b: np.ndarray,
+        log_a: np.ndarray,
+        fit_discrimination: bool = True,
+        epochs: int = 30,
+        batch_size: int = 65536,
+        learning_rate: float = 0.05,
+        seed: int = 0
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        미니배치 Adam으로 로그 사후확률 최대화
+
+        미니배치 기울기는 전체 응답 수 / 배치 크기만큼 키워 전체 로그우도의 추정치로 쓰고,
+        사전분포 기울기를 더합니다. 모수별 기울기는 np.bincount로 모읍니다.
+
+        Args:
+            users, items: 응답별 사용자/문항 인덱스
+            y: 응답별 정답 여부 (0/1)
+            theta, b, log_a: 초기값 (복사해서 사용)
+            fit_discrimination: False면 log_a를 고정 (1PL)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: (theta, b, log_a)
+        """
+        theta, b, log_a = theta.astype(np.float64).copy(), b.astype(np.float64).copy(), log_a.astype(np.float64).copy()
+        params = [theta, b, log_a] if fit_discrimination else [theta, b]
+        first_moments = [np.zeros_like(param) for param in params]
+        second_moments = [np.zeros_like(param) for param in params]
+        beta1, beta2, eps = 0.9, 0.999, 1e-8
+
+        rng = np.random.default_rng(seed)
+        n = len(y)
+        step = 0
+        for _ in range(epochs):
+            order = rng.permutation(n)
+            for start in range(0, n, batch_size):
+                batch = order[start:start + batch_size]
+                u, i, target = users[batch], items[batch], y[batch]
+                a = np.exp(log_a[i])
+                diff = theta[u] - b[i]
+                residual = target - cls._sigmoid(a * diff)
+                scale = n / len(batch)
+
+                gradients = [
+                    np.bincount(u, weights=a * residual, minlength=len(theta)) * scale
+                    - theta / cls.THETA_PRIOR_SD ** 2,
+                    -np.bincount(i, weights=a * residual, minlength=len(b)) * scale
+                    - b / cls.DIFFICULTY_PRIOR_SD ** 2,
+                ]
+                if fit_discrimination:
+                    gradients.append(
+                        np.bincount(i, weights=a * diff * residual, minlength=len(log_a)) * scale
+                        - log_a / cls.LOG_DISCRIMINATION_PRIOR_SD ** 2
+                    )
+
+                step += 1
+                for param, gradient, m, v in zip(params, gradients, first_moments, second_moments):
+                    m *= beta1
+                    m += (1 - beta1) * gradient
+                    v *= beta2
+                    v += (1 - beta2) * gradient ** 2
+                    m_hat = m / (1 - beta1 ** step)
+                    v_hat = v / (1 - beta2 ** step)
+                    # 로그 사후확률을 최대화하므로 기울기 방향으로 이동
+                    param += learning_rate * m_hat / (np.sqrt(v_hat) + eps)
+
+        return theta, b, log_a
+
+    @classmethod
+    def standard_errors(
+        cls, users: np.ndarray, items: np.ndarray, theta: np.ndarray, b: np.ndarray, log_a: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        theta와 b의 표준오차 (피셔 정보량 + 사전분포 정밀도의 역제곱근)
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: (theta_se, b_se)
+        """
+        a = np.exp(log_a[items])
+        p = cls._sigmoid(a * (theta[users] - b[items]))
+        information = a * a * p * (1 - p)
+        theta_information = np.bincount(users, weights=information, minlength=len(theta))
+        b_information = np.bincount(items, weights=information, minlength=len(b))
+        return (
+            1 / np.sqrt(theta_information + 1 / cls.THETA_PRIOR_SD ** 2),
+            1 / np.sqrt(b_information + 1 / cls.DIFFICULTY_PRIOR_SD ** 2)
+        )
+
+    @classmethod
+    def mean_log_likelihood(
+        cls, users: np.ndarray, items: np.ndarray, y: np.ndarray,
+        theta: np.ndarray, b: np.ndarray, log_a: np.ndarray
+    ) -> float:
+        """응답당 평균 로그우도 (보정 품질 확인용)"""
+        p = cls._sigmoid(np.exp(log_a[items]) * (theta[users] - b[items]))
+        p = np.clip(p, 1e-12, 1 - 1e-12)
+        return float(np.mean(y * np.log(p) + (1 - y) * np.log(1 - p)))
+
+    @classmethod
+    def _sigmoid(cls, z: np.ndarray) -> np.ndarray:
+        """수치적으로 안정한 시그모이드"""
+        return 1 / (1 + np.exp(-np.clip(z, -cls.LOGIT_CLIP, cls.LOGIT_CLIP)))
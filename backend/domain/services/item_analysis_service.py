@@ -0,0 +1,150 @@
+"""
+문항 분석 도메인 서비스
+answer_details를 문제별로 벡터화 집계해 난이도(정답률), 변별도(점이연 상관), 선택지별 선택 비율,
+풀이 시간 중앙값을 계산하고 question_stats에 증분 저장
+"""
+
+import time
+from typing import Any, Dict, List
+import numpy as np
+from backend.infrastructure.repositories.question_stats_repository import SqliteQuestionStatsRepository
+
+
+class ItemAnalysisService:
+    """
+    문항 분석 도메인 서비스
+
+    마지막 갱신 이후 새 답안이 생긴 문제만 골라 그 문제들의 전체 답안을 한 번에 읽고,
+    문제 ID로 정렬한 배열에서 구간별 reduce로 통계를 계산합니다 (문제별 Python 루프 없음).
+    시험 조립과 어드민 도구는 답안을 스캔하지 않고 question_stats를 조회합니다.
+    """
+
+    def __init__(self, question_stats_repo: SqliteQuestionStatsRepository):
+        """
+        ItemAnalysisService 초기화
+
+        Args:
+            question_stats_repo: 문항 분석 통계 Repository
+        """
+        self.question_stats_repo = question_stats_repo
+
+    def refresh(self, full: bool = False) -> Dict[str, Any]:
+        """
+        문항 통계 갱신
+
+        Args:
+            full: True면 전체 통계를 지우고 모든 답안으로 다시 계산 (답안 수정/삭제 반영)
+
+        Returns:
+            Dict[str, Any]: mode('full'/'incremental'), questions(갱신한 문제 수),
+                answers(읽은 답안 수), last_answer_id, elapsed_seconds
+        """
+        started = time.monotonic()
+        after_answer_id = 0 if full else self.question_stats_repo.find_watermark()
+        through_answer_id, rows = self.question_stats_repo.find_answers_for_refresh(after_answer_id)
+
+        stats: List[Dict[str, Any]] = []
+        if rows:
+            answer_ids, question_ids, is_correct, times, _, total_scores = (
+                np.array(column) for column in zip(*rows)
+            )
+            stats = self.compute_item_stats(
+                question_ids.astype(np.int64),
+                is_correct.astype(np.float64),
+                times.astype(np.float64),
+                [row[4] for row in rows],
+                total_scores.astype(np.float64),
+                answer_ids.astype(np.int64)
+            )
+
+        self.question_stats_repo.save_all(stats, replace=full)
+
+        return {
+            'mode': 'full' if full else 'incremental',
+            'questions': len(stats),
+            'answers': len(rows),
+            'last_answer_id': through_answer_id,
+            'elapsed_seconds': round(time.monotonic() - started, 3)
+        }
+
+    @staticmethod
+    def compute_item_stats(
+        question_ids: np.ndarray,
+        is_correct: np.ndarray,
+        times: np.ndarray,
+        answers: List[str],
+        total_scores: np.ndarray,
+        answer_ids: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """
+        문제별 통계 계산 (답안 단위 배열 입력)
+
+        - p_value: 정답률 (고전 검사 이론의 문항 난이도, 높을수록 쉬움)
+        - discrimination: 정답 여부(0/1)와 결과 총점의 점이연 상관계수
+          (응답이 2개 미만이거나 정답 여부/총점이 모두 같으면 None)
+        - median_time_seconds: 풀이 시간 중앙값
+        - choice_rates: 사용자 답안별 선택 비율 (무응답 제외, 분모는 전체 응답 수)
+
+        Args:
+            question_ids: 문제 ID
+            is_correct: 정답 여부 (0/1)
+            times: 풀이 시간 (초)
+            answers: 사용자 답안
+            total_scores: 답안이 속한 결과의 총점 (정답 비율)
+            answer_ids: 답안 ID
+
+        Returns:
+            List[Dict[str, Any]]: 문제 ID 순 통계 목록
+        """
+        # 문제 ID, 풀이 시간 순으로 정렬하면 문제별로 연속 구간이 되고 구간 안의 시간은 정렬됨
+        order = np.lexsort((times, question_ids))
+        question_ids = question_ids[order]
+        is_correct = is_correct[order]
+        times = times[order]
+        total_scores = total_scores[order]
+        answer_ids = answer_ids[order]
+
+        unique_ids, starts, counts = np.unique(question_ids, return_index=True, return_counts=True)
+        n = counts.astype(np.float64)
+
+        correct = np.add.reduceat(is_correct, starts)
+        p = correct / n
+
+        # 점이연 상관 = cov(정답 여부, 총점) / (sd(정답 여부) * sd(총점)), 모두 모집단 기준
+        mean_total = np.add.reduceat(total_scores, starts) / n
+        mean_total_sq = np.add.reduceat(total_scores * total_scores, starts) / n
+        mean_cross = np.add.reduceat(is_correct * total_scores, starts) / n
+        covariance = mean_cross - p * mean_total
+        denominator = np.sqrt(np.clip(p * (1 - p), 0, None) * np.clip(mean_total_sq - mean_total ** 2, 0, None))
+        valid = (counts >= 2) & (denominator > 1e-12)
+        discrimination = np.divide(covariance, denominator, out=np.zeros_like(covariance), where=valid)
+        discrimination = np.clip(discrimination, -1.0, 1.0)
+
+        median_time = (times[starts + (counts - 1) // 2] + times[starts + counts // 2]) / 2
+        last_answer_ids = np.maximum.reduceat(answer_ids, starts)
+
+        # 선택지별 선택 수: (문제 위치, 답안 코드) 쌍을 하나의 정수 키로 묶어 한 번에 집계
+        answer_values = np.array(answers, dtype=object)[order].astype(str)
+        choices, choice_codes = np.unique(answer_values, return_inverse=True)
+        question_index = np.repeat(np.arange(len(unique_ids)), counts)
+        pair_keys, pair_counts = np.unique(question_index * len(choices) + choice_codes, return_counts=True)
+        choice_rates: List[Dict[str, float]] = [{} for _ in unique_ids]
+        for key, count in zip(pair_keys.tolist(), pair_counts.tolist()):
+            index, code = divmod(key, len(choices))
+            choice = choices[code]
+            if choice.strip():
+                choice_rates[index][choice] = round(count / counts[index], 4)
+
+        return [
+            {
+                'question_id': int(unique_ids[i]),
+                'responses': int(counts[i]),
+                'correct_count': int(correct[i]),
+                'p_value': round(float(p[i]), 4),
+                'discrimination': round(float(discrimination[i]), 4) if valid[i] else None,
+                'median_time_seconds': float(median_time[i]),
+                'choice_rates': choice_rates[i],
+                'last_answer_id': int(last_answer_ids[i])
+            }
+            for i in range(len(unique_ids))
+        ]
@@ -0,0 +1,151 @@
+"""
+레벨별 점수 추이 도메인 서비스
+level_scores 시계열을 구간 조회하고 차트용 점 개수로 다운샘플링
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, Optional
+import numpy as np
+from backend.infrastructure.repositories.level_score_repository import SqliteLevelScoreRepository
+
+
+class LevelProgressionService:
+    """
+    레벨별 점수 추이 도메인 서비스
+
+    - lttb: 기간 내 모든 시험 점수를 Largest-Triangle-Three-Buckets로 max_points개까지 줄임
+      (첫/마지막 점과 급격한 변화가 유지됨)
+    - daily_max: SQL에서 일별 최고 점수로 묶고, 그래도 max_points를 넘으면 LTTB 적용
+    """
+
+    METHODS = ('lttb', 'daily_max')
+    DEFAULT_DAYS = 365
+    DEFAULT_MAX_POINTS = 200
+    MAX_POINTS = 1000
+
+    def __init__(self, level_score_repo: SqliteLevelScoreRepository):
+        """
+        LevelProgressionService 초기화
+
+        Args:
+            level_score_repo: 레벨별 점수 이력 Repository
+        """
+        self.level_score_repo = level_score_repo
+
+    def get_progression(
+        self,
+        user_id: int,
+        level: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        max_points: int = DEFAULT_MAX_POINTS,
+        method: str = 'lttb'
+    ) -> Dict[str, Any]:
+        """
+        레벨별 점수 추이 조회
+
+        Args:
+            user_id: 사용자 ID
+            level: JLPT 레벨 (None이면 점수 이력이 있는 모든 레벨)
+            start_date: 시작일 (None이면 종료일 기준 DEFAULT_DAYS일 전부터)
+            end_date: 종료일 (None이면 오늘)
+            max_points: 레벨별 최대 점 개수
+            method: 다운샘플링 방식 ('lttb', 'daily_max')
+
+        Returns:
+            Dict[str, Any]: start_date, end_date, method, levels(레벨 -> points, total_points, downsampled)
+
+        Raises:
+            ValueError: 방식, 날짜 범위, max_points가 올바르지 않은 경우
+        """
+        if method not in self.METHODS:
+            raise ValueError(f"지원하지 않는 다운샘플링 방식입니다: {method} (lttb, daily_max)")
+        if not 3 <= max_points <= self.MAX_POINTS:
+            raise ValueError(f"max_points는 3 이상 {self.MAX_POINTS} 이하여야 합니다")
+        if end_date is None:
+            end_date = date.today()
+        if start_date is None:
+            start_date = end_date - timedelta(days=self.DEFAULT_DAYS - 1)
+        if start_date > end_date:
+            raise ValueError("시작일은 종료일보다 늦을 수 없습니다")
+
+        levels = [level] if level else self.level_score_repo.find_levels(user_id)
+        return {
+            'start_date': start_date.isoformat(),
+            'end_date': end_date.isoformat(),
+            'method': method,
+            'levels': {
+                name: self._series(user_id, name, start_date, end_date, max_points, method)
+                for name in levels
+            }
+        }
+
+    def _series(
+        self, user_id: int, level: str, start_date: date, end_date: date, max_points: int, method: str
+    ) -> Dict[str, Any]:
+        """한 레벨의 점수 추이 (max_points개 이하)"""
+        if method == 'daily_max':
+            points = self.level_score_repo.find_daily_max(user_id, level, start_date, end_date)
+        else:
+            points = [
+                {'date': study_date, 'score': score}
+                for study_date, score in self.level_score_repo.find_series(user_id, level, start_date, end_date)
+            ]
+
+        total_points = len(points)
+        if total_points > max_points:
+            x = np.array([point['date'] for point in points], dtype='datetime64[D]').astype(np.float64)
+            y = np.array([point['score'] for point in points], dtype=np.float64)
+            points = [points[index] for index in self.lttb(x, y, max_points)]
+
+        return {
+            'points': points,
+            'total_points': total_points,
+            'downsampled': total_points > max_points
+        }
+
+    @staticmethod
+    def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> np.ndarray:
+        """
+        Largest-Triangle-Three-Buckets 다운샘플링
+
+        첫 점과 마지막 점을 유지하고, 나머지 점을 threshold - 2개 구간으로 나눠 구간마다
+        (이전에 고른 점, 현재 구간의 점, 다음 구간 평균)이 만드는 삼각형 넓이가 가장 큰 점을 고릅니다.
+
+        Args:
+            x: x 좌표 (오름차순)
+            y: y 좌표
+            threshold: 남길 점 개수 (3 이상)
+
+        Returns:
+            np.ndarray: 고른 점의 인덱스 (오름차순, 길이 min(len(x), threshold))
+        """
+        n = len(x)
+        if threshold >= n or threshold < 3:
+            return np.arange(n)
+
+        # 가운데 점(1 ~ n-2)을 threshold - 2개 구간으로 나눈 경계
+        edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+        selected = np.empty(threshold, dtype=np.int64)
+        selected[0] = 0
+        selected[-1] = n - 1
+
+        previous = 0
+        for bucket in range(threshold - 2):
+            start, end = edges[bucket], edges[bucket + 1]
+            if bucket + 2 < len(edges):
+                next_start, next_end = edges[bucket + 1], edges[bucket + 2]
+            else:
+                next_start, next_end = n - 1, n
+            next_x = x[next_start:next_end].mean()
+            next_y = y[next_start:next_end].mean()
+
+            # 세 점이 만드는 삼각형 넓이의 2배 (상수 배는 비교에 영향 없음)
+            areas = np.abs(
+                (x[previous] - next_x) * (y[start:end] - y[previous])
+                - (x[previous] - x[start:end]) * (next_y - y[previous])
+            )
+            previous = start + int(np.argmax(areas))
+            selected[bucket + 1] = previous
+
+        return selected
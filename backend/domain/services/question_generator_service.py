@@ -4,12 +4,13 @@ JLPT 문제를 대량 생성하는 비즈니스 로직
 """
 
 import random
-import json
 import logging
 from pathlib import Path
 from typing import List, Dict, Optional
 from backend.domain.entities.question import Question
 from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.adapters.audio_metadata import AudioMetadata
+from backend.infrastructure.adapters.sample_bank import SampleBank
 
 logger = logging.getLogger(__name__)
 
@@ -19,13 +20,11 @@ class QuestionGeneratorService:
     문제 생성 도메인 서비스
     
     JLPT 문제를 대량 생성하는 비즈니스 로직을 담당합니다.
-    JSON 파일에서 샘플 데이터를 로드하여 사용합니다.
+    샘플 데이터는 SampleBank로 로드합니다. scripts/build_sample_bank.py로 만든 스냅샷이 있으면
+    메모리 매핑으로 필요한 레벨만 읽고, 난이도별 인덱스로 샘플을 추출합니다.
     """
     
-    _vocabulary_samples = None
-    _grammar_patterns = None
-    _reading_questions = None
-    _listening_questions = None
+    _sample_bank: Optional[SampleBank] = None
     
     @classmethod
     def _get_data_dir(cls) -> Path:
@@ -35,103 +34,17 @@ class QuestionGeneratorService:
         return Path(__file__).parent.parent.parent.parent / "data"
     
     @classmethod
-    def _load_vocabulary_samples(cls) -> Dict[JLPTLevel, List[Dict]]:
-        """JSON 파일에서 어휘 샘플 로드"""
-        if cls._vocabulary_samples is None:
-            data_file = cls._get_data_dir() / "sample_vocabulary_for_questions.json"
-            
-            if not data_file.exists():
-                # 파일이 없으면 빈 딕셔너리 반환
-                cls._vocabulary_samples = {}
-                return cls._vocabulary_samples
-            
-            with open(data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            cls._vocabulary_samples = {}
-            for level_str, words in data.items():
-                try:
-                    level = JLPTLevel(level_str)
-                    cls._vocabulary_samples[level] = words
-                except ValueError:
-                    continue
-        
-        return cls._vocabulary_samples
-    
-    @classmethod
-    def _load_grammar_patterns(cls) -> Dict[JLPTLevel, List[Dict]]:
-        """JSON 파일에서 문법 패턴 로드"""
-        if cls._grammar_patterns is None:
-            data_file = cls._get_data_dir() / "sample_grammar_patterns.json"
-            
-            if not data_file.exists():
-                # 파일이 없으면 빈 딕셔너리 반환
-                cls._grammar_patterns = {}
-                return cls._grammar_patterns
-            
-            with open(data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            cls._grammar_patterns = {}
-            for level_str, patterns in data.items():
-                try:
-                    level = JLPTLevel(level_str)
-                    cls._grammar_patterns[level] = patterns
-                except ValueError:
-                    continue
-        
-        return cls._grammar_patterns
-    
-    @classmethod
-    def _load_reading_questions(cls) -> Dict[JLPTLevel, List[Dict]]:
-        """JSON 파일에서 독해 문제 로드"""
-        if cls._reading_questions is None:
-            data_file = cls._get_data_dir() / "sample_reading_questions.json"
-            
-            if not data_file.exists():
-                cls._reading_questions = {}
-                return cls._reading_questions
-            
-            with open(data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            cls._reading_questions = {}
-            for level_str, questions in data.items():
-                try:
-                    level = JLPTLevel(level_str)
-                    cls._reading_questions[level] = questions
-                except ValueError:
-                    continue
-        
-        return cls._reading_questions
-    
-    @classmethod
-    def _load_listening_questions(cls) -> Dict[JLPTLevel, List[Dict]]:
-        """JSON 파일에서 청해 문제 로드"""
-        if cls._listening_questions is None:
-            data_file = cls._get_data_dir() / "sample_listening_questions.json"
-            
-            if not data_file.exists():
-                cls._listening_questions = {}
-                return cls._listening_questions
-            
-            with open(data_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            cls._listening_questions = {}
-            for level_str, questions in data.items():
-                try:
-                    level = JLPTLevel(level_str)
-                    cls._listening_questions[level] = questions
-                except ValueError:
-                    continue
-        
-        return cls._listening_questions
+    def _get_sample_bank(cls) -> SampleBank:
+        """샘플 뱅크 반환 (최신 스냅샷이 있으면 메모리 매핑, 없으면 JSON 파일에서 구성)"""
+        if cls._sample_bank is None:
+            cls._sample_bank = SampleBank.load(cls._get_data_dir())
+        return cls._sample_bank
     
     @staticmethod
     def generate_vocabulary_questions(
         level: JLPTLevel,
-        count: int = 10
+        count: int = 10,
+        difficulty: Optional[int] = None
     ) -> List[Question]:
         """
         어휘 문제 생성
@@ -139,27 +52,36 @@ class QuestionGeneratorService:
         Args:
             level: JLPT 레벨
             count: 생성할 문제 수
+            difficulty: 난이도 (None이면 전체)
             
         Returns:
             생성된 문제 목록
         """
         questions = []
-        vocab_list = QuestionGeneratorService._load_vocabulary_samples().get(level, [])
+        bank = QuestionGeneratorService._get_sample_bank()
+        vocab_list = bank.records('vocabulary', level)
+        candidates = bank.indices('vocabulary', level, difficulty)
         
-        if not vocab_list:
+        if not vocab_list or len(candidates) == 0:
             return questions
         
-        for i in range(count):
-            # 랜덤으로 어휘 선택
-            vocab = random.choice(vocab_list)
+        attempts = 0
+        max_attempts = count * 10  # 무한 루프 방지
+        
+        while len(questions) < count and attempts < max_attempts:
+            attempts += 1
+            # 난이도 조건에 맞는 어휘를 랜덤으로 선택
+            vocab_index = int(candidates[random.randrange(len(candidates))])
+            vocab = vocab_list[vocab_index]
             
             # 선택지 생성 (정답 + 오답 3개)
-            wrong_answers = []
-            other_vocabs = [v for v in vocab_list if v != vocab]
-            wrong_answers = random.sample(
-                [v["meaning"] for v in other_vocabs],
-                min(3, len(other_vocabs))
-            )
+            # 대량 생성 시 매번 목록을 복사하지 않도록 선택한 어휘를 제외한 인덱스에서 추출
+            other_count = len(vocab_list) - 1
+            other_vocabs = [
+                vocab_list[j + 1 if j >= vocab_index else j]
+                for j in random.sample(range(other_count), min(3, other_count))
+            ]
+            wrong_answers = [v["meaning"] for v in other_vocabs]
             
             choices = [vocab["meaning"]] + wrong_answers
             random.shuffle(choices)
@@ -176,12 +98,14 @@ class QuestionGeneratorService:
             else:
                 question_text = f"「{vocab['word']}」の読み方は何ですか？"
                 # 읽기 문제의 경우 선택지를 읽기로 변경
-                choices = [vocab["reading"]] + [
-                    v["reading"] for v in random.sample(other_vocabs, min(3, len(other_vocabs)))
-                ]
+                choices = [vocab["reading"]] + [v["reading"] for v in other_vocabs]
                 random.shuffle(choices)
                 correct_answer = vocab["reading"]
             
+            # 의미/읽기가 같은 어휘가 오답으로 뽑히면 선택지가 중복되므로 건너뛰기
+            if len(set(choices)) != len(choices):
+                continue
+            
             question = Question(
                 id=0,
                 level=level,
@@ -199,7 +123,8 @@ class QuestionGeneratorService:
     @staticmethod
     def generate_grammar_questions(
         level: JLPTLevel,
-        count: int = 10
+        count: int = 10,
+        difficulty: Optional[int] = None
     ) -> List[Question]:
         """
         문법 문제 생성
@@ -207,18 +132,23 @@ class QuestionGeneratorService:
         Args:
             level: JLPT 레벨
             count: 생성할 문제 수
+            difficulty: 난이도 (None이면 전체)
             
         Returns:
             생성된 문제 목록
         """
         questions = []
-        patterns = QuestionGeneratorService._load_grammar_patterns().get(level, [])
+        bank = QuestionGeneratorService._get_sample_bank()
+        patterns = bank.records('grammar', level)
         
         if not patterns:
             return questions
         
-        # pattern에 "___"가 있는 패턴만 필터링
-        valid_patterns = [p for p in patterns if "___" in p.get("pattern", "")]
+        # 난이도 조건에 맞고 pattern에 "___"가 있는 패턴만 필터링
+        valid_patterns = [
+            patterns[int(i)] for i in bank.indices('grammar', level, difficulty)
+            if "___" in patterns[int(i)].get("pattern", "")
+        ]
         
         if not valid_patterns:
             return questions
@@ -268,7 +198,8 @@ class QuestionGeneratorService:
     @staticmethod
     def generate_reading_questions(
         level: JLPTLevel,
-        count: int = 10
+        count: int = 10,
+        difficulty: Optional[int] = None
     ) -> List[Question]:
         """
         독해 문제 생성
@@ -276,20 +207,15 @@ class QuestionGeneratorService:
         Args:
             level: JLPT 레벨
             count: 생성할 문제 수
+            difficulty: 난이도 (None이면 전체)
             
         Returns:
             생성된 문제 목록
         """
+        # 난이도 조건에 맞는 샘플 중 요청한 개수만큼 랜덤으로 선택
         questions = []
-        reading_list = QuestionGeneratorService._load_reading_questions().get(level, [])
-        
-        if not reading_list:
-            return questions
-        
-        # 요청한 개수만큼 랜덤으로 선택
-        selected_questions = random.sample(
-            reading_list,
-            min(count, len(reading_list))
+        selected_questions = QuestionGeneratorService._get_sample_bank().sample(
+            'reading', level, count, difficulty
         )
         
         for q_data in selected_questions:
@@ -313,7 +239,9 @@ class QuestionGeneratorService:
     @staticmethod
     def generate_listening_questions(
         level: JLPTLevel,
-        count: int = 10
+        count: int = 10,
+        with_audio: bool = True,
+        difficulty: Optional[int] = None
     ) -> List[Question]:
         """
         청해 문제 생성
@@ -321,20 +249,16 @@ class QuestionGeneratorService:
         Args:
             level: JLPT 레벨
             count: 생성할 문제 수
+            with_audio: True이면 TTS 오디오 생성 (대량 생성 시에는 False로 두고 나중에 일괄 생성)
+            difficulty: 난이도 (None이면 전체)
             
         Returns:
             생성된 문제 목록
         """
+        # 난이도 조건에 맞는 샘플 중 요청한 개수만큼 랜덤으로 선택
         questions = []
-        listening_list = QuestionGeneratorService._load_listening_questions().get(level, [])
-        
-        if not listening_list:
-            return questions
-        
-        # 요청한 개수만큼 랜덤으로 선택
-        selected_questions = random.sample(
-            listening_list,
-            min(count, len(listening_list))
+        selected_questions = QuestionGeneratorService._get_sample_bank().sample(
+            'listening', level, count, difficulty
         )
         
         for q_data in selected_questions:
@@ -344,16 +268,12 @@ class QuestionGeneratorService:
             # TTS 오디오 생성 (audio_text가 있으면 사용, 없으면 dialogue 사용)
             audio_url = None
             audio_text = q_data.get('audio_text', q_data.get('dialogue', ''))
-            if audio_text:
+            if with_audio and audio_text:
                 try:
                     from backend.domain.services.tts_service import TTSService
-                    # 대화 형식 제거
-                    clean_text = audio_text.replace('（会話）', '').replace('\n', ' ').strip()
-                    # A:, B: 같은 화자 표시 제거
-                    import re
-                    clean_text = re.sub(r'[A-Z]:\s*', '', clean_text)
+                    # 대화 형식과 A:, B: 같은 화자 표시 제거
                     audio_url = TTSService.generate_audio(
-                        text=clean_text,
+                        text=TTSService.clean_text(audio_text),
                         language='ja',
                         slow=False
                     )
@@ -369,9 +289,9 @@ class QuestionGeneratorService:
                 choices=q_data['choices'],
                 correct_answer=q_data['correct_answer'],
                 explanation=q_data['explanation'],
-                difficulty=q_data.get('difficulty', 2),
-                audio_url=audio_url
+                difficulty=q_data.get('difficulty', 2)
             )
+            question.attach_audio(audio_url, **AudioMetadata.fields_for_url(audio_url))
             questions.append(question)
         
         return questions
@@ -380,7 +300,9 @@ class QuestionGeneratorService:
     def generate_questions(
         level: JLPTLevel,
         question_type: Optional[QuestionType] = None,
-        count: int = 10
+        count: int = 10,
+        with_audio: bool = True,
+        difficulty: Optional[int] = None
     ) -> List[Question]:
         """
         문제 생성 (통합)
@@ -389,6 +311,8 @@ class QuestionGeneratorService:
             level: JLPT 레벨
             question_type: 문제 유형 (None이면 모든 유형)
             count: 생성할 문제 수
+            with_audio: True이면 청해 문제의 TTS 오디오 생성
+            difficulty: 난이도 (None이면 전체)
             
         Returns:
             생성된 문제 목록
@@ -403,32 +327,36 @@ class QuestionGeneratorService:
             listening_count = count - vocab_count - grammar_count - reading_count
             
             all_questions.extend(
-                QuestionGeneratorService.generate_vocabulary_questions(level, vocab_count)
+                QuestionGeneratorService.generate_vocabulary_questions(level, vocab_count, difficulty)
             )
             all_questions.extend(
-                QuestionGeneratorService.generate_grammar_questions(level, grammar_count)
+                QuestionGeneratorService.generate_grammar_questions(level, grammar_count, difficulty)
             )
             all_questions.extend(
-                QuestionGeneratorService.generate_reading_questions(level, reading_count)
+                QuestionGeneratorService.generate_reading_questions(level, reading_count, difficulty)
             )
             all_questions.extend(
-                QuestionGeneratorService.generate_listening_questions(level, listening_count)
+                QuestionGeneratorService.generate_listening_questions(
+                    level, listening_count, with_audio=with_audio, difficulty=difficulty
+                )
             )
         elif question_type == QuestionType.VOCABULARY:
             all_questions.extend(
-                QuestionGeneratorService.generate_vocabulary_questions(level, count)
+                QuestionGeneratorService.generate_vocabulary_questions(level, count, difficulty)
             )
         elif question_type == QuestionType.GRAMMAR:
             all_questions.extend(
-                QuestionGeneratorService.generate_grammar_questions(level, count)
+                QuestionGeneratorService.generate_grammar_questions(level, count, difficulty)
             )
         elif question_type == QuestionType.READING:
             all_questions.extend(
-                QuestionGeneratorService.generate_reading_questions(level, count)
+                QuestionGeneratorService.generate_reading_questions(level, count, difficulty)
             )
         elif question_type == QuestionType.LISTENING:
             all_questions.extend(
-                QuestionGeneratorService.generate_listening_questions(level, count)
+                QuestionGeneratorService.generate_listening_questions(
+                    level, count, with_audio=with_audio, difficulty=difficulty
+                )
             )
         
         return all_questions
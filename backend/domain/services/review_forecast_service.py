@@ -0,0 +1,242 @@
+"""
+복습량 예측 도메인 서비스
+SRS 스케줄 히스토그램과 벡터화된 시뮬레이션으로 향후 N일간의 일별 복습량을 예측
+"""
+
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+import numpy as np
+from backend.domain.services.bulk_spaced_repetition_service import BulkSpacedRepetitionService
+from backend.domain.services.spaced_repetition_service import SpacedRepetitionService
+from backend.infrastructure.repositories.user_vocabulary_repository import SqliteUserVocabularyRepository
+
+
+class ReviewForecastService:
+    """
+    복습량 예측 도메인 서비스
+
+    user_vocabulary 테이블을 (복습 예정일, 간격, Ease Factor) 그룹으로 집계한 뒤,
+    기간 안에 복습 예정일이 도래하는 그룹을 난이도 분포에 따라 나누어 다시 스케줄링하는
+    기대값 시뮬레이션을 수행합니다. 개별 카드를 로드하지 않으며, 결과는 짧은 시간 동안 캐시됩니다.
+    """
+
+    # 복습 난이도 분포 (기본값)
+    DEFAULT_OUTCOME_PROBABILITIES = {"easy": 0.2, "normal": 0.6, "hard": 0.2}
+
+    MAX_DAYS = 365  # 최대 예측 기간 (일)
+    CACHE_TTL_SECONDS = 300  # 캐시 유효 시간 (초)
+    MAX_CACHE_ENTRIES = 1024  # 최대 캐시 항목 수
+
+    # (user_id, days, 시작일, 난이도 분포) -> (저장 시각, 예측 결과)
+    _cache: Dict[Tuple, Tuple[float, Dict[str, Any]]] = {}
+
+    def __init__(
+        self,
+        user_vocab_repo: SqliteUserVocabularyRepository,
+        srs_service: Optional[SpacedRepetitionService] = None,
+        outcome_probabilities: Optional[Dict[str, float]] = None
+    ):
+        """
+        ReviewForecastService 초기화
+
+        Args:
+            user_vocab_repo: UserVocabulary Repository
+            srs_service: 스케줄링 상수를 제공하는 SpacedRepetitionService (기본값: 기본 상수)
+            outcome_probabilities: 복습 난이도 분포 (기본값: DEFAULT_OUTCOME_PROBABILITIES)
+
+        Raises:
+            ValueError: 난이도 분포가 올바르지 않은 경우
+        """
+        probabilities = outcome_probabilities or self.DEFAULT_OUTCOME_PROBABILITIES
+        if set(probabilities) != set(BulkSpacedRepetitionService.DIFFICULTY_CODES):
+            raise ValueError("난이도 분포는 'easy', 'normal', 'hard'를 모두 포함해야 합니다")
+        if any(p < 0 for p in probabilities.values()) or abs(sum(probabilities.values()) - 1.0) > 1e-9:
+            raise ValueError("난이도 분포는 합이 1인 0 이상의 값이어야 합니다")
+
+        self.user_vocab_repo = user_vocab_repo
+        self.bulk_service = BulkSpacedRepetitionService(srs_service)
+        self.outcome_probabilities = dict(probabilities)
+
+    def forecast(
+        self,
+        days: int = 30,
+        user_id: Optional[int] = None,
+        today: Optional[date] = None
+    ) -> Dict[str, Any]:
+        """
+        향후 일별 복습량 예측
+
+        Args:
+            days: 예측 기간 (일, 1 ~ MAX_DAYS)
+            user_id: 사용자 ID (기본값: None이면 전체 사용자)
+            today: 예측 시작 날짜 (기본값: None이면 현재 날짜)
+
+        Returns:
+            Dict[str, Any]: 예측 결과
+                - start_date: 예측 시작 날짜
+                - days: 예측 기간
+                - total_scheduled: 현재 스케줄 기준 기간 내 복습 수
+                - total_expected: 재복습을 포함한 기간 내 기대 복습 수
+                - forecast: 일별 {date, scheduled, expected} 목록 (밀린 복습은 첫날에 포함)
+
+        Raises:
+            ValueError: 예측 기간이 범위를 벗어난 경우
+        """
+        if days < 1 or days > self.MAX_DAYS:
+            raise ValueError(f"예측 기간은 1~{self.MAX_DAYS}일이어야 합니다")
+        if today is None:
+            today = date.today()
+
+        cache_key = (
+            user_id, days, today.isoformat(),
+            tuple(sorted(self.outcome_probabilities.items()))
+        )
+        cached = self._cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL_SECONDS:
+            return cached[1]
+
+        result = self._compute_forecast(days, user_id, today)
+        self._store(cache_key, result)
+        return result
+
+    @classmethod
+    def _store(cls, cache_key: Tuple, result: Dict[str, Any]) -> None:
+        """
+        예측 결과 캐시 저장
+
+        만료된 항목을 먼저 제거하고, 그래도 MAX_CACHE_ENTRIES를 넘으면 오래 저장된 항목부터 제거합니다.
+        """
+        now = time.monotonic()
+        for key, (stored_at, _) in list(cls._cache.items()):
+            if now - stored_at >= cls.CACHE_TTL_SECONDS:
+                cls._cache.pop(key, None)
+        cls._cache.pop(cache_key, None)
+        while len(cls._cache) >= cls.MAX_CACHE_ENTRIES:
+            cls._cache.pop(next(iter(cls._cache)))
+        cls._cache[cache_key] = (now, result)
+
+    @classmethod
+    def invalidate(cls, user_id: Optional[int] = None) -> None:
+        """
+        캐시 무효화
+
+        Args:
+            user_id: 복습 기록이 변경된 사용자 ID (해당 사용자와 전체 사용자 캐시를 제거,
+                None이면 모든 캐시 제거)
+        """
+        if user_id is None:
+            cls._cache.clear()
+            return
+        for key in list(cls._cache):
+            if key[0] in (user_id, None):
+                cls._cache.pop(key, None)
+
+    def _compute_forecast(self, days: int, user_id: Optional[int], today: date) -> Dict[str, Any]:
+        """히스토그램 조회 및 시뮬레이션 수행"""
+        until = today + timedelta(days=days - 1)
+        histogram = self.user_vocab_repo.find_review_schedule_histogram(
+            until.isoformat(), user_id=user_id
+        )
+
+        due_offsets = np.array(
+            [self._to_offset(row[0], today) for row in histogram], dtype=np.int64
+        )
+        intervals = np.array([row[1] for row in histogram], dtype=np.int64)
+        eases = np.array([row[2] for row in histogram], dtype=np.float64)
+        weights = np.array([row[3] for row in histogram], dtype=np.float64)
+
+        scheduled = np.bincount(due_offsets, weights=weights, minlength=days)[:days]
+        expected = self._simulate(due_offsets, intervals, eases, weights, days)
+
+        return {
+            'start_date': today.isoformat(),
+            'days': days,
+            'total_scheduled': int(scheduled.sum()),
+            'total_expected': round(float(expected.sum()), 2),
+            'forecast': [
+                {
+                    'date': (today + timedelta(days=i)).isoformat(),
+                    'scheduled': int(scheduled[i]),
+                    'expected': round(float(expected[i]), 2)
+                }
+                for i in range(days)
+            ]
+        }
+
+    @staticmethod
+    def _to_offset(next_review_date: Optional[str], today: date) -> int:
+        """복습 예정일을 시작일 기준 일수로 변환 (미정/밀린 복습은 0)"""
+        if not next_review_date:
+            return 0
+        due = datetime.strptime(next_review_date, '%Y-%m-%d').date()
+        return max((due - today).days, 0)
+
+    def _simulate(
+        self,
+        due_offsets: np.ndarray,
+        intervals: np.ndarray,
+        eases: np.ndarray,
+        weights: np.ndarray,
+        days: int
+    ) -> np.ndarray:
+        """
+        기대값 기반 전방 시뮬레이션
+
+        매일 복습 예정인 그룹을 난이도별로 분할해 다음 간격을 계산하고,
+        기간 안에 다시 도래하는 그룹만 남긴 뒤 같은 상태의 그룹을 병합합니다.
+        """
+        codes = np.array(
+            [BulkSpacedRepetitionService.DIFFICULTY_CODES[d] for d in self.outcome_probabilities],
+            dtype=np.int8
+        )
+        probabilities = np.array(list(self.outcome_probabilities.values()), dtype=np.float64)
+        expected = np.zeros(days, dtype=np.float64)
+
+        for day in range(days):
+            due = due_offsets == day
+            if not due.any():
+                continue
+            expected[day] = weights[due].sum()
+
+            count = int(due.sum())
+            result = self.bulk_service.calculate_next_review(
+                interval_days=np.repeat(intervals[due], len(codes)),
+                ease_factor=np.repeat(eases[due], len(codes)),
+                consecutive_correct=np.zeros(count * len(codes), dtype=np.int64),
+                consecutive_incorrect=np.zeros(count * len(codes), dtype=np.int64),
+                difficulties=np.tile(codes, count),
+                today=date(1970, 1, 1)
+            )
+            next_offsets = day + result['interval_days']
+            next_weights = np.repeat(weights[due], len(codes)) * np.tile(probabilities, count)
+            returning = (next_offsets < days) & (next_weights > 0)
+
+            due_offsets, intervals, eases, weights = self._merge(
+                np.concatenate([due_offsets[~due], next_offsets[returning]]),
+                np.concatenate([intervals[~due], result['interval_days'][returning]]),
+                np.concatenate([eases[~due], result['ease_factor'][returning]]),
+                np.concatenate([weights[~due], next_weights[returning]])
+            )
+
+        return expected
+
+    @staticmethod
+    def _merge(
+        due_offsets: np.ndarray,
+        intervals: np.ndarray,
+        eases: np.ndarray,
+        weights: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """같은 (복습 예정일, 간격, Ease Factor) 그룹의 가중치 병합"""
+        if len(due_offsets) == 0:
+            return due_offsets, intervals, eases, weights
+        keys = np.column_stack([due_offsets, intervals, eases])
+        unique_keys, inverse = np.unique(keys, axis=0, return_inverse=True)
+        merged_weights = np.bincount(inverse.ravel(), weights=weights)
+        return (
+            unique_keys[:, 0].astype(np.int64),
+            unique_keys[:, 1].astype(np.int64),
+            unique_keys[:, 2],
+            merged_weights
+        )
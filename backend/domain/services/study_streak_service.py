@@ -0,0 +1,136 @@
+"""
+연속 학습 일수 도메인 서비스
+일별 학습 롤업의 활동 날짜로 현재/최장 연속 학습 일수를 계산
+"""
+
+from datetime import date, timedelta
+from typing import Any, Dict, Optional
+import numpy as np
+from backend.infrastructure.repositories.user_streak_repository import SqliteUserStreakRepository
+
+
+class StudyStreakService:
+    """
+    연속 학습 일수 도메인 서비스
+
+    학습 활동이 저장될 때는 SqliteUserStreakRepository.record_activity가 마지막 학습 날짜와만
+    비교해 O(1)로 갱신합니다. 이 서비스는 조회 시점 기준의 현재 연속 일수를 계산하고,
+    과거 날짜 활동이나 끊긴 연속 기록을 반영하기 위해 전체 사용자를 한 번에 다시 계산합니다
+    (야간 배치, scripts/recompute_study_streaks.py).
+    """
+
+    def __init__(self, streak_repo: SqliteUserStreakRepository):
+        """
+        StudyStreakService 초기화
+
+        Args:
+            streak_repo: 사용자 연속 학습 일수 Repository
+        """
+        self.streak_repo = streak_repo
+
+    def get_streak(self, user_id: int, today: Optional[date] = None) -> Dict[str, Any]:
+        """
+        사용자의 연속 학습 일수 조회
+
+        저장된 현재 연속 일수는 마지막 학습 날짜 기준이므로, 어제도 오늘도 학습하지 않았다면
+        0으로 계산합니다 (오늘 아직 학습하지 않았어도 어제까지의 연속 기록은 유지).
+
+        Args:
+            user_id: 사용자 ID
+            today: 기준 날짜 (None이면 오늘)
+
+        Returns:
+            Dict[str, Any]: current_streak, longest_streak, last_study_date, studied_today
+        """
+        if today is None:
+            today = date.today()
+
+        streak = self.streak_repo.find_by_user_id(user_id)
+        if streak is None or streak['last_study_date'] is None:
+            return {
+                'current_streak': 0,
+                'longest_streak': 0,
+                'last_study_date': None,
+                'studied_today': False
+            }
+
+        last_study_date = date.fromisoformat(streak['last_study_date'])
+        is_alive = last_study_date >= today - timedelta(days=1)
+        return {
+            'current_streak': streak['current_streak'] if is_alive else 0,
+            'longest_streak': streak['longest_streak'],
+            'last_study_date': streak['last_study_date'],
+            'studied_today': last_study_date == today
+        }
+
+    @staticmethod
+    def compute_streaks(user_ids: np.ndarray, days: np.ndarray, today: int) -> Dict[str, np.ndarray]:
+        """
+        사용자별 현재/최장 연속 학습 일수를 배열 연산으로 계산
+
+        (사용자, 날짜) 순으로 정렬된 학습한 날 배열에서 사용자가 바뀌거나 날짜가 하루 넘게
+        벌어지는 위치를 연속 구간의 시작으로 보고, 구간 길이의 사용자별 최댓값(최장)과
+        마지막 구간 길이(현재)를 구합니다.
+
+        Args:
+            user_ids: 사용자 ID 배열 (사용자 순 정렬)
+            days: 학습 날짜의 일 단위 정수 배열 (사용자 안에서 날짜 순 정렬, 중복 없음)
+            today: 기준 날짜의 일 단위 정수 (마지막 학습이 어제 이전이면 현재 연속 일수 0)
+
+        Returns:
+            Dict[str, np.ndarray]: user_id, current_streak, longest_streak, last_day 배열
+        """
+        count = len(user_ids)
+        if count == 0:
+            empty = np.array([], dtype=np.int64)
+            return {'user_id': empty, 'current_streak': empty, 'longest_streak': empty, 'last_day': empty}
+
+        user_starts = np.ones(count, dtype=bool)
+        user_starts[1:] = user_ids[1:] != user_ids[:-1]
+        run_starts = user_starts.copy()
+        run_starts[1:] |= np.diff(days) != 1
+
+        run_start_positions = np.flatnonzero(run_starts)
+        run_lengths = np.diff(np.append(run_start_positions, count))
+        # 각 사용자의 첫 구간 번호, 마지막 구간 번호, 마지막 학습 위치
+        first_runs = np.flatnonzero(user_starts[run_start_positions])
+        last_runs = np.append(first_runs[1:], len(run_lengths)) - 1
+        last_positions = np.append(np.flatnonzero(user_starts)[1:], count) - 1
+
+        last_days = days[last_positions]
+        return {
+            'user_id': user_ids[user_starts],
+            'current_streak': np.where(last_days >= today - 1, run_lengths[last_runs], 0),
+            'longest_streak': np.maximum.reduceat(run_lengths, first_runs),
+            'last_day': last_days
+        }
+
+    def recompute_all(self, today: Optional[date] = None) -> Dict[str, int]:
+        """
+        전체 사용자의 연속 학습 일수를 일별 롤업에서 다시 계산해 저장 (야간 배치)
+
+        Args:
+            today: 기준 날짜 (None이면 오늘)
+
+        Returns:
+            Dict[str, int]: users (학습 기록이 있는 사용자 수), active_streaks (연속 학습 중인 사용자 수)
+        """
+        if today is None:
+            today = date.today()
+
+        rows = self.streak_repo.find_active_days()
+        user_ids = np.array([row[0] for row in rows], dtype=np.int64)
+        days = np.array([row[1] for row in rows], dtype='datetime64[D]').astype(np.int64)
+        result = self.compute_streaks(user_ids, days, np.datetime64(today, 'D').astype(np.int64))
+
+        last_dates = result['last_day'].astype('datetime64[D]').astype(str)
+        self.streak_repo.replace_all(list(zip(
+            result['user_id'].tolist(),
+            result['current_streak'].tolist(),
+            result['longest_streak'].tolist(),
+            last_dates.tolist()
+        )))
+        return {
+            'users': len(result['user_id']),
+            'active_streaks': int(np.count_nonzero(result['current_streak']))
+        }
@@ -0,0 +1,266 @@
+"""
+시험 조립 도메인 서비스
+출제 계획(유형별 문제 수, 난이도 분포, 최대 노출률)을 레벨별 메모리 색인에서 한 번에 만족하는 문제 집합을 선택
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from backend.domain.entities.question import Question
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+from backend.infrastructure.repositories.test_repository import SqliteTestRepository
+
+# 문제 유형 <-> 색인 배열의 정수 코드
+_TYPE_CODES = {question_type: code for code, question_type in enumerate(QuestionType)}
+
+
+class TestBlueprint:
+    """
+    시험 출제 계획
+
+    - type_counts: 유형별 문제 수 (None이면 question_types 안에서 유형 구분 없이 question_count개)
+    - difficulty_distribution: 난이도(1-5)별 비율 (None이면 난이도 구분 없음, 합이 1이 아니어도 비율로 정규화)
+    - max_exposure_rate: 문제별 최대 노출률 (출제된 시험 수 / 해당 레벨 시험 수, None이면 제한 없음)
+    """
+
+    def __init__(
+        self,
+        type_counts: Optional[Dict[QuestionType, int]] = None,
+        question_count: int = 20,
+        question_types: Optional[List[QuestionType]] = None,
+        difficulty_distribution: Optional[Dict[int, float]] = None,
+        max_exposure_rate: Optional[float] = None
+    ):
+        """
+        TestBlueprint 초기화
+
+        Raises:
+            ValueError: 문제 수, 난이도 분포, 노출률이 올바르지 않은 경우
+        """
+        if type_counts is not None:
+            if not type_counts or any(count < 1 for count in type_counts.values()):
+                raise ValueError("유형별 문제 수는 1개 이상이어야 합니다")
+        elif question_count < 1:
+            raise ValueError("문제 수는 1개 이상이어야 합니다")
+
+        if difficulty_distribution is not None:
+            if any(d < 1 or d > 5 for d in difficulty_distribution):
+                raise ValueError("난이도 분포의 난이도는 1-5 사이여야 합니다")
+            if any(w < 0 for w in difficulty_distribution.values()) or sum(difficulty_distribution.values()) <= 0:
+                raise ValueError("난이도 분포의 비율은 0 이상이고 합이 0보다 커야 합니다")
+
+        if max_exposure_rate is not None and not 0 < max_exposure_rate <= 1:
+            raise ValueError("최대 노출률은 0 초과 1 이하여야 합니다")
+
+        self.type_counts = type_counts
+        self.question_count = sum(type_counts.values()) if type_counts is not None else question_count
+        self.question_types = question_types
+        self.difficulty_distribution = difficulty_distribution
+        self.max_exposure_rate = max_exposure_rate
+
+    def difficulty_targets(self, count: int) -> Dict[int, int]:
+        """
+        count개를 난이도 분포에 따라 난이도별 문제 수로 나눔 (최대 잔여 방식, 난이도 구분이 없으면 {0: count})
+        """
+        if self.difficulty_distribution is None:
+            return {0: count}
+        difficulties = sorted(self.difficulty_distribution)
+        weights = np.array([self.difficulty_distribution[d] for d in difficulties], dtype=np.float64)
+        raw = count * weights / weights.sum()
+        targets = np.floor(raw).astype(np.int64)
+        # 소수부가 큰 난이도부터 남은 문제를 하나씩 배정 (같으면 쉬운 난이도 우선)
+        for i in np.argsort(-(raw - targets), kind='stable')[:count - int(targets.sum())]:
+            targets[i] += 1
+        return {d: int(t) for d, t in zip(difficulties, targets)}
+
+
+class AssemblyIndex:
+    """
+    레벨별 시험 조립 색인
+
+    문제 ID, 유형 코드, 난이도와 문제별 노출 횟수(int32)를 같은 위치의 배열로 보관합니다.
+    노출 횟수는 색인을 만들 때 저장된 시험에서 읽고, 이후 조립할 때마다 메모리에서 증가시킵니다.
+    """
+
+    def __init__(self, rows: List[Tuple[int, str, int]], tests_assembled: int, exposure: Dict[int, int]):
+        """
+        AssemblyIndex 초기화
+
+        Args:
+            rows: (문제 ID, 문제 유형, 난이도) 목록
+            tests_assembled: 해당 레벨 시험 수
+            exposure: 문제 ID -> 출제된 시험 수
+        """
+        self.question_ids = np.array([row[0] for row in rows], dtype=np.int64)
+        self.type_codes = np.array([_TYPE_CODES[QuestionType(row[1])] for row in rows], dtype=np.int8)
+        self.difficulty = np.array([row[2] for row in rows], dtype=np.int8)
+        self.exposure = np.array([exposure.get(row[0], 0) for row in rows], dtype=np.int32)
+        self.tests_assembled = tests_assembled
+
+    def __len__(self) -> int:
+        return len(self.question_ids)
+
+    def record(self, positions: np.ndarray) -> None:
+        """조립한 시험 하나의 노출 기록"""
+        self.exposure[positions] += 1
+        self.tests_assembled += 1
+
+
+class TestAssemblyService:
+    """
+    시험 조립 도메인 서비스
+
+    레벨의 모든 문제를 (유형, 난이도 층, 노출률 초과 여부, 노출 횟수, 난수) 순으로 한 번 정렬하면
+    출제 계획의 각 (유형, 난이도) 칸은 정렬 결과의 연속 구간이 되고, 구간 앞에서부터 필요한 수만큼
+    가져오면 됩니다. 노출률을 넘기게 될 문제는 다른 문제가 부족할 때만 노출 횟수가 적은 순으로 쓰고,
+    난이도 칸의 문제가 부족하면 같은 유형의 가까운 난이도에서 채웁니다.
+    """
+
+    CACHE_TTL_SECONDS = 600  # 색인 캐시 유효 시간 (초)
+
+    # (데이터베이스 경로, 레벨) -> (저장 시각, 색인)
+    _indexes: Dict[Tuple[str, str], Tuple[float, AssemblyIndex]] = {}
+
+    def __init__(
+        self,
+        question_repo: SqliteQuestionRepository,
+        test_repo: SqliteTestRepository,
+        rng: Optional[np.random.Generator] = None
+    ):
+        """
+        TestAssemblyService 초기화
+
+        Args:
+            question_repo: 문제 Repository (색인, 선택한 문제 로드)
+            test_repo: 시험 Repository (노출 횟수)
+            rng: 난수 생성기 (테스트용, None이면 새로 생성)
+        """
+        self.question_repo = question_repo
+        self.test_repo = test_repo
+        self.rng = rng or np.random.default_rng()
+
+    def assemble(self, level: JLPTLevel, blueprint: TestBlueprint) -> List[Question]:
+        """
+        출제 계획에 맞는 문제 선택 (선택한 문제는 노출 횟수에 반영)
+
+        Args:
+            level: JLPT 레벨
+            blueprint: 출제 계획
+
+        Returns:
+            List[Question]: 섞인 순서의 문제 목록
+
+        Raises:
+            ValueError: 유형별 문제가 부족한 경우
+        """
+        for attempt in range(2):
+            index = self.get_index(level)
+            positions = self.select(index, blueprint, self.rng)
+            question_ids = index.question_ids[positions].tolist()
+            questions = self.question_repo.find_by_ids(question_ids)
+            if len(questions) == len(question_ids):
+                index.record(positions)
+                return questions
+            # 색인을 만든 뒤 삭제된 문제가 있으면 색인을 새로 만들어 한 번 더 시도
+            self.invalidate(level)
+        raise ValueError("문제 색인이 변경되어 시험을 조립하지 못했습니다. 다시 시도해주세요.")
+
+    @staticmethod
+    def select(index: AssemblyIndex, blueprint: TestBlueprint, rng: np.random.Generator) -> np.ndarray:
+        """
+        출제 계획을 만족하는 색인 위치 선택
+
+        Args:
+            index: 레벨 색인
+            blueprint: 출제 계획
+            rng: 난수 생성기
+
+        Returns:
+            np.ndarray: 선택한 색인 위치 (섞인 순서)
+
+        Raises:
+            ValueError: 유형별 문제가 부족한 경우
+        """
+        if blueprint.type_counts is not None:
+            type_keys = index.type_codes.astype(np.int64)
+            type_targets = {_TYPE_CODES[t]: (t.value, count) for t, count in blueprint.type_counts.items()}
+        else:
+            # 유형 구분 없음: 허용 유형은 0, 나머지는 -1 (선택 대상 아님)
+            type_keys = np.zeros(len(index), dtype=np.int64)
+            if blueprint.question_types:
+                allowed = [_TYPE_CODES[t] for t in blueprint.question_types]
+                type_keys[~np.isin(index.type_codes, allowed)] = -1
+            type_targets = {0: ("모든 유형", blueprint.question_count)}
+
+        strata = index.difficulty.astype(np.int64) if blueprint.difficulty_distribution else np.zeros(len(index), dtype=np.int64)
+
+        # 이번 시험에 넣으면 최대 노출률을 넘는 문제는 뒤로, 그중에서는 노출이 적은 문제부터
+        if blueprint.max_exposure_rate is not None:
+            over = (index.exposure + 1) / (index.tests_assembled + 1) > blueprint.max_exposure_rate
+        else:
+            over = np.zeros(len(index), dtype=bool)
+        penalty = np.where(over, index.exposure, 0)
+
+        order = np.lexsort((rng.random(len(index)), penalty, over, strata, type_keys))
+        cell_keys = type_keys[order] * 8 + strata[order]
+
+        selected = []
+        for type_key, (type_name, count) in type_targets.items():
+            type_start, type_end = np.searchsorted(cell_keys, [type_key * 8, type_key * 8 + 8])
+            if type_end - type_start < count:
+                raise ValueError(
+                    f"유형 {type_name}에 대해 요청한 문제 수({count})보다 적은 문제"
+                    f"({type_end - type_start})만 사용 가능합니다. (문제 수 부족)"
+                )
+
+            targets = blueprint.difficulty_targets(count)
+            stratum_values = sorted(set(targets) | set(np.unique(strata[order[type_start:type_end]]).tolist()))
+            bounds = {
+                s: tuple(np.searchsorted(cell_keys, [type_key * 8 + s, type_key * 8 + s + 1]))
+                for s in stratum_values
+            }
+            available = {s: int(bounds[s][1] - bounds[s][0]) for s in stratum_values}
+            take = {s: min(targets.get(s, 0), available[s]) for s in stratum_values}
+
+            # 부족한 난이도 칸은 가까운 난이도부터 (같으면 쉬운 쪽) 남은 문제로 채움
+            for s, target in targets.items():
+                missing = target - min(target, available[s])
+                for other in sorted(stratum_values, key=lambda o: (abs(o - s), o)):
+                    if missing == 0:
+                        break
+                    extra = min(missing, available[other] - take[other])
+                    take[other] += extra
+                    missing -= extra
+
+            for s in stratum_values:
+                start = bounds[s][0]
+                selected.append(order[start:start + take[s]])
+
+        positions = np.concatenate(selected) if selected else np.array([], dtype=np.int64)
+        rng.shuffle(positions)
+        return positions
+
+    def get_index(self, level: JLPTLevel) -> AssemblyIndex:
+        """레벨 색인 (캐시 유효 시간 안에서는 메모리에서 반환)"""
+        key = (self.question_repo.db.db_path, level.value)
+        cached = self._indexes.get(key)
+        if cached and time.monotonic() - cached[0] < self.CACHE_TTL_SECONDS:
+            return cached[1]
+
+        tests_assembled, exposure = self.test_repo.find_question_exposure(level)
+        index = AssemblyIndex(self.question_repo.find_assembly_index(level), tests_assembled, exposure)
+        self._indexes[key] = (time.monotonic(), index)
+        return index
+
+    @classmethod
+    def invalidate(cls, level: Optional[JLPTLevel] = None) -> None:
+        """
+        색인 캐시 무효화
+
+        Args:
+            level: 문제가 변경된 레벨 (None이면 모든 레벨)
+        """
+        for key in list(cls._indexes):
+            if level is None or key[1] == level.value:
+                cls._indexes.pop(key, None)
@@ -4,9 +4,15 @@ gTTS를 사용하여 텍스트를 오디오 파일로 변환하는 비즈니스
 """
 
 import hashlib
+import os
+import re
+import tempfile
 from pathlib import Path
-from typing import Optional
-from gtts import gTTS
+from typing import TYPE_CHECKING, Optional
+from backend.infrastructure.adapters.tts_engine import GTTSEngine, TTSEngine
+
+if TYPE_CHECKING:
+    from backend.infrastructure.adapters.tts_cache import TTSCacheManager
 
 
 class TTSService:
@@ -20,8 +26,59 @@ class TTSService:
     - 자동 캐싱: 같은 텍스트는 재생성하지 않음 (해시 기반)
     - 일본어 지원: JLPT 문제에 최적화
     - 에러 처리: TTS 생성 실패 시 예외 발생
+    - 원자적 저장: 임시 파일에 쓴 뒤 이름을 바꾸므로 중단되어도 불완전한 파일이 남지 않음
+    
+    합성 엔진은 engine 클래스 속성으로 교체할 수 있습니다 (예: 테스트에서 StubTTSEngine).
+    cache 클래스 속성에 TTSCacheManager를 설정하면(애플리케이션 시작 시) 기본 디렉토리의
+    파일 생성/적중을 매니페스트에 기록하고 예산을 넘으면 오래된 파일을 제거합니다.
+    여러 텍스트를 한꺼번에 만들 때는 TTSRenderPool을 사용합니다.
     """
     
+    AUDIO_URL_PREFIX = "/static/audio/tts/"
+    engine: TTSEngine = GTTSEngine()
+    cache: Optional['TTSCacheManager'] = None
+    
+    @staticmethod
+    def default_output_dir() -> Path:
+        """기본 출력 디렉토리 (backend/static/audio/tts)"""
+        backend_dir = Path(__file__).parent.parent.parent
+        return backend_dir / "static" / "audio" / "tts"
+    
+    @staticmethod
+    def audio_filename(text: str, language: str = 'ja', slow: bool = False) -> str:
+        """텍스트 해시 기반 파일명 (같은 텍스트/언어/속도는 같은 파일)"""
+        text_hash = hashlib.md5(f"{text}_{language}_{slow}".encode()).hexdigest()
+        return f"tts_{text_hash}.mp3"
+    
+    @staticmethod
+    def write_atomic(file_path: Path, data: bytes) -> None:
+        """같은 디렉토리의 임시 파일에 쓴 뒤 이름 바꾸기 (동시에 같은 파일을 써도 안전)"""
+        fd, tmp_path = tempfile.mkstemp(dir=file_path.parent, prefix=".tts_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+    
+    @staticmethod
+    def clean_text(text: str) -> str:
+        """청해 대화문에서 읽지 않을 표시 제거 ((会話) 표시, 줄바꿈, A:/B: 같은 화자 표시)"""
+        clean = text.replace('（会話）', '').replace('\n', ' ').strip()
+        return re.sub(r'[A-Z]:\s*', '', clean)
+    
+    @staticmethod
+    def listening_audio_text(question_text: str) -> str:
+        """
+        저장된 청해 문제 텍스트에서 오디오로 읽을 텍스트
+        
+        청해 문제 텍스트는 대화문과 질문이 빈 줄로 구분되어 있으므로 대화문만 사용합니다.
+        """
+        dialogue = question_text.rsplit("\n\n", 1)[0] if "\n\n" in question_text else question_text
+        return TTSService.clean_text(dialogue)
+    
     @staticmethod
     def generate_audio(
         text: str,
@@ -48,33 +105,34 @@ class TTSService:
         if not text or not text.strip():
             raise ValueError("텍스트는 비어있을 수 없습니다")
         
-        # 출력 디렉토리 설정
-        if output_dir is None:
-            backend_dir = Path(__file__).parent.parent.parent
-            output_dir = backend_dir / "static" / "audio" / "tts"
-        else:
-            output_dir = Path(output_dir)
-        
+        # 출력 디렉토리 설정 (캐시 매니페스트는 기본 디렉토리만 관리)
+        cache = TTSService.cache if output_dir is None else None
+        output_dir = TTSService.default_output_dir() if output_dir is None else Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # 파일명 생성 (텍스트 해시 기반으로 중복 방지 및 캐싱)
-        text_hash = hashlib.md5(f"{text}_{language}_{slow}".encode()).hexdigest()
-        filename = f"tts_{text_hash}.mp3"
+        filename = TTSService.audio_filename(text, language, slow)
         file_path = output_dir / filename
         
         # 이미 존재하는 파일이면 재생성하지 않음 (캐싱)
         if file_path.exists():
-            return f"/static/audio/tts/{filename}"
+            if cache:
+                cache.hit(filename)
+            return f"{TTSService.AUDIO_URL_PREFIX}{filename}"
         
         # TTS 생성
+        if cache:
+            cache.miss()
         try:
-            tts = gTTS(text=text, lang=language, slow=slow)
-            tts.save(str(file_path))
+            audio = TTSService.engine.synthesize(text, language, slow)
         except Exception as e:
             raise Exception(f"TTS 생성 실패: {str(e)}")
+        TTSService.write_atomic(file_path, audio)
+        if cache:
+            cache.store(filename, len(audio))
         
         # 상대 경로 반환
-        return f"/static/audio/tts/{filename}"
+        return f"{TTSService.AUDIO_URL_PREFIX}{filename}"
     
     @staticmethod
     def delete_audio(audio_url: str) -> bool:
@@ -87,9 +145,14 @@ class TTSService:
         Returns:
             bool: 삭제 성공 여부
         """
+        if not audio_url or not audio_url.startswith(TTSService.AUDIO_URL_PREFIX):
+            return False
+        
         try:
-            backend_dir = Path(__file__).parent.parent.parent
-            file_path = backend_dir / "static" / audio_url.lstrip("/static/")
+            filename = audio_url[len(TTSService.AUDIO_URL_PREFIX):]
+            file_path = TTSService.default_output_dir() / filename
+            if TTSService.cache:
+                TTSService.cache.forget(filename)
             
             if file_path.exists():
                 file_path.unlink()
@@ -55,3 +55,23 @@ class MemorizationStatus(Enum):
 
     def __str__(self) -> str:
         return self.value
+
+
+class ImportJobType(Enum):
+    """임포트 작업 대상 열거형"""
+    QUESTIONS = "questions"    # 기출문제
+    VOCABULARY = "vocabulary"  # 단어
+
+    def __str__(self) -> str:
+        return self.value
+
+
+class ImportJobStatus(Enum):
+    """임포트 작업 상태 열거형"""
+    PENDING = "pending"      # 대기 중
+    RUNNING = "running"      # 진행 중
+    COMPLETED = "completed"  # 완료됨
+    FAILED = "failed"        # 실패
+
+    def __str__(self) -> str:
+        return self.value
@@ -0,0 +1,143 @@
+"""
+오디오 메타데이터 어댑터
+오디오 바이트 크기, 재생 시간(MP3 프레임 헤더 기준), 콘텐츠 해시 ETag 계산
+"""
+
+import hashlib
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# backend/static (정적 파일 마운트 루트)
+STATIC_DIR = Path(__file__).resolve().parent.parent.parent / "static"
+STATIC_URL_PREFIX = "/static/"
+
+# MPEG 버전 비트 -> 버전 (1: 예약값)
+_MPEG_VERSIONS = {0: 2.5, 2: 2, 3: 1}
+# 레이어 비트 -> 레이어 (0: 예약값)
+_MPEG_LAYERS = {1: 3, 2: 2, 3: 1}
+# 비트레이트 (kbps): (MPEG 버전 1 여부, 레이어) -> 인덱스별 값 (0: free, 15: 잘못된 값)
+_BITRATES = {
+    (True, 1): (0, 32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (True, 2): (0, 32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (True, 3): (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (False, 1): (0, 32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (False, 2): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (False, 3): (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_SAMPLE_RATES = {1: (44100, 48000, 32000), 2: (22050, 24000, 16000), 2.5: (11025, 12000, 8000)}
+# 첫 프레임을 찾을 때 ID3 태그 뒤에서 건너뛸 수 있는 최대 바이트 수
+_MAX_SYNC_SCAN = 64 * 1024
+
+
+def _parse_frame_header(data: bytes, pos: int) -> Optional[tuple]:
+    """pos 위치의 MPEG 오디오 프레임 헤더 해석 -> (프레임 길이, 샘플 수, 샘플레이트), 프레임이 아니면 None"""
+    if pos + 4 > len(data):
+        return None
+    header = int.from_bytes(data[pos:pos + 4], "big")
+    if (header >> 21) & 0x7FF != 0x7FF:
+        return None
+    version = _MPEG_VERSIONS.get((header >> 19) & 0x3)
+    layer = _MPEG_LAYERS.get((header >> 17) & 0x3)
+    bitrate_index = (header >> 12) & 0xF
+    sample_rate_index = (header >> 10) & 0x3
+    if version is None or layer is None or bitrate_index in (0, 15) or sample_rate_index == 3:
+        return None
+
+    bitrate = _BITRATES[(version == 1, layer)][bitrate_index] * 1000
+    sample_rate = _SAMPLE_RATES[version][sample_rate_index]
+    padding = (header >> 9) & 0x1
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 576 if layer == 3 and version != 1 else 1152
+        length = samples // 8 * bitrate // sample_rate + padding
+    return length, samples, sample_rate
+
+
+def mp3_duration_ms(data: bytes) -> Optional[int]:
+    """
+    MP3 재생 시간 (밀리초)
+
+    ID3v2 태그를 건너뛰고 프레임 헤더를 따라가며 샘플 수를 합산하므로 CBR/VBR 모두 정확합니다.
+    MP3가 아니면 None을 반환합니다.
+    """
+    pos = 0
+    if data[:3] == b"ID3" and len(data) >= 10:
+        size = 0
+        for byte in data[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        pos = 10 + size + (10 if data[5] & 0x10 else 0)
+
+    scan_end = min(len(data), pos + _MAX_SYNC_SCAN)
+    while pos < scan_end and _parse_frame_header(data, pos) is None:
+        pos += 1
+
+    total_ms = 0.0
+    frames = 0
+    while True:
+        frame = _parse_frame_header(data, pos)
+        if frame is None:
+            break
+        length, samples, sample_rate = frame
+        total_ms += samples * 1000 / sample_rate
+        frames += 1
+        pos += length
+    return round(total_ms) if frames else None
+
+
+@dataclass(frozen=True)
+class AudioMetadata:
+    """오디오 파일 메타데이터 (문제에 저장해 청해 API가 파일 시스템을 조회하지 않도록 함)"""
+    size_bytes: int
+    duration_ms: Optional[int]
+    etag: str
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'AudioMetadata':
+        """오디오 바이트로부터 계산 (ETag는 콘텐츠 SHA-256)"""
+        return cls(
+            size_bytes=len(data),
+            duration_ms=mp3_duration_ms(data),
+            etag=hashlib.sha256(data).hexdigest()
+        )
+
+    @classmethod
+    def from_file(cls, path: Path) -> Optional['AudioMetadata']:
+        """파일로부터 계산 (파일이 없으면 None)"""
+        try:
+            return cls.from_bytes(Path(path).read_bytes())
+        except (FileNotFoundError, IsADirectoryError):
+            return None
+
+    @classmethod
+    def from_url(cls, audio_url: Optional[str]) -> Optional['AudioMetadata']:
+        """정적 파일 URL(/static/...)로부터 계산 (정적 파일이 아니거나 없으면 None)"""
+        path = resolve_static_path(audio_url)
+        return cls.from_file(path) if path else None
+
+    @classmethod
+    def fields_for_url(cls, audio_url: Optional[str]) -> Dict[str, Any]:
+        """Question.attach_audio에 넘길 메타데이터 인자 (파일이 없으면 빈 dict)"""
+        metadata = cls.from_url(audio_url)
+        return metadata.to_dict() if metadata else {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Question.attach_audio 인자 형식 (audio_size_bytes, audio_duration_ms, audio_etag)"""
+        return {f"audio_{key}": value for key, value in asdict(self).items()}
+
+
+def resolve_static_path(audio_url: Optional[str], static_dir: Optional[Path] = None) -> Optional[Path]:
+    """
+    정적 파일 URL을 파일 경로로 변환
+
+    /static/ 으로 시작하지 않거나 정적 디렉토리 밖을 가리키면(../ 등) None을 반환합니다.
+    """
+    if not audio_url or not audio_url.startswith(STATIC_URL_PREFIX):
+        return None
+    root = (static_dir or STATIC_DIR).resolve()
+    path = (root / audio_url[len(STATIC_URL_PREFIX):]).resolve()
+    if path == root or root not in path.parents:
+        return None
+    return path
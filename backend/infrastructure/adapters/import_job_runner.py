@@ -0,0 +1,210 @@
+"""
+백그라운드 임포트 작업 실행기
+업로드 파일을 보관하고, 청크 단위로 임포트하며 체크포인트를 기록/재개
+"""
+
+import copy
+import logging
+import os
+import shutil
+import uuid
+from datetime import datetime, timedelta
+from typing import IO, Any, Dict, List, Optional
+from backend.domain.entities.import_job import ImportJob
+from backend.domain.value_objects.jlpt import ImportJobStatus, ImportJobType
+from backend.infrastructure.adapters.streaming_importer import StreamingImporter
+from backend.infrastructure.adapters.streaming_question_importer import StreamingQuestionImporter
+from backend.infrastructure.adapters.streaming_vocabulary_importer import StreamingVocabularyImporter
+from backend.infrastructure.config.database import Database, get_database
+from backend.infrastructure.repositories.import_job_repository import SqliteImportJobRepository
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+
+logger = logging.getLogger(__name__)
+
+
+class ImportJobRunner:
+    """
+    백그라운드 임포트 작업 실행기
+
+    업로드 파일은 데이터베이스 옆의 import_jobs 디렉토리에 보관되고, 작업은 import_jobs 테이블에 기록됩니다.
+    배치를 커밋할 때마다 처리 건수(체크포인트)를 저장하므로, 워커가 중단되면 다음 실행에서
+    체크포인트 이후 레코드부터 재개합니다. 체크포인트 직전에 커밋된 배치가 다시 처리되더라도
+    콘텐츠 해시 업서트로 중복 행이 생기지 않습니다.
+    """
+
+    STALE_TIMEOUT = timedelta(minutes=5)  # 진행 기록이 없으면 중단된 것으로 보는 시간
+    MAX_ATTEMPTS = 3  # 작업당 최대 실행 시도 횟수
+    COPY_BUFFER_SIZE = 1024 * 1024  # 업로드 파일 복사 단위 (바이트)
+    UPLOAD_DIR_NAME = "import_jobs"
+
+    def __init__(
+        self,
+        db: Optional[Database] = None,
+        batch_size: int = StreamingImporter.DEFAULT_BATCH_SIZE,
+        stale_timeout: Optional[timedelta] = None
+    ):
+        """
+        ImportJobRunner 초기화
+
+        Args:
+            db: 데이터베이스 (기본값: 전역 데이터베이스)
+            batch_size: 트랜잭션(체크포인트)당 처리 건수
+            stale_timeout: 중단된 작업 판정 시간 (기본값: STALE_TIMEOUT)
+        """
+        self.db = db or get_database()
+        self.batch_size = batch_size
+        self.stale_timeout = stale_timeout or self.STALE_TIMEOUT
+        self.job_repo = SqliteImportJobRepository(self.db)
+
+    @property
+    def upload_dir(self) -> str:
+        """업로드 파일 보관 디렉토리"""
+        return os.path.join(os.path.dirname(self.db.db_path), self.UPLOAD_DIR_NAME)
+
+    def create_job(
+        self,
+        job_type: ImportJobType,
+        stream: IO[bytes],
+        filename: str,
+        created_by: Optional[int] = None
+    ) -> ImportJob:
+        """
+        업로드 스트림을 보관하고 대기 중인 작업 생성
+
+        파일 전체를 메모리에 올리지 않고 COPY_BUFFER_SIZE 단위로 복사합니다.
+
+        Args:
+            job_type: 임포트 대상
+            stream: 업로드 바이너리 스트림
+            filename: 원본 파일명 (확장자로 형식 감지)
+            created_by: 작업을 생성한 사용자 ID
+
+        Raises:
+            ValueError: 지원하지 않는 파일 형식인 경우
+        """
+        file_type = StreamingImporter.detect_file_type(filename)
+        os.makedirs(self.upload_dir, exist_ok=True)
+        file_path = os.path.join(self.upload_dir, f"{uuid.uuid4().hex}.{file_type}")
+
+        with open(file_path, 'wb') as f:
+            shutil.copyfileobj(stream, f, self.COPY_BUFFER_SIZE)
+
+        job = ImportJob(
+            id=None,
+            job_type=job_type,
+            file_path=file_path,
+            file_type=file_type,
+            original_filename=filename,
+            created_by=created_by
+        )
+        return self.job_repo.save(job)
+
+    def run(self, job_id: int, now: Optional[datetime] = None) -> Optional[ImportJob]:
+        """
+        작업 실행 (대기 중이거나 중단된 작업만)
+
+        다른 워커가 먼저 실행 권한을 가져갔거나 실행할 수 없는 상태면 None을 반환합니다.
+
+        Args:
+            job_id: 작업 ID
+            now: 기준 시각 (기본값: 현재 시각)
+
+        Returns:
+            실행을 마친 작업 (완료/실패/재시도 대기) 또는 None
+        """
+        now = now or datetime.now()
+        previous = self.job_repo.find_by_id(job_id)
+        if previous is None:
+            return None
+        if previous.status != ImportJobStatus.PENDING and not previous.is_stale(now, self.stale_timeout):
+            return None
+
+        job = copy.deepcopy(previous)
+        if job.attempts >= self.MAX_ATTEMPTS:
+            job.fail(f"최대 실행 시도 횟수({self.MAX_ATTEMPTS}회)를 초과했습니다", now=now)
+            self.job_repo.save(job)
+            self._remove_file(job)
+            return job
+
+        job.start(now)
+        if not self.job_repo.claim(job, previous):
+            return None
+        return self._execute(job)
+
+    def run_pending(self, now: Optional[datetime] = None) -> List[ImportJob]:
+        """
+        대기 중인 작업과 중단된 작업을 순서대로 실행
+
+        Returns:
+            실행한 작업 목록
+        """
+        finished = []
+        for job in self.job_repo.find_unfinished():
+            result = self.run(job.id, now=now)
+            if result is not None:
+                finished.append(result)
+        return finished
+
+    def _build_importer(self, job_type: ImportJobType) -> StreamingImporter:
+        """작업 유형에 맞는 스트리밍 임포트 어댑터 생성"""
+        if job_type == ImportJobType.VOCABULARY:
+            return StreamingVocabularyImporter(
+                SqliteVocabularyRepository(self.db), batch_size=self.batch_size
+            )
+        return StreamingQuestionImporter(
+            SqliteQuestionRepository(self.db), batch_size=self.batch_size
+        )
+
+    def _execute(self, job: ImportJob) -> ImportJob:
+        """체크포인트 이후 레코드를 임포트하고 결과 기록"""
+        importer = self._build_importer(job.job_type)
+        # 이전 실행까지의 누적값 (이번 실행의 요약을 더해 기록)
+        base_imported = job.rows_imported
+        base_duplicates = job.rows_duplicates
+        base_rejected = job.rows_rejected
+        base_errors = list(job.errors)
+        base_elapsed = job.elapsed_seconds
+
+        def on_checkpoint(rows_processed: int, summary: Dict[str, Any]) -> None:
+            job.record_progress(
+                rows_processed=rows_processed,
+                rows_imported=base_imported + summary['imported'],
+                rows_duplicates=base_duplicates + summary['duplicates'],
+                rows_rejected=base_rejected + summary['rejected'],
+                errors=(base_errors + summary['errors'])[:importer.max_errors],
+                elapsed_seconds=base_elapsed + summary['elapsed_seconds']
+            )
+            self.job_repo.save(job)
+
+        try:
+            importer.import_file(
+                job.file_path,
+                job.file_type,
+                skip=job.rows_processed,
+                on_checkpoint=on_checkpoint
+            )
+        except (ValueError, OSError) as e:
+            # 파일 구조 오류/파일 없음: 재시도해도 같은 결과이므로 실패 처리
+            job.fail(str(e))
+        except Exception as e:
+            logger.exception("임포트 작업 %s 실행 중 오류", job.id)
+            if job.attempts >= self.MAX_ATTEMPTS:
+                job.fail(str(e))
+            else:
+                job.release()
+        else:
+            job.complete()
+
+        self.job_repo.save(job)
+        if job.is_finished:
+            self._remove_file(job)
+        return job
+
+    @staticmethod
+    def _remove_file(job: ImportJob) -> None:
+        """종료된 작업의 업로드 파일 삭제"""
+        try:
+            os.remove(job.file_path)
+        except FileNotFoundError:
+            pass
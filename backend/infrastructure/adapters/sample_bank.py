@@ -0,0 +1,363 @@
+"""
+샘플 문제 뱅크
+data/*.json 샘플 데이터를 레벨/난이도 인덱스가 포함된 바이너리 스냅샷으로 컴파일하고,
+스냅샷을 메모리 매핑해 필요한 구간만 지연 로드
+"""
+
+import json
+import logging
+import mmap
+import os
+import pickle
+import random
+import struct
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import numpy as np
+from backend.domain.value_objects.jlpt import JLPTLevel
+
+logger = logging.getLogger(__name__)
+
+
+def sample_difficulty(kind: str, level: JLPTLevel, record: Dict[str, Any]) -> int:
+    """
+    샘플로 생성되는 문제의 난이도
+
+    독해/청해 샘플은 difficulty 필드를 사용하고, 어휘/문법은 레벨로 정합니다.
+    """
+    if kind == 'vocabulary':
+        return 1 if level == JLPTLevel.N5 else 2
+    if kind == 'grammar':
+        return 2 if level == JLPTLevel.N5 else 3
+    return record.get('difficulty', 2)
+
+
+class StaleSampleBankError(ValueError):
+    """스냅샷이 원본 JSON 파일과 다르거나 형식이 올바르지 않을 때"""
+
+
+class _LevelRecords(Mapping):
+    """레벨별 샘플 목록 (접근한 레벨만 로드)"""
+
+    def __init__(self, bank: 'SampleBank', kind: str):
+        self._bank = bank
+        self._kind = kind
+
+    def __getitem__(self, level: JLPTLevel) -> List[Dict[str, Any]]:
+        if (self._kind, level.value) not in self._bank._sections:
+            raise KeyError(level)
+        return self._bank.records(self._kind, level)
+
+    def __iter__(self) -> Iterator[JLPTLevel]:
+        return iter(self._bank.levels(self._kind))
+
+    def __len__(self) -> int:
+        return len(self._bank.levels(self._kind))
+
+
+class SampleBank:
+    """
+    샘플 문제 뱅크
+
+    유형(어휘/문법/독해/청해)과 레벨별 샘플 목록, 그리고 난이도별 샘플 인덱스 배열을 제공합니다.
+
+    스냅샷 파일 형식:
+        MAGIC(8바이트) + 헤더 길이(uint32) + JSON 헤더 + 본문
+        본문에는 (유형, 레벨)별로 pickle된 샘플 목록과 난이도별 int32 인덱스 배열이 들어 있고,
+        헤더에 각 구간의 오프셋/길이와 원본 파일 지문(크기, 수정 시각)이 기록됩니다.
+
+    스냅샷을 열 때는 헤더만 읽고, 샘플 목록은 처음 접근할 때 해당 구간만 역직렬화하며,
+    인덱스 배열은 복사 없이 메모리 매핑된 numpy 배열로 사용합니다.
+    따라서 난이도별 무작위 추출은 O(1)입니다.
+    """
+
+    MAGIC = b"JLPTSB01"
+    SNAPSHOT_NAME = "sample_bank.bin"
+    SOURCES = {
+        'vocabulary': 'sample_vocabulary_for_questions.json',
+        'grammar': 'sample_grammar_patterns.json',
+        'reading': 'sample_reading_questions.json',
+        'listening': 'sample_listening_questions.json',
+    }
+    _INDEX_DTYPE = np.dtype('<i4')
+
+    def __init__(
+        self,
+        sections: Dict[Tuple[str, str], Dict[str, Any]],
+        sources: Dict[str, Dict[str, int]],
+        buffer: Optional[mmap.mmap] = None,
+        records: Optional[Dict[Tuple[str, str], List[Dict[str, Any]]]] = None,
+        indexes: Optional[Dict[Tuple[str, str], Dict[int, np.ndarray]]] = None
+    ):
+        """
+        SampleBank 초기화 (from_json, open 사용)
+
+        Args:
+            sections: (유형, 레벨) -> {offset, length, count, indexes: {난이도: {offset, count}}}
+            sources: 원본 파일 지문
+            buffer: 메모리 매핑된 스냅샷 (스냅샷에서 연 경우)
+            records: 로드된 샘플 목록
+            indexes: 난이도별 인덱스 배열
+        """
+        self._sections = sections
+        self.sources = sources
+        self._buffer = buffer
+        self._records = records if records is not None else {}
+        self._indexes = indexes if indexes is not None else {}
+        self._body_start = self._read_body_start(buffer) if buffer is not None else 0
+
+    @property
+    def is_snapshot(self) -> bool:
+        """스냅샷에서 로드했는지 여부"""
+        return self._buffer is not None
+
+    # ---------- 생성/로드 ----------
+
+    @classmethod
+    def load(cls, data_dir: Path) -> 'SampleBank':
+        """
+        샘플 뱅크 로드
+
+        data_dir에 최신 스냅샷이 있으면 메모리 매핑으로 열고,
+        없거나 원본 JSON과 다르면 JSON 파일에서 구성합니다.
+        """
+        snapshot_path = Path(data_dir) / cls.SNAPSHOT_NAME
+        if snapshot_path.exists():
+            try:
+                return cls.open(snapshot_path, data_dir=data_dir)
+            except StaleSampleBankError as e:
+                logger.warning(f"샘플 뱅크 스냅샷을 사용하지 않습니다: {str(e)}")
+        return cls.from_json(data_dir)
+
+    @classmethod
+    def from_json(cls, data_dir: Path) -> 'SampleBank':
+        """JSON 샘플 파일에서 구성 (없는 파일은 빈 유형)"""
+        data_dir = Path(data_dir)
+        sections: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        records: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        indexes: Dict[Tuple[str, str], Dict[int, np.ndarray]] = {}
+
+        for kind, file_name in cls.SOURCES.items():
+            data_file = data_dir / file_name
+            if not data_file.exists():
+                continue
+            with open(data_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+
+            for level_str, items in data.items():
+                try:
+                    level = JLPTLevel(level_str)
+                except ValueError:
+                    continue
+                key = (kind, level.value)
+                records[key] = items
+                indexes[key] = cls._build_indexes(kind, level, items)
+                sections[key] = {'count': len(items)}
+
+        return cls(sections, cls._fingerprint(data_dir), records=records, indexes=indexes)
+
+    @classmethod
+    def open(cls, path: Path, data_dir: Optional[Path] = None) -> 'SampleBank':
+        """
+        스냅샷 열기 (메모리 매핑)
+
+        Args:
+            path: 스냅샷 파일 경로
+            data_dir: 지정하면 원본 JSON 파일 지문과 비교
+
+        Raises:
+            StaleSampleBankError: 형식이 올바르지 않거나 원본 파일이 변경된 경우
+        """
+        with open(path, 'rb') as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                raise StaleSampleBankError("빈 스냅샷 파일입니다")
+
+        if len(buffer) < len(cls.MAGIC) + 4 or buffer[:len(cls.MAGIC)] != cls.MAGIC:
+            buffer.close()
+            raise StaleSampleBankError("샘플 뱅크 스냅샷 형식이 아닙니다")
+        try:
+            body_start = cls._read_body_start(buffer)
+            header = json.loads(buffer[len(cls.MAGIC) + 4:body_start].decode('utf-8'))
+        except ValueError:
+            buffer.close()
+            raise StaleSampleBankError("샘플 뱅크 스냅샷 헤더가 손상되었습니다")
+
+        if data_dir is not None and header['sources'] != cls._fingerprint(Path(data_dir)):
+            buffer.close()
+            raise StaleSampleBankError("원본 샘플 파일이 변경되었습니다. 스냅샷을 다시 생성하세요")
+
+        sections = {
+            tuple(key.split('/', 1)): section
+            for key, section in header['sections'].items()
+        }
+        return cls(sections, header['sources'], buffer=buffer)
+
+    def write(self, path: Path) -> None:
+        """
+        스냅샷 파일로 저장 (임시 파일에 쓴 뒤 교체)
+
+        인덱스 배열은 4바이트 경계에 맞춰 기록해 메모리 매핑 시 그대로 사용할 수 있게 합니다.
+        """
+        body = bytearray()
+        sections: Dict[str, Dict[str, Any]] = {}
+        for kind, level in sorted(self._sections):
+            level_enum = JLPTLevel(level)
+            payload = pickle.dumps(self.records(kind, level_enum), protocol=pickle.HIGHEST_PROTOCOL)
+            section: Dict[str, Any] = {
+                'offset': len(body),
+                'length': len(payload),
+                'count': self._sections[(kind, level)]['count'],
+                'indexes': {},
+            }
+            body += payload
+
+            for difficulty in self.difficulties(kind, level_enum):
+                body += b"\0" * (-len(body) % self._INDEX_DTYPE.itemsize)
+                array = self.indices(kind, level_enum, difficulty).astype(self._INDEX_DTYPE)
+                section['indexes'][str(difficulty)] = {'offset': len(body), 'count': len(array)}
+                body += array.tobytes()
+            sections[f"{kind}/{level}"] = section
+
+        header = json.dumps(
+            {'sources': self.sources, 'sections': sections},
+            ensure_ascii=False
+        ).encode('utf-8')
+        # 본문 오프셋은 헤더 뒤 기준이므로, 본문 시작을 8바이트 경계에 맞춤
+        header += b" " * (-(len(self.MAGIC) + 4 + len(header)) % 8)
+
+        path = Path(path)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(self.MAGIC)
+            f.write(struct.pack('<I', len(header)))
+            f.write(header)
+            f.write(body)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def build(cls, data_dir: Path, path: Optional[Path] = None) -> 'SampleBank':
+        """JSON 샘플 파일을 스냅샷으로 컴파일 (기본 경로: data_dir/SNAPSHOT_NAME)"""
+        bank = cls.from_json(data_dir)
+        bank.write(Path(path) if path else Path(data_dir) / cls.SNAPSHOT_NAME)
+        return bank
+
+    # ---------- 조회 ----------
+
+    def levels(self, kind: str) -> List[JLPTLevel]:
+        """샘플이 있는 레벨 목록"""
+        return [JLPTLevel(level) for k, level in self._sections if k == kind]
+
+    def by_level(self, kind: str) -> Mapping:
+        """레벨별 샘플 목록 매핑 (접근한 레벨만 로드)"""
+        return _LevelRecords(self, kind)
+
+    def records(self, kind: str, level: JLPTLevel) -> List[Dict[str, Any]]:
+        """유형/레벨별 샘플 목록 (없으면 빈 목록)"""
+        key = (kind, level.value)
+        if key not in self._records:
+            section = self._sections.get(key)
+            if section is None or self._buffer is None:
+                return []
+            start = self._body_start + section['offset']
+            self._records[key] = pickle.loads(self._buffer[start:start + section['length']])
+        return self._records[key]
+
+    def difficulties(self, kind: str, level: JLPTLevel) -> List[int]:
+        """샘플이 있는 난이도 목록"""
+        key = (kind, level.value)
+        if key in self._indexes:
+            return sorted(self._indexes[key])
+        section = self._sections.get(key)
+        return sorted(int(d) for d in section['indexes']) if section else []
+
+    def indices(self, kind: str, level: JLPTLevel, difficulty: Optional[int] = None) -> np.ndarray:
+        """
+        난이도별 샘플 인덱스 배열 (difficulty가 None이면 전체)
+
+        스냅샷에서 연 경우 메모리 매핑된 읽기 전용 배열입니다.
+        """
+        key = (kind, level.value)
+        if difficulty is None:
+            return np.arange(self._sections[key]['count'] if key in self._sections else 0)
+
+        cached = self._indexes.get(key, {})
+        if difficulty in cached:
+            return cached[difficulty]
+        section = self._sections.get(key)
+        index = section['indexes'].get(str(difficulty)) if section and 'indexes' in section else None
+        if index is None or self._buffer is None:
+            return np.empty(0, dtype=self._INDEX_DTYPE)
+
+        array = np.frombuffer(
+            self._buffer,
+            dtype=self._INDEX_DTYPE,
+            count=index['count'],
+            offset=self._body_start + index['offset']
+        )
+        self._indexes.setdefault(key, {})[difficulty] = array
+        return array
+
+    def choice(
+        self,
+        kind: str,
+        level: JLPTLevel,
+        difficulty: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """난이도 조건에 맞는 샘플 하나를 무작위로 선택 (O(1), 없으면 None)"""
+        candidates = self.indices(kind, level, difficulty)
+        if len(candidates) == 0:
+            return None
+        return self.records(kind, level)[int(candidates[random.randrange(len(candidates))])]
+
+    def sample(
+        self,
+        kind: str,
+        level: JLPTLevel,
+        count: int,
+        difficulty: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """난이도 조건에 맞는 샘플을 중복 없이 최대 count개 선택 (O(count))"""
+        candidates = self.indices(kind, level, difficulty)
+        if len(candidates) == 0:
+            return []
+        items = self.records(kind, level)
+        picks = random.sample(range(len(candidates)), min(count, len(candidates)))
+        return [items[int(candidates[i])] for i in picks]
+
+    # ---------- 내부 ----------
+
+    @classmethod
+    def _read_body_start(cls, buffer: mmap.mmap) -> int:
+        """스냅샷 본문 시작 오프셋"""
+        (header_length,) = struct.unpack('<I', buffer[len(cls.MAGIC):len(cls.MAGIC) + 4])
+        return len(cls.MAGIC) + 4 + header_length
+
+    @classmethod
+    def _build_indexes(
+        cls,
+        kind: str,
+        level: JLPTLevel,
+        items: List[Dict[str, Any]]
+    ) -> Dict[int, np.ndarray]:
+        """난이도별 인덱스 배열 생성"""
+        by_difficulty: Dict[int, List[int]] = {}
+        for i, item in enumerate(items):
+            by_difficulty.setdefault(sample_difficulty(kind, level, item), []).append(i)
+        return {
+            difficulty: np.array(positions, dtype=cls._INDEX_DTYPE)
+            for difficulty, positions in by_difficulty.items()
+        }
+
+    @classmethod
+    def _fingerprint(cls, data_dir: Path) -> Dict[str, Dict[str, int]]:
+        """원본 파일 지문 (크기, 수정 시각)"""
+        fingerprint = {}
+        for file_name in cls.SOURCES.values():
+            data_file = data_dir / file_name
+            if data_file.exists():
+                stat = data_file.stat()
+                fingerprint[file_name] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        return fingerprint
@@ -0,0 +1,247 @@
+"""
+스트리밍 데이터 내보내기 어댑터
+SQLite 테이블을 ID 순으로 배치 조회해 NDJSON 또는 CSV 바이트 조각으로 변환 (선택적 gzip 압축)
+"""
+
+import csv
+import io
+import json
+import zlib
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional, Tuple
+from backend.infrastructure.config.database import Database
+
+
+class StreamingExporter:
+    """
+    스트리밍 데이터 내보내기 어댑터
+
+    `WHERE id > ? ORDER BY id LIMIT ?` 키셋 페이지네이션으로 batch_size개씩 조회하고,
+    배치마다 연결을 새로 열고 닫습니다. 행을 모아두지 않으므로 answer_details처럼
+    수백만 행인 테이블도 batch_size에 비례하는 메모리로 내보낼 수 있습니다.
+
+    내보낸 문제/단어 파일은 파일 임포트 형식과 같아 그대로 다시 임포트할 수 있습니다.
+    (CSV의 choices는 쉼표 구분 문자열, NDJSON의 JSON 컬럼은 값 그대로)
+    """
+
+    DEFAULT_BATCH_SIZE = 1000
+    FORMATS = ('ndjson', 'csv')
+
+    # 테이블별 (내보낼 컬럼, JSON으로 저장된 컬럼, 불리언 컬럼)
+    TABLES: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]] = {
+        'questions': (
+            ('id', 'level', 'question_type', 'question_text', 'choices', 'correct_answer',
+             'explanation', 'difficulty', 'audio_url', 'created_at'),
+            ('choices',),
+            (),
+        ),
+        'vocabulary': (
+            ('id', 'word', 'reading', 'meaning', 'level', 'example_sentence'),
+            (),
+            (),
+        ),
+        'results': (
+            ('id', 'test_id', 'user_id', 'attempt_id', 'score', 'assessed_level',
+             'recommended_level', 'correct_answers_count', 'total_questions_count',
+             'time_taken_minutes', 'performance_level', 'feedback', 'question_type_analysis',
+             'created_at'),
+            ('feedback', 'question_type_analysis'),
+            (),
+        ),
+        'answer_details': (
+            ('id', 'result_id', 'question_id', 'user_answer', 'correct_answer', 'is_correct',
+             'time_spent_seconds', 'difficulty', 'question_type', 'created_at'),
+            (),
+            ('is_correct',),
+        ),
+    }
+
+    MEDIA_TYPES = {'ndjson': 'application/x-ndjson', 'csv': 'text/csv; charset=utf-8'}
+
+    def __init__(self, db: Database, batch_size: int = DEFAULT_BATCH_SIZE):
+        """
+        StreamingExporter 초기화
+
+        Args:
+            db: 데이터베이스
+            batch_size: 한 번에 조회할 행 수
+        """
+        self.db = db
+        self.batch_size = batch_size
+
+    @classmethod
+    def validate(cls, table: str, file_format: str) -> None:
+        """
+        내보내기 대상/형식 검증
+
+        Raises:
+            ValueError: 지원하지 않는 테이블 또는 형식인 경우
+        """
+        if table not in cls.TABLES:
+            raise ValueError(f"지원하지 않는 내보내기 대상입니다: {table}")
+        if file_format not in cls.FORMATS:
+            raise ValueError(f"지원하지 않는 내보내기 형식입니다: {file_format}")
+
+    @classmethod
+    def file_name(cls, table: str, file_format: str, compress: bool = False) -> str:
+        """내보내기 파일명 (예: questions.ndjson.gz)"""
+        return f"{table}.{file_format}" + (".gz" if compress else "")
+
+    def iter_rows(self, table: str) -> Iterator[Dict[str, Any]]:
+        """
+        테이블 행을 ID 순으로 배치 조회
+
+        JSON 컬럼은 디코딩하고 불리언 컬럼은 bool로 변환합니다.
+        테이블이 아직 생성되지 않았으면 아무 행도 반환하지 않습니다.
+
+        Raises:
+            ValueError: 지원하지 않는 테이블인 경우
+        """
+        if table not in self.TABLES:
+            raise ValueError(f"지원하지 않는 내보내기 대상입니다: {table}")
+        columns, json_columns, bool_columns = self.TABLES[table]
+
+        with self.db.get_connection() as conn:
+            exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+            ).fetchone()
+        if not exists:
+            return
+
+        # 테이블/컬럼명은 TABLES의 고정값만 사용
+        sql = (
+            f"SELECT {', '.join(columns)} FROM {table} "
+            f"WHERE id > ? ORDER BY id LIMIT ?"
+        )
+        last_id = 0
+        while True:
+            with self.db.get_connection() as conn:
+                rows = conn.execute(sql, (last_id, self.batch_size)).fetchall()
+
+            for row in rows:
+                record = dict(row)
+                for column in json_columns:
+                    record[column] = self._decode_json(record[column])
+                for column in bool_columns:
+                    record[column] = bool(record[column])
+                yield record
+
+            if len(rows) < self.batch_size:
+                return
+            last_id = rows[-1]['id']
+
+    def iter_export(
+        self,
+        table: str,
+        file_format: str = 'ndjson',
+        compress: bool = False,
+        on_row: Optional[Callable[[], None]] = None
+    ) -> Iterator[bytes]:
+        """
+        테이블을 NDJSON 또는 CSV 바이트 조각으로 변환
+
+        배치 하나 분량의 행을 한 조각으로 묶어 반환합니다.
+
+        Args:
+            table: 내보낼 테이블 (TABLES 키)
+            file_format: 'ndjson' 또는 'csv'
+            compress: True이면 gzip 스트림으로 압축
+            on_row: 행을 하나 쓸 때마다 호출되는 콜백 (건수 집계용)
+
+        Raises:
+            ValueError: 지원하지 않는 테이블 또는 형식인 경우
+        """
+        self.validate(table, file_format)
+        encode = self._encode_ndjson if file_format == 'ndjson' else self._encode_csv
+        chunks = encode(table, self._count_rows(self.iter_rows(table), on_row))
+        if compress:
+            chunks = self._gzip(chunks)
+        return chunks
+
+    def export_to_stream(
+        self,
+        output: IO[bytes],
+        table: str,
+        file_format: str = 'ndjson',
+        compress: bool = False
+    ) -> int:
+        """
+        바이너리 스트림(파일, stdout)에 내보내기
+
+        Returns:
+            내보낸 행 수
+        """
+        count = 0
+
+        def increment() -> None:
+            nonlocal count
+            count += 1
+
+        for chunk in self.iter_export(table, file_format, compress, on_row=increment):
+            output.write(chunk)
+        return count
+
+    def _encode_ndjson(self, table: str, rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        """행마다 JSON 한 줄"""
+        lines: List[str] = []
+        for record in rows:
+            lines.append(json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            if len(lines) >= self.batch_size:
+                yield ("\n".join(lines) + "\n").encode("utf-8")
+                lines.clear()
+        if lines:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+
+    def _encode_csv(self, table: str, rows: Iterable[Dict[str, Any]]) -> Iterator[bytes]:
+        """헤더 + 행 (리스트 컬럼은 쉼표 구분, 객체 컬럼은 JSON 문자열)"""
+        columns, json_columns, _ = self.TABLES[table]
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, lineterminator="\n")
+        writer.writeheader()
+
+        written = 0
+        for record in rows:
+            for column in json_columns:
+                value = record[column]
+                if isinstance(value, list):
+                    record[column] = ",".join(str(v) for v in value)
+                elif value is not None:
+                    record[column] = json.dumps(value, ensure_ascii=False)
+            writer.writerow(record)
+            written += 1
+            if written % self.batch_size == 0:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+    @staticmethod
+    def _count_rows(
+        rows: Iterable[Dict[str, Any]],
+        on_row: Optional[Callable[[], None]]
+    ) -> Iterator[Dict[str, Any]]:
+        """행마다 on_row 호출"""
+        for record in rows:
+            if on_row:
+                on_row()
+            yield record
+
+    @staticmethod
+    def _gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+        """바이트 조각을 gzip 스트림으로 압축"""
+        compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        for chunk in chunks:
+            compressed = compressor.compress(chunk)
+            if compressed:
+                yield compressed
+        yield compressor.flush()
+
+    @staticmethod
+    def _decode_json(value: Optional[str]) -> Any:
+        """JSON 컬럼 디코딩 (비어 있거나 잘못된 값은 원본 유지)"""
+        if not value:
+            return value
+        try:
+            return json.loads(value)
+        except (json.JSONDecodeError, TypeError):
+            return value
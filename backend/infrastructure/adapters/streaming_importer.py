@@ -0,0 +1,335 @@
+"""
+스트리밍 임포트 어댑터 기반 클래스
+JSON 배열을 점진적으로 파싱하고 CSV를 행 단위로 읽어, 배치 단위로 검증/저장
+"""
+
+import csv
+import io
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingImporter(ABC):
+    """
+    스트리밍 임포트 어댑터 기반 클래스
+
+    파일 전체를 메모리에 올리지 않고 레코드를 하나씩 읽어 parse_record로 엔티티를 검증한 뒤,
+    batch_size개씩 모아 repository.save_all로 한 트랜잭션에 업서트합니다.
+    결과로는 저장된 엔티티 목록 대신 건수 요약과 실패한 행의 오류 보고서를 반환합니다.
+    하위 클래스는 parse_record를 구현합니다.
+    """
+
+    DEFAULT_BATCH_SIZE = 1000  # 트랜잭션당 삽입 건수
+    MAX_ERRORS = 100  # 오류 보고서에 포함할 최대 건수
+    READ_CHUNK_SIZE = 64 * 1024  # JSON 파싱 시 한 번에 읽을 문자 수
+    SUPPORTED_FILE_TYPES = ('json', 'csv')
+    _VALUE_DELIMITERS = frozenset(' \t\r\n,]')
+
+    def __init__(
+        self,
+        repository: Any,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_errors: int = MAX_ERRORS
+    ):
+        """
+        StreamingImporter 초기화
+
+        Args:
+            repository: save_all(entities) -> 새로 삽입된 수 를 제공하는 Repository
+            batch_size: 트랜잭션당 삽입 건수
+            max_errors: 오류 보고서에 포함할 최대 건수
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size는 1 이상이어야 합니다")
+        self.repository = repository
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+
+    @classmethod
+    def iter_json_array(cls, stream: IO[str]) -> Iterator[Any]:
+        """
+        JSON 배열의 원소를 하나씩 파싱
+
+        Args:
+            stream: JSON 배열을 담은 텍스트 스트림
+
+        Yields:
+            배열 원소
+
+        Raises:
+            ValueError: JSON 형식이 잘못되었거나 최상위 값이 배열이 아닐 때 (배열 뒤에 다른 내용이 있는 경우 포함)
+        """
+        decoder = json.JSONDecoder()
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buffer, pos, eof
+            chunk = stream.read(cls.READ_CHUNK_SIZE)
+            if not chunk:
+                eof = True
+                return False
+            buffer = buffer[pos:] + chunk
+            pos = 0
+            return True
+
+        def skip_whitespace() -> Optional[str]:
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos].isspace():
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                if eof or not fill():
+                    return None
+
+        if skip_whitespace() != "[":
+            raise ValueError("JSON 파일은 배열이어야 합니다")
+        pos += 1
+
+        expect_value = True
+        first = True
+        while True:
+            char = skip_whitespace()
+            if char is None:
+                raise ValueError("JSON 배열이 닫히지 않았습니다")
+            if char == "]" and (first or not expect_value):
+                pos += 1
+                if skip_whitespace() is not None:
+                    raise ValueError(f"JSON 형식이 잘못되었습니다: 위치 {pos}에 배열 뒤 불필요한 내용")
+                return
+            if not expect_value:
+                if char != ",":
+                    raise ValueError(f"JSON 형식이 잘못되었습니다: 위치 {pos}에 ',' 필요")
+                pos += 1
+                expect_value = True
+                continue
+
+            while True:
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if not eof and fill():
+                        continue
+                    raise ValueError(f"JSON 형식이 잘못되었습니다: {e.msg}")
+                # 구분자가 보이지 않으면 값(숫자 등)이 잘렸을 수 있으므로 더 읽어서 다시 파싱
+                complete = end < len(buffer) and buffer[end] in cls._VALUE_DELIMITERS
+                if not complete and not eof and fill():
+                    continue
+                break
+
+            pos = end
+            yield value
+            expect_value = False
+            first = False
+
+    @staticmethod
+    def iter_csv_rows(stream: IO[str]) -> Iterator[Dict[str, str]]:
+        """
+        CSV 행을 딕셔너리로 하나씩 읽기
+
+        Args:
+            stream: 헤더 행을 포함한 CSV 텍스트 스트림
+
+        Yields:
+            헤더를 키로 하는 행 딕셔너리
+
+        Raises:
+            ValueError: CSV 형식이 잘못되었을 때
+        """
+        try:
+            yield from csv.DictReader(stream)
+        except csv.Error as e:
+            raise ValueError(f"CSV 형식이 잘못되었습니다: {str(e)}")
+
+    @classmethod
+    def iter_records(cls, stream: IO[str], file_type: str) -> Iterator[Any]:
+        """
+        파일 형식에 맞는 레코드 이터레이터 반환
+
+        Raises:
+            ValueError: 지원하지 않는 파일 형식일 때
+        """
+        if file_type == 'json':
+            return cls.iter_json_array(stream)
+        if file_type == 'csv':
+            return cls.iter_csv_rows(stream)
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {file_type}")
+
+    @staticmethod
+    def detect_file_type(file_name: str) -> str:
+        """
+        확장자로 파일 형식 감지
+
+        Raises:
+            ValueError: 지원하지 않는 확장자일 때
+        """
+        file_ext = Path(file_name).suffix.lower()
+        if file_ext == '.json':
+            return 'json'
+        if file_ext == '.csv':
+            return 'csv'
+        raise ValueError(f"지원하지 않는 파일 형식입니다: {file_ext}")
+
+    @abstractmethod
+    def parse_record(self, record: Any) -> Any:
+        """
+        레코드를 엔티티로 변환 (하위 클래스에서 구현)
+
+        Raises:
+            ValueError: 레코드가 올바르지 않을 때
+        """
+
+    def import_records(
+        self,
+        records: Iterable[Any],
+        skip: int = 0,
+        on_checkpoint: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        레코드 스트림을 배치 단위로 검증/저장
+
+        Args:
+            records: 레코드 이터러블 (JSON 객체 또는 CSV 행 딕셔너리)
+            skip: 건너뛸 앞쪽 레코드 수 (체크포인트에서 재개할 때 사용, 파싱/저장하지 않음)
+            on_checkpoint: 배치를 저장할 때마다 (처리 완료된 레코드 수, 현재 요약)으로 호출되는 콜백.
+                처리 완료된 레코드 수는 skip을 포함하며, 다음 재개 시 skip으로 사용할 수 있습니다.
+
+        Returns:
+            Dict[str, Any]: 임포트 요약
+                - total: 읽은 레코드 수 (skip 제외)
+                - imported: 새로 저장된 수
+                - duplicates: 이미 같은 내용이 있어 새로 만들지 않고 갱신한 레코드 수
+                - rejected: 검증 또는 저장에 실패한 레코드 수
+                - errors: 실패한 레코드의 {row, error} 목록 (최대 max_errors개, row는 1부터 시작)
+                - errors_truncated: 오류 보고서가 잘렸는지 여부
+                - elapsed_seconds: 소요 시간 (초)
+
+        Raises:
+            ValueError: 레코드 스트림이 파일 구조 오류로 중단된 경우 (직전까지 읽은 레코드는 저장됨)
+        """
+        started = time.monotonic()
+        summary: Dict[str, Any] = {
+            'total': 0,
+            'imported': 0,
+            'duplicates': 0,
+            'rejected': 0,
+            'errors': [],
+            'errors_truncated': False,
+        }
+        batch: List[Any] = []
+        batch_rows: List[int] = []
+        row_number = skip
+
+        def checkpoint() -> None:
+            self._flush(summary, batch, batch_rows)
+            batch.clear()
+            batch_rows.clear()
+            if on_checkpoint:
+                summary['elapsed_seconds'] = round(time.monotonic() - started, 3)
+                on_checkpoint(row_number, summary)
+
+        try:
+            for row_number, record in enumerate(records, 1):
+                if row_number <= skip:
+                    continue
+                summary['total'] += 1
+                try:
+                    batch.append(self.parse_record(record))
+                    batch_rows.append(row_number)
+                except Exception as e:
+                    self._reject(summary, row_number, e)
+                    continue
+
+                if len(batch) >= self.batch_size:
+                    checkpoint()
+        except ValueError as e:
+            # 파일 구조 오류: 이미 읽은 레코드는 저장하고, 저장된 건수를 알린 뒤 중단
+            self._flush(summary, batch, batch_rows)
+            if summary['imported'] or summary['duplicates']:
+                saved = summary['imported'] + summary['duplicates']
+                raise ValueError(f"{str(e)} ({saved}개 저장 후 중단)") from e
+            raise
+
+        row_number = max(row_number, skip)
+        checkpoint()
+        summary['elapsed_seconds'] = round(time.monotonic() - started, 3)
+        return summary
+
+    def import_stream(self, stream: IO[str], file_type: str, **options: Any) -> Dict[str, Any]:
+        """
+        텍스트 스트림에서 임포트 (options는 import_records의 skip, on_checkpoint)
+
+        Raises:
+            ValueError: 지원하지 않는 파일 형식이거나 JSON 구조가 잘못되었을 때
+        """
+        return self.import_records(self.iter_records(stream, file_type), **options)
+
+    def import_binary_stream(self, stream: IO[bytes], file_type: str, **options: Any) -> Dict[str, Any]:
+        """
+        바이너리 스트림(업로드 파일 등)에서 UTF-8로 디코딩하며 임포트
+
+        Raises:
+            ValueError: 지원하지 않는 파일 형식이거나 JSON 구조가 잘못되었을 때
+        """
+        text_stream = io.TextIOWrapper(stream, encoding='utf-8-sig', newline='')
+        try:
+            return self.import_stream(text_stream, file_type, **options)
+        finally:
+            # 원본 스트림은 호출자가 닫도록 분리
+            text_stream.detach()
+
+    def import_file(
+        self,
+        file_path: str,
+        file_type: Optional[str] = None,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """
+        파일에서 임포트
+
+        Args:
+            file_path: JSON 또는 CSV 파일 경로
+            file_type: 파일 형식 (json, csv). None이면 확장자로 자동 감지
+            **options: import_records 옵션 (skip, on_checkpoint)
+
+        Raises:
+            FileNotFoundError: 파일이 없을 때
+            ValueError: 지원하지 않는 파일 형식이거나 JSON 구조가 잘못되었을 때
+        """
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"파일을 찾을 수 없습니다: {file_path}")
+        if file_type is None:
+            file_type = self.detect_file_type(path.name)
+
+        with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+            return self.import_stream(f, file_type, **options)
+
+    def _flush(self, summary: Dict[str, Any], batch: List[Any], batch_rows: List[int]) -> None:
+        """배치 저장 (실패 시 배치 전체를 거부 처리)"""
+        if not batch:
+            return
+        try:
+            inserted = self.repository.save_all(batch)
+            summary['imported'] += inserted
+            summary['duplicates'] += len(batch) - inserted
+        except Exception as e:
+            logger.error(f"배치 저장 실패: {str(e)}", exc_info=True)
+            for row_number in batch_rows:
+                self._reject(summary, row_number, e)
+
+    def _reject(self, summary: Dict[str, Any], row_number: int, error: Exception) -> None:
+        """실패한 레코드 기록"""
+        summary['rejected'] += 1
+        if len(summary['errors']) < self.max_errors:
+            summary['errors'].append({'row': row_number, 'error': str(error)})
+        else:
+            summary['errors_truncated'] = True
@@ -0,0 +1,68 @@
+"""
+스트리밍 기출문제 임포트 어댑터
+JSON 배열을 점진적으로 파싱하고 CSV를 행 단위로 읽어, 배치 단위로 검증/저장
+"""
+
+from typing import Any
+from backend.domain.entities.question import Question
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.adapters.streaming_importer import StreamingImporter
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+
+
+class StreamingQuestionImporter(StreamingImporter):
+    """
+    스트리밍 기출문제 임포트 어댑터
+
+    레코드를 Question으로 검증한 뒤 batch_size개씩
+    SqliteQuestionRepository.save_all로 한 트랜잭션에 업서트합니다.
+    """
+
+    def __init__(
+        self,
+        question_repo: SqliteQuestionRepository,
+        batch_size: int = StreamingImporter.DEFAULT_BATCH_SIZE,
+        max_errors: int = StreamingImporter.MAX_ERRORS
+    ):
+        """
+        StreamingQuestionImporter 초기화
+
+        Args:
+            question_repo: Question Repository
+            batch_size: 트랜잭션당 삽입 건수
+            max_errors: 오류 보고서에 포함할 최대 건수
+        """
+        super().__init__(question_repo, batch_size=batch_size, max_errors=max_errors)
+        self.question_repo = question_repo
+
+    def parse_record(self, record: Any) -> Question:
+        """
+        레코드를 Question 엔티티로 변환
+
+        CSV 레코드는 choices를 쉼표로 구분된 문자열로, difficulty를 문자열로 가집니다.
+
+        Raises:
+            ValueError: 레코드가 올바르지 않을 때
+        """
+        if not isinstance(record, dict):
+            raise ValueError("문제 레코드는 객체여야 합니다")
+
+        choices = record.get("choices", [])
+        if isinstance(choices, str):
+            choices = [c.strip() for c in choices.split(",")] if choices else []
+
+        difficulty = record.get("difficulty", 1)
+        if isinstance(difficulty, str):
+            difficulty = int(difficulty) if difficulty.strip() else 1
+
+        return Question(
+            id=0,
+            level=JLPTLevel(record.get("level") or "N5"),
+            question_type=QuestionType(record.get("question_type") or "vocabulary"),
+            question_text=record.get("question_text", ""),
+            choices=choices,
+            correct_answer=record.get("correct_answer", ""),
+            explanation=record.get("explanation") or "",
+            difficulty=difficulty,
+            audio_url=record.get("audio_url") or None
+        )
@@ -0,0 +1,55 @@
+"""
+스트리밍 기출단어 임포트 어댑터
+JSON 배열을 점진적으로 파싱하고 CSV를 행 단위로 읽어, 배치 단위로 검증/저장
+"""
+
+from typing import Any
+from backend.domain.entities.vocabulary import Vocabulary
+from backend.domain.value_objects.jlpt import JLPTLevel
+from backend.infrastructure.adapters.streaming_importer import StreamingImporter
+from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+
+
+class StreamingVocabularyImporter(StreamingImporter):
+    """
+    스트리밍 기출단어 임포트 어댑터
+
+    레코드를 Vocabulary로 검증한 뒤 batch_size개씩
+    SqliteVocabularyRepository.save_all로 한 트랜잭션에 업서트합니다.
+    """
+
+    def __init__(
+        self,
+        vocabulary_repo: SqliteVocabularyRepository,
+        batch_size: int = StreamingImporter.DEFAULT_BATCH_SIZE,
+        max_errors: int = StreamingImporter.MAX_ERRORS
+    ):
+        """
+        StreamingVocabularyImporter 초기화
+
+        Args:
+            vocabulary_repo: Vocabulary Repository
+            batch_size: 트랜잭션당 삽입 건수
+            max_errors: 오류 보고서에 포함할 최대 건수
+        """
+        super().__init__(vocabulary_repo, batch_size=batch_size, max_errors=max_errors)
+        self.vocabulary_repo = vocabulary_repo
+
+    def parse_record(self, record: Any) -> Vocabulary:
+        """
+        레코드를 Vocabulary 엔티티로 변환
+
+        Raises:
+            ValueError: 레코드가 올바르지 않을 때
+        """
+        if not isinstance(record, dict):
+            raise ValueError("단어 레코드는 객체여야 합니다")
+
+        return Vocabulary(
+            id=0,
+            word=record.get("word", ""),
+            reading=record.get("reading", ""),
+            meaning=record.get("meaning", ""),
+            level=JLPTLevel(record.get("level") or "N5"),
+            example_sentence=record.get("example_sentence") or None
+        )
@@ -0,0 +1,372 @@
+"""
+TTS 오디오 캐시 관리 어댑터
+매니페스트 테이블로 캐시 파일의 크기/마지막 접근 시각을 추적하고,
+바이트 예산을 넘으면 문제에서 참조하지 않는 파일부터 LRU로 제거
+"""
+
+import os
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+from backend.infrastructure.config.database import get_database, Database
+
+
+class TTSCacheManager:
+    """
+    TTS 오디오 캐시 관리자
+
+    tts_cache 테이블에 캐시 파일(tts_{hash}.mp3)마다 크기, 적중 횟수, 마지막 접근 시각을 기록합니다.
+    어떤 문제가 파일을 참조하는지는 questions.audio_url로 판단하므로 따로 저장하지 않습니다.
+
+    - 적중/미스: TTSService와 TTSRenderPool이 캐시를 확인할 때 hit/miss를 기록
+    - 예산 초과 제거: store로 전체 크기가 max_bytes를 넘으면, 참조하는 문제가 없는 파일을
+      마지막 접근 시각이 오래된 순으로 제거 (참조 중인 파일은 제거하지 않음)
+    - 고아 정리: 매니페스트에도 없고 참조하는 문제도 없는 파일(delete_audio 실패, 문제 삭제로 남은 파일),
+      파일이 없어진 매니페스트 행, 중단된 렌더링의 임시 파일을 제거
+
+    여러 렌더링 스레드에서 동시에 호출할 수 있습니다.
+    """
+
+    DEFAULT_MAX_BYTES = 1024 * 1024 * 1024  # 1GiB
+    DEFAULT_GRACE_SECONDS = 3600  # 이보다 최근에 만들어진 파일은 고아로 보지 않음 (렌더링 후 audio_url 저장 전일 수 있음)
+    EVICT_PROTECT_SECONDS = 300  # 이보다 최근에 접근한 파일은 예산을 넘어도 제거하지 않음 (같은 이유)
+    AUDIO_URL_PREFIX = "/static/audio/tts/"
+    FILE_PATTERN = "tts_*.mp3"
+    TEMP_PATTERN = ".tts_*.tmp"
+    _EVICT_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        db: Optional[Database] = None,
+        cache_dir: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """
+        TTSCacheManager 초기화
+
+        Args:
+            db: 데이터베이스
+            cache_dir: 캐시 디렉토리 (None이면 backend/static/audio/tts)
+            max_bytes: 캐시 전체 크기 예산 (바이트)
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes는 0 이상이어야 합니다")
+        self.db = db or get_database()
+        if cache_dir is None:
+            # backend/infrastructure/adapters/tts_cache.py -> backend/static/audio/tts
+            cache_dir = Path(__file__).parent.parent.parent / "static" / "audio" / "tts"
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+        self._ensure_table_exists()
+
+    def _ensure_table_exists(self):
+        """테이블이 존재하는지 확인하고 없으면 생성"""
+        with self.db.get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS tts_cache (
+                    filename TEXT PRIMARY KEY,
+                    size_bytes INTEGER NOT NULL,
+                    hit_count INTEGER NOT NULL DEFAULT 0,
+                    created_at TIMESTAMP NOT NULL,
+                    last_accessed_at TIMESTAMP NOT NULL
+                )
+            """)
+            # LRU 제거 후보 조회 인덱스
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tts_cache_last_accessed
+                ON tts_cache(last_accessed_at)
+            """)
+            # 파일 참조 여부 확인 인덱스
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_questions_audio_url
+                ON questions(audio_url)
+            """)
+            conn.commit()
+
+    # ---------- 기록 ----------
+
+    def hit(self, filename: str, now: Optional[datetime] = None) -> None:
+        """
+        캐시 적중 기록
+
+        매니페스트에 없는 파일(매니페스트 도입 전에 만들어진 파일)이면 현재 크기로 등록합니다.
+        """
+        now = (now or datetime.now()).isoformat()
+        with self._lock:
+            self.hits += 1
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                "UPDATE tts_cache SET hit_count = hit_count + 1, last_accessed_at = ? WHERE filename = ?",
+                (now, filename)
+            )
+            if cursor.rowcount == 0:
+                size = self._file_size(filename)
+                if size is not None:
+                    self._insert(conn, filename, size, now, hit_count=1)
+            conn.commit()
+
+    def miss(self) -> None:
+        """캐시 미스 기록"""
+        with self._lock:
+            self.misses += 1
+
+    def store(self, filename: str, size_bytes: int, now: Optional[datetime] = None) -> None:
+        """
+        새로 만든 캐시 파일 등록
+
+        등록 후 전체 크기가 예산을 넘으면 참조하지 않는 파일부터 제거합니다.
+        """
+        now = (now or datetime.now()).isoformat()
+        with self.db.get_connection() as conn:
+            previous = conn.execute(
+                "SELECT size_bytes FROM tts_cache WHERE filename = ?", (filename,)
+            ).fetchone()
+            self._insert(conn, filename, size_bytes, now)
+            conn.commit()
+
+        with self._lock:
+            if self._total_bytes is not None:
+                self._total_bytes += size_bytes - (previous['size_bytes'] if previous else 0)
+        if self.total_bytes() > self.max_bytes:
+            self.evict()
+
+    def forget(self, filename: str) -> None:
+        """삭제된 파일의 매니페스트 행 제거"""
+        with self.db.get_connection() as conn:
+            conn.execute("DELETE FROM tts_cache WHERE filename = ?", (filename,))
+            conn.commit()
+        with self._lock:
+            self._total_bytes = None
+
+    # ---------- 정리 ----------
+
+    def evict(self, max_bytes: Optional[int] = None, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        예산 초과분 LRU 제거
+
+        참조하는 문제가 없는 파일을 마지막 접근 시각이 오래된 순으로 제거합니다.
+        EVICT_PROTECT_SECONDS 안에 접근한 파일과 참조 중인 파일은 제거하지 않으므로,
+        그런 파일만으로 예산을 넘으면 예산보다 큰 상태로 남습니다.
+
+        Args:
+            max_bytes: 이번 제거에 사용할 예산 (None이면 self.max_bytes)
+            now: 기준 시각 (테스트용)
+
+        Returns:
+            {evicted, freed_bytes, total_bytes}
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        protected_since = ((now or datetime.now()) - timedelta(seconds=self.EVICT_PROTECT_SECONDS)).isoformat()
+        evicted = freed = 0
+
+        # 다른 스레드가 제거 중이면 그 결과를 기다림
+        with self._evict_lock:
+            total = self._load_total_bytes()
+            while total > budget:
+                with self.db.get_connection() as conn:
+                    candidates = conn.execute(f"""
+                        SELECT c.filename, c.size_bytes FROM tts_cache c
+                        WHERE c.last_accessed_at < ?
+                          AND NOT EXISTS (
+                            SELECT 1 FROM questions q WHERE q.audio_url = '{self.AUDIO_URL_PREFIX}' || c.filename
+                          )
+                        ORDER BY c.last_accessed_at, c.filename
+                        LIMIT ?
+                    """, (protected_since, self._EVICT_BATCH_SIZE)).fetchall()
+                if not candidates:
+                    break
+
+                removed: List[str] = []
+                for row in candidates:
+                    if total <= budget:
+                        break
+                    self._unlink(row['filename'])
+                    removed.append(row['filename'])
+                    total -= row['size_bytes']
+                    freed += row['size_bytes']
+                self._delete_entries(removed)
+                evicted += len(removed)
+
+            with self._lock:
+                self._total_bytes = total
+
+        return {'evicted': evicted, 'freed_bytes': freed, 'total_bytes': total}
+
+    def sweep_orphans(
+        self,
+        grace_seconds: int = DEFAULT_GRACE_SECONDS,
+        now: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """
+        고아 파일/매니페스트 정리
+
+        - 매니페스트에 없고 참조하는 문제도 없는 파일 제거
+        - 매니페스트에 없지만 문제가 참조하는 파일은 매니페스트에 등록
+        - 파일이 없는 매니페스트 행 제거
+        - 중단된 렌더링이 남긴 임시 파일 제거
+
+        grace_seconds보다 최근에 수정된 파일은 렌더링 직후 audio_url 저장 전일 수 있으므로 건드리지 않습니다.
+
+        Returns:
+            {removed_files, removed_temp_files, removed_entries, adopted, freed_bytes}
+        """
+        now = now or datetime.now()
+        cutoff = (now - timedelta(seconds=grace_seconds)).timestamp()
+        summary = {
+            'removed_files': 0,
+            'removed_temp_files': 0,
+            'removed_entries': 0,
+            'adopted': 0,
+            'freed_bytes': 0,
+        }
+        if not self.cache_dir.exists():
+            on_disk: Dict[str, os.stat_result] = {}
+        else:
+            on_disk = {path.name: path.stat() for path in self.cache_dir.glob(self.FILE_PATTERN)}
+            for path in self.cache_dir.glob(self.TEMP_PATTERN):
+                if path.stat().st_mtime < cutoff:
+                    path.unlink(missing_ok=True)
+                    summary['removed_temp_files'] += 1
+
+        tracked = self._tracked_filenames()
+        referenced = self._referenced_filenames()
+
+        orphans = [
+            name for name, stat in on_disk.items()
+            if name not in tracked and name not in referenced and stat.st_mtime < cutoff
+        ]
+        for name in orphans:
+            self._unlink(name)
+            summary['freed_bytes'] += on_disk[name].st_size
+        summary['removed_files'] = len(orphans)
+
+        missing = [name for name in tracked if name not in on_disk]
+        self._delete_entries(missing)
+        summary['removed_entries'] = len(missing)
+
+        adopt = [name for name in on_disk if name not in tracked and name in referenced]
+        if adopt:
+            with self.db.get_connection() as conn:
+                for name in adopt:
+                    accessed = datetime.fromtimestamp(on_disk[name].st_mtime).isoformat()
+                    self._insert(conn, name, on_disk[name].st_size, accessed)
+                conn.commit()
+        summary['adopted'] = len(adopt)
+
+        with self._lock:
+            self._total_bytes = None
+        return summary
+
+    # ---------- 조회 ----------
+
+    def total_bytes(self) -> int:
+        """매니페스트에 기록된 캐시 전체 크기"""
+        with self._lock:
+            if self._total_bytes is not None:
+                return self._total_bytes
+        return self._load_total_bytes()
+
+    def referenced_by(self, filename: str) -> List[int]:
+        """파일을 참조하는 문제 ID 목록"""
+        with self.db.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT id FROM questions WHERE audio_url = ? ORDER BY id",
+                (f"{self.AUDIO_URL_PREFIX}{filename}",)
+            ).fetchall()
+        return [row['id'] for row in rows]
+
+    def find_entry(self, filename: str) -> Optional[Dict[str, Any]]:
+        """매니페스트 항목 (참조하는 문제 ID 포함)"""
+        with self.db.get_connection() as conn:
+            row = conn.execute("SELECT * FROM tts_cache WHERE filename = ?", (filename,)).fetchone()
+        if row is None:
+            return None
+        entry = dict(row)
+        entry['referenced_by'] = self.referenced_by(filename)
+        return entry
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        캐시 통계
+
+        hits/misses/hit_rate는 이 프로세스가 시작된 뒤의 값이고,
+        total_hit_count는 매니페스트에 누적된 파일별 적중 횟수의 합입니다.
+        """
+        with self.db.get_connection() as conn:
+            row = conn.execute(f"""
+                SELECT
+                    COUNT(*) AS entries,
+                    COALESCE(SUM(c.size_bytes), 0) AS total_bytes,
+                    COALESCE(SUM(c.hit_count), 0) AS total_hit_count,
+                    COALESCE(SUM(CASE WHEN r.audio_url IS NULL THEN 1 ELSE 0 END), 0) AS unreferenced_entries,
+                    COALESCE(SUM(CASE WHEN r.audio_url IS NULL THEN c.size_bytes ELSE 0 END), 0) AS unreferenced_bytes
+                FROM tts_cache c
+                LEFT JOIN (
+                    SELECT DISTINCT audio_url FROM questions WHERE audio_url LIKE '{self.AUDIO_URL_PREFIX}%'
+                ) r ON r.audio_url = '{self.AUDIO_URL_PREFIX}' || c.filename
+            """).fetchone()
+
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            **dict(row),
+            'max_bytes': self.max_bytes,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / lookups, 4) if lookups else None,
+        }
+
+    # ---------- 내부 ----------
+
+    @staticmethod
+    def _insert(conn, filename: str, size_bytes: int, now: str, hit_count: int = 0) -> None:
+        """매니페스트 행 추가 (이미 있으면 크기와 접근 시각 갱신)"""
+        conn.execute("""
+            INSERT INTO tts_cache (filename, size_bytes, hit_count, created_at, last_accessed_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(filename) DO UPDATE SET
+                size_bytes = excluded.size_bytes,
+                last_accessed_at = excluded.last_accessed_at
+        """, (filename, size_bytes, hit_count, now, now))
+
+    def _delete_entries(self, filenames: List[str]) -> None:
+        if not filenames:
+            return
+        with self.db.get_connection() as conn:
+            conn.executemany("DELETE FROM tts_cache WHERE filename = ?", [(f,) for f in filenames])
+            conn.commit()
+
+    def _load_total_bytes(self) -> int:
+        with self.db.get_connection() as conn:
+            total = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM tts_cache").fetchone()[0]
+        with self._lock:
+            self._total_bytes = total
+        return total
+
+    def _tracked_filenames(self) -> Set[str]:
+        with self.db.get_connection() as conn:
+            return {row['filename'] for row in conn.execute("SELECT filename FROM tts_cache")}
+
+    def _referenced_filenames(self) -> Set[str]:
+        with self.db.get_connection() as conn:
+            rows = conn.execute(
+                "SELECT DISTINCT audio_url FROM questions WHERE audio_url LIKE ?",
+                (f"{self.AUDIO_URL_PREFIX}%",)
+            ).fetchall()
+        return {row['audio_url'][len(self.AUDIO_URL_PREFIX):] for row in rows}
+
+    def _file_size(self, filename: str) -> Optional[int]:
+        try:
+            return (self.cache_dir / filename).stat().st_size
+        except OSError:
+            return None
+
+    def _unlink(self, filename: str) -> None:
+        (self.cache_dir / filename).unlink(missing_ok=True)
@@ -0,0 +1,98 @@
+"""
+TTS 엔진 어댑터
+텍스트를 음성 바이트로 합성하는 엔진 (gTTS, 로컬 스텁)
+"""
+
+import hashlib
+import io
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple, Type
+
+
+class TTSEngine(ABC):
+    """
+    TTS 엔진
+
+    합성만 담당하고 파일 저장/캐싱은 TTSService와 TTSRenderPool이 처리합니다.
+    여러 스레드에서 동시에 호출되므로 구현은 스레드 안전해야 합니다.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def synthesize(self, text: str, language: str = 'ja', slow: bool = False) -> bytes:
+        """
+        텍스트를 오디오(mp3) 바이트로 합성
+
+        Raises:
+            Exception: 합성 실패 시 (일시적인 오류는 호출하는 쪽에서 재시도)
+        """
+
+
+class GTTSEngine(TTSEngine):
+    """Google TTS(gTTS) 엔진 (네트워크 필요)"""
+
+    name = "gtts"
+
+    def synthesize(self, text: str, language: str = 'ja', slow: bool = False) -> bytes:
+        # 스텁 엔진만 쓰는 환경에서는 gTTS가 없어도 되도록 합성 시점에 임포트
+        from gtts import gTTS
+
+        buffer = io.BytesIO()
+        gTTS(text=text, lang=language, slow=slow).write_to_fp(buffer)
+        return buffer.getvalue()
+
+
+class StubTTSEngine(TTSEngine):
+    """
+    로컬 스텁 엔진
+
+    네트워크 없이 텍스트마다 결정적인 바이트를 반환합니다. 테스트와 개발 환경,
+    렌더링 파이프라인 성능 측정에 사용합니다. 실제 재생 가능한 오디오는 아닙니다.
+    """
+
+    name = "stub"
+    MAGIC = b"JLPTSTUB"
+
+    def __init__(self, delay: float = 0.0):
+        """
+        StubTTSEngine 초기화
+
+        Args:
+            delay: 합성 한 번에 걸리는 시간 (초, 네트워크 지연 모사)
+        """
+        self.delay = delay
+        self.calls: List[Tuple[str, str, bool]] = []
+        self._lock = threading.Lock()
+
+    def synthesize(self, text: str, language: str = 'ja', slow: bool = False) -> bytes:
+        with self._lock:
+            self.calls.append((text, language, slow))
+        if self.delay:
+            time.sleep(self.delay)
+        payload = json.dumps(
+            {'text': text, 'language': language, 'slow': slow},
+            ensure_ascii=False
+        ).encode('utf-8')
+        return self.MAGIC + hashlib.sha256(payload).digest() + payload
+
+
+ENGINES: Dict[str, Type[TTSEngine]] = {
+    GTTSEngine.name: GTTSEngine,
+    StubTTSEngine.name: StubTTSEngine,
+}
+
+
+def get_tts_engine(name: str) -> TTSEngine:
+    """
+    이름으로 TTS 엔진 생성
+
+    Raises:
+        ValueError: 지원하지 않는 엔진인 경우
+    """
+    if name not in ENGINES:
+        raise ValueError(f"지원하지 않는 TTS 엔진입니다: {name}")
+    return ENGINES[name]()
@@ -0,0 +1,201 @@
+"""
+TTS 일괄 렌더링 어댑터
+중복을 제거한 텍스트 큐를 제한된 스레드 풀로 렌더링 (재시도/백오프, 원자적 저장)
+"""
+
+import random
+import time
+from concurrent.futures import ALL_COMPLETED, FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Optional, Set
+from backend.domain.services.tts_service import TTSService
+from backend.infrastructure.adapters.audio_metadata import AudioMetadata
+from backend.infrastructure.adapters.tts_cache import TTSCacheManager
+from backend.infrastructure.adapters.tts_engine import TTSEngine
+
+
+@dataclass
+class TTSRenderResult:
+    """텍스트 하나의 렌더링 결과"""
+    text: str
+    audio_url: Optional[str] = None
+    attempts: int = 0
+    cached: bool = False
+    error: Optional[str] = None
+    metadata: Optional[AudioMetadata] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.audio_url is not None
+
+
+class TTSRenderPool:
+    """
+    TTS 일괄 렌더링 풀
+
+    같은 텍스트는 한 번만 렌더링하고, 이미 파일이 있으면 엔진을 호출하지 않습니다.
+    동시에 실행 중인 작업은 max_workers의 두 배로 제한하므로 텍스트 목록이 커도
+    Future가 쌓이지 않습니다. 합성이 실패하면 지수 백오프(지터 포함)로 max_retries번까지
+    재시도하고, 파일은 TTSService.write_atomic으로 임시 파일에 쓴 뒤 이름을 바꿉니다.
+    파일명은 TTSService.generate_audio와 같으므로 두 경로가 캐시를 공유하고,
+    캐시 관리자가 있으면 적중/미스와 새 파일을 매니페스트에 기록합니다.
+    결과에는 오디오 메타데이터(크기, 재생 시간, ETag)가 함께 담겨 문제에 저장됩니다.
+    """
+
+    DEFAULT_WORKERS = 4
+    DEFAULT_MAX_RETRIES = 3
+    DEFAULT_BACKOFF = 0.5  # 첫 재시도 전 대기 시간 (초)
+    MAX_BACKOFF = 30.0
+
+    def __init__(
+        self,
+        engine: Optional[TTSEngine] = None,
+        output_dir: Optional[Path] = None,
+        max_workers: int = DEFAULT_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff: float = DEFAULT_BACKOFF,
+        language: str = 'ja',
+        slow: bool = False,
+        sleep: Callable[[float], None] = time.sleep,
+        cache: Optional[TTSCacheManager] = None
+    ):
+        """
+        TTSRenderPool 초기화
+
+        Args:
+            engine: TTS 엔진 (None이면 TTSService.engine)
+            output_dir: 출력 디렉토리 (None이면 TTSService 기본 경로)
+            max_workers: 동시에 합성할 스레드 수
+            max_retries: 실패 시 재시도 횟수
+            backoff: 첫 재시도 전 대기 시간 (초, 재시도마다 두 배)
+            language: 언어 코드
+            slow: 느린 속도로 합성할지 여부
+            sleep: 대기 함수 (테스트에서 교체)
+            cache: 캐시 관리자 (None이면 기본 디렉토리일 때만 TTSService.cache)
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers는 1 이상이어야 합니다")
+        if max_retries < 0:
+            raise ValueError("max_retries는 0 이상이어야 합니다")
+        self.engine = engine or TTSService.engine
+        self.output_dir = Path(output_dir) if output_dir else TTSService.default_output_dir()
+        self.cache = cache if cache is not None else (TTSService.cache if output_dir is None else None)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.language = language
+        self.slow = slow
+        self._sleep = sleep
+
+    def render(
+        self,
+        texts: Iterable[str],
+        on_result: Optional[Callable[[TTSRenderResult], None]] = None
+    ) -> Dict[str, TTSRenderResult]:
+        """
+        텍스트 목록 렌더링
+
+        Args:
+            texts: 렌더링할 텍스트 (중복 허용, 제너레이터 가능)
+            on_result: 텍스트 하나가 끝날 때마다 호출되는 콜백 (렌더링 스레드가 아닌 호출 스레드에서 실행)
+
+        Returns:
+            텍스트 -> 렌더링 결과
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        results: Dict[str, TTSRenderResult] = {}
+        queued: Set[str] = set()
+        in_flight: Dict[Future, str] = {}
+
+        def finish(result: TTSRenderResult) -> None:
+            results[result.text] = result
+            if on_result:
+                on_result(result)
+
+        def drain(return_when: str) -> None:
+            done, _ = wait(in_flight, return_when=return_when)
+            for future in done:
+                del in_flight[future]
+                finish(future.result())
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="tts") as executor:
+            for text in texts:
+                if text in queued:
+                    continue
+                queued.add(text)
+
+                if not text or not text.strip():
+                    finish(TTSRenderResult(text, error="텍스트는 비어있을 수 없습니다"))
+                    continue
+                metadata = AudioMetadata.from_file(self._file_path(text))
+                if metadata is not None:
+                    if self.cache:
+                        self.cache.hit(self._file_path(text).name)
+                    finish(TTSRenderResult(
+                        text, audio_url=self._audio_url(text), cached=True, metadata=metadata
+                    ))
+                    continue
+
+                if self.cache:
+                    self.cache.miss()
+
+                in_flight[executor.submit(self._render_one, text)] = text
+                if len(in_flight) >= self.max_workers * 2:
+                    drain(FIRST_COMPLETED)
+
+            if in_flight:
+                drain(ALL_COMPLETED)
+
+        return results
+
+    @staticmethod
+    def summarize(results: Dict[str, TTSRenderResult]) -> Dict[str, int]:
+        """렌더링 결과 요약 (total, rendered, cached, failed, retried)"""
+        values = list(results.values())
+        return {
+            'total': len(values),
+            'rendered': sum(1 for r in values if r.ok and not r.cached),
+            'cached': sum(1 for r in values if r.cached),
+            'failed': sum(1 for r in values if not r.ok),
+            'retried': sum(1 for r in values if r.attempts > 1),
+        }
+
+    def _render_one(self, text: str) -> TTSRenderResult:
+        """텍스트 하나 합성/저장 (실패 시 백오프 후 재시도)"""
+        file_path = self._file_path(text)
+        for attempt in range(1, self.max_retries + 2):
+            try:
+                audio = self.engine.synthesize(text, self.language, self.slow)
+                TTSService.write_atomic(file_path, audio)
+            except Exception as e:
+                error = e
+                if attempt <= self.max_retries:
+                    self._sleep(self._backoff_delay(attempt))
+                continue
+
+            if self.cache:
+                self.cache.store(file_path.name, len(audio))
+            return TTSRenderResult(
+                text,
+                audio_url=self._audio_url(text),
+                attempts=attempt,
+                metadata=AudioMetadata.from_bytes(audio)
+            )
+
+        return TTSRenderResult(
+            text,
+            attempts=self.max_retries + 1,
+            error=f"TTS 생성 실패: {str(error)}"
+        )
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """attempt번째 실패 후 대기 시간 (지수 백오프, 여러 스레드가 동시에 재시도하지 않도록 지터)"""
+        delay = min(self.MAX_BACKOFF, self.backoff * (2 ** (attempt - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def _file_path(self, text: str) -> Path:
+        return self.output_dir / TTSService.audio_filename(text, self.language, self.slow)
+
+    def _audio_url(self, text: str) -> str:
+        return f"{TTSService.AUDIO_URL_PREFIX}{TTSService.audio_filename(text, self.language, self.slow)}"
@@ -29,6 +29,7 @@ class Database:
         self.db_path = os.path.abspath(db_path)  # 절대 경로로 변환
         self._ensure_directory_exists()
         self._create_tables()
+        self._backfill_derived_tables()
 
     def _ensure_directory_exists(self):
         """데이터베이스 디렉토리 생성"""
@@ -86,16 +87,29 @@ class Database:
                     explanation TEXT NOT NULL,
                     difficulty INTEGER NOT NULL,
                     audio_url TEXT,
+                    audio_size_bytes INTEGER,
+                    audio_duration_ms INTEGER,
+                    audio_etag TEXT,
+                    content_hash TEXT,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
             
-            # 기존 테이블에 audio_url 컬럼이 없는 경우 마이그레이션
+            # 기존 테이블에 audio_url, content_hash, 오디오 메타데이터 컬럼이 없는 경우 마이그레이션
             try:
                 cursor = conn.execute("PRAGMA table_info(questions)")
                 columns = [col[1] for col in cursor.fetchall()]
                 if 'audio_url' not in columns:
                     conn.execute("ALTER TABLE questions ADD COLUMN audio_url TEXT")
+                if 'content_hash' not in columns:
+                    conn.execute("ALTER TABLE questions ADD COLUMN content_hash TEXT")
+                for column, column_type in (
+                    ('audio_size_bytes', 'INTEGER'),
+                    ('audio_duration_ms', 'INTEGER'),
+                    ('audio_etag', 'TEXT'),
+                ):
+                    if column not in columns:
+                        conn.execute(f"ALTER TABLE questions ADD COLUMN {column} {column_type}")
             except Exception:
                 # 테이블이 없거나 다른 오류가 발생한 경우 무시 (CREATE TABLE IF NOT EXISTS가 처리함)
                 pass
@@ -223,8 +237,193 @@ class Database:
                 )
             """)
 
+            # 사용자 일별 학습 롤업 테이블 (학습 이력/학습 세션/단어 복습 저장 시 같은 트랜잭션에서 갱신)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS user_daily_rollup (
+                    user_id INTEGER NOT NULL,
+                    study_date DATE NOT NULL,
+                    questions_answered INTEGER NOT NULL DEFAULT 0,
+                    correct_count INTEGER NOT NULL DEFAULT 0,
+                    time_spent_minutes INTEGER NOT NULL DEFAULT 0,
+                    tests_completed INTEGER NOT NULL DEFAULT 0,
+                    study_sessions INTEGER NOT NULL DEFAULT 0,
+                    vocabulary_reviews INTEGER NOT NULL DEFAULT 0,
+                    vocabulary_total INTEGER NOT NULL DEFAULT 0,
+                    vocabulary_correct INTEGER NOT NULL DEFAULT 0,
+                    grammar_total INTEGER NOT NULL DEFAULT 0,
+                    grammar_correct INTEGER NOT NULL DEFAULT 0,
+                    reading_total INTEGER NOT NULL DEFAULT 0,
+                    reading_correct INTEGER NOT NULL DEFAULT 0,
+                    listening_total INTEGER NOT NULL DEFAULT 0,
+                    listening_correct INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (user_id, study_date)
+                ) WITHOUT ROWID
+            """)
+
+            # 사용자 연속 학습 일수 테이블 (일별 롤업에 학습 활동이 기록될 때 O(1) 갱신, 야간 일괄 재계산)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS user_streaks (
+                    user_id INTEGER PRIMARY KEY,
+                    current_streak INTEGER NOT NULL DEFAULT 0,
+                    longest_streak INTEGER NOT NULL DEFAULT 0,
+                    last_study_date DATE,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users(id)
+                )
+            """)
+
+            # 레벨별 시험 점수 이력 (추가 전용 시계열, (user_id, level, study_date) 구간 조회)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS level_scores (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    level TEXT NOT NULL,
+                    study_date DATE NOT NULL,
+                    score REAL NOT NULL,
+                    result_id INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users(id),
+                    FOREIGN KEY (result_id) REFERENCES results(id)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_level_scores_user_level_date
+                ON level_scores(user_id, level, study_date)
+            """)
+
+            # 문항 분석 통계 (answer_details에서 배치로 계산, 새 답안이 생긴 문제만 증분 갱신)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS question_stats (
+                    question_id INTEGER PRIMARY KEY,
+                    responses INTEGER NOT NULL DEFAULT 0,
+                    correct_count INTEGER NOT NULL DEFAULT 0,
+                    p_value REAL,
+                    discrimination REAL,
+                    median_time_seconds REAL,
+                    choice_rates TEXT,
+                    last_answer_id INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (question_id) REFERENCES questions(id)
+                )
+            """)
+            # 문항 분석 시 문제별 답안 조회용 인덱스
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_answer_details_question_id
+                ON answer_details(question_id)
+            """)
+
+            # IRT 문항 모수 (오프라인 보정 결과, 다음 보정의 초기값)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS question_irt_params (
+                    question_id INTEGER PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    discrimination REAL NOT NULL DEFAULT 1.0,
+                    difficulty REAL NOT NULL DEFAULT 0.0,
+                    difficulty_se REAL,
+                    responses INTEGER NOT NULL DEFAULT 0,
+                    calibrated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (question_id) REFERENCES questions(id)
+                )
+            """)
+
+            # IRT 사용자 능력치 (오프라인 보정 결과, 다음 보정의 초기값)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS user_abilities (
+                    user_id INTEGER PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    theta REAL NOT NULL DEFAULT 0.0,
+                    theta_se REAL,
+                    responses INTEGER NOT NULL DEFAULT 0,
+                    calibrated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users(id)
+                )
+            """)
+
+            # 시험/학습 세션별 문제 목록 (question_ids JSON 컬럼의 정규화 테이블, 위치 순서 유지)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS test_questions (
+                    test_id INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    question_id INTEGER NOT NULL,
+                    PRIMARY KEY (test_id, position),
+                    FOREIGN KEY (test_id) REFERENCES tests(id),
+                    FOREIGN KEY (question_id) REFERENCES questions(id)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_test_questions_question_id
+                ON test_questions(question_id)
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS study_session_questions (
+                    session_id INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    question_id INTEGER NOT NULL,
+                    PRIMARY KEY (session_id, position),
+                    FOREIGN KEY (session_id) REFERENCES study_sessions(id),
+                    FOREIGN KEY (question_id) REFERENCES questions(id)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_study_session_questions_question_id
+                ON study_session_questions(question_id)
+            """)
+
+            # 적응형 시험 세션 (응답마다 능력치를 추정하고 다음 문제를 선택)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS adaptive_tests (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    user_id INTEGER NOT NULL,
+                    level TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'in_progress',
+                    theta REAL NOT NULL DEFAULT 0.0,
+                    theta_se REAL NOT NULL DEFAULT 1.0,
+                    current_question_id INTEGER,
+                    max_questions INTEGER NOT NULL,
+                    target_se REAL NOT NULL,
+                    estimated_score REAL,
+                    recommended_level TEXT,
+                    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    completed_at TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users(id)
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_adaptive_tests_user_id
+                ON adaptive_tests(user_id)
+            """)
+
+            # 적응형 시험 응답 (응답마다 한 행만 추가, 출제 당시 문항 모수를 함께 저장)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS adaptive_test_responses (
+                    session_id INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    question_id INTEGER NOT NULL,
+                    answer TEXT NOT NULL,
+                    correct INTEGER NOT NULL,
+                    discrimination REAL NOT NULL,
+                    difficulty REAL NOT NULL,
+                    PRIMARY KEY (session_id, position),
+                    FOREIGN KEY (session_id) REFERENCES adaptive_tests(id)
+                )
+            """)
+
             conn.commit()
 
+    def _backfill_derived_tables(self):
+        """새로 추가된 파생 테이블을 원본 데이터에서 채움 (이미 채워져 있으면 건너뜀)"""
+        # Repository가 이 모듈을 import하므로 순환 import를 피해 지연 import
+        from backend.infrastructure.repositories.study_session_repository import SqliteStudySessionRepository
+        from backend.infrastructure.repositories.test_repository import SqliteTestRepository
+        from backend.infrastructure.repositories.user_daily_rollup_repository import (
+            SqliteUserDailyRollupRepository,
+        )
+        SqliteUserDailyRollupRepository(self).backfill_if_empty()
+        # 연결 테이블이 없는 시험/학습 세션의 문제 목록(JSON)을 test_questions/study_session_questions로 이관
+        SqliteTestRepository(self).backfill_question_links()
+        SqliteStudySessionRepository(self).backfill_question_links()
+
 
 # 전역 데이터베이스 인스턴스
 _db_instance = None
@@ -0,0 +1,138 @@
+"""
+SQLite 기반 적응형 시험 세션 Repository 구현
+세션의 현재 능력치 추정값과 출제 중인 문제는 adaptive_tests에, 응답은 adaptive_test_responses에 저장
+"""
+
+from typing import Any, Dict, List, Optional
+from backend.infrastructure.config.database import get_database, Database
+
+
+class StaleAdaptiveSessionError(ValueError):
+    """세션을 읽은 뒤 다른 요청이 먼저 응답을 저장해 현재 문제가 바뀐 경우"""
+
+
+class SqliteAdaptiveTestRepository:
+    """
+    적응형 시험 세션 Repository
+
+    adaptive_tests 테이블(테이블은 Database가 생성)의 한 행이 한 세션이고,
+    응답은 adaptive_test_responses에 (세션, 순서)마다 한 행씩 쌓입니다.
+    응답에는 출제 당시의 문항 모수를 함께 저장하므로 세션 도중 재보정이 일어나도
+    능력치 추정이 흔들리지 않습니다.
+    """
+
+    def __init__(self, db: Optional[Database] = None):
+        self.db = db or get_database()
+
+    def create(
+        self,
+        user_id: int,
+        level: str,
+        theta: float,
+        theta_se: float,
+        current_question_id: int,
+        max_questions: int,
+        target_se: float
+    ) -> Dict[str, Any]:
+        """
+        세션 생성
+
+        Args:
+            user_id: 사용자 ID
+            level: JLPT 레벨 (예: 'N5')
+            theta: 시작 능력치
+            theta_se: 시작 능력치 표준오차
+            current_question_id: 첫 문제 ID
+            max_questions: 최대 문제 수
+            target_se: 종료 기준 표준오차
+
+        Returns:
+            Dict[str, Any]: 생성된 세션
+        """
+        with self.db.get_connection() as conn:
+            cursor = conn.execute("""
+                INSERT INTO adaptive_tests
+                    (user_id, level, theta, theta_se, current_question_id, max_questions, target_se)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (user_id, level, theta, theta_se, current_question_id, max_questions, target_se))
+            conn.commit()
+            session_id = cursor.lastrowid
+        return self.find_by_id(session_id)
+
+    def find_by_id(self, session_id: int) -> Optional[Dict[str, Any]]:
+        """세션 조회 (없으면 None, 응답 목록은 답한 순서대로)"""
+        with self.db.get_connection() as conn:
+            row = conn.execute("SELECT * FROM adaptive_tests WHERE id = ?", (session_id,)).fetchone()
+            if not row:
+                return None
+            responses = conn.execute("""
+                SELECT question_id, answer, correct, discrimination, difficulty
+                FROM adaptive_test_responses
+                WHERE session_id = ?
+                ORDER BY position
+            """, (session_id,)).fetchall()
+        return self._to_dict(row, responses)
+
+    def save(self, session: Dict[str, Any], expected_question_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        세션 상태 저장 (능력치, 다음 문제, 새 응답, 종료 정보)
+
+        응답 목록은 덧붙이기만 하므로 이미 저장된 응답 뒤의 새 응답만 추가합니다
+        (응답 수에 관계없이 답할 때마다 한 행).
+
+        Args:
+            session: find_by_id/create가 반환한 세션을 갱신한 딕셔너리
+            expected_question_id: 응답한 문제 ID (지정하면 세션이 아직 진행 중이고 현재 문제가
+                이 문제일 때만 저장하는 compare-and-swap)
+
+        Returns:
+            Dict[str, Any]: 저장된 세션
+
+        Raises:
+            StaleAdaptiveSessionError: expected_question_id가 현재 문제가 아닌 경우 (다른 요청이 먼저 응답함)
+        """
+        query = """
+            UPDATE adaptive_tests
+            SET status = ?, theta = ?, theta_se = ?, current_question_id = ?,
+                estimated_score = ?, recommended_level = ?,
+                completed_at = CASE WHEN ? = 'completed' THEN COALESCE(completed_at, CURRENT_TIMESTAMP) END
+            WHERE id = ?
+        """
+        params = [
+            session['status'], session['theta'], session['theta_se'], session['current_question_id'],
+            session['estimated_score'], session['recommended_level'],
+            session['status'], session['id']
+        ]
+        if expected_question_id is not None:
+            query += " AND status = 'in_progress' AND current_question_id = ?"
+            params.append(expected_question_id)
+
+        with self.db.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if conn.execute(query, params).rowcount == 0 and expected_question_id is not None:
+                    raise StaleAdaptiveSessionError("이미 처리된 응답입니다. 현재 문제를 다시 불러와주세요.")
+                saved = conn.execute(
+                    "SELECT COUNT(*) FROM adaptive_test_responses WHERE session_id = ?", (session['id'],)
+                ).fetchone()[0]
+                conn.executemany("""
+                    INSERT INTO adaptive_test_responses
+                        (session_id, position, question_id, answer, correct, discrimination, difficulty)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                """, [
+                    (session['id'], position, r['question_id'], r['answer'], int(r['correct']),
+                     r['discrimination'], r['difficulty'])
+                    for position, r in enumerate(session['responses'][saved:], start=saved)
+                ])
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return self.find_by_id(session['id'])
+
+    @staticmethod
+    def _to_dict(row, responses: List[Any]) -> Dict[str, Any]:
+        """조회 행 + 응답 행 -> 세션 딕셔너리"""
+        session = dict(row)
+        session['responses'] = [dict(r, correct=bool(r['correct'])) for r in responses]
+        return session
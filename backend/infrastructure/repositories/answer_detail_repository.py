@@ -35,6 +35,11 @@ class SqliteAnswerDetailRepository:
                     FOREIGN KEY (question_id) REFERENCES questions(id)
                 )
             """)
+            # 결과별 답안 조회/유형별 집계(일별 롤업)용 인덱스
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_answer_details_result_id
+                ON answer_details(result_id)
+            """)
             conn.commit()
 
     def save(self, answer_detail: AnswerDetail) -> AnswerDetail:
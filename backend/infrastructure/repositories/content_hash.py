@@ -0,0 +1,75 @@
+"""
+콘텐츠 해시 계산
+임포트 중복 제거를 위해 문제/단어의 정규화된 내용으로 해시를 생성
+"""
+
+import hashlib
+import json
+import re
+import unicodedata
+from typing import Iterable, List, Optional
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class DuplicateContentError(ValueError):
+    """내용(콘텐츠 해시)이 같은 문제/단어가 이미 있을 때"""
+
+    def __init__(self, message: str, existing_id: int):
+        super().__init__(message)
+        self.existing_id = existing_id
+
+
+def normalize_text(text: Optional[str]) -> str:
+    """
+    비교용 텍스트 정규화
+
+    NFKC 정규화(전각/반각 통일), 대소문자 통일, 연속 공백 축약, 앞뒤 공백 제거를 수행합니다.
+    """
+    if not text:
+        return ""
+    normalized = unicodedata.normalize("NFKC", text).casefold()
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def _digest(parts: Iterable) -> str:
+    """정규화된 값 목록의 SHA-256 해시"""
+    payload = json.dumps(list(parts), ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def question_content_hash(
+    level: str,
+    question_type: str,
+    question_text: str,
+    choices: List[str],
+    correct_answer: str
+) -> str:
+    """
+    문제 콘텐츠 해시
+
+    (레벨, 유형, 문제 내용, 선택지, 정답)으로 계산합니다.
+    선택지는 순서를 섞어 출제해도 같은 문제이므로 정렬한 뒤 사용합니다.
+    """
+    return _digest([
+        level,
+        question_type,
+        normalize_text(question_text),
+        sorted(normalize_text(choice) for choice in choices),
+        normalize_text(correct_answer),
+    ])
+
+
+def vocabulary_content_hash(word: str, reading: str, level: str) -> str:
+    """단어 콘텐츠 해시 ((단어, 읽기, 레벨)로 계산)"""
+    return _digest([normalize_text(word), normalize_text(reading), level])
+
+
+def legacy_duplicate_hash(content_hash: str, row_id: int) -> str:
+    """
+    기존 중복 행용 해시
+
+    고유 인덱스 도입 전에 저장된 중복 행은 삭제하지 않고(시험/학습 기록이 참조할 수 있음),
+    행 ID를 붙인 해시를 부여해 인덱스와 충돌하지 않게 합니다.
+    """
+    return f"{content_hash}#{row_id}"
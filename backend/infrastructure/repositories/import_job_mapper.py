@@ -0,0 +1,96 @@
+"""
+ImportJob Mapper 구현
+데이터베이스 행과 ImportJob 엔티티 간 변환
+"""
+
+import json
+import sqlite3
+from typing import Dict, Any, Optional
+from datetime import datetime
+from backend.domain.entities.import_job import ImportJob
+from backend.domain.value_objects.jlpt import ImportJobStatus, ImportJobType
+
+
+class ImportJobMapper:
+    """ImportJob 엔티티와 데이터베이스 행 간 변환"""
+
+    @staticmethod
+    def to_dict(job: ImportJob) -> Dict[str, Any]:
+        """
+        ImportJob 엔티티를 딕셔너리로 변환
+
+        Args:
+            job: ImportJob 엔티티
+
+        Returns:
+            Dict[str, Any]: 딕셔너리
+        """
+        return {
+            'id': job.id,
+            'job_type': job.job_type.value,
+            'file_path': job.file_path,
+            'file_type': job.file_type,
+            'original_filename': job.original_filename,
+            'status': job.status.value,
+            'created_by': job.created_by,
+            'rows_processed': job.rows_processed,
+            'rows_imported': job.rows_imported,
+            'rows_duplicates': job.rows_duplicates,
+            'rows_rejected': job.rows_rejected,
+            'errors': json.dumps(job.errors, ensure_ascii=False),
+            'error_message': job.error_message,
+            'elapsed_seconds': job.elapsed_seconds,
+            'attempts': job.attempts,
+            'created_at': ImportJobMapper._format_datetime(job.created_at),
+            'started_at': ImportJobMapper._format_datetime(job.started_at),
+            'heartbeat_at': ImportJobMapper._format_datetime(job.heartbeat_at),
+            'finished_at': ImportJobMapper._format_datetime(job.finished_at)
+        }
+
+    @staticmethod
+    def to_entity(row: sqlite3.Row) -> ImportJob:
+        """
+        데이터베이스 행을 ImportJob 엔티티로 변환
+
+        Args:
+            row: 데이터베이스 행 (sqlite3.Row)
+
+        Returns:
+            ImportJob: ImportJob 엔티티
+        """
+        return ImportJob(
+            id=row['id'],
+            job_type=ImportJobType(row['job_type']),
+            file_path=row['file_path'],
+            file_type=row['file_type'],
+            original_filename=row['original_filename'],
+            status=ImportJobStatus(row['status']),
+            created_by=row['created_by'],
+            rows_processed=row['rows_processed'],
+            rows_imported=row['rows_imported'],
+            rows_duplicates=row['rows_duplicates'],
+            rows_rejected=row['rows_rejected'],
+            errors=json.loads(row['errors']) if row['errors'] else [],
+            error_message=row['error_message'],
+            elapsed_seconds=row['elapsed_seconds'] or 0.0,
+            attempts=row['attempts'],
+            created_at=ImportJobMapper._parse_datetime(row['created_at']),
+            started_at=ImportJobMapper._parse_datetime(row['started_at']),
+            heartbeat_at=ImportJobMapper._parse_datetime(row['heartbeat_at']),
+            finished_at=ImportJobMapper._parse_datetime(row['finished_at'])
+        )
+
+    @staticmethod
+    def _format_datetime(value: Optional[datetime]) -> Optional[str]:
+        """datetime 객체를 ISO 형식 문자열로 변환"""
+        return value.isoformat() if value else None
+
+    @staticmethod
+    def _parse_datetime(datetime_str: Optional[str]) -> Optional[datetime]:
+        """ISO 형식의 datetime 문자열을 datetime 객체로 변환"""
+        if not datetime_str:
+            return None
+        try:
+            return datetime.fromisoformat(datetime_str.replace('Z', '+00:00'))
+        except (ValueError, TypeError):
+            return None
@@ -0,0 +1,149 @@
+"""
+SQLite 기반 ImportJob Repository 구현
+"""
+
+from typing import List, Optional
+from backend.domain.entities.import_job import ImportJob
+from backend.domain.value_objects.jlpt import ImportJobStatus
+from backend.infrastructure.config.database import get_database, Database
+from backend.infrastructure.repositories.import_job_mapper import ImportJobMapper
+
+
+class SqliteImportJobRepository:
+    """SQLite 기반 ImportJob Repository 구현"""
+
+    def __init__(self, db: Optional[Database] = None):
+        self.db = db or get_database()
+        self._ensure_table_exists()
+
+    def _ensure_table_exists(self):
+        """테이블이 존재하는지 확인하고 없으면 생성"""
+        with self.db.get_connection() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS import_jobs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    job_type TEXT NOT NULL,
+                    file_path TEXT NOT NULL,
+                    file_type TEXT NOT NULL,
+                    original_filename TEXT,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    created_by INTEGER,
+                    rows_processed INTEGER NOT NULL DEFAULT 0,
+                    rows_imported INTEGER NOT NULL DEFAULT 0,
+                    rows_duplicates INTEGER NOT NULL DEFAULT 0,
+                    rows_rejected INTEGER NOT NULL DEFAULT 0,
+                    errors TEXT,
+                    error_message TEXT,
+                    elapsed_seconds REAL NOT NULL DEFAULT 0,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    started_at TIMESTAMP,
+                    heartbeat_at TIMESTAMP,
+                    finished_at TIMESTAMP,
+                    FOREIGN KEY (created_by) REFERENCES users(id)
+                )
+            """)
+            # 워커가 실행할 작업(대기 중/진행 중) 조회 인덱스
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_import_jobs_status
+                ON import_jobs(status, id)
+            """)
+            conn.commit()
+
+    def save(self, job: ImportJob) -> ImportJob:
+        """ImportJob 저장/업데이트"""
+        with self.db.get_connection() as conn:
+            data = ImportJobMapper.to_dict(job)
+
+            if job.id is None or job.id == 0:
+                # 새 작업 생성
+                cursor = conn.execute("""
+                    INSERT INTO import_jobs (job_type, file_path, file_type, original_filename,
+                                             status, created_by, rows_processed, rows_imported,
+                                             rows_duplicates, rows_rejected, errors, error_message,
+                                             elapsed_seconds, attempts, created_at, started_at,
+                                             heartbeat_at, finished_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    data['job_type'], data['file_path'], data['file_type'], data['original_filename'],
+                    data['status'], data['created_by'], data['rows_processed'], data['rows_imported'],
+                    data['rows_duplicates'], data['rows_rejected'], data['errors'], data['error_message'],
+                    data['elapsed_seconds'], data['attempts'], data['created_at'], data['started_at'],
+                    data['heartbeat_at'], data['finished_at']
+                ))
+
+                # 생성된 ID를 작업 객체에 설정
+                job.id = cursor.lastrowid
+            else:
+                # 기존 작업 업데이트 (진행 상황/상태)
+                conn.execute("""
+                    UPDATE import_jobs
+                    SET status = ?, rows_processed = ?, rows_imported = ?, rows_duplicates = ?,
+                        rows_rejected = ?, errors = ?, error_message = ?, elapsed_seconds = ?,
+                        attempts = ?, started_at = ?, heartbeat_at = ?, finished_at = ?
+                    WHERE id = ?
+                """, (
+                    data['status'], data['rows_processed'], data['rows_imported'],
+                    data['rows_duplicates'], data['rows_rejected'], data['errors'],
+                    data['error_message'], data['elapsed_seconds'], data['attempts'],
+                    data['started_at'], data['heartbeat_at'], data['finished_at'], job.id
+                ))
+
+            conn.commit()
+            return job
+
+    def claim(self, job: ImportJob, previous: ImportJob) -> bool:
+        """
+        작업 실행 권한 획득 (compare-and-swap)
+
+        job.start()로 실행 상태가 된 작업을, DB의 상태/진행 기록이 previous와 같을 때만 저장합니다.
+        여러 워커가 같은 작업을 동시에 가져가려 해도 하나만 성공합니다.
+
+        Args:
+            job: start()를 호출한 작업
+            previous: start() 호출 전에 조회한 작업 (상태/heartbeat 비교 기준)
+
+        Returns:
+            실행 권한을 얻었으면 True
+        """
+        data = ImportJobMapper.to_dict(job)
+        previous_data = ImportJobMapper.to_dict(previous)
+        with self.db.get_connection() as conn:
+            cursor = conn.execute("""
+                UPDATE import_jobs
+                SET status = ?, attempts = ?, started_at = ?, heartbeat_at = ?
+                WHERE id = ? AND status = ? AND heartbeat_at IS ?
+            """, (
+                data['status'], data['attempts'], data['started_at'], data['heartbeat_at'],
+                job.id, previous_data['status'], previous_data['heartbeat_at']
+            ))
+            conn.commit()
+            return cursor.rowcount == 1
+
+    def find_by_id(self, id: int) -> Optional[ImportJob]:
+        """ID로 ImportJob 조회"""
+        with self.db.get_connection() as conn:
+            cursor = conn.execute("SELECT * FROM import_jobs WHERE id = ?", (id,))
+            row = cursor.fetchone()
+
+            if row:
+                return ImportJobMapper.to_entity(row)
+            return None
+
+    def find_recent(self, limit: int = 50) -> List[ImportJob]:
+        """최근 작업 목록 조회 (ID 내림차순)"""
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT * FROM import_jobs ORDER BY id DESC LIMIT ?",
+                (limit,)
+            )
+            return [ImportJobMapper.to_entity(row) for row in cursor.fetchall()]
+
+    def find_unfinished(self) -> List[ImportJob]:
+        """대기 중이거나 진행 중인 작업 조회 (ID 오름차순, 워커가 재개 대상을 찾을 때 사용)"""
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT * FROM import_jobs WHERE status IN (?, ?) ORDER BY id",
+                (ImportJobStatus.PENDING.value, ImportJobStatus.RUNNING.value)
+            )
+            return [ImportJobMapper.to_entity(row) for row in cursor.fetchall()]
@@ -0,0 +1,148 @@
+"""
+SQLite 기반 IRT 모수 Repository 구현
+보정용 응답을 청크로 읽고, 문항 모수(question_irt_params)와 사용자 능력치(user_abilities)를 저장/조회
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from backend.infrastructure.config.database import get_database, Database
+
+
+class SqliteIrtParameterRepository:
+    """
+    IRT 모수 Repository
+
+    question_irt_params, user_abilities 테이블(테이블은 Database가 생성)은 answer_details의
+    오프라인 보정 결과입니다. 저장된 값은 다음 보정의 초기값(warm start)으로도 사용합니다.
+    """
+
+    def __init__(self, db: Optional[Database] = None):
+        self.db = db or get_database()
+
+    def iter_responses(self, chunk_size: int = 100_000) -> Iterator[List[Tuple[int, int, int]]]:
+        """
+        보정용 응답을 청크 단위로 조회 (전체를 한 번에 메모리에 올리지 않음)
+
+        Args:
+            chunk_size: 청크당 응답 수
+
+        Yields:
+            List[Tuple[int, int, int]]: (user_id, question_id, 정답 여부) 목록
+        """
+        with self.db.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT r.user_id, ad.question_id, ad.is_correct
+                FROM answer_details ad
+                JOIN results r ON r.id = ad.result_id
+            """)
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield [tuple(row) for row in rows]
+
+    def find_item_params(self) -> Dict[int, Tuple[float, float]]:
+        """저장된 문항 모수 (question_id -> (discrimination, difficulty))"""
+        with self.db.get_connection() as conn:
+            return {
+                row['question_id']: (row['discrimination'], row['difficulty'])
+                for row in conn.execute(
+                    "SELECT question_id, discrimination, difficulty FROM question_irt_params"
+                ).fetchall()
+            }
+
+    def find_user_abilities(self) -> Dict[int, float]:
+        """저장된 사용자 능력치 (user_id -> theta)"""
+        with self.db.get_connection() as conn:
+            return {
+                row['user_id']: row['theta']
+                for row in conn.execute("SELECT user_id, theta FROM user_abilities").fetchall()
+            }
+
+    def find_by_question_id(self, question_id: int) -> Optional[Dict[str, Any]]:
+        """문항 모수 조회 (보정된 적이 없으면 None)"""
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM question_irt_params WHERE question_id = ?", (question_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def find_by_question_ids(self, question_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """여러 문항 모수 조회 (question_id -> 모수, 보정되지 않은 문항은 제외)"""
+        if not question_ids:
+            return {}
+        placeholders = ','.join('?' * len(question_ids))
+        with self.db.get_connection() as conn:
+            return {
+                row['question_id']: dict(row)
+                for row in conn.execute(
+                    f"SELECT * FROM question_irt_params WHERE question_id IN ({placeholders})",
+                    list(question_ids)
+                ).fetchall()
+            }
+
+    def find_item_pool(self, level: str) -> List[Tuple[int, Optional[float], Optional[float], int]]:
+        """
+        레벨의 적응형 시험 문제 은행 조회
+
+        Args:
+            level: JLPT 레벨 (예: 'N5')
+
+        Returns:
+            List[Tuple]: (question_id, discrimination, difficulty, 문제 난이도(1-5)) 목록
+                (보정되지 않은 문제는 discrimination/difficulty가 None)
+        """
+        with self.db.get_connection() as conn:
+            return [
+                tuple(row)
+                for row in conn.execute("""
+                    SELECT q.id, p.discrimination, p.difficulty, q.difficulty
+                    FROM questions q
+                    LEFT JOIN question_irt_params p ON p.question_id = q.id
+                    WHERE q.level = ?
+                """, (level,)).fetchall()
+            ]
+
+    def find_by_user_id(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """사용자 능력치 조회 (보정된 적이 없으면 None)"""
+        with self.db.get_connection() as conn:
+            row = conn.execute("SELECT * FROM user_abilities WHERE user_id = ?", (user_id,)).fetchone()
+        return dict(row) if row else None
+
+    def save_calibration(
+        self,
+        model: str,
+        items: List[Tuple[int, float, float, float, int]],
+        users: List[Tuple[int, float, float, int]]
+    ) -> None:
+        """
+        보정 결과를 한 트랜잭션으로 저장 (이번 보정에 포함되지 않은 문항/사용자는 유지)
+
+        Args:
+            model: IRT 모델 ('1pl', '2pl')
+            items: (question_id, discrimination, difficulty, difficulty_se, 응답 수) 목록
+            users: (user_id, theta, theta_se, 응답 수) 목록
+        """
+        with self.db.get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO question_irt_params
+                    (question_id, model, discrimination, difficulty, difficulty_se, responses, calibrated_at)
+                VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(question_id) DO UPDATE SET
+                    model = excluded.model,
+                    discrimination = excluded.discrimination,
+                    difficulty = excluded.difficulty,
+                    difficulty_se = excluded.difficulty_se,
+                    responses = excluded.responses,
+                    calibrated_at = CURRENT_TIMESTAMP
+            """, [(question_id, model, a, b, se, n) for question_id, a, b, se, n in items])
+            conn.executemany("""
+                INSERT INTO user_abilities (user_id, model, theta, theta_se, responses, calibrated_at)
+                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(user_id) DO UPDATE SET
+                    model = excluded.model,
+                    theta = excluded.theta,
+                    theta_se = excluded.theta_se,
+                    responses = excluded.responses,
+                    calibrated_at = CURRENT_TIMESTAMP
+            """, [(user_id, model, theta, se, n) for user_id, theta, se, n in users])
+            conn.commit()
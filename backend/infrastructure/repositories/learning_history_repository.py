@@ -2,11 +2,12 @@
 SQLite 기반 LearningHistory Repository 구현
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import date
 from backend.domain.entities.learning_history import LearningHistory
 from backend.infrastructure.config.database import get_database, Database
 from backend.infrastructure.repositories.learning_history_mapper import LearningHistoryMapper
+from backend.infrastructure.repositories.user_daily_rollup_repository import SqliteUserDailyRollupRepository
 
 
 class SqliteLearningHistoryRepository:
@@ -36,10 +37,15 @@ class SqliteLearningHistoryRepository:
                     FOREIGN KEY (result_id) REFERENCES results(id)
                 )
             """)
+            # 사용자별 날짜 집계/조회용 복합 인덱스
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_learning_history_user_date
+                ON learning_history(user_id, study_date)
+            """)
             conn.commit()
 
     def save(self, learning_history: LearningHistory) -> LearningHistory:
-        """LearningHistory 저장/업데이트"""
+        """LearningHistory 저장/업데이트 (같은 트랜잭션에서 일별 롤업 갱신)"""
         with self.db.get_connection() as conn:
             data = LearningHistoryMapper.to_dict(learning_history)
 
@@ -59,7 +65,8 @@ class SqliteLearningHistoryRepository:
                 # 생성된 ID를 LearningHistory 객체에 설정
                 learning_history.id = cursor.lastrowid
             else:
-                # 기존 LearningHistory 업데이트
+                # 기존 LearningHistory 업데이트 (이전 값은 롤업에서 빼기)
+                self._apply_rollup(conn, learning_history.id, sign=-1)
                 conn.execute("""
                     UPDATE learning_history
                     SET user_id = ?, test_id = ?, result_id = ?, study_date = ?,
@@ -72,6 +79,7 @@ class SqliteLearningHistoryRepository:
                     data['time_spent_minutes'], learning_history.id
                 ))
 
+            self._apply_rollup(conn, learning_history.id, sign=1)
             conn.commit()
             return learning_history
 
@@ -99,9 +107,27 @@ class SqliteLearningHistoryRepository:
             return
 
         with self.db.get_connection() as conn:
+            self._apply_rollup(conn, learning_history.id, sign=-1)
             conn.execute("DELETE FROM learning_history WHERE id = ?", (learning_history.id,))
             conn.commit()
 
+    @staticmethod
+    def _apply_rollup(conn, id: int, sign: int) -> None:
+        """저장된 학습 이력 한 건을 일별 롤업에 더하거나(sign=1) 빼기(sign=-1)"""
+        row = conn.execute(
+            "SELECT user_id, result_id, study_date, total_questions, correct_count, time_spent_minutes "
+            "FROM learning_history WHERE id = ?",
+            (id,)
+        ).fetchone()
+        if row is None:
+            return
+        counts = SqliteUserDailyRollupRepository.test_counts(
+            conn, row['result_id'], row['total_questions'], row['correct_count'], row['time_spent_minutes']
+        )
+        if sign < 0:
+            counts = SqliteUserDailyRollupRepository.negate(counts)
+        SqliteUserDailyRollupRepository.apply(conn, row['user_id'], row['study_date'], counts)
+
     def exists_by_id(self, id: int) -> bool:
         """ID 존재 여부 확인"""
         with self.db.get_connection() as conn:
@@ -129,3 +155,25 @@ class SqliteLearningHistoryRepository:
             rows = cursor.fetchall()
 
             return [LearningHistoryMapper.to_entity(row) for row in rows]
+
+    def aggregate_by_hour(self, user_id: int, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """
+        기간 내 학습 시간대(study_hour)별 합계 (user_id, study_date 인덱스 범위만 집계)
+
+        Returns:
+            List[Dict[str, Any]]: study_hour, sessions, total_questions, correct_count, time_spent_minutes
+                (기록이 있는 시간대만, 시간대 순 정렬)
+        """
+        with self.db.get_connection() as conn:
+            rows = conn.execute("""
+                SELECT study_hour,
+                       COUNT(*) AS sessions,
+                       SUM(total_questions) AS total_questions,
+                       SUM(correct_count) AS correct_count,
+                       SUM(time_spent_minutes) AS time_spent_minutes
+                FROM learning_history
+                WHERE user_id = ? AND study_date BETWEEN ? AND ?
+                GROUP BY study_hour
+                ORDER BY study_hour
+            """, (user_id, start_date.isoformat(), end_date.isoformat())).fetchall()
+            return [dict(row) for row in rows]
@@ -0,0 +1,137 @@
+"""
+SQLite 기반 레벨별 점수 이력 Repository 구현
+시험 점수를 추가 전용 시계열로 저장하고 (user_id, level, study_date) 인덱스로 구간 조회
+"""
+
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from backend.infrastructure.config.database import get_database, Database
+
+
+class SqliteLevelScoreRepository:
+    """
+    레벨별 점수 이력 Repository
+
+    level_scores 테이블(테이블은 Database가 생성)은 시험 제출마다 한 행을 추가하기만 합니다.
+    UserPerformance.level_progression에는 레벨별 요약만 남기고, 차트용 점수 추이는
+    이 테이블의 구간 조회로 가져옵니다.
+    """
+
+    def __init__(self, db: Optional[Database] = None):
+        self.db = db or get_database()
+
+    def add(
+        self,
+        user_id: int,
+        level: str,
+        study_date: date,
+        score: float,
+        result_id: Optional[int] = None
+    ) -> int:
+        """
+        점수 한 건 추가
+
+        Args:
+            user_id: 사용자 ID
+            level: JLPT 레벨 (예: 'N5')
+            study_date: 시험 날짜
+            score: 점수 (0~100)
+            result_id: 결과 ID
+
+        Returns:
+            int: 추가된 행 ID
+        """
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                "INSERT INTO level_scores (user_id, level, study_date, score, result_id) VALUES (?, ?, ?, ?, ?)",
+                (user_id, level, study_date.isoformat(), score, result_id)
+            )
+            conn.commit()
+            return cursor.lastrowid
+
+    def add_all(self, scores: Iterable[Tuple[int, str, str, float, Optional[int]]]) -> int:
+        """
+        점수 여러 건을 한 트랜잭션으로 추가
+
+        Args:
+            scores: (user_id, level, 날짜(ISO 형식), score, result_id) 목록
+
+        Returns:
+            int: 추가된 행 수
+        """
+        rows = list(scores)
+        if not rows:
+            return 0
+        with self.db.get_connection() as conn:
+            self.insert_all(conn, rows)
+            conn.commit()
+        return len(rows)
+
+    @staticmethod
+    def insert_all(conn, scores: Iterable[Tuple[int, str, str, float, Optional[int]]]) -> None:
+        """
+        현재 트랜잭션에서 점수 여러 건 추가 (커밋하지 않음)
+
+        Args:
+            conn: 성능 데이터 등 다른 변경을 함께 저장하는 트랜잭션의 연결
+            scores: (user_id, level, 날짜(ISO 형식), score, result_id) 목록
+        """
+        conn.executemany(
+            "INSERT INTO level_scores (user_id, level, study_date, score, result_id) VALUES (?, ?, ?, ?, ?)",
+            scores
+        )
+
+    @staticmethod
+    def legacy_rows(user_id: int, legacy: Dict[str, List[Dict[str, Any]]]) -> List[Tuple[int, str, str, float, None]]:
+        """
+        예전 형식 level_progression의 점수 목록을 insert_all 행으로 변환 (date/score가 없는 항목은 제외)
+
+        Args:
+            user_id: 사용자 ID
+            legacy: 레벨 -> {date, score} 목록 (UserPerformance.compact_level_progression 결과)
+        """
+        return [
+            (user_id, level, entry['date'], entry['score'], None)
+            for level, entries in legacy.items()
+            for entry in entries
+            if isinstance(entry, dict) and 'date' in entry and 'score' in entry
+        ]
+
+    def find_levels(self, user_id: int) -> List[str]:
+        """점수 이력이 있는 레벨 목록 (레벨 순)"""
+        with self.db.get_connection() as conn:
+            return [row['level'] for row in conn.execute(
+                "SELECT DISTINCT level FROM level_scores WHERE user_id = ? ORDER BY level",
+                (user_id,)
+            ).fetchall()]
+
+    def find_series(self, user_id: int, level: str, start_date: date, end_date: date) -> List[Tuple[str, float]]:
+        """
+        기간 내 점수 이력 (시험 순서대로)
+
+        Returns:
+            List[Tuple[str, float]]: (날짜(ISO 형식), 점수) 목록
+        """
+        with self.db.get_connection() as conn:
+            return [tuple(row) for row in conn.execute("""
+                SELECT study_date, score
+                FROM level_scores
+                WHERE user_id = ? AND level = ? AND study_date BETWEEN ? AND ?
+                ORDER BY study_date, id
+            """, (user_id, level, start_date.isoformat(), end_date.isoformat())).fetchall()]
+
+    def find_daily_max(self, user_id: int, level: str, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """
+        기간 내 일별 최고 점수 (시험을 본 날만)
+
+        Returns:
+            List[Dict[str, Any]]: date, score(그날 최고 점수), tests(그날 시험 수) 목록, 날짜 순
+        """
+        with self.db.get_connection() as conn:
+            return [dict(row) for row in conn.execute("""
+                SELECT study_date AS date, MAX(score) AS score, COUNT(*) AS tests
+                FROM level_scores
+                WHERE user_id = ? AND level = ? AND study_date BETWEEN ? AND ?
+                GROUP BY study_date
+                ORDER BY study_date
+            """, (user_id, level, start_date.isoformat(), end_date.isoformat())).fetchall()]
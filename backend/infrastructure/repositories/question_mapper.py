@@ -7,6 +7,7 @@ import sqlite3
 from typing import Dict, Any
 from backend.domain.entities.question import Question
 from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.repositories.content_hash import question_content_hash
 
 
 class QuestionMapper:
@@ -22,19 +23,11 @@ class QuestionMapper:
             except (json.JSONDecodeError, ValueError) as e:
                 raise ValueError(f"Invalid choices JSON: {e}")
 
-        # audio_url은 선택적 필드이므로 키가 없을 수 있음
-        audio_url = None
-        try:
-            # sqlite3.Row나 MockRow 모두 처리
-            if hasattr(row, 'keys') and 'audio_url' in row.keys():
-                audio_url = row['audio_url']
-            elif hasattr(row, '__getitem__'):
-                try:
-                    audio_url = row['audio_url']
-                except (KeyError, IndexError):
-                    pass
-        except Exception:
-            pass
+        # 오디오 필드는 선택적이므로 키가 없을 수 있음 (sqlite3.Row나 MockRow 모두 처리)
+        audio = {
+            key: QuestionMapper._optional(row, key)
+            for key in ('audio_url', 'audio_size_bytes', 'audio_duration_ms', 'audio_etag')
+        }
 
         return Question(
             id=row['id'],
@@ -45,9 +38,19 @@ class QuestionMapper:
             correct_answer=row['correct_answer'],
             explanation=row['explanation'],
             difficulty=row['difficulty'],
-            audio_url=audio_url
+            **audio
         )
 
+    @staticmethod
+    def _optional(row: Any, key: str) -> Any:
+        """행에서 선택적 컬럼 값 조회 (컬럼이 없으면 None)"""
+        try:
+            if hasattr(row, 'keys'):
+                return row[key] if key in row.keys() else None
+            return row[key]
+        except Exception:
+            return None
+
     @staticmethod
     def to_dict(question: Question) -> Dict[str, Any]:
         """Question 엔티티를 데이터베이스 행으로 변환"""
@@ -59,7 +62,14 @@ class QuestionMapper:
             'correct_answer': question.correct_answer,
             'explanation': question.explanation,
             'difficulty': question.difficulty,
-            'audio_url': question.audio_url
+            'audio_url': question.audio_url,
+            'audio_size_bytes': question.audio_size_bytes,
+            'audio_duration_ms': question.audio_duration_ms,
+            'audio_etag': question.audio_etag,
+            'content_hash': question_content_hash(
+                question.level.value, question.question_type.value,
+                question.question_text, question.choices, question.correct_answer
+            )
         }
         return data
 
@@ -2,54 +2,233 @@
 SQLite 기반 Question Repository 구현
 """
 
+import json
 import random
-from typing import List, Optional, Dict
+import sqlite3
+from typing import Iterable, List, Optional, Dict, Tuple
 from backend.domain.entities.question import Question
 from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.adapters.audio_metadata import AudioMetadata
 from backend.infrastructure.config.database import get_database, Database
 from backend.infrastructure.repositories.question_mapper import QuestionMapper
+from backend.infrastructure.repositories.content_hash import (
+    DuplicateContentError,
+    legacy_duplicate_hash,
+    question_content_hash,
+)
+
+
+def _invalidate_question_caches(levels: Optional[Iterable[JLPTLevel]] = None) -> None:
+    """
+    문제 목록으로 만든 메모리 캐시(시험 조립 색인, 적응형 시험 문제 은행) 무효화
+
+    Args:
+        levels: 문제가 추가/변경/삭제된 레벨 (None이면 모든 레벨)
+    """
+    # 두 서비스가 이 모듈(또는 이 모듈을 쓰는 Repository)을 import하므로 순환 import를 피해 지연 import
+    from backend.domain.services.adaptive_test_service import AdaptiveTestService
+    from backend.domain.services.test_assembly_service import TestAssemblyService
+
+    if levels is None:
+        TestAssemblyService.invalidate()
+        AdaptiveTestService.invalidate()
+        return
+    for level in set(levels):
+        TestAssemblyService.invalidate(level)
+        AdaptiveTestService.invalidate(level.value)
 
 
 class SqliteQuestionRepository:
-    """SQLite 기반 Question Repository 구현"""
+    """
+    SQLite 기반 Question Repository 구현
+
+    문제를 저장/삭제하면 해당 레벨의 시험 조립 색인과 적응형 시험 문제 은행 캐시를 무효화합니다.
+    """
+
+    # IN 절 하나에 바인딩할 최대 파라미터 수 (구버전 SQLite 한도 999 이하)
+    _MAX_IN_PARAMS = 500
+
+    _INSERT_SQL = """
+        INSERT INTO questions (level, question_type, question_text,
+                             choices, correct_answer, explanation, difficulty, audio_url,
+                             audio_size_bytes, audio_duration_ms, audio_etag, content_hash)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    # 임포트(save_all)에서 콘텐츠 해시가 같은 문제를 다시 저장하면 해시에 포함되지 않는 필드만 갱신
+    # (오디오 메타데이터는 audio_url이 바뀌면 함께 교체하고, 같으면 새 값이 있을 때만 갱신)
+    _UPSERT_SQL = _INSERT_SQL.rstrip() + """
+        ON CONFLICT(content_hash) DO UPDATE SET
+            explanation = excluded.explanation,
+            difficulty = excluded.difficulty,
+            audio_url = COALESCE(excluded.audio_url, questions.audio_url),
+            audio_size_bytes = CASE
+                WHEN excluded.audio_url IS NOT NULL AND questions.audio_url IS NOT excluded.audio_url
+                THEN excluded.audio_size_bytes
+                ELSE COALESCE(excluded.audio_size_bytes, questions.audio_size_bytes)
+            END,
+            audio_duration_ms = CASE
+                WHEN excluded.audio_url IS NOT NULL AND questions.audio_url IS NOT excluded.audio_url
+                THEN excluded.audio_duration_ms
+                ELSE COALESCE(excluded.audio_duration_ms, questions.audio_duration_ms)
+            END,
+            audio_etag = CASE
+                WHEN excluded.audio_url IS NOT NULL AND questions.audio_url IS NOT excluded.audio_url
+                THEN excluded.audio_etag
+                ELSE COALESCE(excluded.audio_etag, questions.audio_etag)
+            END
+        WHERE questions.explanation IS NOT excluded.explanation
+           OR questions.difficulty IS NOT excluded.difficulty
+           OR (excluded.audio_url IS NOT NULL AND questions.audio_url IS NOT excluded.audio_url)
+           OR (excluded.audio_etag IS NOT NULL AND questions.audio_etag IS NOT excluded.audio_etag)
+    """
 
     def __init__(self, db: Optional[Database] = None):
         self.db = db or get_database()
+        self._ensure_content_hash_index()
+
+    def _ensure_content_hash_index(self):
+        """콘텐츠 해시 고유 인덱스 생성 및 해시가 없는 기존 문제 백필"""
+        with self.db.get_connection() as conn:
+            conn.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_questions_content_hash
+                ON questions(content_hash)
+            """)
+            rows = conn.execute(
+                "SELECT * FROM questions WHERE content_hash IS NULL ORDER BY id"
+            ).fetchall()
+            if rows:
+                taken = {
+                    row[0] for row in conn.execute(
+                        "SELECT content_hash FROM questions WHERE content_hash IS NOT NULL"
+                    )
+                }
+                updates = []
+                for row in rows:
+                    content_hash = question_content_hash(
+                        row['level'], row['question_type'], row['question_text'],
+                        json.loads(row['choices'] or '[]'), row['correct_answer']
+                    )
+                    if content_hash in taken:
+                        content_hash = legacy_duplicate_hash(content_hash, row['id'])
+                    taken.add(content_hash)
+                    updates.append((content_hash, row['id']))
+                conn.executemany("UPDATE questions SET content_hash = ? WHERE id = ?", updates)
+            conn.commit()
+
+    @staticmethod
+    def _to_params(data: Dict) -> Tuple:
+        """to_dict 결과를 _INSERT_SQL/_UPSERT_SQL 파라미터로 변환"""
+        return (
+            data['level'], data['question_type'], data['question_text'],
+            data['choices'], data['correct_answer'], data['explanation'],
+            data['difficulty'], data.get('audio_url'), data.get('audio_size_bytes'),
+            data.get('audio_duration_ms'), data.get('audio_etag'), data['content_hash']
+        )
+
+    def _find_ids_by_content_hashes(self, conn, hashes: List[str]) -> Dict[str, int]:
+        """콘텐츠 해시로 문제 ID 조회"""
+        ids: Dict[str, int] = {}
+        unique_hashes = list(dict.fromkeys(hashes))
+        for start in range(0, len(unique_hashes), self._MAX_IN_PARAMS):
+            chunk = unique_hashes[start:start + self._MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = conn.execute(
+                f"SELECT content_hash, id FROM questions WHERE content_hash IN ({placeholders})",
+                chunk
+            )
+            ids.update({row[0]: row[1] for row in cursor})
+        return ids
 
     def save(self, question: Question) -> Question:
-        """문제 저장/업데이트"""
+        """
+        문제 저장/업데이트
+
+        Raises:
+            DuplicateContentError: 새 문제와 내용(콘텐츠 해시)이 같은 문제가 이미 있는 경우
+                (기존 문제를 갱신하는 임포트는 save_all 사용)
+        """
         with self.db.get_connection() as conn:
             data = QuestionMapper.to_dict(question)
+            is_new = question.id is None or question.id == 0
 
-            if question.id is None or question.id == 0:
+            if is_new:
                 # 새 문제 생성
-                cursor = conn.execute("""
-                    INSERT INTO questions (level, question_type, question_text,
-                                         choices, correct_answer, explanation, difficulty, audio_url)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    data['level'], data['question_type'], data['question_text'],
-                    data['choices'], data['correct_answer'], data['explanation'],
-                    data['difficulty'], data.get('audio_url')
-                ))
+                try:
+                    cursor = conn.execute(self._INSERT_SQL, self._to_params(data))
+                except sqlite3.IntegrityError:
+                    existing = self._find_ids_by_content_hashes(conn, [data['content_hash']])
+                    if data['content_hash'] not in existing:
+                        raise
+                    raise DuplicateContentError(
+                        "같은 내용의 문제가 이미 있습니다", existing[data['content_hash']]
+                    )
 
                 # 생성된 ID를 문제 객체에 설정
                 question.id = cursor.lastrowid
             else:
                 # 기존 문제 업데이트
+                # 수정 결과가 다른 문제와 같은 내용이면 행 ID를 붙인 해시로 고유 인덱스 충돌을 피함
                 conn.execute("""
                     UPDATE questions
                     SET level = ?, question_type = ?, question_text = ?,
-                        choices = ?, correct_answer = ?, explanation = ?, difficulty = ?, audio_url = ?
+                        choices = ?, correct_answer = ?, explanation = ?, difficulty = ?, audio_url = ?,
+                        audio_size_bytes = ?, audio_duration_ms = ?, audio_etag = ?,
+                        content_hash = CASE
+                            WHEN EXISTS (
+                                SELECT 1 FROM questions AS other
+                                WHERE other.content_hash = ? AND other.id != questions.id
+                            ) THEN ?
+                            ELSE ?
+                        END
                     WHERE id = ?
                 """, (
                     data['level'], data['question_type'], data['question_text'],
                     data['choices'], data['correct_answer'], data['explanation'],
-                    data['difficulty'], data.get('audio_url'), question.id
+                    data['difficulty'], data.get('audio_url'),
+                    data.get('audio_size_bytes'), data.get('audio_duration_ms'), data.get('audio_etag'),
+                    data['content_hash'],
+                    legacy_duplicate_hash(data['content_hash'], question.id),
+                    data['content_hash'], question.id
                 ))
 
             conn.commit()
-            return question
+        # 수정으로 레벨이 바뀌었을 수 있으므로 수정은 모든 레벨을 무효화
+        _invalidate_question_caches([question.level] if is_new else None)
+        return question
+
+    def save_all(self, questions: List[Question]) -> int:
+        """
+        새 문제 일괄 저장 (INSERT ... ON CONFLICT 업서트)
+
+        executemany로 한 트랜잭션 안에서 저장하고, 모든 문제 객체에 ID를 설정합니다.
+        내용이 같은 문제가 이미 있으면 새로 만들지 않고 기존 문제를 갱신하므로
+        같은 파일을 다시 임포트해도 중복이 생기지 않습니다. 대량 임포트에서 청크 단위로 호출합니다.
+
+        Returns:
+            새로 삽입된 문제 수
+        """
+        if not questions:
+            return 0
+
+        rows = [self._to_params(QuestionMapper.to_dict(q)) for q in questions]
+        hashes = [row[-1] for row in rows]
+
+        with self.db.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                existing = self._find_ids_by_content_hashes(conn, hashes)
+                conn.executemany(self._UPSERT_SQL, rows)
+                ids = self._find_ids_by_content_hashes(conn, hashes)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        for question, content_hash in zip(questions, hashes):
+            question.id = ids[content_hash]
+        _invalidate_question_caches(question.level for question in questions)
+        return len(set(hashes) - set(existing))
 
     def find_by_id(self, id: int) -> Optional[Question]:
         """ID로 문제 조회"""
@@ -61,6 +240,36 @@ class SqliteQuestionRepository:
                 return QuestionMapper.to_entity(row)
             return None
 
+    def find_by_ids(self, ids: List[int]) -> List[Question]:
+        """
+        여러 문제를 ID 목록 순서대로 조회 (없는 ID는 제외)
+
+        IN 절은 _MAX_IN_PARAMS개씩 나누어 조회합니다.
+        """
+        found: Dict[int, Question] = {}
+        with self.db.get_connection() as conn:
+            for start in range(0, len(ids), self._MAX_IN_PARAMS):
+                chunk = ids[start:start + self._MAX_IN_PARAMS]
+                placeholders = ','.join('?' * len(chunk))
+                for row in conn.execute(f"SELECT * FROM questions WHERE id IN ({placeholders})", chunk):
+                    found[row['id']] = QuestionMapper.to_entity(row)
+        return [found[id] for id in ids if id in found]
+
+    def find_assembly_index(self, level: JLPTLevel) -> List[Tuple[int, str, int]]:
+        """
+        시험 조립용 문제 색인 조회 (엔티티를 만들지 않고 필요한 컬럼만)
+
+        Returns:
+            List[Tuple[int, str, int]]: (문제 ID, 문제 유형, 난이도) 목록
+        """
+        with self.db.get_connection() as conn:
+            return [
+                tuple(row)
+                for row in conn.execute(
+                    "SELECT id, question_type, difficulty FROM questions WHERE level = ?", (level.value,)
+                ).fetchall()
+            ]
+
     def find_all(self) -> List[Question]:
         """모든 문제 조회"""
         with self.db.get_connection() as conn:
@@ -77,6 +286,7 @@ class SqliteQuestionRepository:
         with self.db.get_connection() as conn:
             conn.execute("DELETE FROM questions WHERE id = ?", (question.id,))
             conn.commit()
+        _invalidate_question_caches([question.level])
 
     def exists_by_id(self, id: int) -> bool:
         """ID 존재 여부 확인"""
@@ -164,26 +374,120 @@ class SqliteQuestionRepository:
             # limit만큼 반환
             return questions[:limit]
 
-    def find_random_by_level_and_type_counts(
+    def find_missing_audio(
         self,
-        level: JLPTLevel,
-        question_type_counts: Dict[QuestionType, int]
+        after_id: int = 0,
+        limit: int = 500,
+        level: Optional[JLPTLevel] = None
     ) -> List[Question]:
-        """레벨과 유형별 개수로 랜덤 문제 조회"""
-        all_questions = []
-        
-        for question_type, count in question_type_counts.items():
-            questions = self.find_random_by_level_and_types(
-                level, [question_type], limit=count
-            )
-            if len(questions) < count:
-                raise ValueError(
-                    f"레벨 {level.value}, 유형 {question_type.value}에 대해 "
-                    f"요청한 문제 수({count})보다 적은 문제({len(questions)})만 사용 가능합니다. (문제 수 부족)"
+        """
+        오디오가 없는 청해 문제를 ID 순으로 조회 (키셋 페이지네이션)
+
+        Args:
+            after_id: 이 ID 다음부터 조회
+            limit: 최대 조회 수
+            level: JLPT 레벨 (None이면 전체)
+        """
+        query = """
+            SELECT * FROM questions
+            WHERE question_type = ? AND (audio_url IS NULL OR audio_url = '') AND id > ?
+        """
+        params: List = [QuestionType.LISTENING.value, after_id]
+        if level is not None:
+            query += " AND level = ?"
+            params.append(level.value)
+        query += " ORDER BY id LIMIT ?"
+        params.append(limit)
+
+        with self.db.get_connection() as conn:
+            rows = conn.execute(query, params).fetchall()
+            return [QuestionMapper.to_entity(row) for row in rows]
+
+    def update_audio_urls(
+        self,
+        audio_urls: Dict[int, str],
+        metadata: Optional[Dict[str, AudioMetadata]] = None
+    ) -> int:
+        """
+        문제 ID별 오디오 URL 일괄 갱신 (한 트랜잭션)
+
+        Args:
+            audio_urls: 문제 ID -> 오디오 URL
+            metadata: 오디오 URL -> 메타데이터 (없는 URL은 메타데이터를 비움)
+
+        Returns:
+            갱신된 문제 수
+        """
+        if not audio_urls:
+            return 0
+        metadata = metadata or {}
+
+        def row(question_id: int, url: str) -> Tuple:
+            meta = metadata.get(url)
+            if meta is None:
+                return (url, None, None, None, question_id)
+            return (url, meta.size_bytes, meta.duration_ms, meta.etag, question_id)
+
+        with self.db.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                before = conn.total_changes
+                conn.executemany(
+                    """
+                    UPDATE questions
+                    SET audio_url = ?, audio_size_bytes = ?, audio_duration_ms = ?, audio_etag = ?
+                    WHERE id = ?
+                    """,
+                    [row(question_id, url) for question_id, url in audio_urls.items()]
                 )
-            all_questions.extend(questions)
-        
-        # 전체 문제를 랜덤으로 섞어서 반환
-        random.shuffle(all_questions)
-        return all_questions
+                updated = conn.total_changes - before
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return updated
+
+    def find_audio_urls_missing_metadata(self, after_url: str = '', limit: int = 500) -> List[str]:
+        """
+        메타데이터가 없는 오디오 URL을 URL 순으로 조회 (키셋 페이지네이션)
+
+        Args:
+            after_url: 이 URL 다음부터 조회
+            limit: 최대 조회 수
+        """
+        with self.db.get_connection() as conn:
+            rows = conn.execute("""
+                SELECT DISTINCT audio_url FROM questions
+                WHERE audio_url > ? AND (audio_etag IS NULL OR audio_size_bytes IS NULL)
+                ORDER BY audio_url LIMIT ?
+            """, (after_url, limit)).fetchall()
+            return [row[0] for row in rows]
+
+    def update_audio_metadata(self, metadata: Dict[str, AudioMetadata]) -> int:
+        """
+        오디오 URL별 메타데이터 일괄 갱신 (같은 오디오를 쓰는 문제 모두, 한 트랜잭션)
+
+        Returns:
+            갱신된 문제 수
+        """
+        if not metadata:
+            return 0
 
+        with self.db.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                before = conn.total_changes
+                conn.executemany(
+                    """
+                    UPDATE questions
+                    SET audio_size_bytes = ?, audio_duration_ms = ?, audio_etag = ?
+                    WHERE audio_url = ?
+                    """,
+                    [(m.size_bytes, m.duration_ms, m.etag, url) for url, m in metadata.items()]
+                )
+                updated = conn.total_changes - before
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return updated
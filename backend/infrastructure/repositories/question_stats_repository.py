@@ -0,0 +1,196 @@
+"""
+SQLite 기반 문항 분석 통계 Repository 구현
+answer_details에서 계산한 문제별 통계를 question_stats에 저장하고 조회
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from backend.infrastructure.config.database import get_database, Database
+
+
+class SqliteQuestionStatsRepository:
+    """
+    문항 분석 통계 Repository
+
+    question_stats 테이블(테이블은 Database가 생성)은 answer_details의 파생 데이터입니다.
+    각 행의 last_answer_id는 그 문제를 계산할 때 반영한 마지막 답안 ID이며, 전체 최댓값이
+    증분 갱신의 기준점(이 ID 이후에 답안이 생긴 문제만 다시 계산)이 됩니다.
+    """
+
+    # 정렬 기준 (API 파라미터 -> ORDER BY 절)
+    SORT_COLUMNS = {
+        'discrimination': 'qs.discrimination IS NULL, qs.discrimination ASC',
+        'p_value': 'qs.p_value IS NULL, qs.p_value ASC',
+        'responses': 'qs.responses DESC',
+        'question_id': 'qs.question_id ASC',
+    }
+
+    def __init__(self, db: Optional[Database] = None):
+        self.db = db or get_database()
+
+    def find_watermark(self) -> int:
+        """통계에 반영된 마지막 답안 ID (통계가 없으면 0)"""
+        with self.db.get_connection() as conn:
+            row = conn.execute("SELECT COALESCE(MAX(last_answer_id), 0) FROM question_stats").fetchone()
+        return row[0]
+
+    def find_answers_for_refresh(
+        self, after_answer_id: int
+    ) -> Tuple[int, List[Tuple[int, int, int, int, str, float]]]:
+        """
+        after_answer_id 이후에 답안이 생긴 문제의 모든 답안과 각 답안이 속한 결과의 총점 조회
+
+        새 답안 확인과 조회를 한 읽기 트랜잭션에서 수행하고, 그 시점의 마지막 답안 ID까지만 읽습니다.
+        총점은 결과(result_id)별 정답 비율입니다.
+
+        Args:
+            after_answer_id: 기준 답안 ID (0이면 전체)
+
+        Returns:
+            Tuple: (조회 시점의 마지막 답안 ID,
+                    (답안 ID, 문제 ID, 정답 여부, 소요 시간(초), 사용자 답안, 결과 총점) 목록)
+        """
+        with self.db.get_connection() as conn:
+            conn.execute("BEGIN")
+            try:
+                through_answer_id = conn.execute(
+                    "SELECT COALESCE(MAX(id), 0) FROM answer_details"
+                ).fetchone()[0]
+                rows = conn.execute("""
+                    WITH affected AS (
+                        SELECT DISTINCT question_id FROM answer_details WHERE id > ? AND id <= ?
+                    ),
+                    totals AS (
+                        SELECT result_id, AVG(is_correct) AS total_score
+                        FROM answer_details
+                        WHERE id <= ? AND result_id IN (
+                            SELECT result_id FROM answer_details
+                            WHERE id <= ? AND question_id IN (SELECT question_id FROM affected)
+                        )
+                        GROUP BY result_id
+                    )
+                    SELECT ad.id, ad.question_id, ad.is_correct, ad.time_spent_seconds, ad.user_answer, t.total_score
+                    FROM answer_details ad
+                    JOIN totals t ON t.result_id = ad.result_id
+                    WHERE ad.id <= ? AND ad.question_id IN (SELECT question_id FROM affected)
+                """, (after_answer_id, through_answer_id, through_answer_id, through_answer_id,
+                      through_answer_id)).fetchall()
+            finally:
+                conn.rollback()
+        return through_answer_id, [tuple(row) for row in rows]
+
+    def save_all(self, stats: List[Dict[str, Any]], replace: bool = False) -> int:
+        """
+        문제별 통계를 한 트랜잭션으로 저장 (있으면 교체)
+
+        Args:
+            stats: question_id, responses, correct_count, p_value, discrimination,
+                median_time_seconds, choice_rates, last_answer_id 딕셔너리 목록
+            replace: True면 같은 트랜잭션에서 기존 통계를 모두 지운 뒤 저장 (전체 재계산)
+
+        Returns:
+            int: 저장한 문제 수
+        """
+        if not stats and not replace:
+            return 0
+        with self.db.get_connection() as conn:
+            if replace:
+                conn.execute("DELETE FROM question_stats")
+            conn.executemany("""
+                INSERT INTO question_stats (
+                    question_id, responses, correct_count, p_value, discrimination,
+                    median_time_seconds, choice_rates, last_answer_id, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(question_id) DO UPDATE SET
+                    responses = excluded.responses,
+                    correct_count = excluded.correct_count,
+                    p_value = excluded.p_value,
+                    discrimination = excluded.discrimination,
+                    median_time_seconds = excluded.median_time_seconds,
+                    choice_rates = excluded.choice_rates,
+                    last_answer_id = excluded.last_answer_id,
+                    updated_at = CURRENT_TIMESTAMP
+            """, [
+                (
+                    item['question_id'], item['responses'], item['correct_count'], item['p_value'],
+                    item['discrimination'], item['median_time_seconds'],
+                    json.dumps(item['choice_rates'], ensure_ascii=False), item['last_answer_id']
+                )
+                for item in stats
+            ])
+            conn.commit()
+        return len(stats)
+
+    def find_by_question_id(self, question_id: int) -> Optional[Dict[str, Any]]:
+        """문제의 통계 조회 (계산된 적이 없으면 None)"""
+        with self.db.get_connection() as conn:
+            row = conn.execute("""
+                SELECT qs.*, q.level, q.question_type
+                FROM question_stats qs
+                LEFT JOIN questions q ON q.id = qs.question_id
+                WHERE qs.question_id = ?
+            """, (question_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def find_all(
+        self,
+        level: Optional[str] = None,
+        question_type: Optional[str] = None,
+        min_responses: int = 0,
+        sort: str = 'discrimination',
+        limit: int = 100,
+        offset: int = 0
+    ) -> List[Dict[str, Any]]:
+        """
+        문제별 통계 목록 조회
+
+        Args:
+            level: JLPT 레벨 필터
+            question_type: 문제 유형 필터
+            min_responses: 최소 응답 수
+            sort: 정렬 기준 (SORT_COLUMNS 키, 변별도/정답률은 낮은 순)
+            limit: 최대 개수
+            offset: 건너뛸 개수
+
+        Raises:
+            ValueError: 지원하지 않는 정렬 기준
+        """
+        if sort not in self.SORT_COLUMNS:
+            raise ValueError(f"지원하지 않는 정렬 기준입니다: {sort} ({', '.join(self.SORT_COLUMNS)})")
+
+        query = """
+            SELECT qs.*, q.level, q.question_type
+            FROM question_stats qs
+            LEFT JOIN questions q ON q.id = qs.question_id
+            WHERE qs.responses >= ?
+        """
+        params: list = [min_responses]
+        if level is not None:
+            query += " AND q.level = ?"
+            params.append(level)
+        if question_type is not None:
+            query += " AND q.question_type = ?"
+            params.append(question_type)
+        query += f" ORDER BY {self.SORT_COLUMNS[sort]}, qs.question_id LIMIT ? OFFSET ?"
+        params.extend([limit, offset])
+
+        with self.db.get_connection() as conn:
+            return [self._to_dict(row) for row in conn.execute(query, params).fetchall()]
+
+    @staticmethod
+    def _to_dict(row) -> Dict[str, Any]:
+        """조회 행 -> 응답 딕셔너리"""
+        return {
+            'question_id': row['question_id'],
+            'level': row['level'],
+            'question_type': row['question_type'],
+            'responses': row['responses'],
+            'correct_count': row['correct_count'],
+            'p_value': row['p_value'],
+            'discrimination': row['discrimination'],
+            'median_time_seconds': row['median_time_seconds'],
+            'choice_rates': json.loads(row['choice_rates']) if row['choice_rates'] else {},
+            'last_answer_id': row['last_answer_id'],
+            'updated_at': row['updated_at'],
+        }
@@ -14,8 +14,14 @@ class StudySessionMapper:
     """StudySession 엔티티와 데이터베이스 행 간 변환"""
 
     @staticmethod
-    def to_entity(row: sqlite3.Row) -> StudySession:
-        """데이터베이스 행을 StudySession 엔티티로 변환"""
+    def to_entity(row: sqlite3.Row, question_ids: Optional[List[int]] = None) -> StudySession:
+        """
+        데이터베이스 행을 StudySession 엔티티로 변환
+
+        Args:
+            row: study_sessions 행
+            question_ids: study_session_questions에서 미리 로드한 문제 ID 목록 (없으면 JSON 컬럼 사용)
+        """
         created_at = None
         try:
             created_at_str = row['created_at']
@@ -53,13 +59,13 @@ class StudySessionMapper:
             question_types = None
 
         # question_ids 파싱 (JSON 배열)
-        question_ids = None
-        try:
-            question_ids_str = row['question_ids']
-            if question_ids_str:
-                question_ids = json.loads(question_ids_str)
-        except (KeyError, TypeError, ValueError, json.JSONDecodeError):
-            question_ids = None
+        if question_ids is None:
+            try:
+                question_ids_str = row['question_ids']
+                if question_ids_str:
+                    question_ids = json.loads(question_ids_str)
+            except (KeyError, TypeError, ValueError, json.JSONDecodeError):
+                question_ids = None
 
         study_session = StudySession(
             id=row['id'],
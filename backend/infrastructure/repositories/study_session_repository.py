@@ -2,15 +2,24 @@
 SQLite 기반 StudySession Repository 구현
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import date
 from backend.domain.entities.study_session import StudySession
 from backend.infrastructure.config.database import get_database, Database
 from backend.infrastructure.repositories.study_session_mapper import StudySessionMapper
+from backend.infrastructure.repositories.user_daily_rollup_repository import SqliteUserDailyRollupRepository
 
 
 class SqliteStudySessionRepository:
-    """SQLite 기반 StudySession Repository 구현"""
+    """
+    SQLite 기반 StudySession Repository 구현
+
+    세션의 문제 ID 목록은 study_sessions.question_ids(JSON)와 study_session_questions(세션 ID, 위치, 문제 ID)에
+    함께 저장합니다. 조회는 study_session_questions를 읽고, 아직 이관되지 않은 세션만 JSON을 읽습니다.
+    """
+
+    # IN 절 하나에 바인딩할 최대 파라미터 수 (구버전 SQLite 한도 999 이하)
+    _MAX_IN_PARAMS = 500
 
     def __init__(self, db: Optional[Database] = None):
         self.db = db or get_database()
@@ -54,10 +63,15 @@ class SqliteStudySessionRepository:
                     except Exception:
                         pass  # 이미 존재할 수 있음
 
+            # 사용자별 기간 집계/조회용 복합 인덱스
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_study_sessions_user_date
+                ON study_sessions(user_id, study_date)
+            """)
             conn.commit()
 
     def save(self, study_session: StudySession) -> StudySession:
-        """StudySession 저장/업데이트"""
+        """StudySession 저장/업데이트 (같은 트랜잭션에서 일별 롤업 갱신)"""
         with self.db.get_connection() as conn:
             data = StudySessionMapper.to_dict(study_session)
 
@@ -77,8 +91,10 @@ class SqliteStudySessionRepository:
 
                 # 생성된 ID를 StudySession 객체에 설정
                 study_session.id = cursor.lastrowid
+                self._save_question_links(conn, study_session.id, study_session.question_ids, replace=False)
             else:
-                # 기존 StudySession 업데이트
+                # 기존 StudySession 업데이트 (이전 값은 롤업에서 빼기)
+                self._apply_rollup(conn, study_session.id, sign=-1)
                 conn.execute("""
                     UPDATE study_sessions
                     SET user_id = ?, study_date = ?, study_hour = ?,
@@ -91,10 +107,64 @@ class SqliteStudySessionRepository:
                     data['time_spent_minutes'], data['level'], data['question_types'],
                     data['question_ids'], study_session.id
                 ))
+                self._save_question_links(conn, study_session.id, study_session.question_ids, replace=True)
 
+            self._apply_rollup(conn, study_session.id, sign=1)
             conn.commit()
             return study_session
 
+    @staticmethod
+    def _apply_rollup(conn, id: int, sign: int) -> None:
+        """저장된 학습 세션 한 건을 일별 롤업에 더하거나(sign=1) 빼기(sign=-1)"""
+        row = conn.execute(
+            "SELECT user_id, study_date, total_questions, correct_count, time_spent_minutes "
+            "FROM study_sessions WHERE id = ?",
+            (id,)
+        ).fetchone()
+        if row is None:
+            return
+        counts = SqliteUserDailyRollupRepository.study_session_counts(
+            row['total_questions'], row['correct_count'], row['time_spent_minutes']
+        )
+        if sign < 0:
+            counts = SqliteUserDailyRollupRepository.negate(counts)
+        SqliteUserDailyRollupRepository.apply(conn, row['user_id'], row['study_date'], counts)
+
+    @staticmethod
+    def _save_question_links(conn, session_id: int, question_ids: Optional[List[int]], replace: bool) -> None:
+        """study_session_questions 저장 (replace면 문제 목록이 바뀐 경우에만 기존 행을 교체)"""
+        question_ids = question_ids or []
+        if replace:
+            current = [
+                row[0] for row in conn.execute(
+                    "SELECT question_id FROM study_session_questions WHERE session_id = ? ORDER BY position",
+                    (session_id,)
+                ).fetchall()
+            ]
+            if current == question_ids:
+                return
+            conn.execute("DELETE FROM study_session_questions WHERE session_id = ?", (session_id,))
+        conn.executemany(
+            "INSERT INTO study_session_questions (session_id, position, question_id) VALUES (?, ?, ?)",
+            [(session_id, position, question_id) for position, question_id in enumerate(question_ids)]
+        )
+
+    def _to_entities(self, conn, rows: List) -> List[StudySession]:
+        """study_sessions 행 목록 -> StudySession 엔티티 (문제 ID는 study_session_questions에서 한 번에 로드)"""
+        question_ids: Dict[int, List[int]] = {}
+        session_ids = [row['id'] for row in rows]
+        for start in range(0, len(session_ids), self._MAX_IN_PARAMS):
+            chunk = session_ids[start:start + self._MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            for link in conn.execute(f"""
+                SELECT session_id, question_id FROM study_session_questions
+                WHERE session_id IN ({placeholders})
+                ORDER BY session_id, position
+            """, chunk):
+                question_ids.setdefault(link['session_id'], []).append(link['question_id'])
+
+        return [StudySessionMapper.to_entity(row, question_ids.get(row['id'])) for row in rows]
+
     def find_by_id(self, id: int) -> Optional[StudySession]:
         """ID로 StudySession 조회"""
         with self.db.get_connection() as conn:
@@ -102,7 +172,7 @@ class SqliteStudySessionRepository:
             row = cursor.fetchone()
 
             if row:
-                return StudySessionMapper.to_entity(row)
+                return self._to_entities(conn, [row])[0]
             return None
 
     def find_by_user_id(self, user_id: int) -> List[StudySession]:
@@ -114,5 +184,69 @@ class SqliteStudySessionRepository:
             )
             rows = cursor.fetchall()
 
-            return [StudySessionMapper.to_entity(row) for row in rows]
+            return self._to_entities(conn, rows)
 
+    def find_session_ids_by_question_id(self, question_id: int) -> List[int]:
+        """문제가 포함된 학습 세션 ID 목록 (study_session_questions의 question_id 인덱스 조회)"""
+        with self.db.get_connection() as conn:
+            return [
+                row[0] for row in conn.execute(
+                    "SELECT DISTINCT session_id FROM study_session_questions WHERE question_id = ? ORDER BY session_id",
+                    (question_id,)
+                ).fetchall()
+            ]
+
+    def backfill_question_links(self, dry_run: bool = False) -> Tuple[int, int]:
+        """
+        study_session_questions가 없는 세션의 question_ids JSON을 study_session_questions로 이관 (한 트랜잭션)
+
+        Args:
+            dry_run: True면 이관할 건수만 계산하고 되돌림
+
+        Returns:
+            Tuple[int, int]: (이관한 세션 수, 이관한 문제 행 수)
+        """
+        with self.db.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                unlinked = "NOT EXISTS (SELECT 1 FROM study_session_questions sq WHERE sq.session_id = s.id)"
+                sessions_count = conn.execute(f"""
+                    SELECT COUNT(*) FROM study_sessions s
+                    WHERE json_valid(s.question_ids) AND json_array_length(s.question_ids) > 0 AND {unlinked}
+                """).fetchone()[0]
+                links = conn.execute(f"""
+                    INSERT INTO study_session_questions (session_id, position, question_id)
+                    SELECT s.id, j.key, j.value
+                    FROM study_sessions s, json_each(s.question_ids) j
+                    WHERE json_valid(s.question_ids) AND {unlinked}
+                """).rowcount
+                if dry_run:
+                    conn.rollback()
+                else:
+                    conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return sessions_count, links
+
+    def aggregate_by_hour(self, user_id: int, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """
+        기간 내 학습 시간대(study_hour)별 합계 (user_id, study_date 인덱스 범위만 집계)
+
+        Returns:
+            List[Dict[str, Any]]: study_hour, sessions, total_questions, correct_count, time_spent_minutes
+                (기록이 있는 시간대만, 시간대 순 정렬)
+        """
+        with self.db.get_connection() as conn:
+            rows = conn.execute("""
+                SELECT study_hour,
+                       COUNT(*) AS sessions,
+                       SUM(total_questions) AS total_questions,
+                       SUM(correct_count) AS correct_count,
+                       SUM(time_spent_minutes) AS time_spent_minutes
+                FROM study_sessions
+                WHERE user_id = ? AND study_date BETWEEN ? AND ?
+                GROUP BY study_hour
+                ORDER BY study_hour
+            """, (user_id, start_date.isoformat(), end_date.isoformat())).fetchall()
+            return [dict(row) for row in rows]
@@ -16,21 +16,29 @@ class TestMapper:
     """Test 엔티티와 데이터베이스 행 간 변환"""
 
     @staticmethod
-    def to_entity(row: sqlite3.Row, question_repo: SqliteQuestionRepository) -> Test:
-        """데이터베이스 행을 Test 엔티티로 변환"""
-        question_ids: List[int] = []
-        if row['question_ids']:
-            try:
-                question_ids = json.loads(row['question_ids'])
-            except (json.JSONDecodeError, ValueError) as e:
-                raise ValueError(f"Invalid question_ids JSON: {e}")
+    def to_entity(
+        row: sqlite3.Row,
+        question_repo: SqliteQuestionRepository,
+        questions: Optional[List[Question]] = None
+    ) -> Test:
+        """
+        데이터베이스 행을 Test 엔티티로 변환
+
+        Args:
+            row: tests 행
+            question_repo: 문제 Repository (questions가 없을 때 question_ids JSON으로 문제 로드)
+            questions: test_questions에서 미리 로드한 문제 목록 (없으면 JSON 컬럼 사용)
+        """
+        if questions is None:
+            question_ids: List[int] = []
+            if row['question_ids']:
+                try:
+                    question_ids = json.loads(row['question_ids'])
+                except (json.JSONDecodeError, ValueError) as e:
+                    raise ValueError(f"Invalid question_ids JSON: {e}")
 
-        # Question 객체들 로드
-        questions: List[Question] = []
-        for q_id in question_ids:
-            question = question_repo.find_by_id(q_id)
-            if question:
-                questions.append(question)
+            # Question 객체들 로드
+            questions = question_repo.find_by_ids(question_ids)
 
         user_answers: Optional[Dict[int, str]] = None
         if row['user_answers']:
@@ -3,16 +3,26 @@ SQLite 기반 Test Repository 구현
 """
 
 import sqlite3
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from backend.domain.entities.question import Question
 from backend.domain.entities.test import Test
 from backend.domain.value_objects.jlpt import JLPTLevel, TestStatus
 from backend.infrastructure.config.database import get_database, Database
 from backend.infrastructure.repositories.test_mapper import TestMapper
+from backend.infrastructure.repositories.question_mapper import QuestionMapper
 from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
 
 
 class SqliteTestRepository:
-    """SQLite 기반 Test Repository 구현"""
+    """
+    SQLite 기반 Test Repository 구현
+
+    시험의 문제 목록은 tests.question_ids(JSON)와 test_questions(시험 ID, 위치, 문제 ID)에 함께 저장합니다.
+    조회는 test_questions 조인으로 하고, 아직 이관되지 않은 시험(test_questions 행 없음)만 JSON을 읽습니다.
+    """
+
+    # IN 절 하나에 바인딩할 최대 파라미터 수 (구버전 SQLite 한도 999 이하)
+    _MAX_IN_PARAMS = 500
 
     def __init__(self, db: Optional[Database] = None):
         self.db = db or get_database()
@@ -65,6 +75,7 @@ class SqliteTestRepository:
 
                 # 생성된 ID를 테스트 객체에 설정
                 test.id = cursor.lastrowid
+                self._save_question_links(conn, test.id, [q.id for q in test.questions], replace=False)
             else:
                 # 기존 테스트 업데이트
                 conn.execute("""
@@ -79,10 +90,51 @@ class SqliteTestRepository:
                     data['started_at'], data['completed_at'],
                     data['user_answers'], data['score'], test.id
                 ))
+                self._save_question_links(conn, test.id, [q.id for q in test.questions], replace=True)
 
             conn.commit()
             return test
 
+    @staticmethod
+    def _save_question_links(conn, test_id: int, question_ids: List[int], replace: bool) -> None:
+        """test_questions 저장 (replace면 문제 목록이 바뀐 경우에만 기존 행을 교체)"""
+        if replace:
+            current = [
+                row[0] for row in conn.execute(
+                    "SELECT question_id FROM test_questions WHERE test_id = ? ORDER BY position", (test_id,)
+                ).fetchall()
+            ]
+            if current == question_ids:
+                return
+            conn.execute("DELETE FROM test_questions WHERE test_id = ?", (test_id,))
+        conn.executemany(
+            "INSERT INTO test_questions (test_id, position, question_id) VALUES (?, ?, ?)",
+            [(test_id, position, question_id) for position, question_id in enumerate(question_ids)]
+        )
+
+    def _to_entities(self, conn, rows: List[sqlite3.Row]) -> List[Test]:
+        """tests 행 목록 -> Test 엔티티 (문제는 test_questions 조인 한 번으로 로드)"""
+        questions_by_test: Dict[int, List[Question]] = {}
+        test_ids = [row['id'] for row in rows]
+        for start in range(0, len(test_ids), self._MAX_IN_PARAMS):
+            chunk = test_ids[start:start + self._MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            for question_row in conn.execute(f"""
+                SELECT tq.test_id AS link_test_id, q.*
+                FROM test_questions tq
+                JOIN questions q ON q.id = tq.question_id
+                WHERE tq.test_id IN ({placeholders})
+                ORDER BY tq.test_id, tq.position
+            """, chunk):
+                questions_by_test.setdefault(question_row['link_test_id'], []).append(
+                    QuestionMapper.to_entity(question_row)
+                )
+
+        return [
+            TestMapper.to_entity(row, self.question_repo, questions_by_test.get(row['id']))
+            for row in rows
+        ]
+
     def find_by_id(self, id: int) -> Optional[Test]:
         """ID로 테스트 조회"""
         with self.db.get_connection() as conn:
@@ -90,7 +142,7 @@ class SqliteTestRepository:
             row = cursor.fetchone()
 
             if row:
-                return TestMapper.to_entity(row, self.question_repo)
+                return self._to_entities(conn, [row])[0]
             return None
 
     def find_all(self) -> List[Test]:
@@ -99,7 +151,7 @@ class SqliteTestRepository:
             cursor = conn.execute("SELECT * FROM tests ORDER BY created_at DESC")
             rows = cursor.fetchall()
 
-            return [TestMapper.to_entity(row, self.question_repo) for row in rows]
+            return self._to_entities(conn, rows)
 
     def delete(self, test: Test) -> None:
         """테스트 삭제"""
@@ -107,6 +159,7 @@ class SqliteTestRepository:
             return
 
         with self.db.get_connection() as conn:
+            conn.execute("DELETE FROM test_questions WHERE test_id = ?", (test.id,))
             conn.execute("DELETE FROM tests WHERE id = ?", (test.id,))
             conn.commit()
 
@@ -122,7 +175,70 @@ class SqliteTestRepository:
             cursor = conn.execute("SELECT * FROM tests WHERE level = ? ORDER BY created_at DESC", (level.value,))
             rows = cursor.fetchall()
 
-            return [TestMapper.to_entity(row, self.question_repo) for row in rows]
+            return self._to_entities(conn, rows)
+
+    def find_question_exposure(self, level: JLPTLevel) -> Tuple[int, Dict[int, int]]:
+        """
+        레벨별 문제 노출 횟수 조회 (test_questions 인덱스 조인으로 집계)
+
+        Returns:
+            Tuple[int, Dict[int, int]]: (해당 레벨 시험 수, 문제 ID -> 출제된 시험 수)
+        """
+        with self.db.get_connection() as conn:
+            tests_count = conn.execute(
+                "SELECT COUNT(*) FROM tests WHERE level = ?", (level.value,)
+            ).fetchone()[0]
+            rows = conn.execute("""
+                SELECT tq.question_id, COUNT(DISTINCT tq.test_id)
+                FROM tests t
+                JOIN test_questions tq ON tq.test_id = t.id
+                WHERE t.level = ?
+                GROUP BY tq.question_id
+            """, (level.value,)).fetchall()
+        return tests_count, {row[0]: row[1] for row in rows}
+
+    def find_test_ids_by_question_id(self, question_id: int) -> List[int]:
+        """문제가 포함된 시험 ID 목록 (test_questions의 question_id 인덱스 조회)"""
+        with self.db.get_connection() as conn:
+            return [
+                row[0] for row in conn.execute(
+                    "SELECT DISTINCT test_id FROM test_questions WHERE question_id = ? ORDER BY test_id",
+                    (question_id,)
+                ).fetchall()
+            ]
+
+    def backfill_question_links(self, dry_run: bool = False) -> Tuple[int, int]:
+        """
+        test_questions가 없는 시험의 question_ids JSON을 test_questions로 이관 (한 트랜잭션)
+
+        Args:
+            dry_run: True면 이관할 건수만 계산하고 되돌림
+
+        Returns:
+            Tuple[int, int]: (이관한 시험 수, 이관한 문제 행 수)
+        """
+        with self.db.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                unlinked = "NOT EXISTS (SELECT 1 FROM test_questions tq WHERE tq.test_id = t.id)"
+                tests_count = conn.execute(f"""
+                    SELECT COUNT(*) FROM tests t
+                    WHERE json_valid(t.question_ids) AND json_array_length(t.question_ids) > 0 AND {unlinked}
+                """).fetchone()[0]
+                links = conn.execute(f"""
+                    INSERT INTO test_questions (test_id, position, question_id)
+                    SELECT t.id, j.key, j.value
+                    FROM tests t, json_each(t.question_ids) j
+                    WHERE json_valid(t.question_ids) AND {unlinked}
+                """).rowcount
+                if dry_run:
+                    conn.rollback()
+                else:
+                    conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        return tests_count, links
 
     def find_by_status(self, status: TestStatus) -> List[Test]:
         """상태별 테스트 조회"""
@@ -130,7 +246,7 @@ class SqliteTestRepository:
             cursor = conn.execute("SELECT * FROM tests WHERE status = ? ORDER BY created_at DESC", (status.value,))
             rows = cursor.fetchall()
 
-            return [TestMapper.to_entity(row, self.question_repo) for row in rows]
+            return self._to_entities(conn, rows)
 
     def find_active_tests(self) -> List[Test]:
         """활성 테스트 조회 (IN_PROGRESS 상태)"""
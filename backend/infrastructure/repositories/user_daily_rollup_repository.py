@@ -0,0 +1,302 @@
+"""
+SQLite 기반 사용자 일별 학습 롤업 Repository 구현
+(user_id, 날짜)별 학습 합계를 쓰기 시점에 갱신해 대시보드 조회를 작은 범위 스캔으로 만듦
+"""
+
+from datetime import date
+from typing import Any, Dict, List, Optional
+from backend.domain.value_objects.jlpt import QuestionType
+from backend.infrastructure.config.database import get_database, Database
+from backend.infrastructure.repositories.user_streak_repository import SqliteUserStreakRepository
+from backend.domain.services.study_streak_service import StudyStreakService
+
+
+class SqliteUserDailyRollupRepository:
+    """
+    사용자 일별 학습 롤업 Repository
+
+    user_daily_rollup 테이블(테이블은 Database가 생성)은 원본 이력의 파생 데이터입니다.
+    학습 이력(시험), 학습 세션, 단어 복습 Repository가 원본을 저장하는 같은 트랜잭션에서
+    apply로 변경분을 더하므로 원본과 롤업이 어긋나지 않습니다.
+
+    - 시험: 문제 수/정답 수/시간/시험 수, 유형별 문제 수/정답 수 (answer_details 기준)
+    - 학습 모드: 문제 수/정답 수/시간/학습 세션 수 (문제별 결과를 저장하지 않으므로 유형별 집계 제외)
+    - 단어 복습: 복습 횟수 (복습 날짜 기준)
+    """
+
+    BASE_COUNTERS = (
+        'questions_answered',
+        'correct_count',
+        'time_spent_minutes',
+        'tests_completed',
+        'study_sessions',
+        'vocabulary_reviews',
+    )
+    TYPE_COUNTERS = tuple(
+        f"{question_type.value}_{kind}"
+        for question_type in QuestionType
+        for kind in ('total', 'correct')
+    )
+    COUNTERS = BASE_COUNTERS + TYPE_COUNTERS
+    # 이 카운터가 늘어나면 그날 학습한 것으로 보고 연속 학습 일수 갱신
+    ACTIVITY_COUNTERS = ('questions_answered', 'tests_completed', 'study_sessions', 'vocabulary_reviews')
+
+    def __init__(self, db: Optional[Database] = None):
+        self.db = db or get_database()
+
+    @classmethod
+    def apply(cls, conn, user_id: int, study_date: str, counts: Dict[str, int]) -> None:
+        """
+        현재 트랜잭션에서 (user_id, study_date) 롤업에 변경분 더하기 (커밋하지 않음)
+
+        학습 활동이 늘어나면 같은 트랜잭션에서 연속 학습 일수도 갱신합니다.
+
+        Args:
+            conn: 원본을 저장하는 트랜잭션의 연결
+            user_id: 사용자 ID
+            study_date: 학습 날짜 (ISO 형식)
+            counts: 카운터 이름 -> 더할 값 (음수면 빼기)
+        """
+        unknown = set(counts) - set(cls.COUNTERS)
+        if unknown:
+            raise ValueError(f"알 수 없는 롤업 카운터입니다: {sorted(unknown)}")
+        counts = {name: value for name, value in counts.items() if value}
+        if not counts or study_date is None:
+            return
+
+        columns = ", ".join(counts)
+        placeholders = ", ".join("?" * len(counts))
+        updates = ", ".join(f"{name} = {name} + excluded.{name}" for name in counts)
+        conn.execute(f"""
+            INSERT INTO user_daily_rollup (user_id, study_date, {columns})
+            VALUES (?, ?, {placeholders})
+            ON CONFLICT(user_id, study_date) DO UPDATE SET
+                {updates},
+                updated_at = CURRENT_TIMESTAMP
+        """, (user_id, study_date, *counts.values()))
+        if any(counts.get(name, 0) > 0 for name in cls.ACTIVITY_COUNTERS):
+            SqliteUserStreakRepository.record_activity(conn, user_id, study_date)
+
+    @staticmethod
+    def negate(counts: Dict[str, int]) -> Dict[str, int]:
+        """변경분 부호 반전 (원본 수정/삭제 시 이전 값 빼기)"""
+        return {name: -value for name, value in counts.items()}
+
+    @staticmethod
+    def test_counts(conn, result_id: int, total_questions: int, correct_count: int,
+                    time_spent_minutes: int) -> Dict[str, int]:
+        """시험 학습 이력 한 건의 변경분 (유형별 집계는 같은 결과의 answer_details에서)"""
+        counts = {
+            'questions_answered': total_questions,
+            'correct_count': correct_count,
+            'time_spent_minutes': time_spent_minutes,
+            'tests_completed': 1,
+        }
+        rows = conn.execute("""
+            SELECT question_type, COUNT(*) AS total, SUM(CASE WHEN is_correct THEN 1 ELSE 0 END) AS correct
+            FROM answer_details
+            WHERE result_id = ?
+            GROUP BY question_type
+        """, (result_id,)).fetchall()
+        known_types = {question_type.value for question_type in QuestionType}
+        for row in rows:
+            if row['question_type'] in known_types:
+                counts[f"{row['question_type']}_total"] = row['total']
+                counts[f"{row['question_type']}_correct"] = row['correct']
+        return counts
+
+    @staticmethod
+    def study_session_counts(total_questions: int, correct_count: int,
+                             time_spent_minutes: int) -> Dict[str, int]:
+        """학습 모드 세션 한 건의 변경분"""
+        return {
+            'questions_answered': total_questions,
+            'correct_count': correct_count,
+            'time_spent_minutes': time_spent_minutes,
+            'study_sessions': 1,
+        }
+
+    def find_by_user_and_date(self, user_id: int, study_date: date) -> Dict[str, Any]:
+        """사용자의 하루 롤업 (기록이 없으면 모든 카운터가 0)"""
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT * FROM user_daily_rollup WHERE user_id = ? AND study_date = ?",
+                (user_id, study_date.isoformat())
+            ).fetchone()
+        if row is None:
+            return self._to_dict({'user_id': user_id, 'study_date': study_date.isoformat()})
+        return self._to_dict(row)
+
+    def find_by_user_and_period(self, user_id: int, start_date: date, end_date: date) -> List[Dict[str, Any]]:
+        """기간(시작일, 종료일 포함)의 롤업을 날짜 순으로 조회 (기록이 있는 날만)"""
+        with self.db.get_connection() as conn:
+            rows = conn.execute("""
+                SELECT * FROM user_daily_rollup
+                WHERE user_id = ? AND study_date BETWEEN ? AND ?
+                ORDER BY study_date
+            """, (user_id, start_date.isoformat(), end_date.isoformat())).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    # 기간 단위 -> 기간 시작일 SQL 식 (주는 월요일 시작)
+    PERIOD_EXPRESSIONS = {
+        'day': "study_date",
+        'week': "date(study_date, 'weekday 0', '-6 days')",
+        'month': "strftime('%Y-%m-01', study_date)",
+    }
+
+    def aggregate_by_period(
+        self, user_id: int, start_date: date, end_date: date, granularity: str = 'day'
+    ) -> List[Dict[str, Any]]:
+        """
+        기간 단위(일/주/월)별 롤업 합계 (기본 카운터만, 기록이 있는 기간만)
+
+        (user_id, study_date) 기본 키 범위만 읽고 SQL에서 묶으므로 결과 크기는 기간 수에 비례합니다.
+
+        Args:
+            user_id: 사용자 ID
+            start_date: 시작일 (포함)
+            end_date: 종료일 (포함)
+            granularity: 'day', 'week', 'month'
+
+        Returns:
+            List[Dict[str, Any]]: period_start, 기본 카운터 합계, active_days(학습한 날 수), 기간 순 정렬
+        """
+        period = self.PERIOD_EXPRESSIONS.get(granularity)
+        if period is None:
+            raise ValueError(f"지원하지 않는 기간 단위입니다: {granularity}")
+        sums = ", ".join(f"SUM({name}) AS {name}" for name in self.BASE_COUNTERS)
+        is_active = " OR ".join(f"{name} > 0" for name in self.ACTIVITY_COUNTERS)
+        with self.db.get_connection() as conn:
+            rows = conn.execute(f"""
+                SELECT {period} AS period_start, {sums},
+                       SUM(CASE WHEN {is_active} THEN 1 ELSE 0 END) AS active_days
+                FROM user_daily_rollup
+                WHERE user_id = ? AND study_date BETWEEN ? AND ?
+                GROUP BY period_start
+                ORDER BY period_start
+            """, (user_id, start_date.isoformat(), end_date.isoformat())).fetchall()
+        return [dict(row) for row in rows]
+
+    def backfill_if_empty(self, today: Optional[date] = None) -> Optional[Dict[str, int]]:
+        """
+        롤업이 비어 있는데 원본 이력이 있으면 재구성 (Database 초기화 시 호출)
+
+        롤업 도입 후 처음 시작할 때 과거 학습 기록이 모두 0으로 보이지 않도록 합니다.
+        Database 초기화는 모든 쓰기보다 먼저 실행되므로, 롤업이 비어 있으면 아직 채워지지 않은 것입니다.
+
+        Returns:
+            Optional[Dict[str, int]]: 재구성했으면 rebuild 결과, 아니면 None
+        """
+        with self.db.get_connection() as conn:
+            if conn.execute("SELECT 1 FROM user_daily_rollup LIMIT 1").fetchone() is not None:
+                return None
+            has_history = conn.execute("SELECT 1 FROM learning_history LIMIT 1").fetchone() is not None
+            if not has_history and conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'study_sessions'"
+            ).fetchone() is not None:
+                has_history = conn.execute("SELECT 1 FROM study_sessions LIMIT 1").fetchone() is not None
+        if not has_history:
+            return None
+        return self.rebuild(today=today)
+
+    def rebuild(self, user_id: Optional[int] = None, today: Optional[date] = None) -> Dict[str, int]:
+        """
+        원본 이력에서 롤업 재구성 (한 트랜잭션, 집계 쿼리 한 번)
+
+        학습 이력(+answer_details)과 학습 세션으로 다시 계산합니다. 단어 복습 횟수는 복습마다의
+        이력이 남지 않아 원본에서 다시 만들 수 없으므로 기존 값을 유지합니다.
+        재구성은 apply를 거치지 않으므로, 끝난 뒤 연속 학습 일수도 롤업에서 다시 계산합니다.
+
+        Args:
+            user_id: 사용자 ID (None이면 전체)
+            today: 연속 학습 일수 기준 날짜 (None이면 오늘)
+
+        Returns:
+            Dict[str, int]: rows (재구성한 롤업 행 수), streak_users (연속 학습 일수를 다시 계산한 사용자 수)
+        """
+        user_filter = "" if user_id is None else "WHERE user_id = ?"
+        user_params = () if user_id is None else (user_id,)
+        base_columns = ", ".join(self.BASE_COUNTERS)
+        type_columns = ", ".join(self.TYPE_COUNTERS)
+        type_aggregates = ",\n".join(
+            f"SUM(CASE WHEN question_type = '{question_type.value}' THEN 1 ELSE 0 END) AS {question_type.value}_total,\n"
+            f"SUM(CASE WHEN question_type = '{question_type.value}' AND is_correct THEN 1 ELSE 0 END) "
+            f"AS {question_type.value}_correct"
+            for question_type in QuestionType
+        )
+        type_sums = ", ".join(f"SUM({name})" for name in self.TYPE_COUNTERS)
+        type_zeros = ", ".join("0" for _ in self.TYPE_COUNTERS)
+        type_values = ", ".join(f"COALESCE(ad.{name}, 0) AS {name}" for name in self.TYPE_COUNTERS)
+
+        with self.db.get_connection() as conn:
+            has_study_sessions = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'study_sessions'"
+            ).fetchone() is not None
+            study_branch = f"""
+                UNION ALL
+                SELECT user_id, study_date, total_questions, correct_count, time_spent_minutes,
+                       0, 1, {type_zeros}
+                FROM study_sessions {user_filter}
+            """ if has_study_sessions else ""
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                kept_reviews = conn.execute(
+                    f"SELECT user_id, study_date, vocabulary_reviews FROM user_daily_rollup "
+                    f"{'WHERE' if user_id is None else user_filter + ' AND'} vocabulary_reviews != 0",
+                    user_params
+                ).fetchall()
+                conn.execute(f"DELETE FROM user_daily_rollup {user_filter}", user_params)
+                conn.execute(f"""
+                    INSERT INTO user_daily_rollup (user_id, study_date, {base_columns}, {type_columns})
+                    SELECT user_id, study_date,
+                           SUM(total_questions), SUM(correct_count), SUM(time_spent_minutes),
+                           SUM(tests_completed), SUM(study_sessions), 0, {type_sums}
+                    FROM (
+                        SELECT lh.user_id, lh.study_date, lh.total_questions, lh.correct_count,
+                               lh.time_spent_minutes, 1 AS tests_completed, 0 AS study_sessions,
+                               {type_values}
+                        FROM learning_history AS lh
+                        LEFT JOIN (
+                            SELECT result_id,
+                                   {type_aggregates}
+                            FROM answer_details
+                            GROUP BY result_id
+                        ) AS ad ON ad.result_id = lh.result_id
+                        {user_filter.replace('user_id', 'lh.user_id')}
+                        {study_branch}
+                    )
+                    GROUP BY user_id, study_date
+                """, user_params * (2 if has_study_sessions else 1))
+                for row in kept_reviews:
+                    self.apply(conn, row['user_id'], row['study_date'],
+                               {'vocabulary_reviews': row['vocabulary_reviews']})
+                rows = conn.execute(
+                    f"SELECT COUNT(*) FROM user_daily_rollup {user_filter}", user_params
+                ).fetchone()[0]
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        streaks = StudyStreakService(SqliteUserStreakRepository(self.db)).recompute_all(today=today)
+        return {'rows': rows, 'streak_users': streaks['users']}
+
+    @classmethod
+    def _to_dict(cls, row) -> Dict[str, Any]:
+        """롤업 행을 dict로 변환 (유형별 카운터는 question_types 아래로 묶음)"""
+        data = dict(row)
+        result: Dict[str, Any] = {
+            'user_id': data['user_id'],
+            'date': data['study_date'],
+        }
+        for name in cls.BASE_COUNTERS:
+            result[name] = data.get(name) or 0
+        result['question_types'] = {
+            question_type.value: {
+                'total': data.get(f"{question_type.value}_total") or 0,
+                'correct': data.get(f"{question_type.value}_correct") or 0,
+            }
+            for question_type in QuestionType
+        }
+        return result
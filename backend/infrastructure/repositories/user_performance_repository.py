@@ -2,9 +2,10 @@
 SQLite 기반 UserPerformance Repository 구현
 """
 
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from backend.domain.entities.user_performance import UserPerformance
 from backend.infrastructure.config.database import get_database, Database
+from backend.infrastructure.repositories.level_score_repository import SqliteLevelScoreRepository
 from backend.infrastructure.repositories.user_performance_mapper import UserPerformanceMapper
 
 
@@ -36,10 +37,23 @@ class SqliteUserPerformanceRepository:
             """)
             conn.commit()
 
-    def save(self, user_performance: UserPerformance) -> UserPerformance:
-        """UserPerformance 저장/업데이트"""
+    def save(
+        self,
+        user_performance: UserPerformance,
+        level_scores: Optional[Iterable[Tuple[int, str, str, float, Optional[int]]]] = None
+    ) -> UserPerformance:
+        """
+        UserPerformance 저장/업데이트
+
+        Args:
+            user_performance: 저장할 성능 데이터
+            level_scores: 같은 트랜잭션에서 level_scores에 추가할 (user_id, level, 날짜(ISO 형식), score, result_id) 목록
+                (새 시험 점수와 level_progression에서 요약으로 바꾼 예전 점수 목록)
+        """
         with self.db.get_connection() as conn:
             data = UserPerformanceMapper.to_dict(user_performance)
+            if level_scores:
+                SqliteLevelScoreRepository.insert_all(conn, level_scores)
 
             if user_performance.id is None or user_performance.id == 0:
                 # 새 UserPerformance 생성
@@ -0,0 +1,109 @@
+"""
+SQLite 기반 사용자 연속 학습 일수 Repository 구현
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from backend.infrastructure.config.database import get_database, Database
+
+
+class SqliteUserStreakRepository:
+    """
+    사용자 연속 학습 일수 Repository
+
+    user_streaks 테이블(테이블은 Database가 생성)은 사용자별 현재/최장 연속 학습 일수와
+    마지막 학습 날짜를 저장하고, 현재 연속 일수는 users.study_streak에도 반영합니다.
+
+    - 학습 활동: 일별 롤업에 활동이 기록될 때 같은 트랜잭션에서 record_activity로 O(1) 갱신
+    - 야간 재계산: 롤업의 활동 날짜 전체로 다시 계산한 값을 replace_all로 일괄 저장
+    """
+
+    def __init__(self, db: Optional[Database] = None):
+        self.db = db or get_database()
+
+    @staticmethod
+    def record_activity(conn, user_id: int, study_date: str) -> None:
+        """
+        현재 트랜잭션에서 학습 활동 하루 반영 (커밋하지 않음)
+
+        마지막 학습 날짜의 다음 날이면 연속 일수를 1 늘리고, 하루 이상 비었으면 1부터 다시 셉니다.
+        같은 날이나 과거 날짜의 활동은 연속 일수를 바꾸지 않습니다 (야간 재계산에서 반영).
+
+        Args:
+            conn: 학습 활동을 저장하는 트랜잭션의 연결
+            user_id: 사용자 ID
+            study_date: 학습 날짜 (ISO 형식)
+        """
+        # UPDATE의 우변은 모두 갱신 전 값을 참조하므로 longest_streak는 새 current_streak과 비교됨
+        conn.execute("""
+            INSERT INTO user_streaks (user_id, current_streak, longest_streak, last_study_date)
+            VALUES (?, 1, 1, ?)
+            ON CONFLICT(user_id) DO UPDATE SET
+                current_streak = CASE
+                    WHEN excluded.last_study_date = date(last_study_date, '+1 day') THEN current_streak + 1
+                    ELSE 1
+                END,
+                longest_streak = MAX(longest_streak, CASE
+                    WHEN excluded.last_study_date = date(last_study_date, '+1 day') THEN current_streak + 1
+                    ELSE 1
+                END),
+                last_study_date = excluded.last_study_date,
+                updated_at = CURRENT_TIMESTAMP
+            WHERE last_study_date IS NULL OR excluded.last_study_date > last_study_date
+        """, (user_id, study_date))
+        conn.execute("""
+            UPDATE users
+            SET study_streak = (SELECT current_streak FROM user_streaks WHERE user_id = ?)
+            WHERE id = ?
+        """, (user_id, user_id))
+
+    def find_by_user_id(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """사용자의 연속 학습 기록 조회 (학습 기록이 없으면 None)"""
+        with self.db.get_connection() as conn:
+            row = conn.execute(
+                "SELECT user_id, current_streak, longest_streak, last_study_date "
+                "FROM user_streaks WHERE user_id = ?",
+                (user_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def find_active_days(self) -> List[Tuple[int, str]]:
+        """
+        전체 사용자의 학습한 날 목록 (일별 롤업 기준)
+
+        Returns:
+            List[Tuple[int, str]]: (user_id, 학습 날짜) 목록, 사용자/날짜 순 정렬
+        """
+        with self.db.get_connection() as conn:
+            return [tuple(row) for row in conn.execute("""
+                SELECT user_id, study_date
+                FROM user_daily_rollup
+                WHERE questions_answered > 0 OR tests_completed > 0
+                   OR study_sessions > 0 OR vocabulary_reviews > 0
+                ORDER BY user_id, study_date
+            """)]
+
+    def replace_all(self, streaks: List[Tuple[int, int, int, str]]) -> None:
+        """
+        전체 연속 학습 기록을 한 트랜잭션으로 교체하고 users.study_streak 동기화
+
+        Args:
+            streaks: (user_id, 현재 연속 일수, 최장 연속 일수, 마지막 학습 날짜) 목록
+        """
+        with self.db.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM user_streaks")
+                conn.executemany("""
+                    INSERT INTO user_streaks (user_id, current_streak, longest_streak, last_study_date)
+                    VALUES (?, ?, ?, ?)
+                """, streaks)
+                conn.execute("""
+                    UPDATE users
+                    SET study_streak = COALESCE(
+                        (SELECT current_streak FROM user_streaks WHERE user_id = users.id), 0
+                    )
+                """)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
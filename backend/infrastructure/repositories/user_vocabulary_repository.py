@@ -2,12 +2,15 @@
 SQLite 기반 UserVocabulary Repository 구현
 """
 
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 from datetime import date
 from backend.domain.entities.user_vocabulary import UserVocabulary
-from backend.domain.value_objects.jlpt import MemorizationStatus
+from backend.domain.entities.vocabulary import Vocabulary
+from backend.domain.value_objects.jlpt import JLPTLevel, MemorizationStatus
 from backend.infrastructure.config.database import get_database, Database
+from backend.infrastructure.repositories.user_daily_rollup_repository import SqliteUserDailyRollupRepository
 from backend.infrastructure.repositories.user_vocabulary_mapper import UserVocabularyMapper
+from backend.infrastructure.repositories.vocabulary_mapper import VocabularyMapper
 
 
 class SqliteUserVocabularyRepository:
@@ -92,6 +95,28 @@ class SqliteUserVocabularyRepository:
                 CREATE INDEX IF NOT EXISTS idx_user_vocabulary_next_review_date 
                 ON user_vocabulary(next_review_date)
             """)
+            # 사용자별 복습 대상 조회용 복합 인덱스
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_user_vocabulary_user_next_review
+                ON user_vocabulary(user_id, next_review_date)
+            """)
+            # 복습 통계 집계용 커버링 인덱스
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_user_vocabulary_review_stats
+                ON user_vocabulary(user_id, last_review_date, review_count, consecutive_correct)
+            """)
+            # 사용자별 복습 통계 카운터 캐시 (복습 저장 시 함께 갱신)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS user_review_stats (
+                    user_id INTEGER PRIMARY KEY,
+                    total_reviewed INTEGER NOT NULL DEFAULT 0,
+                    successful_reviews INTEGER NOT NULL DEFAULT 0,
+                    last_review_date DATE,
+                    reviewed_on_last_date INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (user_id) REFERENCES users(id)
+                )
+            """)
             conn.commit()
 
     def save(self, user_vocabulary: UserVocabulary) -> UserVocabulary:
@@ -99,7 +124,11 @@ class SqliteUserVocabularyRepository:
         with self.db.get_connection() as conn:
             data = UserVocabularyMapper.to_dict(user_vocabulary)
 
-            if user_vocabulary.id is None or user_vocabulary.id == 0:
+            # 변경 전 스냅샷을 쓰기 트랜잭션 안에서 읽어 동시 저장이 같은 변경분을 두 번 반영하지 않도록 함
+            conn.execute("BEGIN IMMEDIATE")
+            is_new = user_vocabulary.id is None or user_vocabulary.id == 0
+            if is_new:
+                before = None
                 # 새 상태 생성
                 cursor = conn.execute("""
                     INSERT INTO user_vocabulary (
@@ -117,6 +146,9 @@ class SqliteUserVocabularyRepository:
                 ))
                 user_vocabulary.id = cursor.lastrowid
             else:
+                before = self._find_stats_snapshots_by_ids(conn, [user_vocabulary.id]).get(
+                    user_vocabulary.id
+                )
                 # 기존 상태 업데이트
                 conn.execute("""
                     UPDATE user_vocabulary
@@ -142,9 +174,62 @@ class SqliteUserVocabularyRepository:
                     user_vocabulary.id
                 ))
 
+            if is_new or before is not None:
+                changes = [(user_vocabulary.user_id, before, self._stats_snapshot(data))]
+                self._apply_review_stats_changes(conn, changes)
+                self._apply_daily_rollup_changes(conn, changes)
             conn.commit()
             return user_vocabulary
 
+    def save_all(self, user_vocabularies: List[UserVocabulary]) -> None:
+        """
+        여러 사용자별 단어 학습 상태를 하나의 트랜잭션으로 일괄 저장 (upsert)
+
+        (user_id, vocabulary_id)가 이미 존재하면 SRS 필드를 갱신하고,
+        없으면 새로 생성합니다.
+
+        Args:
+            user_vocabularies: 저장할 UserVocabulary 목록
+        """
+        if not user_vocabularies:
+            return
+
+        params = []
+        for user_vocabulary in user_vocabularies:
+            data = UserVocabularyMapper.to_dict(user_vocabulary)
+            params.append((
+                data['user_id'], data['vocabulary_id'], data['memorization_status'],
+                data['next_review_date'], data['interval_days'], data['ease_factor'],
+                data['review_count'], data['last_review_date'],
+                data['consecutive_correct'], data['consecutive_incorrect']
+            ))
+
+        with self.db.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            changes = self._collect_review_stats_changes(conn, user_vocabularies)
+            conn.executemany("""
+                INSERT INTO user_vocabulary (
+                    user_id, vocabulary_id, memorization_status,
+                    next_review_date, interval_days, ease_factor,
+                    review_count, last_review_date,
+                    consecutive_correct, consecutive_incorrect
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, vocabulary_id) DO UPDATE SET
+                    memorization_status = excluded.memorization_status,
+                    next_review_date = excluded.next_review_date,
+                    interval_days = excluded.interval_days,
+                    ease_factor = excluded.ease_factor,
+                    review_count = excluded.review_count,
+                    last_review_date = excluded.last_review_date,
+                    consecutive_correct = excluded.consecutive_correct,
+                    consecutive_incorrect = excluded.consecutive_incorrect,
+                    updated_at = CURRENT_TIMESTAMP
+            """, params)
+            self._apply_review_stats_changes(conn, changes)
+            self._apply_daily_rollup_changes(conn, changes)
+            conn.commit()
+
     def find_by_user_and_vocabulary(
         self, user_id: int, vocabulary_id: int
     ) -> Optional[UserVocabulary]:
@@ -160,6 +245,23 @@ class SqliteUserVocabularyRepository:
                 return UserVocabularyMapper.to_entity(row)
             return None
 
+    def find_by_user_and_vocabulary_ids(
+        self, user_id: int, vocabulary_ids: List[int]
+    ) -> List[UserVocabulary]:
+        """사용자 ID와 여러 단어 ID로 한 번에 조회"""
+        if not vocabulary_ids:
+            return []
+
+        placeholders = ",".join("?" * len(vocabulary_ids))
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                f"SELECT * FROM user_vocabulary WHERE user_id = ? AND vocabulary_id IN ({placeholders})",
+                (user_id, *vocabulary_ids)
+            )
+            rows = cursor.fetchall()
+
+            return [UserVocabularyMapper.to_entity(row) for row in rows]
+
     def find_by_user_id(self, user_id: int) -> List[UserVocabulary]:
         """사용자 ID로 모든 단어 학습 상태 조회"""
         with self.db.get_connection() as conn:
@@ -219,12 +321,183 @@ class SqliteUserVocabularyRepository:
                     CASE WHEN next_review_date IS NULL THEN 0 ELSE 1 END,
                     next_review_date ASC,
                     consecutive_incorrect DESC,
-                    review_count ASC
+                    review_count ASC,
+                    id ASC
             """, (user_id, today))
             rows = cursor.fetchall()
             
             return [UserVocabularyMapper.to_entity(row) for row in rows]
 
+    def find_due_for_review_with_vocabulary(
+        self,
+        user_id: int,
+        today: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0
+    ) -> List[Tuple[UserVocabulary, Vocabulary]]:
+        """
+        오늘 복습해야 하는 단어를 단어 정보와 함께 조회 (단일 JOIN 쿼리)
+
+        Args:
+            user_id: 사용자 ID
+            today: 오늘 날짜 (YYYY-MM-DD 형식, 기본값: None이면 현재 날짜)
+            limit: 최대 조회 개수 (기본값: None이면 전체)
+            offset: 건너뛸 개수 (기본값: 0)
+
+        Returns:
+            (사용자 단어 학습 상태, 단어) 튜플 목록 (find_due_for_review와 같은 우선순위, 같으면 ID 순이라 페이지가 겹치지 않음)
+        """
+        if today is None:
+            today = date.today().isoformat()
+
+        with self.db.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT
+                    uv.id, uv.user_id, uv.vocabulary_id, uv.memorization_status,
+                    uv.next_review_date, uv.interval_days, uv.ease_factor,
+                    uv.review_count, uv.last_review_date,
+                    uv.consecutive_correct, uv.consecutive_incorrect,
+                    v.word, v.reading, v.meaning, v.level, v.example_sentence
+                FROM user_vocabulary uv
+                JOIN vocabulary v ON v.id = uv.vocabulary_id
+                WHERE uv.user_id = ?
+                AND (uv.next_review_date IS NULL OR uv.next_review_date <= ?)
+                ORDER BY
+                    CASE WHEN uv.next_review_date IS NULL THEN 0 ELSE 1 END,
+                    uv.next_review_date ASC,
+                    uv.consecutive_incorrect DESC,
+                    uv.review_count ASC,
+                    uv.id ASC
+                LIMIT ? OFFSET ?
+            """, (user_id, today, -1 if limit is None else limit, offset))
+            rows = cursor.fetchall()
+
+            return [
+                (UserVocabularyMapper.to_entity(row), self._to_vocabulary(row))
+                for row in rows
+            ]
+
+    def iter_vocabulary_with_status(
+        self,
+        user_id: int,
+        level: Optional[JLPTLevel] = None,
+        status: Optional[MemorizationStatus] = None,
+        search: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        batch_size: int = 500
+    ) -> Iterator[Tuple[Vocabulary, MemorizationStatus]]:
+        """
+        단어 목록을 사용자별 암기 상태와 함께 순차 조회 (LEFT JOIN)
+
+        레벨/상태/검색 필터를 SQL에서 적용하고, ID 내림차순으로 batch_size씩 나누어 조회합니다.
+        배치마다 연결을 새로 열고 닫으므로 스트리밍 응답에서 사용해도 연결을 오래 점유하지 않습니다.
+        학습 기록이 없는 단어는 NOT_MEMORIZED 상태로 취급합니다.
+
+        Args:
+            user_id: 사용자 ID
+            level: JLPT 레벨 필터 (선택적)
+            status: 사용자별 암기 상태 필터 (선택적)
+            search: 단어 또는 의미 부분 일치 검색어 (선택적)
+            limit: 최대 조회 개수 (기본값: None이면 전체)
+            offset: 건너뛸 개수 (기본값: 0)
+            batch_size: 한 번에 조회할 행 수
+
+        Yields:
+            (단어, 사용자별 암기 상태) 튜플
+        """
+        conditions = []
+        filter_params: list = []
+        if level is not None:
+            conditions.append("v.level = ?")
+            filter_params.append(level.value)
+        if status is not None:
+            conditions.append("COALESCE(uv.memorization_status, ?) = ?")
+            filter_params.extend([MemorizationStatus.NOT_MEMORIZED.value, status.value])
+        if search:
+            conditions.append("(v.word LIKE ? OR v.meaning LIKE ?)")
+            filter_params.extend([f"%{search}%", f"%{search}%"])
+
+        remaining = limit
+        last_id = None
+        while remaining is None or remaining > 0:
+            fetch_size = batch_size if remaining is None else min(batch_size, remaining)
+            batch_conditions = list(conditions)
+            batch_params = list(filter_params)
+            if last_id is not None:
+                batch_conditions.append("v.id < ?")
+                batch_params.append(last_id)
+            where = f"WHERE {' AND '.join(batch_conditions)}" if batch_conditions else ""
+
+            with self.db.get_connection() as conn:
+                rows = conn.execute(f"""
+                    SELECT v.*, COALESCE(uv.memorization_status, ?) AS user_status
+                    FROM vocabulary v
+                    LEFT JOIN user_vocabulary uv
+                        ON uv.vocabulary_id = v.id AND uv.user_id = ?
+                    {where}
+                    ORDER BY v.id DESC
+                    LIMIT ? OFFSET ?
+                """, (
+                    MemorizationStatus.NOT_MEMORIZED.value, user_id, *batch_params,
+                    fetch_size, offset if last_id is None else 0
+                )).fetchall()
+
+            for row in rows:
+                yield VocabularyMapper.to_entity(row), MemorizationStatus(row['user_status'])
+
+            if len(rows) < fetch_size:
+                return
+            last_id = rows[-1]['id']
+            if remaining is not None:
+                remaining -= len(rows)
+
+    @staticmethod
+    def _to_vocabulary(row) -> Vocabulary:
+        """JOIN 결과 행에서 Vocabulary 엔티티 생성"""
+        return Vocabulary(
+            id=row['vocabulary_id'],
+            word=row['word'],
+            reading=row['reading'],
+            meaning=row['meaning'],
+            level=JLPTLevel(row['level']),
+            example_sentence=row['example_sentence']
+        )
+
+    def find_review_schedule_histogram(
+        self, until: str, user_id: Optional[int] = None
+    ) -> List[Tuple[Optional[str], int, float, int]]:
+        """
+        복습 예정일 히스토그램 조회 (집계 쿼리)
+
+        같은 (복습 예정일, 간격, Ease Factor)를 가진 카드를 하나의 그룹으로 묶어
+        개수와 함께 반환합니다. 복습량 예측 시뮬레이션의 입력으로 사용합니다.
+
+        Args:
+            until: 조회 종료 날짜 (YYYY-MM-DD 형식, 포함)
+            user_id: 사용자 ID (기본값: None이면 전체 사용자)
+
+        Returns:
+            (next_review_date, interval_days, ease_factor, 카드 수) 튜플 목록
+        """
+        query = """
+            SELECT next_review_date, interval_days, ease_factor, COUNT(*) AS card_count
+            FROM user_vocabulary
+            WHERE (next_review_date IS NULL OR next_review_date <= ?)
+        """
+        params: list = [until]
+        if user_id is not None:
+            query += " AND user_id = ?"
+            params.append(user_id)
+        query += " GROUP BY next_review_date, interval_days, ease_factor"
+
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(query, params)
+            return [
+                (row[0], row[1] or 0, row[2] if row[2] is not None else 2.5, row[3])
+                for row in cursor.fetchall()
+            ]
+
     def upsert(
         self, user_id: int, vocabulary_id: int, status: MemorizationStatus
     ) -> UserVocabulary:
@@ -249,9 +522,235 @@ class SqliteUserVocabularyRepository:
             return
 
         with self.db.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            before = self._find_stats_snapshots_by_ids(conn, [user_vocabulary.id]).get(
+                user_vocabulary.id
+            )
             conn.execute(
                 "DELETE FROM user_vocabulary WHERE id = ?",
                 (user_vocabulary.id,)
             )
+            if before is not None:
+                self._apply_review_stats_changes(
+                    conn, [(user_vocabulary.user_id, before, None)]
+                )
             conn.commit()
 
+    def get_review_statistics(self, user_id: int, today: Optional[str] = None) -> dict:
+        """
+        사용자의 복습 통계 조회 (카운터 캐시 사용)
+
+        대기 중인 복습 수는 (user_id, next_review_date) 인덱스 범위 조회로 세고,
+        나머지 값은 user_review_stats 카운터 캐시에서 읽습니다.
+        캐시가 없으면 집계 쿼리로 생성합니다.
+
+        Args:
+            user_id: 사용자 ID
+            today: 오늘 날짜 (YYYY-MM-DD 형식, 기본값: None이면 현재 날짜)
+
+        Returns:
+            total_due, reviewed_today, total_reviewed, successful_reviews를 담은 딕셔너리
+        """
+        if today is None:
+            today = date.today().isoformat()
+
+        with self.db.get_connection() as conn:
+            total_due = conn.execute("""
+                SELECT COUNT(*) FROM user_vocabulary
+                WHERE user_id = ?
+                AND (next_review_date IS NULL OR next_review_date <= ?)
+            """, (user_id, today)).fetchone()[0]
+            stats = conn.execute(
+                "SELECT * FROM user_review_stats WHERE user_id = ?", (user_id,)
+            ).fetchone()
+
+        if stats is None:
+            stats = self.rebuild_review_statistics(user_id)
+
+        return {
+            'total_due': total_due,
+            'reviewed_today': (
+                stats['reviewed_on_last_date'] if stats['last_review_date'] == today else 0
+            ),
+            'total_reviewed': stats['total_reviewed'],
+            'successful_reviews': stats['successful_reviews']
+        }
+
+    def rebuild_review_statistics(self, user_id: int) -> dict:
+        """
+        사용자의 복습 통계 카운터 캐시를 user_vocabulary에서 다시 계산
+
+        Args:
+            user_id: 사용자 ID
+
+        Returns:
+            저장된 카운터 캐시 (total_reviewed, successful_reviews,
+            last_review_date, reviewed_on_last_date)
+        """
+        with self.db.get_connection() as conn:
+            row = conn.execute("""
+                SELECT
+                    COALESCE(SUM(CASE WHEN review_count > 0 THEN 1 ELSE 0 END), 0) AS total_reviewed,
+                    COALESCE(SUM(CASE WHEN review_count > 0 AND consecutive_correct >= 2
+                                 THEN 1 ELSE 0 END), 0) AS successful_reviews,
+                    MAX(last_review_date) AS last_review_date
+                FROM user_vocabulary
+                WHERE user_id = ?
+            """, (user_id,)).fetchone()
+            reviewed_on_last_date = 0
+            if row['last_review_date'] is not None:
+                reviewed_on_last_date = conn.execute(
+                    "SELECT COUNT(*) FROM user_vocabulary WHERE user_id = ? AND last_review_date = ?",
+                    (user_id, row['last_review_date'])
+                ).fetchone()[0]
+
+            stats = {
+                'total_reviewed': row['total_reviewed'],
+                'successful_reviews': row['successful_reviews'],
+                'last_review_date': row['last_review_date'],
+                'reviewed_on_last_date': reviewed_on_last_date
+            }
+            conn.execute("""
+                INSERT OR REPLACE INTO user_review_stats (
+                    user_id, total_reviewed, successful_reviews,
+                    last_review_date, reviewed_on_last_date, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+            """, (
+                user_id, stats['total_reviewed'], stats['successful_reviews'],
+                stats['last_review_date'], stats['reviewed_on_last_date']
+            ))
+            conn.commit()
+            return stats
+
+    @staticmethod
+    def _stats_snapshot(data: dict) -> Tuple[int, int, Optional[str]]:
+        """복습 통계에 영향을 주는 필드 (review_count, consecutive_correct, last_review_date)"""
+        return (
+            data['review_count'] or 0,
+            data['consecutive_correct'] or 0,
+            data['last_review_date']
+        )
+
+    @staticmethod
+    def _find_stats_snapshots_by_ids(conn, ids: List[int]) -> dict:
+        """ID별 현재 복습 통계 스냅샷 조회 (BEGIN IMMEDIATE로 시작한 쓰기 트랜잭션 안에서 호출)"""
+        placeholders = ",".join("?" * len(ids))
+        rows = conn.execute(f"""
+            SELECT id, review_count, consecutive_correct, last_review_date
+            FROM user_vocabulary WHERE id IN ({placeholders})
+        """, tuple(ids)).fetchall()
+        return {row[0]: (row[1] or 0, row[2] or 0, row[3]) for row in rows}
+
+    def _collect_review_stats_changes(self, conn, user_vocabularies: List[UserVocabulary]) -> list:
+        """일괄 저장 전후의 복습 통계 스냅샷 목록 생성 (쓰기 트랜잭션 안에서 호출)"""
+        vocabulary_ids_by_user: dict = {}
+        for user_vocabulary in user_vocabularies:
+            vocabulary_ids_by_user.setdefault(user_vocabulary.user_id, []).append(
+                user_vocabulary.vocabulary_id
+            )
+
+        before_by_key = {}
+        for user_id, vocabulary_ids in vocabulary_ids_by_user.items():
+            placeholders = ",".join("?" * len(vocabulary_ids))
+            rows = conn.execute(f"""
+                SELECT vocabulary_id, review_count, consecutive_correct, last_review_date
+                FROM user_vocabulary
+                WHERE user_id = ? AND vocabulary_id IN ({placeholders})
+            """, (user_id, *vocabulary_ids)).fetchall()
+            for row in rows:
+                before_by_key[(user_id, row[0])] = (row[1] or 0, row[2] or 0, row[3])
+
+        changes = []
+        for user_vocabulary in user_vocabularies:
+            key = (user_vocabulary.user_id, user_vocabulary.vocabulary_id)
+            after = self._stats_snapshot(UserVocabularyMapper.to_dict(user_vocabulary))
+            changes.append((user_vocabulary.user_id, before_by_key.get(key), after))
+            before_by_key[key] = after
+        return changes
+
+    @staticmethod
+    def _apply_review_stats_changes(conn, changes: list) -> None:
+        """
+        복습 통계 카운터 캐시에 변경분 반영
+
+        캐시가 아직 없는 사용자는 건너뜁니다 (조회 시 집계 쿼리로 생성).
+
+        Args:
+            conn: 현재 트랜잭션의 연결
+            changes: (user_id, 변경 전 스냅샷, 변경 후 스냅샷) 목록 (없으면 None)
+        """
+        def reviewed(snapshot):
+            return 1 if snapshot and snapshot[0] > 0 else 0
+
+        def successful(snapshot):
+            return 1 if snapshot and snapshot[0] > 0 and snapshot[1] >= 2 else 0
+
+        stats_by_user = {}
+        for user_id, before, after in changes:
+            if user_id not in stats_by_user:
+                row = conn.execute(
+                    "SELECT * FROM user_review_stats WHERE user_id = ?", (user_id,)
+                ).fetchone()
+                stats_by_user[user_id] = dict(row) if row else None
+            stats = stats_by_user[user_id]
+            if stats is None:
+                continue
+
+            stats['total_reviewed'] += reviewed(after) - reviewed(before)
+            stats['successful_reviews'] += successful(after) - successful(before)
+
+            old_date = before[2] if before else None
+            new_date = after[2] if after else None
+            if old_date == new_date:
+                continue
+            if old_date is not None and old_date == stats['last_review_date']:
+                stats['reviewed_on_last_date'] -= 1
+            if new_date is not None:
+                if stats['last_review_date'] is None or new_date > stats['last_review_date']:
+                    stats['last_review_date'] = new_date
+                    stats['reviewed_on_last_date'] = 1
+                elif new_date == stats['last_review_date']:
+                    stats['reviewed_on_last_date'] += 1
+
+        for user_id, stats in stats_by_user.items():
+            if stats is None:
+                continue
+            conn.execute("""
+                UPDATE user_review_stats
+                SET total_reviewed = ?,
+                    successful_reviews = ?,
+                    last_review_date = ?,
+                    reviewed_on_last_date = ?,
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE user_id = ?
+            """, (
+                stats['total_reviewed'], stats['successful_reviews'],
+                stats['last_review_date'], stats['reviewed_on_last_date'], user_id
+            ))
+
+    @staticmethod
+    def _apply_daily_rollup_changes(conn, changes: list) -> None:
+        """
+        일별 학습 롤업에 단어 복습 횟수 반영
+
+        review_count 증가분을 변경 후 복습 날짜에 더합니다. 삭제나 초기화로 review_count가
+        줄어드는 경우는 이미 한 복습이므로 빼지 않습니다.
+
+        Args:
+            conn: 현재 트랜잭션의 연결
+            changes: (user_id, 변경 전 스냅샷, 변경 후 스냅샷) 목록 (없으면 None)
+        """
+        reviews_by_day: dict = {}
+        for user_id, before, after in changes:
+            if after is None or after[2] is None:
+                continue
+            reviews = after[0] - (before[0] if before else 0)
+            if reviews > 0:
+                key = (user_id, after[2])
+                reviews_by_day[key] = reviews_by_day.get(key, 0) + reviews
+
+        for (user_id, review_date), reviews in reviews_by_day.items():
+            SqliteUserDailyRollupRepository.apply(
+                conn, user_id, review_date, {'vocabulary_reviews': reviews}
+            )
@@ -6,6 +6,7 @@ import sqlite3
 from typing import Dict, Any
 from backend.domain.entities.vocabulary import Vocabulary
 from backend.domain.value_objects.jlpt import JLPTLevel
+from backend.infrastructure.repositories.content_hash import vocabulary_content_hash
 
 
 class VocabularyMapper:
@@ -45,7 +46,10 @@ class VocabularyMapper:
             'reading': vocabulary.reading,
             'meaning': vocabulary.meaning,
             'level': vocabulary.level.value,
-            'example_sentence': vocabulary.example_sentence
+            'example_sentence': vocabulary.example_sentence,
+            'content_hash': vocabulary_content_hash(
+                vocabulary.word, vocabulary.reading, vocabulary.level.value
+            )
         }
         return data
 
@@ -2,16 +2,41 @@
 SQLite 기반 Vocabulary Repository 구현
 """
 
-from typing import List, Optional
+import sqlite3
+from typing import Dict, List, Optional, Tuple
 from backend.domain.entities.vocabulary import Vocabulary
 from backend.domain.value_objects.jlpt import JLPTLevel
 from backend.infrastructure.config.database import get_database, Database
 from backend.infrastructure.repositories.vocabulary_mapper import VocabularyMapper
+from backend.infrastructure.repositories.content_hash import (
+    DuplicateContentError,
+    legacy_duplicate_hash,
+    vocabulary_content_hash,
+)
 
 
 class SqliteVocabularyRepository:
     """SQLite 기반 Vocabulary Repository 구현"""
 
+    # IN 절 하나에 바인딩할 최대 파라미터 수 (구버전 SQLite 한도 999 이하)
+    _MAX_IN_PARAMS = 500
+
+    _INSERT_SQL = """
+        INSERT INTO vocabulary (word, reading, meaning, level, example_sentence, content_hash)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """
+
+    # 임포트(save_all)에서 콘텐츠 해시가 같은 단어를 다시 저장하면 해시에 포함되지 않는 필드만 갱신
+    # (memorization_status는 더 이상 사용하지 않음, 기본값 유지)
+    _UPSERT_SQL = _INSERT_SQL.rstrip() + """
+        ON CONFLICT(content_hash) DO UPDATE SET
+            meaning = excluded.meaning,
+            example_sentence = COALESCE(excluded.example_sentence, vocabulary.example_sentence)
+        WHERE vocabulary.meaning IS NOT excluded.meaning
+           OR (excluded.example_sentence IS NOT NULL
+               AND vocabulary.example_sentence IS NOT excluded.example_sentence)
+    """
+
     def __init__(self, db: Optional[Database] = None):
         self.db = db or get_database()
         self._ensure_table_exists()
@@ -27,42 +52,154 @@ class SqliteVocabularyRepository:
                     meaning TEXT NOT NULL,
                     level TEXT NOT NULL,
                     memorization_status TEXT NOT NULL DEFAULT 'not_memorized',
-                    example_sentence TEXT
+                    example_sentence TEXT,
+                    content_hash TEXT
                 )
             """)
+            # 기존 테이블에 content_hash 컬럼이 없는 경우 마이그레이션
+            columns = [col[1] for col in conn.execute("PRAGMA table_info(vocabulary)").fetchall()]
+            if 'content_hash' not in columns:
+                conn.execute("ALTER TABLE vocabulary ADD COLUMN content_hash TEXT")
+            # 레벨별 목록 조회 (ID 내림차순) 인덱스
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_vocabulary_level_id
+                ON vocabulary(level, id)
+            """)
+            # 임포트 중복 제거용 콘텐츠 해시 고유 인덱스
+            conn.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_vocabulary_content_hash
+                ON vocabulary(content_hash)
+            """)
+            self._backfill_content_hashes(conn)
             conn.commit()
 
+    @staticmethod
+    def _backfill_content_hashes(conn) -> None:
+        """해시가 없는 기존 단어에 콘텐츠 해시 설정 (기존 중복 행은 행 ID를 붙인 해시 사용)"""
+        rows = conn.execute(
+            "SELECT id, word, reading, level FROM vocabulary WHERE content_hash IS NULL ORDER BY id"
+        ).fetchall()
+        if not rows:
+            return
+
+        taken = {
+            row[0] for row in conn.execute(
+                "SELECT content_hash FROM vocabulary WHERE content_hash IS NOT NULL"
+            )
+        }
+        updates = []
+        for row in rows:
+            content_hash = vocabulary_content_hash(row['word'], row['reading'], row['level'])
+            if content_hash in taken:
+                content_hash = legacy_duplicate_hash(content_hash, row['id'])
+            taken.add(content_hash)
+            updates.append((content_hash, row['id']))
+        conn.executemany("UPDATE vocabulary SET content_hash = ? WHERE id = ?", updates)
+
+    @staticmethod
+    def _to_params(data: Dict) -> Tuple:
+        """to_dict 결과를 _INSERT_SQL/_UPSERT_SQL 파라미터로 변환"""
+        return (
+            data['word'], data['reading'], data['meaning'],
+            data['level'], data.get('example_sentence'), data['content_hash']
+        )
+
+    def _find_ids_by_content_hashes(self, conn, hashes: List[str]) -> Dict[str, int]:
+        """콘텐츠 해시로 단어 ID 조회"""
+        ids: Dict[str, int] = {}
+        unique_hashes = list(dict.fromkeys(hashes))
+        for start in range(0, len(unique_hashes), self._MAX_IN_PARAMS):
+            chunk = unique_hashes[start:start + self._MAX_IN_PARAMS]
+            placeholders = ','.join('?' * len(chunk))
+            cursor = conn.execute(
+                f"SELECT content_hash, id FROM vocabulary WHERE content_hash IN ({placeholders})",
+                chunk
+            )
+            ids.update({row[0]: row[1] for row in cursor})
+        return ids
+
     def save(self, vocabulary: Vocabulary) -> Vocabulary:
-        """단어 저장/업데이트"""
+        """
+        단어 저장/업데이트
+
+        Raises:
+            DuplicateContentError: 새 단어와 (단어, 읽기, 레벨)이 같은 단어가 이미 있는 경우
+                (기존 단어를 갱신하는 임포트는 save_all 사용)
+        """
         with self.db.get_connection() as conn:
             data = VocabularyMapper.to_dict(vocabulary)
 
             if vocabulary.id is None or vocabulary.id == 0:
-                # 새 단어 생성 (memorization_status는 더 이상 사용하지 않음, 기본값 유지)
-                cursor = conn.execute("""
-                    INSERT INTO vocabulary (word, reading, meaning, level, example_sentence)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    data['word'], data['reading'], data['meaning'],
-                    data['level'], data.get('example_sentence')
-                ))
+                # 새 단어 생성
+                try:
+                    cursor = conn.execute(self._INSERT_SQL, self._to_params(data))
+                except sqlite3.IntegrityError:
+                    existing = self._find_ids_by_content_hashes(conn, [data['content_hash']])
+                    if data['content_hash'] not in existing:
+                        raise
+                    raise DuplicateContentError(
+                        "같은 단어가 이미 있습니다", existing[data['content_hash']]
+                    )
 
                 # 생성된 ID를 단어 객체에 설정
                 vocabulary.id = cursor.lastrowid
             else:
                 # 기존 단어 업데이트 (memorization_status는 업데이트하지 않음)
+                # 수정 결과가 다른 단어와 같은 내용이면 행 ID를 붙인 해시로 고유 인덱스 충돌을 피함
                 conn.execute("""
                     UPDATE vocabulary
-                    SET word = ?, reading = ?, meaning = ?, level = ?, example_sentence = ?
+                    SET word = ?, reading = ?, meaning = ?, level = ?, example_sentence = ?,
+                        content_hash = CASE
+                            WHEN EXISTS (
+                                SELECT 1 FROM vocabulary AS other
+                                WHERE other.content_hash = ? AND other.id != vocabulary.id
+                            ) THEN ?
+                            ELSE ?
+                        END
                     WHERE id = ?
                 """, (
                     data['word'], data['reading'], data['meaning'],
-                    data['level'], data.get('example_sentence'), vocabulary.id
+                    data['level'], data.get('example_sentence'),
+                    data['content_hash'],
+                    legacy_duplicate_hash(data['content_hash'], vocabulary.id),
+                    data['content_hash'], vocabulary.id
                 ))
 
             conn.commit()
             return vocabulary
 
+    def save_all(self, vocabularies: List[Vocabulary]) -> int:
+        """
+        새 단어 일괄 저장 (INSERT ... ON CONFLICT 업서트)
+
+        executemany로 한 트랜잭션 안에서 저장하고, 모든 단어 객체에 ID를 설정합니다.
+        (단어, 읽기, 레벨)이 같은 단어가 이미 있으면 기존 단어를 갱신하므로
+        임포트/생성을 반복해도 중복이 생기지 않습니다.
+
+        Returns:
+            새로 삽입된 단어 수
+        """
+        if not vocabularies:
+            return 0
+
+        rows = [self._to_params(VocabularyMapper.to_dict(v)) for v in vocabularies]
+        hashes = [row[-1] for row in rows]
+
+        with self.db.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                existing = self._find_ids_by_content_hashes(conn, hashes)
+                conn.executemany(self._UPSERT_SQL, rows)
+                ids = self._find_ids_by_content_hashes(conn, hashes)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+
+        for vocabulary, content_hash in zip(vocabularies, hashes):
+            vocabulary.id = ids[content_hash]
+        return len(set(hashes) - set(existing))
+
     def find_by_id(self, id: int) -> Optional[Vocabulary]:
         """ID로 단어 조회"""
         with self.db.get_connection() as conn:
@@ -73,6 +210,21 @@ class SqliteVocabularyRepository:
                 return VocabularyMapper.to_entity(row)
             return None
 
+    def find_by_ids(self, ids: List[int]) -> List[Vocabulary]:
+        """여러 ID로 단어 한 번에 조회"""
+        if not ids:
+            return []
+
+        placeholders = ",".join("?" * len(ids))
+        with self.db.get_connection() as conn:
+            cursor = conn.execute(
+                f"SELECT * FROM vocabulary WHERE id IN ({placeholders})",
+                tuple(ids)
+            )
+            rows = cursor.fetchall()
+
+            return [VocabularyMapper.to_entity(row) for row in rows]
+
     def find_all(self) -> List[Vocabulary]:
         """모든 단어 조회"""
         with self.db.get_connection() as conn:
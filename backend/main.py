@@ -13,7 +13,10 @@ import os
 import logging
 
 from backend.presentation.controllers import router as api_router
+from backend.presentation.controllers.audio import router as audio_router
 from backend.infrastructure.config.database import get_database
+from backend.infrastructure.adapters.tts_cache import TTSCacheManager
+from backend.domain.services.tts_service import TTSService
 from backend.presentation.middleware.error_handler import (
     validation_exception_handler,
     http_exception_handler,
@@ -74,6 +77,8 @@ static_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "static")
 audio_dir = os.path.join(static_dir, "audio")
 os.makedirs(audio_dir, exist_ok=True)  # 오디오 디렉토리 생성
 
+# 오디오는 ETag/Range를 지원하는 전달 라우트로 서빙 (정적 파일 마운트보다 먼저 등록)
+app.include_router(audio_router, tags=["audio"])
 app.mount("/static", StaticFiles(directory=static_dir), name="static")
 
 @app.on_event("startup")
@@ -85,6 +90,9 @@ async def startup_event():
         cursor = conn.cursor()
         cursor.execute("SELECT 1")
     logger.info("Database connection established")
+    
+    # TTS 오디오 캐시 매니페스트 (생성/적중 기록, 예산 초과 시 LRU 제거)
+    TTSService.cache = TTSCacheManager(db)
 
 @app.get("/")
 async def root():
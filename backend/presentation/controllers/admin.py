@@ -3,9 +3,10 @@ JLPT 어드민 관리 API 컨트롤러
 어드민 권한이 있는 사용자만 접근 가능한 관리 기능 제공
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Request, UploadFile, File
-from pydantic import BaseModel
-from typing import Optional, List, Dict
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Request, UploadFile, File, Query
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import Optional, List, Dict, Tuple
 import os
 import shutil
 import logging
@@ -14,12 +15,20 @@ from pathlib import Path
 from backend.domain.entities.user import User
 from backend.domain.entities.question import Question
 from backend.domain.entities.vocabulary import Vocabulary
-from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType, MemorizationStatus
+from backend.domain.entities.import_job import ImportJob
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType, MemorizationStatus, ImportJobType
 from backend.infrastructure.repositories.user_repository import SqliteUserRepository
 from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
 from backend.infrastructure.repositories.test_repository import SqliteTestRepository
 from backend.infrastructure.repositories.result_repository import SqliteResultRepository
 from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+from backend.infrastructure.repositories.content_hash import DuplicateContentError
+from backend.infrastructure.repositories.user_vocabulary_repository import SqliteUserVocabularyRepository
+from backend.infrastructure.repositories.question_stats_repository import SqliteQuestionStatsRepository
+from backend.infrastructure.adapters.audio_metadata import AudioMetadata
+from backend.infrastructure.adapters.import_job_runner import ImportJobRunner
+from backend.infrastructure.adapters.streaming_exporter import StreamingExporter
+from backend.infrastructure.adapters.tts_cache import TTSCacheManager
 from backend.infrastructure.config.database import get_database
 from backend.presentation.controllers.auth import get_admin_user
 
@@ -96,6 +105,16 @@ def get_vocabulary_repository() -> SqliteVocabularyRepository:
     db = get_database()
     return SqliteVocabularyRepository(db)
 
+def get_user_vocabulary_repository() -> SqliteUserVocabularyRepository:
+    """사용자별 단어 학습 상태 리포지토리 의존성 주입"""
+    db = get_database()
+    return SqliteUserVocabularyRepository(db)
+
+def get_question_stats_repository() -> SqliteQuestionStatsRepository:
+    """문항 분석 통계 리포지토리 의존성 주입"""
+    db = get_database()
+    return SqliteQuestionStatsRepository(db)
+
 # ========== 어드민 사용자 관리 API ==========
 
 @router.get("/users")
@@ -260,7 +279,10 @@ async def create_admin_question(
         audio_url=None
     )
     
-    saved_question = repo.save(question)
+    try:
+        saved_question = repo.save(question)
+    except DuplicateContentError as e:
+        raise HTTPException(status_code=409, detail=f"{e} (ID: {e.existing_id})")
     
     # 리스닝 문제인 경우 자동으로 TTS 생성
     audio_url = None
@@ -272,7 +294,7 @@ async def create_admin_question(
                 slow=False
             )
             
-            # audio_url 업데이트
+            # audio_url과 오디오 메타데이터(크기, 재생 시간, ETag) 업데이트
             updated_question = Question(
                 id=saved_question.id,
                 level=saved_question.level,
@@ -281,9 +303,9 @@ async def create_admin_question(
                 choices=saved_question.choices,
                 correct_answer=saved_question.correct_answer,
                 explanation=saved_question.explanation,
-                difficulty=saved_question.difficulty,
-                audio_url=audio_url
+                difficulty=saved_question.difficulty
             )
+            updated_question.attach_audio(audio_url, **AudioMetadata.fields_for_url(audio_url))
             saved_question = repo.save(updated_question)
         except Exception as e:
             # TTS 생성 실패해도 문제 생성은 성공 (오디오는 나중에 수동 생성 가능)
@@ -392,7 +414,10 @@ async def update_admin_question(
             correct_answer=question.correct_answer,
             explanation=question.explanation,
             difficulty=question.difficulty,
-            audio_url=question.audio_url
+            audio_url=question.audio_url,
+            audio_size_bytes=question.audio_size_bytes,
+            audio_duration_ms=question.audio_duration_ms,
+            audio_etag=question.audio_etag
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -414,7 +439,7 @@ async def update_admin_question(
                 language='ja',
                 slow=False
             )
-            updated_question.audio_url = audio_url
+            updated_question.attach_audio(audio_url, **AudioMetadata.fields_for_url(audio_url))
         except Exception as e:
             # TTS 생성 실패해도 문제 수정은 성공
             logger.warning(f"TTS 생성 실패 (문제 ID: {question_id}): {str(e)}")
@@ -532,9 +557,9 @@ async def upload_question_audio(
         choices=question.choices,
         correct_answer=question.correct_answer,
         explanation=question.explanation,
-        difficulty=question.difficulty,
-        audio_url=audio_url
+        difficulty=question.difficulty
     )
+    updated_question.attach_audio(audio_url, **AudioMetadata.from_bytes(file_content).to_dict())
     
     saved_question = repo.save(updated_question)
     
@@ -608,6 +633,84 @@ async def get_admin_statistics(admin_user: User = Depends(get_admin_user)):
         "message": "통계 조회 성공"
     }
 
+@router.get("/statistics/review-forecast")
+async def get_admin_review_forecast(
+    days: int = Query(30, ge=1, le=365, description="예측 기간 (일)"),
+    admin_user: User = Depends(get_admin_user)
+):
+    """어드민 전체 사용자 복습량 예측 조회 (용량 계획용)"""
+    from backend.domain.services.review_forecast_service import ReviewForecastService
+    
+    service = ReviewForecastService(get_user_vocabulary_repository())
+    
+    return {
+        "success": True,
+        "data": service.forecast(days=days),
+        "message": "복습량 예측 조회 성공"
+    }
+
+@router.get("/statistics/items")
+async def get_admin_item_statistics(
+    level: Optional[JLPTLevel] = Query(None, description="JLPT 레벨 필터"),
+    question_type: Optional[QuestionType] = Query(None, description="문제 유형 필터"),
+    min_responses: int = Query(0, ge=0, description="최소 응답 수"),
+    sort: str = Query("discrimination", description="정렬 기준 (discrimination, p_value, responses, question_id)"),
+    limit: int = Query(100, ge=1, le=1000, description="최대 개수"),
+    offset: int = Query(0, ge=0, description="건너뛸 개수"),
+    admin_user: User = Depends(get_admin_user)
+):
+    """어드민 문항 분석 통계 조회 (배치로 미리 계산된 값)"""
+    question_stats_repo = get_question_stats_repository()
+    
+    try:
+        items = question_stats_repo.find_all(
+            level=level.value if level else None,
+            question_type=question_type.value if question_type else None,
+            min_responses=min_responses,
+            sort=sort,
+            limit=limit,
+            offset=offset
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "success": True,
+        "data": items,
+        "message": "문항 분석 통계 조회 성공"
+    }
+
+@router.post("/statistics/items/refresh")
+async def refresh_admin_item_statistics(
+    full: bool = Query(False, description="전체 답안으로 다시 계산 (기본: 새 답안이 생긴 문제만)"),
+    admin_user: User = Depends(get_admin_user)
+):
+    """어드민 문항 분석 통계 갱신"""
+    from backend.domain.services.item_analysis_service import ItemAnalysisService
+    
+    service = ItemAnalysisService(get_question_stats_repository())
+    
+    return {
+        "success": True,
+        "data": service.refresh(full=full),
+        "message": "문항 분석 통계 갱신 완료"
+    }
+
+@router.get("/questions/{question_id}/stats")
+async def get_admin_question_stats(question_id: int, admin_user: User = Depends(get_admin_user)):
+    """어드민 문제별 문항 분석 통계 조회"""
+    question_stats_repo = get_question_stats_repository()
+    
+    stats = question_stats_repo.find_by_question_id(question_id)
+    if stats is None:
+        raise HTTPException(status_code=404, detail="문항 분석 통계를 찾을 수 없습니다")
+    
+    return {
+        "success": True,
+        "data": stats,
+        "message": "문항 분석 통계 조회 성공"
+    }
+
 # ========== 어드민 단어 관리 API ==========
 
 class VocabularyResponse(BaseModel):
@@ -712,7 +815,10 @@ async def create_admin_vocabulary(
         example_sentence=request.example_sentence
     )
     
-    saved_vocabulary = repo.save(vocabulary)
+    try:
+        saved_vocabulary = repo.save(vocabulary)
+    except DuplicateContentError as e:
+        raise HTTPException(status_code=409, detail=f"{e} (ID: {e.existing_id})")
     
     return {
         "success": True,
@@ -790,14 +896,18 @@ async def delete_admin_vocabulary(
 
 # ========== 어드민 문제/단어 생성 API ==========
 
+# API로 한 번에 생성할 수 있는 최대 건수 (더 많은 데이터는 scripts/generate_questions.py 사용)
+MAX_GENERATE_COUNT = 10000
+
 class QuestionGenerateRequest(BaseModel):
     level: JLPTLevel
     question_type: Optional[QuestionType] = None
-    count: int = 10
+    count: int = Field(10, ge=1, le=MAX_GENERATE_COUNT)
+    difficulty: Optional[int] = Field(None, ge=1, le=5)
 
 class VocabularyGenerateRequest(BaseModel):
     level: JLPTLevel
-    count: int = 10
+    count: int = Field(10, ge=1, le=MAX_GENERATE_COUNT)
 
 class QuestionImportRequest(BaseModel):
     questions: List[Dict]
@@ -808,30 +918,42 @@ class VocabularyImportRequest(BaseModel):
 @router.post("/questions/generate")
 async def generate_questions(
     request: QuestionGenerateRequest,
+    background_tasks: BackgroundTasks,
     admin_user: User = Depends(get_admin_user)
 ):
-    """어드민 문제 대량 생성"""
-    from backend.domain.services.question_generator_service import QuestionGeneratorService
+    """어드민 문제 대량 생성 (청크 단위 생성 및 일괄 업서트, 청해 오디오는 백그라운드 렌더링)"""
+    from backend.domain.services.audio_prerender_service import AudioPrerenderService
+    from backend.domain.services.bulk_generation_service import BulkQuestionGenerationService
     
     repo = get_question_repository()
+    service = BulkQuestionGenerationService(repo, with_audio=False)
     
-    # 문제 생성
-    questions = QuestionGeneratorService.generate_questions(
+    # 청크마다 저장된 문제 수집 (같은 내용의 문제는 ID 기준으로 한 번만)
+    saved_questions: Dict[int, Question] = {}
+    
+    def collect(chunk: Dict, summary: Dict) -> None:
+        for question in chunk['questions']:
+            saved_questions.setdefault(question.id, question)
+    
+    summary = service.generate(
         level=request.level,
         question_type=request.question_type,
-        count=request.count
+        count=request.count,
+        on_chunk=collect,
+        difficulty=request.difficulty
     )
     
-    # 데이터베이스에 저장
-    saved_questions = []
-    for question in questions:
-        saved_question = repo.save(question)
-        saved_questions.append(saved_question)
+    # 청해 문제 오디오는 응답 후 렌더링 풀로 병렬 생성
+    if any(q.question_type == QuestionType.LISTENING and not q.audio_url for q in saved_questions.values()):
+        background_tasks.add_task(AudioPrerenderService(repo).run, request.level)
     
     return {
         "success": True,
         "data": {
-            "count": len(saved_questions),
+            "count": summary['imported'],
+            "duplicates": summary['duplicates'],
+            "by_type": summary['by_type'],
+            "exhausted": summary['exhausted'],
             "questions": [
                 QuestionResponse(
                     id=q.id,
@@ -844,10 +966,10 @@ async def generate_questions(
                     difficulty=q.difficulty,
                     audio_url=q.audio_url
                 )
-                for q in saved_questions
+                for q in saved_questions.values()
             ]
         },
-        "message": f"{len(saved_questions)}개의 문제가 생성되었습니다"
+        "message": f"{summary['imported']}개의 문제가 생성되었습니다"
     }
 
 @router.post("/questions/import")
@@ -856,144 +978,48 @@ async def import_questions(
     admin_user: User = Depends(get_admin_user)
 ):
     """어드민 기출문제 임포트 (JSON 형식)"""
-    from backend.domain.services.question_generator_service import QuestionGeneratorService
-    
-    repo = get_question_repository()
-    
-    # 문제 임포트
-    questions = QuestionGeneratorService.import_from_list(request.questions)
-    
-    # 데이터베이스에 저장
-    saved_questions = []
-    for question in questions:
-        try:
-            saved_question = repo.save(question)
-            saved_questions.append(saved_question)
-        except Exception as e:
-            # 개별 문제 저장 실패해도 계속 진행
-            logger.error(f"문제 임포트 실패: {str(e)}", exc_info=True)
-            continue
-    
+    from backend.infrastructure.adapters.streaming_question_importer import StreamingQuestionImporter
+
+    importer = StreamingQuestionImporter(get_question_repository())
+    summary = importer.import_records(request.questions)
+
     return {
         "success": True,
-        "data": {
-            "imported": len(saved_questions),
-            "total": len(questions),
-            "questions": [
-                QuestionResponse(
-                    id=q.id,
-                    level=q.level.value,
-                    question_type=q.question_type.value,
-                    question_text=q.question_text,
-                    choices=q.choices,
-                    correct_answer=q.correct_answer,
-                    explanation=q.explanation,
-                    difficulty=q.difficulty,
-                    audio_url=q.audio_url
-                )
-                for q in saved_questions
-            ]
-        },
-        "message": f"{len(saved_questions)}/{len(questions)}개의 문제가 임포트되었습니다"
+        "data": summary,
+        "message": f"{summary['imported']}/{summary['total']}개의 문제가 임포트되었습니다"
     }
 
-@router.post("/questions/import-file")
+@router.post("/questions/import-file", status_code=202)
 async def import_questions_from_file(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     admin_user: User = Depends(get_admin_user)
 ):
-    """어드민 기출문제 파일 임포트 (JSON/CSV 파일)"""
-    from backend.infrastructure.adapters.jlpt_question_importer import JLPTQuestionImporter
-    import tempfile
-    
-    repo = get_question_repository()
-    
-    # 파일 확장자 확인
-    file_ext = Path(file.filename).suffix.lower()
-    if file_ext not in ['.json', '.csv']:
-        raise HTTPException(
-            status_code=400,
-            detail="지원하지 않는 파일 형식입니다. JSON 또는 CSV 파일만 지원합니다."
-        )
-    
-    # 임시 파일로 저장
-    with tempfile.NamedTemporaryFile(mode='wb', suffix=file_ext, delete=False) as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
-        tmp_file_path = tmp_file.name
-    
-    try:
-        # 파일 형식에 따라 임포트
-        if file_ext == '.json':
-            questions = JLPTQuestionImporter.import_from_json(tmp_file_path)
-        else:
-            questions = JLPTQuestionImporter.import_from_csv(tmp_file_path)
-        
-        # 데이터베이스에 저장
-        saved_questions = []
-        for question in questions:
-            try:
-                saved_question = repo.save(question)
-                saved_questions.append(saved_question)
-            except Exception as e:
-                # 개별 문제 저장 실패해도 계속 진행
-                logger.error(f"문제 임포트 실패: {str(e)}", exc_info=True)
-                continue
-        
-        return {
-            "success": True,
-            "data": {
-                "imported": len(saved_questions),
-                "total": len(questions),
-                "questions": [
-                    QuestionResponse(
-                        id=q.id,
-                        level=q.level.value,
-                        question_type=q.question_type.value,
-                        question_text=q.question_text,
-                        choices=q.choices,
-                        correct_answer=q.correct_answer,
-                        explanation=q.explanation,
-                        difficulty=q.difficulty,
-                        audio_url=q.audio_url
-                    )
-                    for q in saved_questions
-                ]
-            },
-            "message": f"{len(saved_questions)}/{len(questions)}개의 문제가 임포트되었습니다"
-        }
-    finally:
-        # 임시 파일 삭제
-        import os
-        if os.path.exists(tmp_file_path):
-            os.unlink(tmp_file_path)
+    """어드민 기출문제 파일 임포트 (JSON/CSV 파일, 백그라운드 작업으로 배치 단위 저장)"""
+    return _create_import_job(ImportJobType.QUESTIONS, file, admin_user, background_tasks)
 
 @router.post("/vocabulary/generate")
 async def generate_vocabularies(
     request: VocabularyGenerateRequest,
     admin_user: User = Depends(get_admin_user)
 ):
-    """어드민 단어 대량 생성"""
-    from backend.domain.services.vocabulary_generator_service import VocabularyGeneratorService
+    """어드민 단어 대량 생성 (청크 단위 일괄 업서트)"""
+    from backend.domain.services.bulk_generation_service import BulkVocabularyGenerationService
     
-    repo = get_vocabulary_repository()
+    service = BulkVocabularyGenerationService(get_vocabulary_repository())
     
-    # 단어 생성
-    vocabularies = VocabularyGeneratorService.generate_vocabularies(
+    saved_vocabularies: List[Vocabulary] = []
+    summary = service.generate(
         level=request.level,
-        count=request.count
+        count=request.count,
+        on_chunk=lambda chunk, summary: saved_vocabularies.extend(chunk['vocabularies'])
     )
     
-    # 데이터베이스에 저장
-    saved_vocabularies = []
-    for vocabulary in vocabularies:
-        saved_vocabulary = repo.save(vocabulary)
-        saved_vocabularies.append(saved_vocabulary)
-    
     return {
         "success": True,
         "data": {
-            "count": len(saved_vocabularies),
+            "count": summary['imported'],
+            "duplicates": summary['duplicates'],
             "vocabularies": [
                 VocabularyResponse(
                     id=v.id,
@@ -1001,15 +1027,36 @@ async def generate_vocabularies(
                     reading=v.reading,
                     meaning=v.meaning,
                     level=v.level.value,
-                    memorization_status=v.memorization_status.value,
+                    memorization_status="not_memorized",  # Admin에서는 기본값만 표시
                     example_sentence=v.example_sentence
                 )
                 for v in saved_vocabularies
             ]
         },
-        "message": f"{len(saved_vocabularies)}개의 단어가 생성되었습니다"
+        "message": f"{summary['imported']}개의 단어가 생성되었습니다"
     }
 
+# 단어 임포트 시 트랜잭션당 업서트 건수
+VOCABULARY_IMPORT_CHUNK_SIZE = 1000
+
+def _upsert_vocabularies(
+    repo: SqliteVocabularyRepository,
+    vocabularies: List[Vocabulary]
+) -> Tuple[List[Vocabulary], int]:
+    """단어를 청크 단위로 업서트하고 (저장된 단어 목록, 새로 삽입된 단어 수) 반환"""
+    saved_vocabularies: List[Vocabulary] = []
+    inserted = 0
+    for start in range(0, len(vocabularies), VOCABULARY_IMPORT_CHUNK_SIZE):
+        chunk = vocabularies[start:start + VOCABULARY_IMPORT_CHUNK_SIZE]
+        try:
+            inserted += repo.save_all(chunk)
+            saved_vocabularies.extend(chunk)
+        except Exception as e:
+            # 청크 저장 실패해도 다음 청크 계속 진행
+            logger.error(f"단어 임포트 실패: {str(e)}", exc_info=True)
+            continue
+    return saved_vocabularies, inserted
+
 @router.post("/vocabulary/import")
 async def import_vocabularies(
     request: VocabularyImportRequest,
@@ -1023,21 +1070,14 @@ async def import_vocabularies(
     # 단어 임포트
     vocabularies = VocabularyGeneratorService.import_from_list(request.vocabularies)
     
-    # 데이터베이스에 저장
-    saved_vocabularies = []
-    for vocabulary in vocabularies:
-        try:
-            saved_vocabulary = repo.save(vocabulary)
-            saved_vocabularies.append(saved_vocabulary)
-        except Exception as e:
-            # 개별 단어 저장 실패해도 계속 진행
-            logger.error(f"단어 임포트 실패: {str(e)}", exc_info=True)
-            continue
+    # 데이터베이스에 저장 (동일 단어는 중복 생성하지 않고 갱신)
+    saved_vocabularies, inserted = _upsert_vocabularies(repo, vocabularies)
     
     return {
         "success": True,
         "data": {
-            "imported": len(saved_vocabularies),
+            "imported": inserted,
+            "duplicates": len(saved_vocabularies) - inserted,
             "total": len(vocabularies),
             "vocabularies": [
                 VocabularyResponse(
@@ -1046,81 +1086,188 @@ async def import_vocabularies(
                     reading=v.reading,
                     meaning=v.meaning,
                     level=v.level.value,
-                    memorization_status=v.memorization_status.value,
+                    memorization_status="not_memorized",  # Admin에서는 기본값만 표시
                     example_sentence=v.example_sentence
                 )
                 for v in saved_vocabularies
             ]
         },
-        "message": f"{len(saved_vocabularies)}/{len(vocabularies)}개의 단어가 임포트되었습니다"
+        "message": f"{inserted}/{len(vocabularies)}개의 단어가 임포트되었습니다"
     }
 
-@router.post("/vocabulary/import-file")
+@router.post("/vocabulary/import-file", status_code=202)
 async def import_vocabularies_from_file(
+    background_tasks: BackgroundTasks,
     file: UploadFile = File(...),
     admin_user: User = Depends(get_admin_user)
 ):
-    """어드민 기출단어 파일 임포트 (JSON/CSV 파일)"""
-    from backend.infrastructure.adapters.jlpt_question_importer import JLPTQuestionImporter
-    import tempfile
-    
-    repo = get_vocabulary_repository()
-    
-    # 파일 확장자 확인
-    file_ext = Path(file.filename).suffix.lower()
-    if file_ext not in ['.json', '.csv']:
+    """어드민 기출단어 파일 임포트 (JSON/CSV 파일, 백그라운드 작업으로 배치 단위 저장)"""
+    return _create_import_job(ImportJobType.VOCABULARY, file, admin_user, background_tasks)
+
+# ========== 어드민 임포트 작업 API ==========
+
+class ImportJobResponse(BaseModel):
+    id: int
+    job_type: str
+    status: str
+    original_filename: Optional[str] = None
+    rows_processed: int
+    rows_imported: int
+    rows_duplicates: int
+    rows_rejected: int
+    throughput: float
+    elapsed_seconds: float
+    attempts: int
+    errors: List[Dict]
+    error_message: Optional[str] = None
+    created_at: str
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+
+def get_import_job_runner() -> ImportJobRunner:
+    """임포트 작업 실행기 의존성 주입"""
+    db = get_database()
+    return ImportJobRunner(db)
+
+def _to_import_job_response(job: ImportJob) -> ImportJobResponse:
+    """ImportJob을 응답 모델로 변환"""
+    return ImportJobResponse(
+        id=job.id,
+        job_type=job.job_type.value,
+        status=job.status.value,
+        original_filename=job.original_filename,
+        rows_processed=job.rows_processed,
+        rows_imported=job.rows_imported,
+        rows_duplicates=job.rows_duplicates,
+        rows_rejected=job.rows_rejected,
+        throughput=job.throughput,
+        elapsed_seconds=job.elapsed_seconds,
+        attempts=job.attempts,
+        errors=job.errors,
+        error_message=job.error_message,
+        created_at=job.created_at.isoformat(),
+        started_at=job.started_at.isoformat() if job.started_at else None,
+        finished_at=job.finished_at.isoformat() if job.finished_at else None
+    )
+
+def _create_import_job(
+    job_type: ImportJobType,
+    file: UploadFile,
+    admin_user: User,
+    background_tasks: BackgroundTasks
+) -> Dict:
+    """업로드 파일을 보관하고 임포트 작업을 등록한 뒤 백그라운드 실행 예약"""
+    runner = get_import_job_runner()
+    try:
+        job = runner.create_job(job_type, file.file, file.filename or "", created_by=admin_user.id)
+    except ValueError:
         raise HTTPException(
             status_code=400,
             detail="지원하지 않는 파일 형식입니다. JSON 또는 CSV 파일만 지원합니다."
         )
-    
-    # 임시 파일로 저장
-    with tempfile.NamedTemporaryFile(mode='wb', suffix=file_ext, delete=False) as tmp_file:
-        content = await file.read()
-        tmp_file.write(content)
-        tmp_file_path = tmp_file.name
-    
+
+    background_tasks.add_task(runner.run, job.id)
+
+    return {
+        "success": True,
+        "data": _to_import_job_response(job),
+        "message": f"임포트 작업이 등록되었습니다 (작업 ID: {job.id})"
+    }
+
+@router.get("/jobs")
+async def get_admin_import_jobs(
+    limit: int = Query(50, ge=1, le=200),
+    admin_user: User = Depends(get_admin_user)
+):
+    """어드민 임포트 작업 목록 조회 (최근 순)"""
+    runner = get_import_job_runner()
+    jobs = runner.job_repo.find_recent(limit=limit)
+
+    return {
+        "success": True,
+        "data": [_to_import_job_response(job) for job in jobs],
+        "message": "임포트 작업 목록을 조회했습니다"
+    }
+
+@router.get("/jobs/{job_id}")
+async def get_admin_import_job(
+    job_id: int,
+    admin_user: User = Depends(get_admin_user)
+):
+    """어드민 임포트 작업 진행 상황 조회"""
+    runner = get_import_job_runner()
+    job = runner.job_repo.find_by_id(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="임포트 작업을 찾을 수 없습니다")
+
+    return {
+        "success": True,
+        "data": _to_import_job_response(job),
+        "message": "임포트 작업을 조회했습니다"
+    }
+
+# ========== 어드민 데이터 내보내기 API ==========
+
+@router.get("/export/{table}")
+async def export_admin_data(
+    table: str,
+    format: str = Query("ndjson", description="내보내기 형식 (ndjson, csv)"),
+    gzip: bool = Query(False, description="gzip 압축 여부"),
+    admin_user: User = Depends(get_admin_user)
+):
+    """어드민 데이터 내보내기 (questions, vocabulary, results, answer_details를 NDJSON/CSV로 스트리밍)"""
     try:
-        # 파일 형식에 따라 임포트
-        if file_ext == '.json':
-            vocabularies = JLPTQuestionImporter.import_vocabulary_from_json(tmp_file_path)
-        else:
-            vocabularies = JLPTQuestionImporter.import_vocabulary_from_csv(tmp_file_path)
-        
-        # 데이터베이스에 저장
-        saved_vocabularies = []
-        for vocabulary in vocabularies:
-            try:
-                saved_vocabulary = repo.save(vocabulary)
-                saved_vocabularies.append(saved_vocabulary)
-            except Exception as e:
-                # 개별 단어 저장 실패해도 계속 진행
-                logger.error(f"단어 임포트 실패: {str(e)}", exc_info=True)
-                continue
-        
-        return {
-            "success": True,
-            "data": {
-                "imported": len(saved_vocabularies),
-                "total": len(vocabularies),
-                "vocabularies": [
-                    VocabularyResponse(
-                        id=v.id,
-                        word=v.word,
-                        reading=v.reading,
-                        meaning=v.meaning,
-                        level=v.level.value,
-                        memorization_status=v.memorization_status.value,
-                        example_sentence=v.example_sentence
-                    )
-                    for v in saved_vocabularies
-                ]
-            },
-            "message": f"{len(saved_vocabularies)}/{len(vocabularies)}개의 단어가 임포트되었습니다"
-        }
-    finally:
-        # 임시 파일 삭제
-        import os
-        if os.path.exists(tmp_file_path):
-            os.unlink(tmp_file_path)
+        StreamingExporter.validate(table, format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    exporter = StreamingExporter(get_database())
+    file_name = StreamingExporter.file_name(table, format, compress=gzip)
+    media_type = "application/gzip" if gzip else StreamingExporter.MEDIA_TYPES[format]
 
+    return StreamingResponse(
+        exporter.iter_export(table, format, compress=gzip),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{file_name}"'}
+    )
+
+# ========== 어드민 TTS 캐시 관리 API ==========
+
+def get_tts_cache_manager() -> TTSCacheManager:
+    """TTS 캐시 관리자 의존성 주입 (애플리케이션에서 사용 중인 관리자가 있으면 그대로 사용)"""
+    from backend.domain.services.tts_service import TTSService
+
+    return TTSService.cache or TTSCacheManager(get_database())
+
+@router.get("/tts-cache")
+async def get_admin_tts_cache_stats(
+    admin_user: User = Depends(get_admin_user)
+):
+    """어드민 TTS 캐시 통계 조회 (크기, 참조되지 않는 파일, 적중률)"""
+    cache = get_tts_cache_manager()
+
+    return {
+        "success": True,
+        "data": cache.stats(),
+        "message": "TTS 캐시 통계를 조회했습니다"
+    }
+
+@router.post("/tts-cache/cleanup")
+async def cleanup_admin_tts_cache(
+    max_bytes: Optional[int] = Query(None, ge=0, description="이번 정리에 사용할 예산 (바이트, 생략 시 기본 예산)"),
+    grace_seconds: int = Query(TTSCacheManager.DEFAULT_GRACE_SECONDS, ge=0, description="이보다 최근 파일은 고아로 보지 않음 (초)"),
+    admin_user: User = Depends(get_admin_user)
+):
+    """어드민 TTS 캐시 정리 (고아 파일 정리 후 예산 초과분 LRU 제거)"""
+    cache = get_tts_cache_manager()
+    sweep = cache.sweep_orphans(grace_seconds=grace_seconds)
+    eviction = cache.evict(max_bytes=max_bytes)
+
+    return {
+        "success": True,
+        "data": {"sweep": sweep, "eviction": eviction, "stats": cache.stats()},
+        "message": (
+            f"TTS 캐시를 정리했습니다 (고아 파일 {sweep['removed_files']}개, "
+            f"LRU 제거 {eviction['evicted']}개)"
+        )
+    }
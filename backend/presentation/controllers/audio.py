@@ -0,0 +1,117 @@
+"""
+오디오 전달 컨트롤러
+/static/audio 아래 오디오를 강한 ETag, 장기 캐시 헤더, HTTP Range(206)와 함께 서빙
+"""
+
+import os
+import re
+import stat
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse, Response
+from backend.infrastructure.adapters.audio_metadata import STATIC_DIR, AudioMetadata, resolve_static_path
+
+router = APIRouter()
+
+# 텍스트/언어/속도 해시로 이름을 짓는 TTS 파일 (tts_{md5}.mp3)은 이름이 같으면 같은 오디오이므로
+# 1년 동안 재검증 없이 캐시
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# 업로드 파일 등은 캐시하되 매번 ETag로 재검증
+REVALIDATE_CACHE_CONTROL = "public, no-cache"
+_HASHED_FILENAME = re.compile(r"^tts_[0-9a-f]{32}\.mp3$")
+
+
+class AudioETagCache:
+    """
+    파일별 콘텐츠 해시 ETag 캐시
+
+    (경로, 수정 시각, 크기)가 같으면 파일을 다시 읽지 않습니다. 문제에 저장된 audio_etag와
+    같은 SHA-256이므로 클라이언트가 문제 응답의 ETag로 재검증할 수 있습니다.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Path, Tuple[int, int, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, path: Path, stat_result: os.stat_result) -> Optional[str]:
+        """파일의 ETag (파일이 없어졌으면 None)"""
+        key = (stat_result.st_mtime_ns, stat_result.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[:2] == key:
+                self._entries.move_to_end(path)
+                return entry[2]
+
+        metadata = AudioMetadata.from_file(path)
+        if metadata is None:
+            return None
+        with self._lock:
+            self._entries[path] = (*key, metadata.etag)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return metadata.etag
+
+
+audio_etags = AudioETagCache()
+
+
+def get_static_dir() -> Path:
+    """정적 파일 루트 디렉토리 (테스트에서 교체)"""
+    return STATIC_DIR
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 (약한 비교, * 허용)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate.strip('"') == etag:
+            return True
+    return False
+
+
+@router.api_route("/static/audio/{file_path:path}", methods=["GET", "HEAD"], include_in_schema=False)
+async def serve_audio(file_path: str, request: Request):
+    """
+    오디오 파일 서빙
+
+    - ETag: 콘텐츠 SHA-256 (강한 ETag), If-None-Match가 일치하면 304
+    - Cache-Control: 해시 파일명(tts_*.mp3)은 immutable, 그 외는 no-cache(재검증)
+    - Range: 단일/다중 범위 요청에 206, 범위를 벗어나면 416 (If-Range 지원)
+    """
+    static_dir = get_static_dir()
+    path = resolve_static_path(f"/static/audio/{file_path}", static_dir)
+    if path is None or (static_dir / "audio").resolve() not in path.parents:
+        raise HTTPException(status_code=404, detail="오디오 파일을 찾을 수 없습니다")
+    try:
+        stat_result = await run_in_threadpool(os.stat, path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise HTTPException(status_code=404, detail="오디오 파일을 찾을 수 없습니다")
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status_code=404, detail="오디오 파일을 찾을 수 없습니다")
+
+    etag = await run_in_threadpool(audio_etags.get, path, stat_result)
+    if etag is None:
+        raise HTTPException(status_code=404, detail="오디오 파일을 찾을 수 없습니다")
+
+    headers = {
+        "ETag": f'"{etag}"',
+        "Cache-Control": (
+            IMMUTABLE_CACHE_CONTROL if _HASHED_FILENAME.match(path.name) else REVALIDATE_CACHE_CONTROL
+        ),
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(path, headers=headers, stat_result=stat_result)
@@ -28,6 +28,9 @@ class QuestionResponse(BaseModel):
     choices: List[str]
     difficulty: int
     audio_url: Optional[str] = None
+    audio_size_bytes: Optional[int] = None  # 오디오 메타데이터 (문제에 저장된 값, 파일 시스템을 조회하지 않음)
+    audio_duration_ms: Optional[int] = None
+    audio_etag: Optional[str] = None
     correct_answer: str  # 학습 모드에서는 정답 표시 필요
     explanation: str  # 학습 모드에서는 해설 표시 필요
 
@@ -106,6 +109,9 @@ async def get_study_questions(
             choices=q.choices,
             difficulty=q.difficulty,
             audio_url=q.audio_url,
+            audio_size_bytes=q.audio_size_bytes,
+            audio_duration_ms=q.audio_duration_ms,
+            audio_etag=q.audio_etag,
             correct_answer=q.correct_answer,
             explanation=q.explanation
         )
@@ -228,6 +234,9 @@ async def get_wrong_answer_questions(
             choices=q.choices,
             difficulty=q.difficulty,
             audio_url=q.audio_url,
+            audio_size_bytes=q.audio_size_bytes,
+            audio_duration_ms=q.audio_duration_ms,
+            audio_etag=q.audio_etag,
             correct_answer=q.correct_answer,
             explanation=q.explanation
         )
@@ -293,6 +302,9 @@ async def get_wrong_answer_questions_for_study(
             choices=q.choices,
             difficulty=q.difficulty,
             audio_url=q.audio_url,
+            audio_size_bytes=q.audio_size_bytes,
+            audio_duration_ms=q.audio_duration_ms,
+            audio_etag=q.audio_etag,
             correct_answer=q.correct_answer,
             explanation=q.explanation
         )
@@ -340,12 +352,8 @@ async def get_study_session_questions(
             detail="이 학습 세션에는 저장된 문제가 없습니다."
         )
     
-    # 문제 조회
-    questions = []
-    for question_id in study_session.question_ids:
-        question = question_repo.find_by_id(question_id)
-        if question:
-            questions.append(question)
+    # 문제 조회 (세션 순서 유지)
+    questions = question_repo.find_by_ids(study_session.question_ids)
     
     if not questions:
         raise HTTPException(
@@ -362,6 +370,9 @@ async def get_study_session_questions(
             choices=q.choices,
             difficulty=q.difficulty,
             audio_url=q.audio_url,
+            audio_size_bytes=q.audio_size_bytes,
+            audio_duration_ms=q.audio_duration_ms,
+            audio_etag=q.audio_etag,
             correct_answer=q.correct_answer,
             explanation=q.explanation
         )
@@ -13,6 +13,13 @@ from backend.domain.entities.user import User
 from backend.domain.value_objects.jlpt import JLPTLevel, TestStatus, QuestionType
 from backend.infrastructure.repositories.test_repository import SqliteTestRepository
 from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+from backend.infrastructure.repositories.irt_parameter_repository import SqliteIrtParameterRepository
+from backend.infrastructure.repositories.adaptive_test_repository import (
+    SqliteAdaptiveTestRepository,
+    StaleAdaptiveSessionError,
+)
+from backend.domain.services.adaptive_test_service import AdaptiveTestService
+from backend.domain.services.test_assembly_service import TestAssemblyService, TestBlueprint
 from backend.infrastructure.config.database import get_database
 from backend.presentation.controllers.auth import get_current_user
 
@@ -26,6 +33,8 @@ class TestCreateRequest(BaseModel):
     time_limit_minutes: int = 60
     question_types: Optional[List[QuestionType]] = None  # None이면 모든 유형, 지정하면 해당 유형만
     question_type_counts: Optional[Dict[str, int]] = None  # 유형별 문제 수 지정 (예: {"vocabulary": 10, "grammar": 5})
+    difficulty_distribution: Optional[Dict[int, float]] = None  # 난이도별 비율 (예: {1: 0.2, 2: 0.3, 3: 0.5})
+    max_exposure_rate: Optional[float] = Field(default=None, gt=0, le=1)  # 문제별 최대 노출률 (출제 시험 수 / 레벨 시험 수)
 
 class TestStartRequest(BaseModel):
     pass  # user_id는 세션에서 가져옴
@@ -33,6 +42,19 @@ class TestStartRequest(BaseModel):
 class TestSubmitRequest(BaseModel):
     answers: Dict[int, str]  # question_id -> answer
 
+class AdaptiveTestStartRequest(BaseModel):
+    level: JLPTLevel
+    max_questions: int = Field(
+        default=AdaptiveTestService.DEFAULT_MAX_QUESTIONS,
+        ge=AdaptiveTestService.MIN_QUESTIONS,
+        le=AdaptiveTestService.MAX_QUESTIONS
+    )
+    target_se: float = Field(default=AdaptiveTestService.DEFAULT_TARGET_SE, gt=0, le=1.0)  # 종료 기준 표준오차
+
+class AdaptiveAnswerRequest(BaseModel):
+    question_id: int
+    answer: str
+
 class QuestionResponse(BaseModel):
     id: int
     level: str
@@ -40,6 +62,10 @@ class QuestionResponse(BaseModel):
     question_text: str
     choices: List[str]
     difficulty: int
+    audio_url: Optional[str] = None
+    audio_size_bytes: Optional[int] = None  # 오디오 메타데이터 (문제에 저장된 값, 파일 시스템을 조회하지 않음)
+    audio_duration_ms: Optional[int] = None
+    audio_etag: Optional[str] = None
 
 class TestResponse(BaseModel):
     id: int
@@ -70,6 +96,16 @@ def get_question_repository() -> SqliteQuestionRepository:
     db = get_database()
     return SqliteQuestionRepository(db)
 
+def get_test_assembly_service() -> TestAssemblyService:
+    """시험 조립 서비스 의존성 주입"""
+    db = get_database()
+    return TestAssemblyService(SqliteQuestionRepository(db), SqliteTestRepository(db))
+
+def get_adaptive_test_service() -> AdaptiveTestService:
+    """적응형 시험 서비스 의존성 주입"""
+    db = get_database()
+    return AdaptiveTestService(SqliteIrtParameterRepository(db), SqliteAdaptiveTestRepository(db))
+
 @router.get("/", response_model=List[TestListResponse])
 async def get_tests(level: Optional[JLPTLevel] = None):
     """시험 목록 조회"""
@@ -114,7 +150,11 @@ async def get_test(test_id: int):
                 question_type=q.question_type.value,
                 question_text=q.question_text,
                 choices=q.choices,
-                difficulty=q.difficulty
+                difficulty=q.difficulty,
+                audio_url=q.audio_url,
+                audio_size_bytes=q.audio_size_bytes,
+                audio_duration_ms=q.audio_duration_ms,
+                audio_etag=q.audio_etag
             )
             for q in test.questions
         ],
@@ -168,7 +208,11 @@ async def create_n5_diagnostic_test():
                 question_type=q.question_type.value,
                 question_text=q.question_text,
                 choices=q.choices,
-                difficulty=q.difficulty
+                difficulty=q.difficulty,
+                audio_url=q.audio_url,
+                audio_size_bytes=q.audio_size_bytes,
+                audio_duration_ms=q.audio_duration_ms,
+                audio_etag=q.audio_etag
             )
             for q in saved_test.questions
         ],
@@ -182,26 +226,37 @@ async def create_test(request: TestCreateRequest):
     question_repo = get_question_repository()
     test_repo = get_test_repository()
 
-    # 유형별 문제 수가 지정된 경우
-    if request.question_type_counts:
-        # 문자열 키를 QuestionType enum으로 변환
-        type_counts = {}
-        for type_str, count in request.question_type_counts.items():
-            try:
-                question_type = QuestionType(type_str)
-                type_counts[question_type] = count
-            except ValueError:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"잘못된 문제 유형: {type_str}. 유효한 유형: {[qt.value for qt in QuestionType]}"
-                )
-        
+    # 유형별 문제 수, 난이도 분포, 최대 노출률 중 하나라도 지정된 경우 출제 계획으로 조립
+    if (
+        request.question_type_counts
+        or request.difficulty_distribution
+        or request.max_exposure_rate is not None
+    ):
+        type_counts = None
+        if request.question_type_counts:
+            # 문자열 키를 QuestionType enum으로 변환
+            type_counts = {}
+            for type_str, count in request.question_type_counts.items():
+                try:
+                    question_type = QuestionType(type_str)
+                    type_counts[question_type] = count
+                except ValueError:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"잘못된 문제 유형: {type_str}. 유효한 유형: {[qt.value for qt in QuestionType]}"
+                    )
+
         try:
-            questions = question_repo.find_random_by_level_and_type_counts(
-                request.level, type_counts
+            blueprint = TestBlueprint(
+                type_counts=type_counts,
+                question_count=request.question_count,
+                question_types=request.question_types,
+                difficulty_distribution=request.difficulty_distribution,
+                max_exposure_rate=request.max_exposure_rate
             )
+            questions = get_test_assembly_service().assemble(request.level, blueprint)
         except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
+            raise HTTPException(status_code=400, detail=f"레벨 {request.level.value}: {e}")
     # 유형 필터링이 지정된 경우 해당 유형들만 조회
     elif request.question_types:
         questions = question_repo.find_random_by_level_and_types(
@@ -246,7 +301,11 @@ async def create_test(request: TestCreateRequest):
                 question_type=q.question_type.value,
                 question_text=q.question_text,
                 choices=q.choices,
-                difficulty=q.difficulty
+                difficulty=q.difficulty,
+                audio_url=q.audio_url,
+                audio_size_bytes=q.audio_size_bytes,
+                audio_duration_ms=q.audio_duration_ms,
+                audio_etag=q.audio_etag
             )
             for q in saved_test.questions
         ],
@@ -254,6 +313,136 @@ async def create_test(request: TestCreateRequest):
         completed_at=saved_test.completed_at
     )
 
+def _adaptive_session_data(session: dict, question_repo: SqliteQuestionRepository) -> dict:
+    """적응형 시험 세션 응답 데이터 (진행 중이면 현재 문제, 완료되면 결과 포함)"""
+    question = None
+    if session["current_question_id"] is not None:
+        q = question_repo.find_by_id(session["current_question_id"])
+        if q:
+            question = QuestionResponse(
+                id=q.id,
+                level=q.level.value,
+                question_type=q.question_type.value,
+                question_text=q.question_text,
+                choices=q.choices,
+                difficulty=q.difficulty,
+                audio_url=q.audio_url,
+                audio_size_bytes=q.audio_size_bytes,
+                audio_duration_ms=q.audio_duration_ms,
+                audio_etag=q.audio_etag
+            ).model_dump()
+
+    result = None
+    if session["status"] == "completed":
+        result = {
+            "theta": session["theta"],
+            "theta_se": session["theta_se"],
+            "estimated_score": session["estimated_score"],
+            "recommended_level": session["recommended_level"],
+            "completed_at": session["completed_at"]
+        }
+
+    return {
+        "session_id": session["id"],
+        "level": session["level"],
+        "status": session["status"],
+        "theta": session["theta"],
+        "theta_se": session["theta_se"],
+        "questions_answered": len(session["responses"]),
+        "correct_count": sum(1 for r in session["responses"] if r["correct"]),
+        "max_questions": session["max_questions"],
+        "target_se": session["target_se"],
+        "question": question,
+        "result": result
+    }
+
+def _find_own_adaptive_session(service: AdaptiveTestService, session_id: int, user: User) -> dict:
+    """본인의 적응형 시험 세션 조회 (없으면 404, 다른 사용자의 세션이면 403)"""
+    session = service.adaptive_test_repo.find_by_id(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="적응형 시험을 찾을 수 없습니다")
+    if session["user_id"] != user.id:
+        raise HTTPException(status_code=403, detail="다른 사용자의 적응형 시험에 접근할 수 없습니다")
+    return session
+
+@router.post("/adaptive/start")
+async def start_adaptive_test(
+    request: AdaptiveTestStartRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """적응형 시험 시작
+
+    문제를 미리 뽑지 않고, 응답마다 능력치를 다시 추정해 그 능력치에서 정보량이 가장 큰
+    문제를 다음 문제로 출제합니다. 응답은 첫 문제를 포함합니다.
+    """
+    service = get_adaptive_test_service()
+    try:
+        session = service.start(
+            current_user.id, request.level.value, request.max_questions, request.target_se
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return {
+        "success": True,
+        "data": _adaptive_session_data(session, get_question_repository()),
+        "message": "적응형 시험 시작 성공"
+    }
+
+@router.get("/adaptive/{session_id}/next")
+async def get_adaptive_next_question(
+    session_id: int,
+    current_user: User = Depends(get_current_user)
+):
+    """적응형 시험의 현재 출제 문제 조회 (완료된 세션이면 결과 반환)"""
+    service = get_adaptive_test_service()
+    session = _find_own_adaptive_session(service, session_id, current_user)
+
+    return {
+        "success": True,
+        "data": _adaptive_session_data(session, get_question_repository()),
+        "message": "적응형 시험 문제 조회 성공"
+    }
+
+@router.post("/adaptive/{session_id}/answer")
+async def answer_adaptive_question(
+    session_id: int,
+    request: AdaptiveAnswerRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """적응형 시험 문제 응답
+
+    정답 여부를 채점하고 능력치를 다시 추정한 뒤 다음 문제를 선택합니다.
+    표준오차가 목표 이하가 되거나 최대 문제 수에 도달하면 세션을 완료하고 결과를 반환합니다.
+    """
+    service = get_adaptive_test_service()
+    question_repo = get_question_repository()
+    session = _find_own_adaptive_session(service, session_id, current_user)
+
+    question = question_repo.find_by_id(request.question_id)
+    if not question:
+        raise HTTPException(status_code=404, detail="문제를 찾을 수 없습니다")
+
+    is_correct = question.is_correct_answer(request.answer)
+    try:
+        session = service.answer(session, request.question_id, request.answer, is_correct)
+    except StaleAdaptiveSessionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    data = _adaptive_session_data(session, question_repo)
+    data["answered"] = {
+        "question_id": question.id,
+        "is_correct": is_correct,
+        "correct_answer": question.correct_answer
+    }
+    return {
+        "success": True,
+        "data": data,
+        "message": "적응형 시험 응답 처리 성공"
+    }
+
 @router.post("/{test_id}/start", response_model=TestResponse)
 async def start_test(
     test_id: int,
@@ -293,7 +482,11 @@ async def start_test(
                 question_type=q.question_type.value,
                 question_text=q.question_text,
                 choices=q.choices,
-                difficulty=q.difficulty
+                difficulty=q.difficulty,
+                audio_url=q.audio_url,
+                audio_size_bytes=q.audio_size_bytes,
+                audio_duration_ms=q.audio_duration_ms,
+                audio_etag=q.audio_etag
             )
             for q in saved_test.questions
         ],
@@ -376,6 +569,7 @@ async def submit_test(
         from backend.infrastructure.repositories.answer_detail_repository import SqliteAnswerDetailRepository
         from backend.infrastructure.repositories.learning_history_repository import SqliteLearningHistoryRepository
         from backend.infrastructure.repositories.user_performance_repository import SqliteUserPerformanceRepository
+        from backend.infrastructure.repositories.level_score_repository import SqliteLevelScoreRepository
         from backend.domain.entities.answer_detail import AnswerDetail
         from backend.domain.entities.learning_history import LearningHistory
         from backend.domain.entities.user_performance import UserPerformance
@@ -472,29 +666,24 @@ async def submit_test(
         # 약점 영역 분석
         weaknesses_data = analysis_service.identify_weaknesses(period_answer_details, accuracy_threshold=60.0)
 
-        # 레벨별 성취도 추이 업데이트
-        if current_performance.level_progression is None:
-            current_performance.level_progression = {}
-        
+        # 레벨별 점수 추이: 점수 이력은 level_scores에 추가하고 성능 데이터에는 레벨별 요약만 유지
+        # (요약으로 바뀐 예전 형식의 점수 목록도 성능 데이터와 같은 트랜잭션에서 level_scores로 옮김)
         level_key = test.level.value
-        if level_key not in current_performance.level_progression:
-            current_performance.level_progression[level_key] = []
-        current_performance.level_progression[level_key].append({
-            "date": study_date.isoformat(),
-            "score": score
-        })
+        legacy = current_performance.record_level_score(level_key, score)
+        level_scores = SqliteLevelScoreRepository.legacy_rows(current_user.id, legacy)
+        level_scores.append((current_user.id, level_key, study_date.isoformat(), score, saved_result.id))
 
         # UserPerformance 저장
         current_performance.update_performance_data(
             type_performance=type_performance,
             difficulty_performance=difficulty_performance,
-            level_progression=current_performance.level_progression,
             repeated_mistakes=repeated_mistakes,
             weaknesses=weaknesses_data
         )
-        user_performance_repo.save(current_performance)
+        user_performance_repo.save(current_performance, level_scores=level_scores)
 
-        # 사용자 통계 업데이트
+        # 사용자 통계 업데이트 (연속 학습 일수는 학습 이력 저장 시 갱신되었으므로 최신 값 반영)
+        user.study_streak = user_repo.find_by_id(user.id).study_streak
         user.total_tests_taken += 1
         user_repo.save(user)
 
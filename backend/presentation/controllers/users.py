@@ -2,7 +2,7 @@
 JLPT 사용자 관리 API 컨트롤러
 """
 
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
 from pydantic import BaseModel
 from typing import Optional
 
@@ -12,9 +12,16 @@ from backend.infrastructure.repositories.user_repository import SqliteUserReposi
 from backend.infrastructure.repositories.user_performance_repository import SqliteUserPerformanceRepository
 from backend.infrastructure.repositories.learning_history_repository import SqliteLearningHistoryRepository
 from backend.infrastructure.repositories.daily_goal_repository import SqliteDailyGoalRepository
+from backend.infrastructure.repositories.user_daily_rollup_repository import SqliteUserDailyRollupRepository
+from backend.infrastructure.repositories.user_streak_repository import SqliteUserStreakRepository
+from backend.infrastructure.repositories.study_session_repository import SqliteStudySessionRepository
+from backend.infrastructure.repositories.level_score_repository import SqliteLevelScoreRepository
 from backend.infrastructure.config.database import get_database
 from backend.presentation.controllers.auth import get_current_user
 from backend.domain.services.daily_statistics_service import DailyStatisticsService
+from backend.domain.services.study_streak_service import StudyStreakService
+from backend.domain.services.history_analytics_service import HistoryAnalyticsService
+from backend.domain.services.level_progression_service import LevelProgressionService
 from backend.domain.entities.daily_goal import DailyGoal
 from datetime import date
 
@@ -69,6 +76,26 @@ def get_daily_goal_repository() -> SqliteDailyGoalRepository:
     db = get_database()
     return SqliteDailyGoalRepository(db)
 
+def get_user_daily_rollup_repository() -> SqliteUserDailyRollupRepository:
+    """사용자 일별 학습 롤업 리포지토리 의존성 주입"""
+    db = get_database()
+    return SqliteUserDailyRollupRepository(db)
+
+def get_user_streak_repository() -> SqliteUserStreakRepository:
+    """사용자 연속 학습 일수 리포지토리 의존성 주입"""
+    db = get_database()
+    return SqliteUserStreakRepository(db)
+
+def get_study_session_repository() -> SqliteStudySessionRepository:
+    """학습 세션 리포지토리 의존성 주입"""
+    db = get_database()
+    return SqliteStudySessionRepository(db)
+
+def get_level_score_repository() -> SqliteLevelScoreRepository:
+    """레벨별 점수 이력 리포지토리 의존성 주입"""
+    db = get_database()
+    return SqliteLevelScoreRepository(db)
+
 @router.get("/")
 async def get_users():
     """사용자 목록 조회"""
@@ -343,6 +370,103 @@ async def get_user_history(user_id: int):
         for history in histories
     ]
 
+@router.get("/{user_id}/history/summary")
+async def get_user_history_summary(
+    user_id: int,
+    start_date: Optional[date] = Query(None, description="시작일 (생략 시 종료일 기준 365일 전부터)"),
+    end_date: Optional[date] = Query(None, description="종료일 (생략 시 오늘)"),
+    granularity: str = Query("day", description="기간 단위 (day, week, month)"),
+    max_buckets: int = Query(
+        HistoryAnalyticsService.DEFAULT_MAX_BUCKETS, ge=1, le=HistoryAnalyticsService.MAX_BUCKETS,
+        description="최대 기간 수 (넘으면 더 큰 단위로 다운샘플링)"
+    ),
+    current_user: User = Depends(get_current_user)
+):
+    """사용자 학습 이력 요약 조회
+    
+    기간 단위(일/주/월)별 합계와 학습 시간대별 합계를 서버에서 집계해 반환합니다.
+    응답 크기는 학습 횟수가 아니라 기간 수와 24개 시간대로 제한됩니다.
+    """
+    # 권한 확인: 자신의 이력만 조회 가능
+    if current_user.id != user_id:
+        raise HTTPException(status_code=403, detail="다른 사용자의 학습 이력을 조회할 수 없습니다")
+    
+    user_repo = get_user_repository()
+    
+    # 사용자 존재 확인
+    user = user_repo.find_by_id(user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+    
+    analytics_service = HistoryAnalyticsService(
+        get_user_daily_rollup_repository(),
+        get_learning_history_repository(),
+        get_study_session_repository()
+    )
+    try:
+        summary = analytics_service.get_summary(
+            user_id,
+            start_date=start_date,
+            end_date=end_date,
+            granularity=granularity,
+            max_buckets=max_buckets
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "success": True,
+        "data": summary,
+        "message": "학습 이력 요약 조회 성공"
+    }
+
+@router.get("/{user_id}/level-progression")
+async def get_user_level_progression(
+    user_id: int,
+    level: Optional[JLPTLevel] = Query(None, description="JLPT 레벨 (생략 시 점수 이력이 있는 모든 레벨)"),
+    start_date: Optional[date] = Query(None, description="시작일 (생략 시 종료일 기준 365일 전부터)"),
+    end_date: Optional[date] = Query(None, description="종료일 (생략 시 오늘)"),
+    max_points: int = Query(
+        LevelProgressionService.DEFAULT_MAX_POINTS, ge=3, le=LevelProgressionService.MAX_POINTS,
+        description="레벨별 최대 점 개수 (넘으면 다운샘플링)"
+    ),
+    method: str = Query("lttb", description="다운샘플링 방식 (lttb, daily_max)"),
+    current_user: User = Depends(get_current_user)
+):
+    """사용자 레벨별 점수 추이 조회
+    
+    시험 점수 이력을 기간으로 조회해 차트용으로 레벨별 max_points개 이하로 다운샘플링합니다.
+    """
+    # 권한 확인: 자신의 기록만 조회 가능
+    if current_user.id != user_id:
+        raise HTTPException(status_code=403, detail="다른 사용자의 점수 추이를 조회할 수 없습니다")
+    
+    user_repo = get_user_repository()
+    
+    # 사용자 존재 확인
+    user = user_repo.find_by_id(user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+    
+    progression_service = LevelProgressionService(get_level_score_repository())
+    try:
+        progression = progression_service.get_progression(
+            user_id,
+            level=level.value if level else None,
+            start_date=start_date,
+            end_date=end_date,
+            max_points=max_points,
+            method=method
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "success": True,
+        "data": progression,
+        "message": "레벨별 점수 추이 조회 성공"
+    }
+
 @router.get("/{user_id}/daily-goal")
 async def get_user_daily_goal(
     user_id: int,
@@ -358,7 +482,7 @@ async def get_user_daily_goal(
     
     user_repo = get_user_repository()
     daily_goal_repo = get_daily_goal_repository()
-    learning_history_repo = get_learning_history_repository()
+    daily_rollup_repo = get_user_daily_rollup_repository()
     
     # 사용자 존재 확인
     user = user_repo.find_by_id(user_id)
@@ -369,7 +493,7 @@ async def get_user_daily_goal(
     daily_goal = daily_goal_repo.find_by_user_id(user_id)
     
     # 일일 통계 서비스 생성
-    statistics_service = DailyStatisticsService(learning_history_repo)
+    statistics_service = DailyStatisticsService(daily_rollup_repo)
     
     # 일일 목표와 통계 조회
     result = statistics_service.get_daily_goal_with_statistics(
@@ -435,3 +559,31 @@ async def update_user_daily_goal(
         ),
         "message": "일일 학습 목표가 성공적으로 설정되었습니다"
     }
+
+@router.get("/{user_id}/streak")
+async def get_user_streak(
+    user_id: int,
+    current_user: User = Depends(get_current_user)
+):
+    """사용자 연속 학습 일수 조회
+    
+    현재 연속 학습 일수, 최장 연속 학습 일수, 마지막 학습 날짜를 조회합니다.
+    """
+    # 권한 확인: 자신의 기록만 조회 가능
+    if current_user.id != user_id:
+        raise HTTPException(status_code=403, detail="다른 사용자의 연속 학습 기록을 조회할 수 없습니다")
+    
+    user_repo = get_user_repository()
+    
+    # 사용자 존재 확인
+    user = user_repo.find_by_id(user_id)
+    if not user:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+    
+    streak_service = StudyStreakService(get_user_streak_repository())
+    
+    return {
+        "success": True,
+        "data": streak_service.get_streak(user_id, today=date.today()),
+        "message": "연속 학습 기록 조회 성공"
+    }
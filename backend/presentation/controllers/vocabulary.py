@@ -4,12 +4,15 @@
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
-from pydantic import BaseModel
-from typing import Optional, List
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
+from typing import Optional, List, Iterable, Iterator
+from datetime import datetime
 from backend.domain.entities.user import User
 from backend.domain.value_objects.jlpt import JLPTLevel, MemorizationStatus
 from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
 from backend.infrastructure.repositories.user_vocabulary_repository import SqliteUserVocabularyRepository
+from backend.infrastructure.repositories.content_hash import DuplicateContentError
 from backend.infrastructure.config.database import get_database
 from backend.presentation.controllers.auth import get_current_user
 
@@ -57,6 +60,30 @@ class VocabularyReviewResponse(BaseModel):
     interval_days: int
     review_count: int
 
+class VocabularyBatchReviewItem(BaseModel):
+    vocabulary_id: int
+    difficulty: str  # "easy", "normal", "hard"
+    reviewed_at: Optional[datetime] = None  # 생략 시 오늘 날짜
+
+class VocabularyBatchReviewRequest(BaseModel):
+    reviews: List[VocabularyBatchReviewItem] = Field(..., min_length=1, max_length=500)
+
+class VocabularyBatchReviewResponse(BaseModel):
+    reviewed: int
+    results: List[VocabularyReviewResponse]
+
+class ReviewForecastDay(BaseModel):
+    date: str
+    scheduled: int
+    expected: float
+
+class ReviewForecastResponse(BaseModel):
+    start_date: str
+    days: int
+    total_scheduled: int
+    total_expected: float
+    forecast: List[ReviewForecastDay]
+
 class ReviewStatisticsResponse(BaseModel):
     total_due: int
     reviewed_today: int
@@ -78,65 +105,109 @@ def get_spaced_repetition_service():
     from backend.domain.services.spaced_repetition_service import SpacedRepetitionService
     return SpacedRepetitionService()
 
+def get_review_forecast_service():
+    """복습량 예측 서비스 의존성 주입"""
+    from backend.domain.services.review_forecast_service import ReviewForecastService
+    return ReviewForecastService(get_user_vocabulary_repository())
+
+def _invalidate_review_forecast(user_id: int) -> None:
+    """복습 기록 변경 시 복습량 예측 캐시 무효화"""
+    from backend.domain.services.review_forecast_service import ReviewForecastService
+    ReviewForecastService.invalidate(user_id)
+
 @router.get("/", response_model=List[VocabularyResponse])
 async def get_vocabularies(
     level: Optional[JLPTLevel] = Query(None, description="JLPT 레벨 필터"),
-    status: Optional[str] = Query(None, description="암기 상태 필터"),
+    status: Optional[MemorizationStatus] = Query(None, description="암기 상태 필터"),
     search: Optional[str] = Query(None, description="단어 또는 의미 검색"),
+    limit: Optional[int] = Query(None, ge=1, description="최대 조회 개수"),
+    offset: int = Query(0, ge=0, description="건너뛸 개수"),
     current_user: User = Depends(get_current_user)
 ):
     """단어 목록 조회 (사용자별 상태 포함)
     
     Args:
         level: JLPT 레벨 필터 (선택적)
-        status: 암기 상태 필터 (선택적) - 현재 사용자의 상태 기준
+        status: 암기 상태 필터 (선택적) - 현재 사용자의 상태 기준, 학습 기록이 없으면 not_memorized
         search: 단어 또는 의미 검색 (선택적)
+        limit: 최대 조회 개수 (선택적, 기본값: 전체)
+        offset: 건너뛸 개수 (기본값: 0)
         current_user: 현재 로그인한 사용자 (인증 필수)
     
     Returns:
-        단어 목록 (현재 사용자의 학습 상태 포함)
+        단어 목록 (현재 사용자의 학습 상태 포함, JSON 배열 스트리밍)
     """
-    vocab_repo = get_vocabulary_repository()
     user_vocab_repo = get_user_vocabulary_repository()
     
-    # 단어 목록 조회
-    if search:
-        # 검색 기능
-        by_word = vocab_repo.search_by_word(search)
-        by_meaning = vocab_repo.search_by_meaning(search)
-        # 중복 제거 (ID 기준)
-        vocabularies = {v.id: v for v in by_word + by_meaning}.values()
-        vocabularies = list(vocabularies)
-    elif level:
-        vocabularies = vocab_repo.find_by_level(level)
-    else:
-        vocabularies = vocab_repo.find_all()
-    
-    # 상태 필터 적용 (사용자별 상태 기준)
-    if status:
-        user_vocabs = user_vocab_repo.find_by_user_and_status(
-            current_user.id, MemorizationStatus(status)
+    # 단어와 사용자별 상태를 LEFT JOIN으로 배치 단위 조회
+    rows = user_vocab_repo.iter_vocabulary_with_status(
+        current_user.id,
+        level=level,
+        status=status,
+        search=search,
+        limit=limit,
+        offset=offset
+    )
+    
+    items = (
+        VocabularyResponse(
+            id=vocabulary.id,
+            word=vocabulary.word,
+            reading=vocabulary.reading,
+            meaning=vocabulary.meaning,
+            level=vocabulary.level.value,
+            memorization_status=user_status.value,
+            example_sentence=vocabulary.example_sentence
         )
-        vocab_ids_with_status = {uv.vocabulary_id for uv in user_vocabs}
-        vocabularies = [v for v in vocabularies if v.id in vocab_ids_with_status]
+        for vocabulary, user_status in rows
+    )
     
-    # 사용자별 상태 조회
-    user_vocabs_dict = {
-        uv.vocabulary_id: uv.memorization_status
-        for uv in user_vocab_repo.find_by_user_id(current_user.id)
-    }
+    return StreamingResponse(_stream_json_array(items), media_type="application/json")
+
+def _stream_json_array(items: Iterable[BaseModel]) -> Iterator[str]:
+    """Pydantic 모델 목록을 JSON 배열 문자열 조각으로 변환"""
+    yield "["
+    for index, item in enumerate(items):
+        yield ("," if index else "") + item.model_dump_json()
+    yield "]"
+
+@router.get("/review", response_model=List[VocabularyReviewResponse])
+async def get_review_vocabularies(
+    limit: Optional[int] = Query(None, ge=1, description="최대 조회 개수"),
+    offset: int = Query(0, ge=0, description="건너뛸 개수"),
+    current_user: User = Depends(get_current_user)
+):
+    """오늘 복습해야 하는 단어 목록 조회
+    
+    Args:
+        limit: 최대 조회 개수 (선택적, 기본값: 전체)
+        offset: 건너뛸 개수 (기본값: 0)
+        current_user: 현재 로그인한 사용자 (인증 필수)
+    
+    Returns:
+        오늘 복습해야 하는 단어 목록 (SRS 우선순위 순)
+    """
+    user_vocab_repo = get_user_vocabulary_repository()
+    
+    # 복습 대상과 단어 정보를 한 번의 JOIN 쿼리로 조회
+    due_items = user_vocab_repo.find_due_for_review_with_vocabulary(
+        current_user.id, limit=limit, offset=offset
+    )
     
     return [
-        VocabularyResponse(
-            id=v.id,
-            word=v.word,
-            reading=v.reading,
-            meaning=v.meaning,
-            level=v.level.value,
-            memorization_status=user_vocabs_dict.get(v.id, MemorizationStatus.NOT_MEMORIZED).value,
-            example_sentence=v.example_sentence
+        VocabularyReviewResponse(
+            id=vocabulary.id,
+            word=vocabulary.word,
+            reading=vocabulary.reading,
+            meaning=vocabulary.meaning,
+            level=vocabulary.level.value,
+            memorization_status=user_vocab.memorization_status.value,
+            example_sentence=vocabulary.example_sentence,
+            next_review_date=user_vocab.next_review_date.isoformat() if user_vocab.next_review_date else None,
+            interval_days=user_vocab.interval_days,
+            review_count=user_vocab.review_count
         )
-        for v in vocabularies
+        for user_vocab, vocabulary in due_items
     ]
 
 @router.get("/{vocabulary_id}", response_model=VocabularyResponse)
@@ -190,6 +261,9 @@ async def create_vocabulary(
     
     Returns:
         생성된 단어 정보
+
+    Raises:
+        HTTPException: 같은 단어가 이미 있는 경우 (409)
     """
     from backend.domain.entities.vocabulary import Vocabulary
     
@@ -204,7 +278,10 @@ async def create_vocabulary(
         example_sentence=request.example_sentence
     )
     
-    saved_vocabulary = repo.save(vocabulary)
+    try:
+        saved_vocabulary = repo.save(vocabulary)
+    except DuplicateContentError as e:
+        raise HTTPException(status_code=409, detail=f"{e} (ID: {e.existing_id})")
     
     return VocabularyResponse(
         id=saved_vocabulary.id,
@@ -321,6 +398,8 @@ async def study_vocabulary(
     user_vocab_repo.upsert(
         current_user.id, vocabulary_id, request.memorization_status
     )
+    # 처음 학습한 단어는 바로 복습 대상이 되므로 예측 캐시도 무효화
+    _invalidate_review_forecast(current_user.id)
     
     return VocabularyResponse(
         id=vocabulary.id,
@@ -332,46 +411,6 @@ async def study_vocabulary(
         example_sentence=vocabulary.example_sentence
     )
 
-@router.get("/review", response_model=List[VocabularyReviewResponse])
-async def get_review_vocabularies(
-    current_user: User = Depends(get_current_user)
-):
-    """오늘 복습해야 하는 단어 목록 조회
-    
-    Args:
-        current_user: 현재 로그인한 사용자 (인증 필수)
-    
-    Returns:
-        오늘 복습해야 하는 단어 목록
-    """
-    from datetime import date
-    
-    vocab_repo = get_vocabulary_repository()
-    user_vocab_repo = get_user_vocabulary_repository()
-    
-    # 오늘 복습해야 하는 단어 조회
-    due_user_vocabs = user_vocab_repo.find_due_for_review(current_user.id)
-    
-    # 단어 정보 조회
-    result = []
-    for user_vocab in due_user_vocabs:
-        vocabulary = vocab_repo.find_by_id(user_vocab.vocabulary_id)
-        if vocabulary:
-            result.append(VocabularyReviewResponse(
-                id=vocabulary.id,
-                word=vocabulary.word,
-                reading=vocabulary.reading,
-                meaning=vocabulary.meaning,
-                level=vocabulary.level.value,
-                memorization_status=user_vocab.memorization_status.value,
-                example_sentence=vocabulary.example_sentence,
-                next_review_date=user_vocab.next_review_date.isoformat() if user_vocab.next_review_date else None,
-                interval_days=user_vocab.interval_days,
-                review_count=user_vocab.review_count
-            ))
-    
-    return result
-
 @router.post("/{vocabulary_id}/review", response_model=VocabularyReviewResponse)
 async def review_vocabulary(
     vocabulary_id: int,
@@ -428,6 +467,7 @@ async def review_vocabulary(
     
     # 저장
     user_vocab_repo.save(user_vocab)
+    _invalidate_review_forecast(current_user.id)
     
     return VocabularyReviewResponse(
         id=vocabulary.id,
@@ -442,6 +482,112 @@ async def review_vocabulary(
         review_count=user_vocab.review_count
     )
 
+@router.post("/review/batch", response_model=VocabularyBatchReviewResponse)
+async def review_vocabularies_batch(
+    request: VocabularyBatchReviewRequest,
+    current_user: User = Depends(get_current_user)
+):
+    """단어 일괄 복습 (오프라인 복습 세션 동기화용)
+    
+    요청 순서대로 SRS 알고리즘을 적용한 뒤, 모든 결과를 하나의 트랜잭션으로 저장합니다.
+    같은 단어가 여러 번 포함되면 순서대로 누적 적용됩니다.
+    
+    Args:
+        request: 복습 목록 (단어 ID, 난이도, 복습 시각)
+        current_user: 현재 로그인한 사용자 (인증 필수)
+    
+    Returns:
+        처리한 복습 수와 단어별 최종 복습 일정
+    """
+    from backend.domain.entities.user_vocabulary import UserVocabulary
+    
+    for item in request.reviews:
+        if item.difficulty not in ["easy", "normal", "hard"]:
+            raise HTTPException(
+                status_code=400,
+                detail="난이도는 'easy', 'normal', 'hard' 중 하나여야 합니다"
+            )
+    
+    vocab_repo = get_vocabulary_repository()
+    user_vocab_repo = get_user_vocabulary_repository()
+    srs_service = get_spaced_repetition_service()
+    
+    vocabulary_ids = list(dict.fromkeys(item.vocabulary_id for item in request.reviews))
+    vocabularies = {v.id: v for v in vocab_repo.find_by_ids(vocabulary_ids)}
+    missing_ids = [vid for vid in vocabulary_ids if vid not in vocabularies]
+    if missing_ids:
+        raise HTTPException(
+            status_code=404,
+            detail=f"단어를 찾을 수 없습니다: {missing_ids}"
+        )
+    
+    user_vocabs = {
+        uv.vocabulary_id: uv
+        for uv in user_vocab_repo.find_by_user_and_vocabulary_ids(
+            current_user.id, vocabulary_ids
+        )
+    }
+    
+    # 복습 처리 (요청 순서대로 SRS 알고리즘 적용)
+    for item in request.reviews:
+        reviewed_on = item.reviewed_at.date() if item.reviewed_at else None
+        user_vocab = user_vocabs.get(item.vocabulary_id)
+        if user_vocab is None:
+            user_vocab = srs_service.initialize_review_schedule(
+                UserVocabulary(
+                    id=None,
+                    user_id=current_user.id,
+                    vocabulary_id=item.vocabulary_id,
+                    memorization_status=MemorizationStatus.NOT_MEMORIZED
+                ),
+                today=reviewed_on
+            )
+            user_vocabs[item.vocabulary_id] = user_vocab
+        srs_service.calculate_next_review(user_vocab, item.difficulty, today=reviewed_on)
+    
+    # 일괄 저장 (단일 트랜잭션)
+    reviewed_vocabs = [user_vocabs[vid] for vid in vocabulary_ids]
+    user_vocab_repo.save_all(reviewed_vocabs)
+    _invalidate_review_forecast(current_user.id)
+    
+    results = []
+    for user_vocab in reviewed_vocabs:
+        vocabulary = vocabularies[user_vocab.vocabulary_id]
+        results.append(VocabularyReviewResponse(
+            id=vocabulary.id,
+            word=vocabulary.word,
+            reading=vocabulary.reading,
+            meaning=vocabulary.meaning,
+            level=vocabulary.level.value,
+            memorization_status=user_vocab.memorization_status.value,
+            example_sentence=vocabulary.example_sentence,
+            next_review_date=user_vocab.next_review_date.isoformat() if user_vocab.next_review_date else None,
+            interval_days=user_vocab.interval_days,
+            review_count=user_vocab.review_count
+        ))
+    
+    return VocabularyBatchReviewResponse(
+        reviewed=len(request.reviews),
+        results=results
+    )
+
+@router.get("/review/forecast", response_model=ReviewForecastResponse)
+async def get_review_forecast(
+    days: int = Query(30, ge=1, le=365, description="예측 기간 (일)"),
+    current_user: User = Depends(get_current_user)
+):
+    """향후 일별 복습량 예측 조회
+    
+    Args:
+        days: 예측 기간 (1 ~ 365일, 기본값: 30)
+        current_user: 현재 로그인한 사용자 (인증 필수)
+    
+    Returns:
+        일별 예정 복습 수와 재복습을 포함한 기대 복습 수
+    """
+    service = get_review_forecast_service()
+    return ReviewForecastResponse(**service.forecast(days=days, user_id=current_user.id))
+
 @router.get("/review/statistics", response_model=ReviewStatisticsResponse)
 async def get_review_statistics(
     current_user: User = Depends(get_current_user)
@@ -454,33 +600,18 @@ async def get_review_statistics(
     Returns:
         복습 통계 (대기 중인 복습 수, 오늘 복습한 단어 수, 복습 성공률)
     """
-    from datetime import date, timedelta
-    
     user_vocab_repo = get_user_vocabulary_repository()
-    today = date.today()
     
-    # 오늘 복습해야 하는 단어 수
-    due_vocabs = user_vocab_repo.find_due_for_review(current_user.id, today.isoformat())
-    total_due = len(due_vocabs)
-    
-    # 오늘 복습한 단어 수 (last_review_date가 오늘인 단어)
-    all_user_vocabs = user_vocab_repo.find_by_user_id(current_user.id)
-    reviewed_today = sum(
-        1 for uv in all_user_vocabs
-        if uv.last_review_date == today
-    )
+    # 대기 중인 복습 수는 인덱스 범위 조회, 나머지는 사용자별 카운터 캐시에서 조회
+    stats = user_vocab_repo.get_review_statistics(current_user.id)
     
     # 복습 성공률 계산 (연속 정답이 2회 이상인 단어 비율)
-    total_reviewed = sum(1 for uv in all_user_vocabs if uv.review_count > 0)
-    successful_reviews = sum(
-        1 for uv in all_user_vocabs
-        if uv.review_count > 0 and uv.consecutive_correct >= 2
-    )
-    success_rate = (successful_reviews / total_reviewed * 100) if total_reviewed > 0 else 0.0
+    total_reviewed = stats['total_reviewed']
+    success_rate = (stats['successful_reviews'] / total_reviewed * 100) if total_reviewed > 0 else 0.0
     
     return ReviewStatisticsResponse(
-        total_due=total_due,
-        reviewed_today=reviewed_today,
+        total_due=stats['total_due'],
+        reviewed_today=stats['reviewed_today'],
         success_rate=round(success_rate, 2)
     )
 
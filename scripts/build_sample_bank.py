@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+샘플 뱅크 컴파일 스크립트
+data/*.json 샘플 데이터를 레벨/난이도 인덱스가 포함된 스냅샷(data/sample_bank.bin)으로 컴파일합니다.
+원본 JSON을 수정한 뒤 다시 실행하세요. 스냅샷이 오래되면 문제 생성 시 JSON에서 직접 로드합니다.
+"""
+
+import sys
+import os
+import time
+import argparse
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.infrastructure.adapters.sample_bank import SampleBank
+
+DEFAULT_DATA_DIR = Path(__file__).parent.parent / "data"
+
+
+def build_sample_bank(data_dir: Path = DEFAULT_DATA_DIR, output: Path = None):
+    """샘플 뱅크 컴파일
+
+    Args:
+        data_dir: 샘플 JSON 파일 디렉토리
+        output: 스냅샷 경로 (None이면 data_dir/sample_bank.bin)
+    """
+    output = Path(output) if output else Path(data_dir) / SampleBank.SNAPSHOT_NAME
+    started = time.monotonic()
+    bank = SampleBank.build(data_dir, output)
+    elapsed = time.monotonic() - started
+
+    print(f"✅ 샘플 뱅크를 생성했습니다: {output} ({output.stat().st_size:,}바이트, {elapsed:.2f}초)")
+    for kind in SampleBank.SOURCES:
+        for level in bank.levels(kind):
+            by_difficulty = ", ".join(
+                f"난이도 {d}: {len(bank.indices(kind, level, d))}개"
+                for d in bank.difficulties(kind, level)
+            )
+            print(f"  - {kind} {level.value}: {by_difficulty}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="샘플 뱅크 컴파일")
+    parser.add_argument(
+        "--data-dir",
+        type=Path,
+        default=DEFAULT_DATA_DIR,
+        help="샘플 JSON 파일 디렉토리 (기본값: data)",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=None,
+        help="스냅샷 경로 (기본값: <data-dir>/sample_bank.bin)",
+    )
+    args = parser.parse_args()
+
+    try:
+        build_sample_bank(data_dir=args.data_dir, output=args.output)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
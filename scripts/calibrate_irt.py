@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+IRT 보정 스크립트
+answer_details의 전체 응답으로 1PL/2PL 문항 모수(변별도, 난이도)와 사용자 능력치(theta)를 추정해
+question_irt_params, user_abilities에 저장합니다. 기본은 이전 보정값에서 시작합니다 (야간 배치용).
+"""
+
+import sys
+import os
+import argparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.domain.services.irt_calibration_service import IrtCalibrationService
+from backend.infrastructure.repositories.irt_parameter_repository import SqliteIrtParameterRepository
+from backend.infrastructure.config.database import get_database
+
+
+def calibrate_irt(
+    model: str = '2pl',
+    epochs: int = 30,
+    batch_size: int = 65536,
+    learning_rate: float = 0.05,
+    min_item_responses: int = 5,
+    cold_start: bool = False
+):
+    """IRT 문항 모수와 사용자 능력치 보정
+
+    Args:
+        model: '1pl' 또는 '2pl'
+        epochs: 전체 응답을 도는 횟수
+        batch_size: 미니배치 응답 수
+        learning_rate: Adam 학습률
+        min_item_responses: 이보다 응답이 적은 문항은 제외
+        cold_start: True면 이전 보정값을 쓰지 않고 정답률로 초기화
+    """
+    service = IrtCalibrationService(SqliteIrtParameterRepository(get_database()))
+
+    print(f"🧮 IRT 보정 ({model.upper()}, epochs={epochs}, batch_size={batch_size}, "
+          f"{'cold start' if cold_start else 'warm start'})")
+    try:
+        result = service.calibrate(
+            model=model,
+            epochs=epochs,
+            batch_size=batch_size,
+            learning_rate=learning_rate,
+            warm_start=not cold_start,
+            min_item_responses=min_item_responses
+        )
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    if result['responses'] == 0:
+        print("⚠️  보정할 응답이 없습니다.")
+        return
+
+    print(
+        f"✅ 문항 {result['items']}개, 사용자 {result['users']}명을 보정했습니다. "
+        f"(응답 {result['responses']}건, 이전 값에서 시작한 문항 {result['warm_started']}개, "
+        f"평균 로그우도 {result['mean_log_likelihood']}, {result['elapsed_seconds']}초)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="IRT 문항 모수/사용자 능력치 보정")
+    parser.add_argument("--model", type=str, default="2pl", choices=["1pl", "2pl"], help="IRT 모델 (기본값: 2pl)")
+    parser.add_argument("--epochs", type=int, default=30, help="전체 응답을 도는 횟수 (기본값: 30)")
+    parser.add_argument("--batch-size", type=int, default=65536, help="미니배치 응답 수 (기본값: 65536)")
+    parser.add_argument("--learning-rate", type=float, default=0.05, help="Adam 학습률 (기본값: 0.05)")
+    parser.add_argument("--min-item-responses", type=int, default=5, help="보정에 포함할 문항의 최소 응답 수 (기본값: 5)")
+    parser.add_argument("--cold-start", action="store_true", help="이전 보정값을 쓰지 않고 처음부터 보정")
+    args = parser.parse_args()
+
+    try:
+        calibrate_irt(
+            model=args.model,
+            epochs=args.epochs,
+            batch_size=args.batch_size,
+            learning_rate=args.learning_rate,
+            min_item_responses=args.min_item_responses,
+            cold_start=args.cold_start
+        )
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
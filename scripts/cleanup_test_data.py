@@ -81,6 +81,7 @@ def cleanup_test_users(email_pattern: str = "test-%@example.com"):
                 # 6. tests 삭제 (사용자가 생성한 테스트)
                 if test_ids:
                     placeholders = ','.join(['?'] * len(test_ids))
+                    conn.execute(f"DELETE FROM test_questions WHERE test_id IN ({placeholders})", test_ids)
                     conn.execute(f"DELETE FROM tests WHERE id IN ({placeholders})", test_ids)
                 
                 # 7. users 삭제
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+TTS 캐시 정리 스크립트
+고아 오디오 파일을 정리하고, 캐시가 예산을 넘으면 참조되지 않는 파일부터 LRU로 제거합니다.
+"""
+
+import sys
+import os
+import argparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.infrastructure.adapters.tts_cache import TTSCacheManager
+from backend.infrastructure.config.database import get_database
+
+MB = 1024 * 1024
+
+
+def cleanup_tts_cache(
+    max_mb: float = TTSCacheManager.DEFAULT_MAX_BYTES / MB,
+    grace_seconds: int = TTSCacheManager.DEFAULT_GRACE_SECONDS
+):
+    """TTS 캐시 정리
+
+    Args:
+        max_mb: 캐시 전체 크기 예산 (MB)
+        grace_seconds: 이보다 최근에 만들어진 파일은 고아로 보지 않음 (초)
+    """
+    cache = TTSCacheManager(get_database(), max_bytes=int(max_mb * MB))
+
+    sweep = cache.sweep_orphans(grace_seconds=grace_seconds)
+    print(
+        f"🧹 고아 정리: 파일 {sweep['removed_files']}개 ({sweep['freed_bytes'] / MB:.1f}MB), "
+        f"임시 파일 {sweep['removed_temp_files']}개, 매니페스트 행 {sweep['removed_entries']}개 제거, "
+        f"{sweep['adopted']}개 등록"
+    )
+
+    eviction = cache.evict()
+    print(f"🗑️  LRU 제거: {eviction['evicted']}개 ({eviction['freed_bytes'] / MB:.1f}MB)")
+
+    stats = cache.stats()
+    print(
+        f"✅ 캐시 {stats['entries']}개, {stats['total_bytes'] / MB:.1f}/{max_mb:.0f}MB "
+        f"(참조되지 않는 파일 {stats['unreferenced_entries']}개, "
+        f"누적 적중 {stats['total_hit_count']}회)"
+    )
+    if stats['total_bytes'] > cache.max_bytes:
+        print("⚠️  문제에서 참조 중인 파일만으로 예산을 넘었습니다. 예산을 늘리세요.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TTS 캐시 정리")
+    parser.add_argument(
+        "--max-mb",
+        type=float,
+        default=TTSCacheManager.DEFAULT_MAX_BYTES / MB,
+        help=f"캐시 전체 크기 예산 (MB, 기본값: {TTSCacheManager.DEFAULT_MAX_BYTES // MB})",
+    )
+    parser.add_argument(
+        "--grace-seconds",
+        type=int,
+        default=TTSCacheManager.DEFAULT_GRACE_SECONDS,
+        help=f"이보다 최근 파일은 고아로 보지 않음 (초, 기본값: {TTSCacheManager.DEFAULT_GRACE_SECONDS})",
+    )
+    args = parser.parse_args()
+
+    try:
+        cleanup_tts_cache(max_mb=args.max_mb, grace_seconds=args.grace_seconds)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+데이터 내보내기 스크립트
+문제, 단어, 시험 결과, 답안 상세를 NDJSON 또는 CSV로 내보냅니다 (선택적 gzip 압축).
+"""
+
+import sys
+import os
+import time
+import argparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.infrastructure.adapters.streaming_exporter import StreamingExporter
+from backend.infrastructure.config.database import get_database
+
+
+def export_data(
+    table: str,
+    output: str = None,
+    file_format: str = 'ndjson',
+    compress: bool = False,
+    batch_size: int = StreamingExporter.DEFAULT_BATCH_SIZE
+):
+    """테이블 내보내기
+
+    행을 batch_size개씩 조회해 바로 기록하므로 메모리 사용량은 테이블 크기와 무관합니다.
+
+    Args:
+        table: 내보낼 테이블 (questions, vocabulary, results, answer_details)
+        output: 출력 파일 경로. None이면 표준 출력
+        file_format: 내보내기 형식 (ndjson, csv)
+        compress: True이면 gzip 압축
+        batch_size: 한 번에 조회할 행 수
+    """
+    exporter = StreamingExporter(get_database(), batch_size=batch_size)
+    started = time.monotonic()
+
+    if output is None:
+        exporter.export_to_stream(sys.stdout.buffer, table, file_format, compress)
+        sys.stdout.buffer.flush()
+        return
+
+    with open(output, 'wb') as f:
+        count = exporter.export_to_stream(f, table, file_format, compress)
+
+    elapsed = time.monotonic() - started
+    print(f"✅ {table} {count}행을 내보냈습니다: {output} ({elapsed:.2f}초)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="데이터 내보내기")
+    parser.add_argument(
+        "table",
+        type=str,
+        choices=list(StreamingExporter.TABLES),
+        help="내보낼 테이블",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        type=str,
+        default=None,
+        help="출력 파일 경로 (생략 시 표준 출력, .gz로 끝나면 gzip 압축)",
+    )
+    parser.add_argument(
+        "--format",
+        type=str,
+        default=None,
+        choices=list(StreamingExporter.FORMATS),
+        help="내보내기 형식 (생략 시 출력 파일 확장자로 감지, 기본값: ndjson)",
+    )
+    parser.add_argument(
+        "--gzip",
+        action="store_true",
+        help="gzip 압축",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=StreamingExporter.DEFAULT_BATCH_SIZE,
+        help=f"한 번에 조회할 행 수 (기본값: {StreamingExporter.DEFAULT_BATCH_SIZE})",
+    )
+    args = parser.parse_args()
+
+    output = args.output
+    compress = args.gzip or (output is not None and output.endswith('.gz'))
+    file_format = args.format
+    if file_format is None:
+        base_name = output[:-3] if output and output.endswith('.gz') else (output or '')
+        file_format = 'csv' if base_name.endswith('.csv') else 'ndjson'
+
+    try:
+        export_data(
+            table=args.table,
+            output=output,
+            file_format=file_format,
+            compress=compress,
+            batch_size=args.batch_size,
+        )
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
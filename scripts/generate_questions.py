@@ -11,7 +11,7 @@ import argparse
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from backend.domain.services.question_generator_service import QuestionGeneratorService
+from backend.domain.services.bulk_generation_service import BulkQuestionGenerationService
 from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
 from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
 from backend.infrastructure.config.database import get_database
@@ -21,15 +21,23 @@ def generate_questions(
     level: str,
     question_type: str = None,
     count: int = 10,
-    interactive: bool = True
+    interactive: bool = True,
+    chunk_size: int = BulkQuestionGenerationService.DEFAULT_CHUNK_SIZE,
+    with_audio: bool = False,
+    difficulty: int = None
 ):
     """문제 생성 및 데이터베이스에 저장
     
+    chunk_size개씩 생성해 한 트랜잭션으로 저장하며, 이미 같은 내용의 문제는 새로 만들지 않습니다.
+    
     Args:
         level: JLPT 레벨 (N1-N5)
         question_type: 문제 유형 (vocabulary, grammar, reading, listening) 또는 None
-        count: 생성할 문제 수
+        count: 새로 저장할 문제 수
         interactive: True이면 진행 상황을 출력
+        chunk_size: 트랜잭션당 생성/저장 건수
+        with_audio: True이면 청해 문제의 TTS 오디오를 함께 생성
+        difficulty: 난이도 (1-5) 또는 None
     """
     try:
         jlpt_level = JLPTLevel(level.upper())
@@ -53,51 +61,53 @@ def generate_questions(
             print(f"   문제 유형: {q_type.value}")
         else:
             print(f"   문제 유형: 모든 유형")
+        if difficulty:
+            print(f"   난이도: {difficulty}")
         print(f"   생성할 문제 수: {count}개")
+        print(f"   청크 크기: {chunk_size}")
         print()
     
-    # 문제 생성
-    questions = QuestionGeneratorService.generate_questions(
+    # 청크 단위로 생성 및 저장
+    db = get_database()
+    service = BulkQuestionGenerationService(
+        SqliteQuestionRepository(db),
+        chunk_size=chunk_size,
+        with_audio=with_audio
+    )
+    
+    def report(chunk, summary):
+        if interactive:
+            print(
+                f"[{summary['imported']}/{count}] {chunk['question_type'].value} "
+                f"{chunk['inserted']}/{len(chunk['questions'])}개 저장"
+            )
+    
+    summary = service.generate(
         level=jlpt_level,
         question_type=q_type,
-        count=count
+        count=count,
+        on_chunk=report,
+        difficulty=difficulty
     )
     
-    if not questions:
+    if summary['imported'] == 0:
         print("❌ 생성된 문제가 없습니다.")
         sys.exit(1)
     
-    # 데이터베이스에 저장
-    db = get_database()
-    repo = SqliteQuestionRepository(db)
-    
-    saved_count = 0
-    for i, question in enumerate(questions, 1):
-        try:
-            saved_question = repo.save(question)
-            saved_count += 1
-            if interactive:
-                print(f"[{i}/{len(questions)}] 문제 추가 완료: {saved_question.question_text[:50]}...")
-        except Exception as e:
-            if interactive:
-                print(f"[{i}/{len(questions)}] 문제 저장 실패: {str(e)}")
-            continue
-    
     if interactive:
         print()
-        print(f"✅ 총 {saved_count}/{len(questions)}개의 문제가 생성되었습니다.")
+        print(f"✅ 총 {summary['imported']}/{count}개의 문제가 생성되었습니다. ({summary['elapsed_seconds']}초)")
+        if summary['duplicates']:
+            print(f"   이미 존재하는 문제와 같은 {summary['duplicates']}개는 새로 만들지 않았습니다.")
+        if summary['exhausted']:
+            print("⚠️  샘플 데이터로 만들 수 있는 새 문제를 모두 생성해 요청한 수를 채우지 못했습니다.")
         
         # 유형별 통계
-        type_counts = {}
-        for q in questions:
-            q_type = q.question_type.value
-            type_counts[q_type] = type_counts.get(q_type, 0) + 1
-        
         print("\n유형별 문제 수:")
-        for q_type, count in type_counts.items():
-            print(f"  - {q_type}: {count}개")
+        for q_type, type_count in summary['by_type'].items():
+            print(f"  - {q_type}: {type_count}개")
     else:
-        print(f"{saved_count}/{len(questions)}")
+        print(f"{summary['imported']}/{count}")
 
 
 if __name__ == "__main__":
@@ -120,6 +130,24 @@ if __name__ == "__main__":
         default=10,
         help="생성할 문제 수 (기본: 10)",
     )
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=BulkQuestionGenerationService.DEFAULT_CHUNK_SIZE,
+        help=f"트랜잭션당 생성/저장 건수 (기본: {BulkQuestionGenerationService.DEFAULT_CHUNK_SIZE})",
+    )
+    parser.add_argument(
+        "--with-audio",
+        action="store_true",
+        help="청해 문제의 TTS 오디오를 함께 생성 (기본: 생성하지 않음)",
+    )
+    parser.add_argument(
+        "--difficulty",
+        type=int,
+        default=None,
+        choices=range(1, 6),
+        help="난이도 (1-5). 생략 시 모든 난이도",
+    )
     parser.add_argument(
         "--non-interactive",
         action="store_true",
@@ -133,6 +161,9 @@ if __name__ == "__main__":
             question_type=args.type,
             count=args.count,
             interactive=not args.non_interactive,
+            chunk_size=args.chunk_size,
+            with_audio=args.with_audio,
+            difficulty=args.difficulty,
         )
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
@@ -11,7 +11,7 @@ import argparse
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from backend.domain.services.vocabulary_generator_service import VocabularyGeneratorService
+from backend.domain.services.bulk_generation_service import BulkVocabularyGenerationService
 from backend.domain.value_objects.jlpt import JLPTLevel
 from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
 from backend.infrastructure.config.database import get_database
@@ -41,37 +41,28 @@ def generate_vocabulary(
         print(f"   생성할 단어 수: {count}개")
         print()
     
-    # 단어 생성
-    vocabularies = VocabularyGeneratorService.generate_vocabularies(
-        level=jlpt_level,
-        count=count
-    )
+    # 청크 단위로 생성 및 저장 (이미 같은 단어가 있으면 새로 만들지 않음)
+    db = get_database()
+    service = BulkVocabularyGenerationService(SqliteVocabularyRepository(db))
     
-    if not vocabularies:
-        print("❌ 생성된 단어가 없습니다.")
-        sys.exit(1)
+    def report(chunk, summary):
+        if interactive:
+            for vocabulary in chunk['vocabularies']:
+                print(f"단어 저장 완료: {vocabulary.word} ({vocabulary.meaning})")
     
-    # 데이터베이스에 저장
-    db = get_database()
-    repo = SqliteVocabularyRepository(db)
+    summary = service.generate(level=jlpt_level, count=count, on_chunk=report)
     
-    saved_count = 0
-    for i, vocabulary in enumerate(vocabularies, 1):
-        try:
-            saved_vocabulary = repo.save(vocabulary)
-            saved_count += 1
-            if interactive:
-                print(f"[{i}/{len(vocabularies)}] 단어 추가 완료: {saved_vocabulary.word} ({saved_vocabulary.meaning})")
-        except Exception as e:
-            if interactive:
-                print(f"[{i}/{len(vocabularies)}] 단어 저장 실패: {str(e)}")
-            continue
+    if summary['imported'] + summary['duplicates'] == 0:
+        print("❌ 생성된 단어가 없습니다.")
+        sys.exit(1)
     
     if interactive:
         print()
-        print(f"✅ 총 {saved_count}/{len(vocabularies)}개의 단어가 생성되었습니다.")
+        print(f"✅ 총 {summary['imported']}/{count}개의 단어가 생성되었습니다.")
+        if summary['duplicates']:
+            print(f"   이미 존재하는 단어 {summary['duplicates']}개는 새로 만들지 않고 갱신했습니다.")
     else:
-        print(f"{saved_count}/{len(vocabularies)}")
+        print(f"{summary['imported']}/{count}")
 
 
 if __name__ == "__main__":
@@ -12,7 +12,7 @@ from pathlib import Path
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from backend.infrastructure.adapters.jlpt_question_importer import JLPTQuestionImporter
+from backend.infrastructure.adapters.streaming_question_importer import StreamingQuestionImporter
 from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
 from backend.infrastructure.config.database import get_database
 
@@ -20,14 +20,18 @@ from backend.infrastructure.config.database import get_database
 def import_questions(
     file_path: str,
     file_type: str = None,
-    interactive: bool = True
+    interactive: bool = True,
+    batch_size: int = StreamingQuestionImporter.DEFAULT_BATCH_SIZE
 ):
     """기출문제 임포트 및 데이터베이스에 저장
     
+    파일을 스트리밍으로 읽어 batch_size개씩 한 트랜잭션으로 저장합니다.
+    
     Args:
         file_path: 임포트할 파일 경로
         file_type: 파일 형식 (json, csv). None이면 확장자로 자동 감지
         interactive: True이면 진행 상황을 출력
+        batch_size: 트랜잭션당 삽입 건수
     """
     path = Path(file_path)
     
@@ -37,13 +41,10 @@ def import_questions(
     
     # 파일 형식 확인
     if file_type is None:
-        file_ext = path.suffix.lower()
-        if file_ext == '.json':
-            file_type = 'json'
-        elif file_ext == '.csv':
-            file_type = 'csv'
-        else:
-            print(f"❌ 지원하지 않는 파일 형식입니다: {file_ext}")
+        try:
+            file_type = StreamingQuestionImporter.detect_file_type(path.name)
+        except ValueError:
+            print(f"❌ 지원하지 않는 파일 형식입니다: {path.suffix.lower()}")
             print("지원 형식: .json, .csv")
             sys.exit(1)
     
@@ -51,62 +52,39 @@ def import_questions(
         print(f"📥 기출문제 임포트 중...")
         print(f"   파일: {file_path}")
         print(f"   형식: {file_type}")
+        print(f"   배치 크기: {batch_size}")
         print()
     
-    # 파일에서 문제 임포트
+    # 데이터베이스에 스트리밍 저장
+    db = get_database()
+    importer = StreamingQuestionImporter(SqliteQuestionRepository(db), batch_size=batch_size)
+    
     try:
-        if file_type == 'json':
-            questions = JLPTQuestionImporter.import_from_json(str(path))
-        else:
-            questions = JLPTQuestionImporter.import_from_csv(str(path))
+        summary = importer.import_file(str(path), file_type)
     except Exception as e:
         print(f"❌ 파일 임포트 실패: {str(e)}")
         import traceback
         traceback.print_exc()
         sys.exit(1)
     
-    if not questions:
+    if summary['total'] == 0:
         print("❌ 임포트된 문제가 없습니다.")
         sys.exit(1)
     
-    # 데이터베이스에 저장
-    db = get_database()
-    repo = SqliteQuestionRepository(db)
-    
-    saved_count = 0
-    for i, question in enumerate(questions, 1):
-        try:
-            saved_question = repo.save(question)
-            saved_count += 1
-            if interactive:
-                print(f"[{i}/{len(questions)}] 문제 추가 완료: {saved_question.question_text[:50]}...")
-        except Exception as e:
-            if interactive:
-                print(f"[{i}/{len(questions)}] 문제 저장 실패: {str(e)}")
-            continue
-    
     if interactive:
-        print()
-        print(f"✅ 총 {saved_count}/{len(questions)}개의 문제가 임포트되었습니다.")
-        
-        # 레벨별 통계
-        level_counts = {}
-        type_counts = {}
-        for q in questions:
-            level = q.level.value
-            q_type = q.question_type.value
-            level_counts[level] = level_counts.get(level, 0) + 1
-            type_counts[q_type] = type_counts.get(q_type, 0) + 1
+        print(f"✅ 총 {summary['imported']}/{summary['total']}개의 문제가 임포트되었습니다.")
+        if summary['duplicates']:
+            print(f"   이미 존재하는 문제 {summary['duplicates']}개는 새로 만들지 않고 갱신했습니다.")
+        print(f"   소요 시간: {summary['elapsed_seconds']}초")
         
-        print("\n레벨별 문제 수:")
-        for level, count in sorted(level_counts.items()):
-            print(f"  - {level}: {count}개")
-        
-        print("\n유형별 문제 수:")
-        for q_type, count in type_counts.items():
-            print(f"  - {q_type}: {count}개")
+        if summary['rejected']:
+            print(f"\n⚠️  {summary['rejected']}개의 문제가 거부되었습니다:")
+            for error in summary['errors']:
+                print(f"  - {error['row']}행: {error['error']}")
+            if summary['errors_truncated']:
+                print(f"  ... (처음 {len(summary['errors'])}개만 표시)")
     else:
-        print(f"{saved_count}/{len(questions)}")
+        print(f"{summary['imported']}/{summary['total']}")
 
 
 if __name__ == "__main__":
@@ -123,6 +101,12 @@ if __name__ == "__main__":
         choices=['json', 'csv'],
         help="파일 형식 (json, csv). 생략 시 확장자로 자동 감지",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=StreamingQuestionImporter.DEFAULT_BATCH_SIZE,
+        help=f"트랜잭션당 삽입 건수 (기본값: {StreamingQuestionImporter.DEFAULT_BATCH_SIZE})",
+    )
     parser.add_argument(
         "--non-interactive",
         action="store_true",
@@ -135,6 +119,7 @@ if __name__ == "__main__":
             file_path=args.file,
             file_type=args.type,
             interactive=not args.non_interactive,
+            batch_size=args.batch_size,
         )
     except Exception as e:
         print(f"❌ 오류 발생: {e}")
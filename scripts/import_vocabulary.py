@@ -73,21 +73,27 @@ def import_vocabulary(
     db = get_database()
     repo = SqliteVocabularyRepository(db)
     
+    # 청크 단위 업서트 (동일한 단어/읽기/레벨은 중복 생성하지 않고 갱신)
+    chunk_size = 1000
     saved_count = 0
-    for i, vocabulary in enumerate(vocabularies, 1):
+    inserted_count = 0
+    for start in range(0, len(vocabularies), chunk_size):
+        chunk = vocabularies[start:start + chunk_size]
         try:
-            saved_vocabulary = repo.save(vocabulary)
-            saved_count += 1
+            inserted_count += repo.save_all(chunk)
+            saved_count += len(chunk)
             if interactive:
-                print(f"[{i}/{len(vocabularies)}] 단어 추가 완료: {saved_vocabulary.word} ({saved_vocabulary.meaning})")
+                print(f"[{saved_count}/{len(vocabularies)}] 단어 저장 완료")
         except Exception as e:
             if interactive:
-                print(f"[{i}/{len(vocabularies)}] 단어 저장 실패: {str(e)}")
+                print(f"[{start + 1}-{start + len(chunk)}/{len(vocabularies)}] 단어 저장 실패: {str(e)}")
             continue
     
     if interactive:
         print()
-        print(f"✅ 총 {saved_count}/{len(vocabularies)}개의 단어가 임포트되었습니다.")
+        print(f"✅ 총 {inserted_count}/{len(vocabularies)}개의 단어가 임포트되었습니다.")
+        if saved_count > inserted_count:
+            print(f"   이미 존재하는 단어 {saved_count - inserted_count}개는 갱신되었습니다.")
         
         # 레벨별 통계
         level_counts = {}
@@ -99,7 +105,7 @@ def import_vocabulary(
         for level, count in sorted(level_counts.items()):
             print(f"  - {level}: {count}개")
     else:
-        print(f"{saved_count}/{len(vocabularies)}")
+        print(f"{inserted_count}/{len(vocabularies)}")
 
 
 if __name__ == "__main__":
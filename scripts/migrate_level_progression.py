@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+레벨별 점수 추이 이관 스크립트
+user_performance.level_progression에 쌓인 예전 형식의 점수 목록({date, score})을 level_scores 테이블로 옮기고,
+성능 데이터에는 레벨별 요약(시험 수, 평균 점수)만 남깁니다. 이미 요약 형식인 레벨은 건너뛰므로 다시 실행해도 안전합니다.
+"""
+
+import sys
+import os
+import argparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.infrastructure.repositories.level_score_repository import SqliteLevelScoreRepository
+from backend.infrastructure.repositories.user_performance_repository import SqliteUserPerformanceRepository
+from backend.infrastructure.config.database import get_database
+
+
+def migrate_level_progression(dry_run: bool = False):
+    """예전 형식의 레벨별 점수 목록을 level_scores로 이관
+
+    Args:
+        dry_run: True면 이관할 건수만 출력하고 저장하지 않음
+    """
+    performance_repo = SqliteUserPerformanceRepository(get_database())
+
+    migrated_performances = 0
+    migrated_scores = 0
+    for performance in performance_repo.find_all():
+        legacy = performance.compact_level_progression()
+        if not legacy:
+            continue
+
+        rows = SqliteLevelScoreRepository.legacy_rows(performance.user_id, legacy)
+        migrated_performances += 1
+        migrated_scores += len(rows)
+        if dry_run:
+            continue
+
+        # 점수 추가와 요약 저장을 한 트랜잭션으로 (중간에 중단되어도 다시 실행하면 중복 없이 이관)
+        performance_repo.save(performance, level_scores=rows)
+
+    prefix = "🔍 (dry-run) " if dry_run else "✅ "
+    print(f"{prefix}성능 데이터 {migrated_performances}건에서 점수 {migrated_scores}건을 이관했습니다.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="레벨별 점수 추이를 level_scores 테이블로 이관")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="이관할 건수만 출력하고 저장하지 않음",
+    )
+    args = parser.parse_args()
+
+    try:
+        migrate_level_progression(dry_run=args.dry_run)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+시험/학습 세션 문제 목록 이관 스크립트
+tests.question_ids, study_sessions.question_ids(JSON)를 test_questions, study_session_questions 테이블로 옮깁니다.
+이미 이관된 시험/세션은 건너뛰므로 다시 실행해도 안전합니다. JSON 컬럼은 그대로 유지됩니다.
+"""
+
+import sys
+import os
+import argparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.infrastructure.repositories.test_repository import SqliteTestRepository
+from backend.infrastructure.repositories.study_session_repository import SqliteStudySessionRepository
+from backend.infrastructure.config.database import get_database
+
+
+def migrate_question_links(dry_run: bool = False):
+    """question_ids JSON을 시험/학습 세션 문제 테이블로 이관
+
+    Args:
+        dry_run: True면 이관할 건수만 출력하고 저장하지 않음
+    """
+    db = get_database()
+    prefix = "🔍 (dry-run) " if dry_run else "✅ "
+
+    tests, test_links = SqliteTestRepository(db).backfill_question_links(dry_run=dry_run)
+    print(f"{prefix}시험 {tests}건의 문제 {test_links}개를 test_questions로 이관했습니다.")
+
+    sessions, session_links = SqliteStudySessionRepository(db).backfill_question_links(dry_run=dry_run)
+    print(f"{prefix}학습 세션 {sessions}건의 문제 {session_links}개를 study_session_questions로 이관했습니다.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="question_ids JSON을 test_questions/study_session_questions 테이블로 이관")
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="이관할 건수만 출력하고 저장하지 않음",
+    )
+    args = parser.parse_args()
+
+    try:
+        migrate_question_links(dry_run=args.dry_run)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+청해 오디오 사전 렌더링 스크립트
+audio_url이 없는 청해 문제의 TTS 오디오를 병렬로 생성하고 데이터베이스에 저장합니다.
+오디오는 있지만 메타데이터(크기, 재생 시간, ETag)가 없는 문제도 함께 채웁니다.
+"""
+
+import sys
+import os
+import argparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.domain.services.audio_prerender_service import AudioPrerenderService
+from backend.domain.value_objects.jlpt import JLPTLevel
+from backend.infrastructure.adapters.tts_engine import ENGINES, get_tts_engine
+from backend.infrastructure.adapters.tts_render_pool import TTSRenderPool
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+from backend.infrastructure.config.database import get_database
+
+
+def prerender_audio(
+    level: str = None,
+    engine: str = 'gtts',
+    workers: int = TTSRenderPool.DEFAULT_WORKERS,
+    retries: int = TTSRenderPool.DEFAULT_MAX_RETRIES,
+    backoff: float = TTSRenderPool.DEFAULT_BACKOFF,
+    batch_size: int = AudioPrerenderService.DEFAULT_BATCH_SIZE
+):
+    """오디오가 없는 청해 문제 사전 렌더링
+
+    Args:
+        level: JLPT 레벨 (N1-N5) 또는 None (전체)
+        engine: TTS 엔진 (gtts, stub)
+        workers: 동시에 합성할 스레드 수
+        retries: 실패 시 재시도 횟수
+        backoff: 첫 재시도 전 대기 시간 (초)
+        batch_size: 한 번에 조회/저장할 문제 수
+    """
+    jlpt_level = None
+    if level:
+        try:
+            jlpt_level = JLPTLevel(level.upper())
+        except ValueError:
+            print(f"❌ 잘못된 레벨입니다: {level}")
+            print("사용 가능한 레벨: N1, N2, N3, N4, N5")
+            sys.exit(1)
+
+    pool = TTSRenderPool(
+        engine=get_tts_engine(engine),
+        max_workers=workers,
+        max_retries=retries,
+        backoff=backoff
+    )
+    service = AudioPrerenderService(
+        SqliteQuestionRepository(get_database()),
+        pool=pool,
+        batch_size=batch_size
+    )
+
+    print(f"🔊 청해 오디오 사전 렌더링 ({level or '전체 레벨'}, 엔진: {engine}, 스레드: {workers})")
+
+    def report(batch, summary):
+        print(
+            f"  - {summary['questions']}문제 처리: 저장 {summary['updated']}, "
+            f"렌더링 {summary['rendered']}, 캐시 {summary['cached']}, 실패 {summary['failed']}"
+        )
+        for result in batch['results'].values():
+            if not result.ok:
+                print(f"    ❌ {result.text[:30]}: {result.error}")
+
+    backfill = service.backfill_metadata()
+    if backfill['urls']:
+        print(
+            f"📏 오디오 메타데이터 백필: {backfill['urls']}개 파일, {backfill['updated']}개 문제 갱신"
+            + (f" (파일 없음 {backfill['missing']}개)" if backfill['missing'] else "")
+        )
+
+    summary = service.run(level=jlpt_level, on_batch=report)
+
+    if summary['questions'] == 0:
+        print("✅ 오디오가 없는 청해 문제가 없습니다.")
+        return
+
+    print()
+    print(
+        f"✅ {summary['updated']}/{summary['questions']}개 문제의 오디오를 저장했습니다. "
+        f"({summary['elapsed_seconds']}초)"
+    )
+    if summary['failed']:
+        print(f"⚠️  {summary['failed']}개 텍스트는 렌더링하지 못했습니다. 다시 실행하면 실패한 문제만 재시도합니다.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="청해 오디오 사전 렌더링")
+    parser.add_argument(
+        "--level",
+        type=str,
+        default=None,
+        help="JLPT 레벨 (N1-N5). 생략 시 전체",
+    )
+    parser.add_argument(
+        "--engine",
+        type=str,
+        default='gtts',
+        choices=list(ENGINES),
+        help="TTS 엔진 (기본: gtts, stub은 네트워크 없이 테스트용 파일 생성)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=TTSRenderPool.DEFAULT_WORKERS,
+        help=f"동시에 합성할 스레드 수 (기본: {TTSRenderPool.DEFAULT_WORKERS})",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=TTSRenderPool.DEFAULT_MAX_RETRIES,
+        help=f"실패 시 재시도 횟수 (기본: {TTSRenderPool.DEFAULT_MAX_RETRIES})",
+    )
+    parser.add_argument(
+        "--backoff",
+        type=float,
+        default=TTSRenderPool.DEFAULT_BACKOFF,
+        help=f"첫 재시도 전 대기 시간 (초, 재시도마다 두 배, 기본: {TTSRenderPool.DEFAULT_BACKOFF})",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=AudioPrerenderService.DEFAULT_BATCH_SIZE,
+        help=f"한 번에 조회/저장할 문제 수 (기본: {AudioPrerenderService.DEFAULT_BATCH_SIZE})",
+    )
+    args = parser.parse_args()
+
+    try:
+        prerender_audio(
+            level=args.level,
+            engine=args.engine,
+            workers=args.workers,
+            retries=args.retries,
+            backoff=args.backoff,
+            batch_size=args.batch_size,
+        )
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
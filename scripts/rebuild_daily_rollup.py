@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+사용자 일별 학습 롤업 재구성 스크립트
+학습 이력(시험 + 답안 상세)과 학습 세션으로 user_daily_rollup 테이블을 한 번의 집계 쿼리로 다시 만듭니다.
+원본을 직접 수정한 뒤 롤업을 맞출 때 사용합니다 (비어 있는 롤업은 Database 초기화 시 자동으로 채워짐).
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.infrastructure.repositories.user_daily_rollup_repository import SqliteUserDailyRollupRepository
+from backend.infrastructure.config.database import get_database
+
+
+def rebuild_daily_rollup(user_id: int = None):
+    """일별 학습 롤업 재구성
+
+    Args:
+        user_id: 사용자 ID 또는 None (전체)
+    """
+    repository = SqliteUserDailyRollupRepository(get_database())
+
+    print(f"📊 일별 학습 롤업 재구성 ({f'사용자 {user_id}' if user_id else '전체 사용자'})")
+    started = time.monotonic()
+    result = repository.rebuild(user_id=user_id)
+    elapsed = round(time.monotonic() - started, 2)
+
+    print(f"✅ {result['rows']}개 (사용자, 날짜) 롤업을 재구성했습니다. ({elapsed}초)")
+    print(f"🔥 사용자 {result['streak_users']}명의 연속 학습 일수를 다시 계산했습니다.")
+    print("ℹ️  단어 복습 횟수는 복습별 이력이 없어 기존 값을 유지합니다.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="사용자 일별 학습 롤업 재구성")
+    parser.add_argument(
+        "--user-id",
+        type=int,
+        default=None,
+        help="재구성할 사용자 ID. 생략 시 전체",
+    )
+    args = parser.parse_args()
+
+    try:
+        rebuild_daily_rollup(user_id=args.user_id)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
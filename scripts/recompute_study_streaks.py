@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+연속 학습 일수 재계산 스크립트
+일별 학습 롤업의 활동 날짜로 전체 사용자의 현재/최장 연속 학습 일수를 한 번에 다시 계산합니다.
+매일 자정 이후 실행하면 끊긴 연속 기록이 0으로 바뀌고 과거 날짜 활동도 반영됩니다 (cron 등록용).
+"""
+
+import sys
+import os
+import argparse
+import time
+from datetime import date
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.domain.services.study_streak_service import StudyStreakService
+from backend.infrastructure.repositories.user_streak_repository import SqliteUserStreakRepository
+from backend.infrastructure.config.database import get_database
+
+
+def recompute_study_streaks(today: str = None):
+    """전체 사용자의 연속 학습 일수 재계산
+
+    Args:
+        today: 기준 날짜 (YYYY-MM-DD) 또는 None (오늘)
+    """
+    try:
+        base_date = date.fromisoformat(today) if today else date.today()
+    except ValueError:
+        print(f"❌ 잘못된 날짜입니다: {today} (형식: YYYY-MM-DD)")
+        sys.exit(1)
+
+    service = StudyStreakService(SqliteUserStreakRepository(get_database()))
+
+    print(f"🔥 연속 학습 일수 재계산 (기준일: {base_date.isoformat()})")
+    started = time.monotonic()
+    result = service.recompute_all(today=base_date)
+    elapsed = round(time.monotonic() - started, 2)
+
+    print(
+        f"✅ {result['users']}명의 연속 학습 기록을 재계산했습니다. "
+        f"(연속 학습 중 {result['active_streaks']}명, {elapsed}초)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="연속 학습 일수 재계산")
+    parser.add_argument(
+        "--today",
+        type=str,
+        default=None,
+        help="기준 날짜 (YYYY-MM-DD). 생략 시 오늘",
+    )
+    args = parser.parse_args()
+
+    try:
+        recompute_study_streaks(today=args.today)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+문항 분석 통계 갱신 스크립트
+answer_details로 문제별 정답률, 변별도(점이연 상관), 선택지별 선택 비율, 풀이 시간 중앙값을 계산해
+question_stats에 저장합니다. 기본은 마지막 갱신 이후 새 답안이 생긴 문제만 다시 계산합니다 (cron 등록용).
+"""
+
+import sys
+import os
+import argparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.domain.services.item_analysis_service import ItemAnalysisService
+from backend.infrastructure.repositories.question_stats_repository import SqliteQuestionStatsRepository
+from backend.infrastructure.config.database import get_database
+
+
+def refresh_question_stats(full: bool = False):
+    """문항 분석 통계 갱신
+
+    Args:
+        full: True면 전체 답안으로 다시 계산 (답안 수정/삭제 반영)
+    """
+    service = ItemAnalysisService(SqliteQuestionStatsRepository(get_database()))
+
+    print(f"📊 문항 분석 통계 갱신 ({'전체' if full else '증분'})")
+    result = service.refresh(full=full)
+
+    print(
+        f"✅ 문제 {result['questions']}개의 통계를 갱신했습니다. "
+        f"(답안 {result['answers']}건, 마지막 답안 ID {result['last_answer_id']}, {result['elapsed_seconds']}초)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="문항 분석 통계 갱신")
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="전체 답안으로 다시 계산 (기본: 새 답안이 생긴 문제만)",
+    )
+    args = parser.parse_args()
+
+    try:
+        refresh_question_stats(full=args.full)
+    except Exception as e:
+        print(f"❌ 오류 발생: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+임포트 작업 워커 스크립트
+대기 중인 임포트 작업을 실행하고, 중단된 작업을 마지막 체크포인트부터 재개합니다.
+"""
+
+import sys
+import os
+import time
+import argparse
+
+# 프로젝트 루트를 Python 경로에 추가
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from backend.infrastructure.adapters.import_job_runner import ImportJobRunner
+from backend.infrastructure.adapters.streaming_importer import StreamingImporter
+from backend.infrastructure.config.database import get_database
+
+
+def run_worker(
+    once: bool = False,
+    interval: float = 5.0,
+    batch_size: int = StreamingImporter.DEFAULT_BATCH_SIZE
+):
+    """임포트 작업 워커 실행
+
+    Args:
+        once: True이면 현재 대기 중인 작업만 처리하고 종료
+        interval: 작업 확인 주기 (초)
+        batch_size: 트랜잭션(체크포인트)당 처리 건수
+    """
+    runner = ImportJobRunner(get_database(), batch_size=batch_size)
+
+    print(f"🔄 임포트 작업 워커 시작 (배치 크기: {batch_size})")
+    while True:
+        for job in runner.run_pending():
+            print(
+                f"  - 작업 {job.id} ({job.job_type.value}): {job.status.value}, "
+                f"처리 {job.rows_processed}행, 저장 {job.rows_imported}, "
+                f"중복 {job.rows_duplicates}, 거부 {job.rows_rejected}, "
+                f"{job.throughput}행/초"
+            )
+            if job.error_message:
+                print(f"    ❌ {job.error_message}")
+
+        if once:
+            break
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="임포트 작업 워커")
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="대기 중인 작업만 처리하고 종료",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=5.0,
+        help="작업 확인 주기 (초, 기본값: 5)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=StreamingImporter.DEFAULT_BATCH_SIZE,
+        help=f"트랜잭션당 처리 건수 (기본값: {StreamingImporter.DEFAULT_BATCH_SIZE})",
+    )
+    args = parser.parse_args()
+
+    try:
+        run_worker(once=args.once, interval=args.interval, batch_size=args.batch_size)
+    except KeyboardInterrupt:
+        print("\n워커를 종료합니다. 진행 중이던 작업은 다음 실행에서 체크포인트부터 재개됩니다.")
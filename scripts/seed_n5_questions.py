@@ -315,11 +315,14 @@ def seed_database(ensure_minimum: int = 20, force: bool = False, interactive: bo
     
     # 데이터베이스에 저장
     print(f"{len(questions)}개의 N5 샘플 문제를 추가합니다... (최소 보장: {ensure_minimum}개)")
+    # 이미 있는 샘플 문제는 새로 만들지 않고 갱신 (콘텐츠 해시 업서트)
+    inserted = repo.save_all(questions)
     for i, question in enumerate(questions, 1):
-        saved_question = repo.save(question)
-        print(f"[{i}/{len(questions)}] 문제 추가 완료: {saved_question.question_text[:30]}...")
+        print(f"[{i}/{len(questions)}] 문제 저장 완료: {question.question_text[:30]}...")
     
-    print(f"\n✅ 총 {len(questions)}개의 N5 샘플 문제가 추가되었습니다.")
+    print(f"\n✅ 총 {inserted}개의 N5 샘플 문제가 추가되었습니다.")
+    if inserted < len(questions):
+        print(f"   이미 존재하는 문제 {len(questions) - inserted}개는 갱신했습니다.")
     
     # 유형별 통계
     type_counts = {}
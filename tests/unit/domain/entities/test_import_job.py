@@ -0,0 +1,127 @@
+"""
+ImportJob 도메인 엔티티 테스트
+"""
+
+import pytest
+from datetime import datetime, timedelta
+from backend.domain.entities.import_job import ImportJob
+from backend.domain.value_objects.jlpt import ImportJobStatus, ImportJobType
+
+
+def _job(**overrides):
+    """테스트용 ImportJob 생성"""
+    values = dict(
+        id=1,
+        job_type=ImportJobType.QUESTIONS,
+        file_path="/tmp/questions.json",
+        file_type="json"
+    )
+    values.update(overrides)
+    return ImportJob(**values)
+
+
+class TestImportJob:
+    """ImportJob 엔티티 테스트"""
+
+    def test_import_job_creation_defaults(self):
+        """기본값으로 ImportJob 생성 테스트"""
+        job = _job(id=None)
+
+        assert job.id is None
+        assert job.status == ImportJobStatus.PENDING
+        assert job.rows_processed == 0
+        assert job.errors == []
+        assert job.attempts == 0
+        assert isinstance(job.created_at, datetime)
+        assert job.started_at is None
+        assert not job.is_finished
+
+    @pytest.mark.parametrize("overrides", [
+        {"id": 0},
+        {"file_path": ""},
+        {"file_type": "xml"},
+    ])
+    def test_import_job_invalid_values(self, overrides):
+        """잘못된 값으로 생성 시 ValueError"""
+        with pytest.raises(ValueError):
+            _job(**overrides)
+
+    def test_start_and_resume(self):
+        """시작 시 시도 횟수 증가, 재개 시 최초 시작 일시 유지"""
+        job = _job()
+        first = datetime(2024, 1, 1, 10, 0)
+        second = first + timedelta(minutes=10)
+
+        job.start(first)
+        job.start(second)
+
+        assert job.status == ImportJobStatus.RUNNING
+        assert job.attempts == 2
+        assert job.started_at == first
+        assert job.heartbeat_at == second
+
+    def test_is_stale(self):
+        """진행 기록이 timeout보다 오래된 진행 중 작업만 중단된 것으로 판정"""
+        now = datetime(2024, 1, 1, 10, 0)
+        timeout = timedelta(minutes=5)
+        job = _job()
+
+        assert not job.is_stale(now, timeout)  # 대기 중
+
+        job.start(now - timedelta(minutes=10))
+        assert job.is_stale(now, timeout)
+
+        job.record_progress(10, 10, 0, 0, [], 1.0, now=now - timedelta(minutes=1))
+        assert not job.is_stale(now, timeout)
+
+    def test_record_progress_and_throughput(self):
+        """체크포인트 기록 및 처리량 계산"""
+        job = _job()
+        assert job.throughput == 0.0
+
+        job.record_progress(
+            rows_processed=500, rows_imported=400, rows_duplicates=90, rows_rejected=10,
+            errors=[{"row": 3, "error": "잘못된 레벨"}], elapsed_seconds=2.0
+        )
+
+        assert job.rows_processed == 500
+        assert job.rows_imported == 400
+        assert job.rows_duplicates == 90
+        assert job.rows_rejected == 10
+        assert job.errors == [{"row": 3, "error": "잘못된 레벨"}]
+        assert job.throughput == 250.0
+
+    def test_release_keeps_checkpoint(self):
+        """중단 후 대기 상태로 돌려도 체크포인트 유지"""
+        job = _job()
+        job.start()
+        job.record_progress(100, 100, 0, 0, [], 1.0)
+
+        job.release()
+
+        assert job.status == ImportJobStatus.PENDING
+        assert job.rows_processed == 100
+        assert not job.is_finished
+
+    def test_complete_and_fail(self):
+        """완료/실패 처리 후에는 다시 시작할 수 없음"""
+        completed = _job()
+        completed.start()
+        completed.complete()
+        assert completed.status == ImportJobStatus.COMPLETED
+        assert completed.finished_at is not None
+        assert completed.is_finished
+
+        failed = _job(id=2)
+        failed.start()
+        failed.fail("JSON 배열이 아닙니다")
+        assert failed.status == ImportJobStatus.FAILED
+        assert failed.error_message == "JSON 배열이 아닙니다"
+
+        with pytest.raises(ValueError):
+            failed.start()
+
+    def test_equality_by_id(self):
+        """ID 기반 동등성"""
+        assert _job() == _job(file_path="/tmp/other.json")
+        assert _job() != _job(id=2)
@@ -168,6 +168,51 @@ class TestUserPerformance:
         assert user_performance.level_progression == {"N5": {"avg_score": 90.0, "test_count": 6}}
         assert user_performance.updated_at > original_updated_at
 
+    def test_record_level_score_keeps_summary(self):
+        """시험 점수는 레벨별 시험 수/평균 점수 요약으로만 반영되어 크기가 늘지 않음"""
+        # Given
+        user_performance = UserPerformance(
+            id=1,
+            user_id=1,
+            analysis_period_start=date(2025, 1, 1),
+            analysis_period_end=date(2025, 1, 31)
+        )
+
+        # When
+        for score in (80.0, 90.0, 100.0):
+            user_performance.record_level_score("N5", score)
+        user_performance.record_level_score("N4", 55.5)
+
+        # Then
+        assert user_performance.record_level_score("N5", 90.0) == {}
+        assert user_performance.level_progression == {
+            "N5": {"tests": 4, "average_score": 90.0},
+            "N4": {"tests": 1, "average_score": 55.5}
+        }
+
+    def test_compact_legacy_level_progression(self):
+        """예전 형식의 점수 목록은 요약으로 바뀌고 원래 목록을 반환"""
+        # Given
+        legacy_scores = [{"date": "2025-01-01", "score": 60.0}, {"date": "2025-01-02", "score": 70.0}]
+        user_performance = UserPerformance(
+            id=1,
+            user_id=1,
+            analysis_period_start=date(2025, 1, 1),
+            analysis_period_end=date(2025, 1, 31),
+            level_progression={"N5": list(legacy_scores), "N4": {"tests": 2, "average_score": 50.0}}
+        )
+
+        # When
+        legacy = user_performance.record_level_score("N5", 80.0)
+
+        # Then
+        assert legacy == {"N5": legacy_scores}
+        assert user_performance.level_progression == {
+            "N5": {"tests": 3, "average_score": 70.0},
+            "N4": {"tests": 2, "average_score": 50.0}
+        }
+        assert user_performance.compact_level_progression() == {}
+
     def test_equality_by_id(self):
         """ID 기반 동등성 비교 테스트"""
         # Given
@@ -0,0 +1,181 @@
+"""
+AdaptiveTestService 테스트
+정보량 최대 문제 선택, EAP 능력치 추정, 세션 진행과 종료 조건 검증
+"""
+
+import pytest
+import numpy as np
+from backend.domain.entities.question import Question
+from backend.domain.services.adaptive_test_service import AdaptiveItemPool, AdaptiveTestService
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.adaptive_test_repository import (
+    SqliteAdaptiveTestRepository,
+    StaleAdaptiveSessionError,
+)
+from backend.infrastructure.repositories.irt_parameter_repository import SqliteIrtParameterRepository
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+
+
+class TestAdaptiveItemPool:
+    """AdaptiveItemPool 테스트"""
+
+    def test_select_maximum_information(self):
+        """2PL 문제 은행은 theta에서 a²P(1-P)가 가장 큰 미출제 문제를 선택"""
+        pool = AdaptiveItemPool(
+            np.array([10, 11, 12, 13]), np.array([0.5, 2.0, 1.0, 1.5]), np.array([0.0, 1.0, 0.1, -2.0])
+        )
+        none = pool.administered_mask([])
+
+        p = pool.probabilities(0.2)
+        expected = int(np.argmax(pool.information_scale * p * (1 - p)))
+        assert pool.select(0.2, none) == expected
+        assert pool.question_ids[pool.select(1.0, none)] == 11
+        assert pool.question_ids[pool.select(1.0, pool.administered_mask([11]))] != 11
+
+    def test_select_nearest_difficulty_when_discrimination_is_uniform(self):
+        """변별도가 모두 같으면 난이도가 theta에 가장 가까운 미출제 문제"""
+        pool = AdaptiveItemPool(np.array([1, 2, 3, 4]), np.ones(4), np.array([1.5, -1.0, 0.2, 0.4]))
+
+        assert pool.uniform_discrimination
+        assert pool.difficulty.tolist() == [-1.0, 0.2, 0.4, 1.5]
+        assert pool.question_ids[pool.select(0.35, pool.administered_mask([]))] == 4
+        assert pool.question_ids[pool.select(0.35, pool.administered_mask([4, 3]))] == 1
+        assert pool.select(0.0, pool.administered_mask([1, 2, 3, 4])) is None
+
+
+class TestAdaptiveTestService:
+    """AdaptiveTestService 테스트"""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        """N5 문제 40개 (절반은 보정됨)가 있는 데이터베이스"""
+        db = Database(db_path=str(tmp_path / "test.db"))
+        question_repo = SqliteQuestionRepository(db=db)
+        for i in range(40):
+            question_repo.save(Question(
+                id=0, level=JLPTLevel.N5, question_type=QuestionType.VOCABULARY,
+                question_text=f"問題{i}", choices=["はい", "いいえ"], correct_answer="はい",
+                explanation="해설", difficulty=i % 5 + 1
+            ))
+        SqliteIrtParameterRepository(db=db).save_calibration(
+            '2pl', [(i, 1.0 + (i % 3) * 0.3, (i - 10) / 5, 0.2, 50) for i in range(1, 21)], []
+        )
+        return db
+
+    @pytest.fixture
+    def service(self, db):
+        """AdaptiveTestService 인스턴스 생성 (문제 은행 캐시 초기화)"""
+        AdaptiveTestService.invalidate()
+        yield AdaptiveTestService(SqliteIrtParameterRepository(db=db), SqliteAdaptiveTestRepository(db=db))
+        AdaptiveTestService.invalidate()
+
+    def test_estimate_ability(self):
+        """정답이 많을수록 높게, 응답이 많을수록 표준오차가 작게 추정 (모두 정답이어도 유한)"""
+        a = np.ones(10)
+        b = np.zeros(10)
+
+        high, high_se = AdaptiveTestService.estimate_ability(a, b, np.ones(10))
+        low, _ = AdaptiveTestService.estimate_ability(a, b, np.zeros(10))
+        mid, mid_se = AdaptiveTestService.estimate_ability(a, b, np.array([1.0, 0.0] * 5))
+        _, short_se = AdaptiveTestService.estimate_ability(a[:2], b[:2], np.array([1.0, 0.0]))
+
+        assert low < mid < high < 4.0
+        assert abs(mid) < 1e-9
+        assert mid_se < short_se < 1.0
+        assert np.isfinite(high_se)
+
+    def test_pool_includes_uncalibrated_questions(self, service):
+        """보정되지 않은 문제는 a = 1, b = 난이도 - 3으로 포함"""
+        pool = service.get_pool('N5')
+
+        assert len(pool) == 40
+        position = pool.positions[40]
+        assert (pool.discrimination[position], pool.difficulty[position]) == (1.0, 2.0)
+        assert service.get_pool('N5') is pool
+
+    def test_pool_cache_is_per_database_and_invalidated_on_question_writes(self, db, service, tmp_path):
+        """문제 은행은 데이터베이스별로 캐시하고, 문제를 추가/수정/삭제하면 다시 만듦"""
+        pool = service.get_pool('N5')
+        other_db = Database(db_path=str(tmp_path / "other.db"))
+        other = AdaptiveTestService(SqliteIrtParameterRepository(db=other_db), SqliteAdaptiveTestRepository(db=other_db))
+        assert len(other.get_pool('N5')) == 0
+        assert service.get_pool('N5') is pool
+
+        question_repo = SqliteQuestionRepository(db=db)
+        question = question_repo.save(Question(
+            id=0, level=JLPTLevel.N5, question_type=QuestionType.VOCABULARY,
+            question_text="新しい問題", choices=["はい", "いいえ"], correct_answer="はい",
+            explanation="해설", difficulty=5
+        ))
+        pool = service.get_pool('N5')
+        assert len(pool) == 41 and question.id in pool.positions
+
+        question.difficulty = 1
+        question_repo.save(question)
+        pool = service.get_pool('N5')
+        assert pool.difficulty[pool.positions[question.id]] == -2.0
+
+        question_repo.delete(question)
+        assert question.id not in service.get_pool('N5').positions
+
+    def test_start_uses_calibrated_ability(self, db, service):
+        """보정된 능력치가 있으면 그 값에서 첫 문제를 선택"""
+        SqliteIrtParameterRepository(db=db).save_calibration('2pl', [], [(1, 1.8, 0.3, 40)])
+
+        session = service.start(1, 'N5')
+
+        assert session['theta'] == 1.8
+        pool = service.get_pool('N5')
+        assert session['current_question_id'] == pool.question_ids[pool.select(1.8, pool.administered_mask([]))]
+
+    def test_session_runs_until_max_questions(self, service):
+        """응답마다 다음 문제를 새로 고르고 최대 문제 수에서 완료"""
+        session = service.start(1, 'N5', max_questions=6, target_se=0.01)
+        seen = []
+        while session['status'] == 'in_progress':
+            seen.append(session['current_question_id'])
+            session = service.answer(session, session['current_question_id'], 'はい', True)
+
+        assert len(seen) == len(set(seen)) == 6
+        assert session['current_question_id'] is None
+        assert session['theta'] > 0
+        assert 0 < session['estimated_score'] <= 100
+        assert session['recommended_level'] in {'N5', 'N4'}
+        assert session['completed_at'] is not None
+
+    def test_session_stops_at_target_se(self, service):
+        """최소 문제 수 이후 표준오차가 목표 이하면 종료"""
+        session = service.start(1, 'N5', max_questions=50, target_se=0.99)
+        for _ in range(AdaptiveTestService.MIN_QUESTIONS):
+            session = service.answer(session, session['current_question_id'], 'いいえ', False)
+
+        assert session['status'] == 'completed'
+        assert len(session['responses']) == AdaptiveTestService.MIN_QUESTIONS
+
+    def test_concurrent_answers_to_same_question(self, service):
+        """같은 세션 스냅샷으로 같은 문제에 두 번 답하면 두 번째는 반영되지 않고 StaleAdaptiveSessionError"""
+        session = service.start(1, 'N5')
+        question_id = session['current_question_id']
+
+        first = service.answer(session, question_id, 'はい', True)
+        with pytest.raises(StaleAdaptiveSessionError):
+            service.answer(session, question_id, 'いいえ', False)
+
+        assert service.adaptive_test_repo.find_by_id(session['id']) == first
+        assert len(first['responses']) == 1
+
+    def test_invalid_arguments(self, service):
+        """범위를 벗어난 인자, 현재 문제가 아닌 응답, 완료된 세션 응답은 ValueError"""
+        with pytest.raises(ValueError):
+            service.start(1, 'N5', max_questions=2)
+        with pytest.raises(ValueError):
+            service.start(1, 'N5', target_se=0)
+        with pytest.raises(ValueError):
+            service.start(1, 'N1')
+
+        session = service.start(1, 'N5', max_questions=5)
+        with pytest.raises(ValueError):
+            service.answer(session, session['current_question_id'] + 1, 'はい', True)
+        with pytest.raises(ValueError):
+            service.answer(dict(session, status='completed'), session['current_question_id'], 'はい', True)
@@ -0,0 +1,140 @@
+"""
+AudioPrerenderService 테스트
+"""
+
+import hashlib
+import os
+import tempfile
+import pytest
+from backend.domain.entities.question import Question
+from backend.domain.services.audio_prerender_service import AudioPrerenderService
+from backend.domain.services.tts_service import TTSService
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.adapters.tts_engine import StubTTSEngine
+from backend.infrastructure.adapters.tts_render_pool import TTSRenderPool
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+
+
+class FailingEngine(StubTTSEngine):
+    """특정 텍스트는 항상 실패하는 엔진"""
+
+    def synthesize(self, text, language='ja', slow=False):
+        if "失敗" in text:
+            raise ConnectionError("network down")
+        return super().synthesize(text, language, slow)
+
+
+class TestAudioPrerenderService:
+    """AudioPrerenderService 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def repo(self, temp_db):
+        """오디오가 없는 청해 문제 5개(대화문 3종)와 어휘 문제 1개가 저장된 Repository"""
+        repo = SqliteQuestionRepository(Database(db_path=temp_db))
+        dialogues = ["A: おはよう。\nB: おはよう。", "A: 失敗です。", "A: さようなら。"]
+        questions = [
+            Question(
+                id=0,
+                level=JLPTLevel.N5 if i < 4 else JLPTLevel.N4,
+                question_type=QuestionType.LISTENING,
+                question_text=f"（会話）\n{dialogues[i % 3]}\n\n質問{i}",
+                choices=["A", "B", "C", "D"],
+                correct_answer="A",
+                explanation="説明",
+                difficulty=1
+            )
+            for i in range(5)
+        ]
+        questions.append(Question(
+            id=0,
+            level=JLPTLevel.N5,
+            question_type=QuestionType.VOCABULARY,
+            question_text="「水」の意味は何ですか？",
+            choices=["물", "불", "나무", "돌"],
+            correct_answer="물",
+            explanation="説明",
+            difficulty=1
+        ))
+        repo.save_all(questions)
+        return repo
+
+    def test_listening_audio_text_uses_dialogue(self):
+        """저장된 문제 텍스트에서 질문과 화자 표시를 제외한 대화문만 사용"""
+        text = TTSService.listening_audio_text("（会話）\nA: おはよう。\nB: はい。\n\n何と言いましたか？")
+
+        assert text == "おはよう。 はい。"
+
+    def test_run_renders_missing_audio(self, repo, tmp_path):
+        """오디오가 없는 청해 문제만 렌더링하고 같은 대화문은 한 번만 합성"""
+        engine = StubTTSEngine()
+        pool = TTSRenderPool(engine=engine, output_dir=tmp_path, max_workers=2)
+        service = AudioPrerenderService(repo, pool=pool, batch_size=2)
+
+        summary = service.run()
+
+        assert summary['questions'] == 5
+        assert summary['updated'] == 5
+        assert summary['failed'] == 0
+        assert len(engine.calls) == 3
+        listening = repo.find_by_type(QuestionType.LISTENING)
+        assert all(q.audio_url.startswith("/static/audio/tts/") for q in listening)
+        assert repo.find_by_type(QuestionType.VOCABULARY)[0].audio_url is None
+        assert repo.find_missing_audio() == []
+
+        # 렌더링 결과의 메타데이터(크기, ETag)를 함께 저장
+        for question in listening:
+            data = (tmp_path / question.audio_url.split("/")[-1]).read_bytes()
+            assert question.audio_size_bytes == len(data)
+            assert question.audio_etag == hashlib.sha256(data).hexdigest()
+            assert question.audio_duration_ms is None  # 스텁 엔진 출력은 MP3가 아님
+
+    def test_backfill_metadata(self, repo, tmp_path, monkeypatch):
+        """audio_url은 있지만 메타데이터가 없는 문제는 URL마다 파일을 한 번 읽어 채움"""
+        monkeypatch.setattr(
+            "backend.infrastructure.adapters.audio_metadata.STATIC_DIR", tmp_path
+        )
+        (tmp_path / "audio").mkdir()
+        (tmp_path / "audio" / "shared.mp3").write_bytes(b"audio")
+        listening = repo.find_by_type(QuestionType.LISTENING)
+        repo.update_audio_urls({
+            listening[0].id: "/static/audio/shared.mp3",
+            listening[1].id: "/static/audio/shared.mp3",
+            listening[2].id: "/static/audio/missing.mp3",
+        })
+
+        summary = AudioPrerenderService(repo, batch_size=1).backfill_metadata()
+
+        assert summary == {'urls': 2, 'updated': 2, 'missing': 1}
+        found = repo.find_by_id(listening[1].id)
+        assert (found.audio_size_bytes, found.audio_etag) == (5, hashlib.sha256(b"audio").hexdigest())
+        assert repo.find_audio_urls_missing_metadata() == ["/static/audio/missing.mp3"]
+
+    def test_run_leaves_failed_questions_for_retry(self, repo, tmp_path):
+        """렌더링에 실패한 문제는 audio_url 없이 남아 다음 실행에서 다시 시도"""
+        pool = TTSRenderPool(
+            engine=FailingEngine(), output_dir=tmp_path, max_retries=1, sleep=lambda _: None
+        )
+        service = AudioPrerenderService(repo, pool=pool)
+
+        summary = service.run(level=JLPTLevel.N5)
+
+        assert summary['questions'] == 4
+        assert summary['updated'] == 3
+        assert summary['failed'] == 1
+        missing = repo.find_missing_audio()
+        assert [q.level for q in missing] == [JLPTLevel.N5, JLPTLevel.N4]
+        assert "失敗" in missing[0].question_text
+
+        retry = AudioPrerenderService(repo, pool=TTSRenderPool(engine=StubTTSEngine(), output_dir=tmp_path))
+        assert retry.run()['updated'] == 2
+        assert repo.find_missing_audio() == []
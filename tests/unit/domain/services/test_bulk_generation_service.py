@@ -0,0 +1,113 @@
+"""
+BulkQuestionGenerationService / BulkVocabularyGenerationService 테스트
+"""
+
+import os
+import tempfile
+import pytest
+from unittest.mock import patch
+from backend.domain.services.bulk_generation_service import (
+    BulkQuestionGenerationService,
+    BulkVocabularyGenerationService,
+)
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+
+
+class TestBulkQuestionGenerationService:
+    """BulkQuestionGenerationService 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def repo(self, temp_db):
+        """Question Repository"""
+        return SqliteQuestionRepository(Database(db_path=temp_db))
+
+    def test_generate_saves_requested_count_in_chunks(self, repo):
+        """요청한 수만큼 새 문제를 청크 단위로 저장"""
+        service = BulkQuestionGenerationService(repo, chunk_size=50)
+        chunks = []
+
+        summary = service.generate(
+            JLPTLevel.N5, QuestionType.VOCABULARY, count=120,
+            on_chunk=lambda chunk, s: chunks.append(len(chunk['questions']))
+        )
+
+        assert summary['imported'] == 120
+        assert summary['by_type'] == {'vocabulary': 120}
+        assert summary['exhausted'] is False
+        assert all(size <= 50 for size in chunks)
+        assert len(repo.find_all()) == 120
+
+    def test_generate_all_types_without_audio(self, repo):
+        """유형 미지정 시 모든 유형을 생성하고 청해 TTS는 호출하지 않음"""
+        service = BulkQuestionGenerationService(repo, chunk_size=40)
+
+        with patch('backend.domain.services.tts_service.TTSService.generate_audio') as mock_tts:
+            summary = service.generate(JLPTLevel.N5, None, count=40)
+
+        mock_tts.assert_not_called()
+        assert summary['imported'] == 40
+        assert set(summary['by_type']) == {'vocabulary', 'grammar', 'reading', 'listening'}
+
+    def test_exhausted_pool_stops_with_partial_count(self, repo):
+        """샘플 조합을 소진하면 요청한 수를 채우지 못하고 종료"""
+        service = BulkQuestionGenerationService(repo, chunk_size=20)
+
+        summary = service.generate(JLPTLevel.N5, QuestionType.READING, count=1000)
+
+        assert summary['exhausted'] is True
+        assert summary['imported'] == len(repo.find_all())
+        assert summary['imported'] < 1000
+        assert summary['duplicates'] > 0
+
+    def test_regenerating_does_not_duplicate_existing_content(self, repo):
+        """기존 문제와 같은 내용은 새 행을 만들지 않음"""
+        service = BulkQuestionGenerationService(repo, chunk_size=100)
+        first = service.generate(JLPTLevel.N5, QuestionType.LISTENING, count=1000)
+        second = service.generate(JLPTLevel.N5, QuestionType.LISTENING, count=1000)
+
+        assert first['imported'] > 0
+        assert second['imported'] == 0
+        assert len(repo.find_all()) == first['imported']
+
+    def test_invalid_chunk_size(self, repo):
+        """chunk_size는 1 이상"""
+        with pytest.raises(ValueError):
+            BulkQuestionGenerationService(repo, chunk_size=0)
+
+
+class TestBulkVocabularyGenerationService:
+    """BulkVocabularyGenerationService 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    def test_generate_and_regenerate(self, temp_db):
+        """청크 단위 저장 및 재생성 시 중복 집계"""
+        repo = SqliteVocabularyRepository(Database(db_path=temp_db))
+        service = BulkVocabularyGenerationService(repo, chunk_size=7)
+
+        first = service.generate(JLPTLevel.N5, count=20)
+        second = service.generate(JLPTLevel.N5, count=20)
+
+        assert (first['imported'], first['duplicates']) == (20, 0)
+        assert (second['imported'], second['duplicates']) == (0, 20)
+        assert second['exhausted'] is True
+        assert len(repo.find_all()) == 20
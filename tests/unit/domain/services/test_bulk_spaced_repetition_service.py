@@ -0,0 +1,191 @@
+"""
+벡터화된 SRS 서비스 테스트
+스칼라 SpacedRepetitionService와 결과가 정확히 일치하는지 검증
+"""
+
+import copy
+import pytest
+import numpy as np
+from datetime import date, timedelta
+from backend.domain.entities.user_vocabulary import UserVocabulary
+from backend.domain.services.bulk_spaced_repetition_service import BulkSpacedRepetitionService
+from backend.domain.services.spaced_repetition_service import SpacedRepetitionService
+from backend.domain.value_objects.jlpt import MemorizationStatus
+
+
+def _random_user_vocabs(rng, count):
+    """무작위 SRS 상태를 가진 UserVocabulary 목록 생성"""
+    statuses = list(MemorizationStatus)
+    return [
+        UserVocabulary(
+            id=i + 1,
+            user_id=1,
+            vocabulary_id=i + 1,
+            memorization_status=statuses[rng.integers(len(statuses))],
+            interval_days=int(rng.choice([0, rng.integers(1, 400)])),
+            ease_factor=float(rng.choice([2.5, 1.3, rng.uniform(1.0, 3.0)])),
+            review_count=int(rng.integers(0, 50)),
+            consecutive_correct=int(rng.integers(0, 5)),
+            consecutive_incorrect=int(rng.integers(0, 5))
+        )
+        for i in range(count)
+    ]
+
+
+class TestBulkSpacedRepetitionService:
+    """BulkSpacedRepetitionService 단위 테스트"""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_scalar_service(self, seed):
+        """무작위 상태/난이도에서 스칼라 서비스와 결과가 정확히 일치하는지 검증 (property test)"""
+        # Given
+        rng = np.random.default_rng(seed)
+        today = date(2025, 1, 1) + timedelta(days=int(rng.integers(0, 365)))
+        user_vocabs = _random_user_vocabs(rng, 200)
+        difficulties = list(rng.choice(["easy", "normal", "hard"], size=len(user_vocabs)))
+        scalar = SpacedRepetitionService()
+
+        # When
+        expected = [
+            scalar.calculate_next_review(copy.copy(uv), d, today=today)
+            for uv, d in zip(user_vocabs, difficulties)
+        ]
+        actual = BulkSpacedRepetitionService().apply(user_vocabs, difficulties, today=today)
+
+        # Then
+        for e, a in zip(expected, actual):
+            assert a.interval_days == e.interval_days
+            assert a.ease_factor == e.ease_factor
+            assert a.review_count == e.review_count
+            assert a.consecutive_correct == e.consecutive_correct
+            assert a.consecutive_incorrect == e.consecutive_incorrect
+            assert a.memorization_status == e.memorization_status
+            assert a.next_review_date == e.next_review_date
+            assert a.last_review_date == e.last_review_date
+
+    def test_matches_scalar_service_over_review_sequences(self):
+        """여러 번 연속 복습한 결과도 스칼라 서비스와 일치하는지 검증"""
+        # Given
+        rng = np.random.default_rng(42)
+        scalar = SpacedRepetitionService()
+        bulk = BulkSpacedRepetitionService()
+        expected = _random_user_vocabs(rng, 100)
+        actual = [copy.copy(uv) for uv in expected]
+
+        # When
+        for step in range(15):
+            today = date(2025, 1, 1) + timedelta(days=step)
+            difficulties = list(rng.choice(["easy", "normal", "hard"], size=len(expected)))
+            for uv, d in zip(expected, difficulties):
+                scalar.calculate_next_review(uv, d, today=today)
+            bulk.apply(actual, difficulties, today=today)
+
+        # Then
+        assert [uv.interval_days for uv in actual] == [uv.interval_days for uv in expected]
+        assert [uv.ease_factor for uv in actual] == [uv.ease_factor for uv in expected]
+        assert [uv.next_review_date for uv in actual] == [uv.next_review_date for uv in expected]
+
+    def test_calculate_next_review_arrays(self):
+        """배열 입력으로 다음 간격과 날짜 계산"""
+        # Given
+        bulk = BulkSpacedRepetitionService()
+        difficulties = bulk.encode_difficulties(["easy", "normal", "hard", "normal"])
+
+        # When
+        result = bulk.calculate_next_review(
+            interval_days=np.array([10, 10, 10, 0]),
+            ease_factor=np.array([2.0, 2.0, 2.0, 2.5]),
+            consecutive_correct=np.array([0, 2, 3, 0]),
+            consecutive_incorrect=np.array([1, 0, 1, 0]),
+            difficulties=difficulties,
+            today=date(2025, 1, 1)
+        )
+
+        # Then
+        assert result['interval_days'].tolist() == [27, 20, 12, 1]
+        assert result['ease_factor'].tolist() == pytest.approx([2.15, 2.0, 1.8, 2.5])
+        assert result['consecutive_correct'].tolist() == [1, 3, 0, 1]
+        assert result['consecutive_incorrect'].tolist() == [0, 0, 2, 0]
+        assert result['next_review_date'].tolist() == [
+            date(2025, 1, 28), date(2025, 1, 21), date(2025, 1, 13), date(2025, 1, 2)
+        ]
+
+    def test_calculate_next_review_does_not_mutate_inputs(self):
+        """입력 배열이 변경되지 않는지 검증"""
+        bulk = BulkSpacedRepetitionService()
+        ease = np.array([2.0, 2.0])
+
+        bulk.calculate_next_review(
+            interval_days=np.array([5, 5]),
+            ease_factor=ease,
+            consecutive_correct=np.array([0, 0]),
+            consecutive_incorrect=np.array([0, 0]),
+            difficulties=bulk.encode_difficulties(["easy", "hard"]),
+            today=date(2025, 1, 1)
+        )
+
+        assert ease.tolist() == [2.0, 2.0]
+
+    def test_retuned_constants(self):
+        """SpacedRepetitionService 상수를 재조정하면 벡터화 결과에도 반영되는지 검증"""
+        # Given
+        tuned = SpacedRepetitionService()
+        tuned.EASE_FACTOR_INCREASE = 0.05
+        tuned.MAX_INTERVAL = 30
+        user_vocabs = [
+            UserVocabulary(id=1, user_id=1, vocabulary_id=1, interval_days=100, ease_factor=2.0)
+        ]
+
+        # When
+        expected = tuned.calculate_next_review(copy.copy(user_vocabs[0]), "easy", today=date(2025, 1, 1))
+        actual = BulkSpacedRepetitionService(tuned).apply(user_vocabs, ["easy"], today=date(2025, 1, 1))
+
+        # Then
+        assert actual[0].interval_days == expected.interval_days == 30
+        assert actual[0].ease_factor == expected.ease_factor
+
+    def test_encode_difficulties_invalid(self):
+        """알 수 없는 난이도는 ValueError 발생"""
+        with pytest.raises(ValueError):
+            BulkSpacedRepetitionService.encode_difficulties(["easy", "impossible"])
+
+    def test_calculate_next_review_invalid_codes(self):
+        """EASY/NORMAL/HARD가 아닌 난이도 코드는 보통으로 처리하지 않고 ValueError 발생"""
+        bulk = BulkSpacedRepetitionService()
+
+        with pytest.raises(ValueError):
+            bulk.calculate_next_review(
+                interval_days=np.array([5, 5]),
+                ease_factor=np.array([2.0, 2.0]),
+                consecutive_correct=np.array([0, 0]),
+                consecutive_incorrect=np.array([0, 0]),
+                difficulties=np.array([BulkSpacedRepetitionService.EASY, 7]),
+                today=date(2025, 1, 1)
+            )
+
+    @pytest.mark.parametrize("difficulty", ["easy", "normal", "hard"])
+    def test_difficulty_code_parity_with_scalar_service(self, difficulty):
+        """난이도 코드별 배열 결과가 같은 문자열을 받은 스칼라 서비스 결과와 일치"""
+        # Given
+        rng = np.random.default_rng(0)
+        user_vocabs = _random_user_vocabs(rng, 50)
+        arrays = BulkSpacedRepetitionService.to_arrays(user_vocabs)
+        today = date(2025, 1, 1)
+        scalar = SpacedRepetitionService()
+
+        # When
+        result = BulkSpacedRepetitionService().calculate_next_review(
+            arrays['interval_days'], arrays['ease_factor'],
+            arrays['consecutive_correct'], arrays['consecutive_incorrect'],
+            np.full(len(user_vocabs), BulkSpacedRepetitionService.DIFFICULTY_CODES[difficulty]),
+            today=today, review_count=arrays['review_count'], status=arrays['status']
+        )
+        expected = [scalar.calculate_next_review(copy.copy(uv), difficulty, today=today) for uv in user_vocabs]
+
+        # Then
+        assert result['interval_days'].tolist() == [uv.interval_days for uv in expected]
+        assert result['ease_factor'].tolist() == [uv.ease_factor for uv in expected]
+        assert result['next_review_date'].tolist() == [uv.next_review_date for uv in expected]
+        assert [BulkSpacedRepetitionService.STATUSES[code] for code in result['status']] == [
+            uv.memorization_status for uv in expected
+        ]
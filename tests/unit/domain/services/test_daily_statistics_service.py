@@ -8,6 +8,7 @@ from backend.domain.entities.daily_goal import DailyGoal
 from backend.domain.services.daily_statistics_service import DailyStatisticsService
 from backend.infrastructure.repositories.learning_history_repository import SqliteLearningHistoryRepository
 from backend.infrastructure.repositories.learning_history_mapper import LearningHistoryMapper
+from backend.infrastructure.repositories.user_daily_rollup_repository import SqliteUserDailyRollupRepository
 from backend.domain.entities.learning_history import LearningHistory
 
 
@@ -15,14 +16,14 @@ class TestDailyStatisticsService:
     """DailyStatisticsService 테스트"""
 
     @pytest.fixture
-    def learning_history_repo(self):
-        """LearningHistory Repository 인스턴스 생성"""
-        return SqliteLearningHistoryRepository()
+    def daily_rollup_repo(self):
+        """사용자 일별 학습 롤업 Repository 인스턴스 생성"""
+        return SqliteUserDailyRollupRepository()
 
     @pytest.fixture
-    def service(self, learning_history_repo):
+    def service(self, daily_rollup_repo):
         """DailyStatisticsService 인스턴스 생성"""
-        return DailyStatisticsService(learning_history_repo)
+        return DailyStatisticsService(daily_rollup_repo)
 
     @pytest.fixture
     def sample_daily_goal(self):
@@ -45,6 +46,33 @@ class TestDailyStatisticsService:
         assert stats['study_sessions'] == 0
         assert stats['date'] == date.today().isoformat()
 
+    def test_get_daily_statistics_only_counts_user(self, tmp_path):
+        """다른 사용자와 다른 날짜의 이력은 집계하지 않음 (학습 이력 저장 시 롤업 갱신)"""
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=str(tmp_path / "test.db"))
+        repo = SqliteLearningHistoryRepository(db)
+        for user_id, study_date in [(1, date(2024, 1, 1)), (1, date(2024, 1, 1)), (2, date(2024, 1, 1)), (1, date(2024, 1, 2))]:
+            repo.save(LearningHistory(
+                id=None, user_id=user_id, test_id=1, result_id=1,
+                study_date=study_date, study_hour=9,
+                total_questions=10, correct_count=7, time_spent_minutes=15
+            ))
+
+        stats = DailyStatisticsService(SqliteUserDailyRollupRepository(db)).get_daily_statistics(
+            user_id=1, target_date=date(2024, 1, 1)
+        )
+
+        assert stats == {
+            'date': '2024-01-01',
+            'total_questions': 20,
+            'correct_count': 14,
+            'total_minutes': 30,
+            'study_sessions': 2,
+            'tests_completed': 2,
+            'vocabulary_reviews': 0
+        }
+
     def test_calculate_goal_achievement_no_goal(self, service):
         """목표가 없는 경우 달성률 계산 테스트"""
         # Given
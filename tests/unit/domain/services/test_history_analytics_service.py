@@ -0,0 +1,103 @@
+"""
+HistoryAnalyticsService 테스트
+기간 단위별 버킷(빈 기간 포함), 다운샘플링, 시간대별 합계 검증
+"""
+
+import pytest
+from datetime import date
+from backend.domain.entities.learning_history import LearningHistory
+from backend.domain.entities.study_session import StudySession
+from backend.domain.services.history_analytics_service import HistoryAnalyticsService
+from backend.domain.value_objects.jlpt import JLPTLevel
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.learning_history_repository import SqliteLearningHistoryRepository
+from backend.infrastructure.repositories.study_session_repository import SqliteStudySessionRepository
+from backend.infrastructure.repositories.user_daily_rollup_repository import SqliteUserDailyRollupRepository
+
+
+class TestHistoryAnalyticsService:
+    """HistoryAnalyticsService 테스트"""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        """Database 인스턴스 생성"""
+        return Database(db_path=str(tmp_path / "test.db"))
+
+    @pytest.fixture
+    def service(self, db):
+        """HistoryAnalyticsService 인스턴스 생성"""
+        return HistoryAnalyticsService(
+            SqliteUserDailyRollupRepository(db),
+            SqliteLearningHistoryRepository(db),
+            SqliteStudySessionRepository(db)
+        )
+
+    @pytest.fixture
+    def history(self, db):
+        """시험 2회(1/1 9시, 1/3 9시)와 학습 모드 1회(1/3 21시)"""
+        history_repo = SqliteLearningHistoryRepository(db)
+        for study_date in (date(2025, 1, 1), date(2025, 1, 3)):
+            history_repo.save(LearningHistory(
+                id=None, user_id=1, test_id=1, result_id=1,
+                study_date=study_date, study_hour=9,
+                total_questions=10, correct_count=5, time_spent_minutes=20
+            ))
+        SqliteStudySessionRepository(db).save(StudySession(
+            id=None, user_id=1, study_date=date(2025, 1, 3), study_hour=21,
+            total_questions=10, correct_count=10, time_spent_minutes=10, level=JLPTLevel.N5
+        ))
+
+    def test_daily_buckets_include_empty_days(self, service, history):
+        """일 단위는 범위의 모든 날을 반환하고 합계/정답률을 계산"""
+        summary = service.get_summary(1, date(2025, 1, 1), date(2025, 1, 4))
+
+        assert summary['granularity'] == 'day'
+        assert [bucket['period_start'] for bucket in summary['buckets']] == [
+            '2025-01-01', '2025-01-02', '2025-01-03', '2025-01-04'
+        ]
+        assert summary['buckets'][1]['questions_answered'] == 0
+        assert summary['buckets'][2] == {
+            'period_start': '2025-01-03',
+            'questions_answered': 20,
+            'correct_count': 15,
+            'time_spent_minutes': 30,
+            'tests_completed': 1,
+            'study_sessions': 1,
+            'vocabulary_reviews': 0,
+            'active_days': 1,
+            'accuracy_percentage': 75.0
+        }
+        assert summary['totals']['questions_answered'] == 30
+        assert summary['totals']['active_days'] == 2
+        assert summary['totals']['accuracy_percentage'] == 66.7
+
+    def test_hours(self, service, history):
+        """시험과 학습 모드를 합친 0~23시 시간대별 합계"""
+        hours = service.get_summary(1, date(2025, 1, 1), date(2025, 1, 31))['hours']
+
+        assert len(hours) == 24
+        assert hours[9]['sessions'] == 2
+        assert hours[9]['questions_answered'] == 20
+        assert hours[21]['accuracy_percentage'] == 100.0
+        assert hours[0]['sessions'] == 0
+
+    def test_downsamples_when_buckets_exceed_limit(self, service, history):
+        """요청한 단위로 max_buckets를 넘으면 주, 월 단위로 다운샘플링"""
+        weekly = service.get_summary(1, date(2025, 1, 1), date(2025, 1, 31), granularity='day', max_buckets=10)
+        monthly = service.get_summary(1, date(2024, 1, 1), date(2025, 1, 31), granularity='day', max_buckets=20)
+
+        assert weekly['granularity'] == 'week'
+        assert [bucket['period_start'] for bucket in weekly['buckets']][:2] == ['2024-12-30', '2025-01-06']
+        assert weekly['buckets'][0]['tests_completed'] == 2
+        assert monthly['granularity'] == 'month'
+        assert len(monthly['buckets']) == 13
+        assert monthly['buckets'][-1]['questions_answered'] == 30
+
+    def test_invalid_arguments(self, service):
+        """잘못된 단위, 날짜 순서, 월 단위로도 넘치는 기간은 ValueError"""
+        with pytest.raises(ValueError):
+            service.get_summary(1, granularity='year')
+        with pytest.raises(ValueError):
+            service.get_summary(1, date(2025, 2, 1), date(2025, 1, 1))
+        with pytest.raises(ValueError):
+            service.get_summary(1, date(2000, 1, 1), date(2025, 1, 1), max_buckets=12)
@@ -0,0 +1,149 @@
+"""
+IrtCalibrationService 테스트
+시뮬레이션 응답으로 모수 복원, 1PL 변별도 고정, DB 보정/저장과 warm start 검증
+"""
+
+import pytest
+import numpy as np
+from backend.domain.services.adaptive_test_service import AdaptiveTestService
+from backend.domain.services.irt_calibration_service import IrtCalibrationService
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.adaptive_test_repository import SqliteAdaptiveTestRepository
+from backend.infrastructure.repositories.irt_parameter_repository import SqliteIrtParameterRepository
+
+
+def simulate(n_users=600, n_items=30, seed=1):
+    """2PL 모델로 응답 시뮬레이션 (사용자마다 문항의 절반 정도에 응답)"""
+    rng = np.random.default_rng(seed)
+    theta = rng.normal(size=n_users)
+    b = rng.normal(size=n_items)
+    a = np.exp(rng.normal(0, 0.3, size=n_items))
+    users = np.repeat(np.arange(n_users), n_items)
+    items = np.tile(np.arange(n_items), n_users)
+    answered = rng.random(len(users)) < 0.5
+    users, items = users[answered], items[answered]
+    y = (rng.random(len(users)) < 1 / (1 + np.exp(-a[items] * (theta[users] - b[items])))).astype(np.float64)
+    return users, items, y, theta, b, a
+
+
+class TestIrtCalibrationService:
+    """IrtCalibrationService 테스트"""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        """Database 인스턴스 생성"""
+        return Database(db_path=str(tmp_path / "test.db"))
+
+    @pytest.fixture
+    def repository(self, db):
+        """IRT 모수 Repository 생성"""
+        return SqliteIrtParameterRepository(db)
+
+    @pytest.fixture
+    def service(self, repository):
+        """IrtCalibrationService 인스턴스 생성"""
+        return IrtCalibrationService(repository)
+
+    def test_fit_recovers_simulated_parameters(self):
+        """미니배치 적합으로 시뮬레이션 모수를 복원"""
+        users, items, y, theta, b, a = simulate()
+        n_users, n_items = len(theta), len(b)
+
+        fitted_theta, fitted_b, fitted_log_a = IrtCalibrationService.fit(
+            users, items, y, np.zeros(n_users), np.zeros(n_items), np.zeros(n_items),
+            epochs=40, batch_size=2048
+        )
+
+        assert np.corrcoef(fitted_b, b)[0, 1] > 0.95
+        assert np.corrcoef(fitted_theta, theta)[0, 1] > 0.8
+        assert np.corrcoef(np.exp(fitted_log_a), a)[0, 1] > 0.5
+
+    def test_fit_1pl_keeps_discrimination(self):
+        """1PL은 변별도(log a = 0)를 바꾸지 않음"""
+        users, items, y, theta, b, _ = simulate(n_users=200, n_items=10)
+
+        _, _, log_a = IrtCalibrationService.fit(
+            users, items, y, np.zeros(len(theta)), np.zeros(len(b)), np.zeros(len(b)),
+            fit_discrimination=False, epochs=5, batch_size=512
+        )
+
+        assert np.all(log_a == 0)
+
+    def _insert_responses(self, db, users, items, y):
+        """시뮬레이션 응답을 사용자당 결과 하나로 results/answer_details에 저장 (ID는 1부터)"""
+        with db.get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO results (id, test_id, user_id, score, assessed_level, recommended_level,
+                                     correct_answers_count, total_questions_count, time_taken_minutes)
+                VALUES (?, 1, ?, 0, 'N5', 'N5', 0, 0, 1)
+            """, [(user + 1, user + 1) for user in np.unique(users).tolist()])
+            conn.executemany("""
+                INSERT INTO answer_details (result_id, question_id, user_answer, correct_answer, is_correct,
+                                            time_spent_seconds, difficulty, question_type)
+                VALUES (?, ?, 'A', 'A', ?, 30, 1, 'vocabulary')
+            """, [
+                (int(user) + 1, int(item) + 1, int(correct))
+                for user, item, correct in zip(users.tolist(), items.tolist(), y.tolist())
+            ])
+            conn.commit()
+
+    def test_calibrate_persists_and_warm_starts(self, db, repository, service):
+        """보정 결과를 문항/사용자별로 저장하고, 다시 보정하면 저장된 값에서 시작"""
+        users, items, y, theta, b, _ = simulate(n_users=300, n_items=12)
+        self._insert_responses(db, users, items, y)
+
+        first = service.calibrate(model='2pl', epochs=20, batch_size=1024)
+        item = repository.find_by_question_id(1)
+        ability = repository.find_by_user_id(1)
+
+        assert (first['items'], first['users'], first['responses'], first['warm_started']) == (12, 300, len(y), 0)
+        assert item['model'] == '2pl' and item['responses'] == int(np.sum(items == 0))
+        assert item['difficulty_se'] > 0 and ability['theta_se'] > 0
+        fitted_b = [repository.find_by_question_id(i + 1)['difficulty'] for i in range(12)]
+        assert np.corrcoef(fitted_b, b)[0, 1] > 0.9
+
+        # 이전 값에서 한 epoch만 더 돌면 결과가 거의 그대로
+        second = service.calibrate(model='2pl', epochs=1, batch_size=1024, learning_rate=0.01)
+        assert second['warm_started'] == 12
+        assert second['mean_log_likelihood'] == pytest.approx(first['mean_log_likelihood'], abs=0.01)
+
+    def test_calibrate_1pl_and_min_item_responses(self, db, repository, service):
+        """1PL은 변별도 1로 저장하고, 응답이 적은 문항은 제외"""
+        users, items, y, _, _, _ = simulate(n_users=50, n_items=4)
+        self._insert_responses(db, users, items, y)
+        with db.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO answer_details (result_id, question_id, user_answer, correct_answer, is_correct,
+                                            time_spent_seconds, difficulty, question_type)
+                VALUES (1, 99, 'A', 'A', 1, 30, 1, 'vocabulary')
+            """)
+            conn.commit()
+
+        result = service.calibrate(model='1pl', epochs=3, batch_size=64, min_item_responses=5)
+
+        assert result['items'] == 4
+        assert repository.find_by_question_id(1)['discrimination'] == 1.0
+        assert repository.find_by_question_id(99) is None
+
+    def test_calibrate_invalidates_adaptive_pools(self, db, repository, service):
+        """보정 결과를 저장하면 적응형 시험 문제 은행 캐시를 무효화"""
+        users, items, y, _, _, _ = simulate(n_users=20, n_items=3)
+        self._insert_responses(db, users, items, y)
+        adaptive_service = AdaptiveTestService(repository, SqliteAdaptiveTestRepository(db))
+        AdaptiveTestService.invalidate()
+        try:
+            pool = adaptive_service.get_pool('N5')
+            assert adaptive_service.get_pool('N5') is pool
+
+            service.calibrate(model='1pl', epochs=1, batch_size=64)
+
+            assert adaptive_service.get_pool('N5') is not pool
+        finally:
+            AdaptiveTestService.invalidate()
+
+    def test_calibrate_validation_and_empty(self, service):
+        """잘못된 모델은 ValueError, 응답이 없으면 아무것도 저장하지 않음"""
+        with pytest.raises(ValueError):
+            service.calibrate(model='3pl')
+
+        assert service.calibrate()['responses'] == 0
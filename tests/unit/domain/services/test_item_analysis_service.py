@@ -0,0 +1,110 @@
+"""
+ItemAnalysisService 테스트
+문제별 정답률/점이연 변별도/선택 비율/풀이 시간 중앙값 계산과 증분 갱신 검증
+"""
+
+import pytest
+import numpy as np
+from backend.domain.entities.answer_detail import AnswerDetail
+from backend.domain.services.item_analysis_service import ItemAnalysisService
+from backend.domain.value_objects.jlpt import QuestionType
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.answer_detail_repository import SqliteAnswerDetailRepository
+from backend.infrastructure.repositories.question_stats_repository import SqliteQuestionStatsRepository
+
+
+class TestItemAnalysisService:
+    """ItemAnalysisService 테스트"""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        """Database 인스턴스 생성"""
+        return Database(db_path=str(tmp_path / "test.db"))
+
+    @pytest.fixture
+    def repository(self, db):
+        """문항 분석 통계 Repository 생성"""
+        return SqliteQuestionStatsRepository(db)
+
+    @pytest.fixture
+    def service(self, repository):
+        """ItemAnalysisService 인스턴스 생성"""
+        return ItemAnalysisService(repository)
+
+    def _answer(self, db, result_id, question_id, user_answer, is_correct, seconds=30):
+        """답안 상세 저장 (정답은 항상 'A')"""
+        SqliteAnswerDetailRepository(db=db).save(AnswerDetail(
+            id=None, result_id=result_id, question_id=question_id,
+            user_answer=user_answer, correct_answer="A", is_correct=is_correct,
+            time_spent_seconds=seconds, difficulty=1, question_type=QuestionType.VOCABULARY
+        ))
+
+    @pytest.fixture
+    def answers(self, db):
+        """결과 4개 x 문제 3개 (문제 3은 모두 정답)"""
+        # 결과별 문제 1, 2의 정답 여부: 1=(O, O), 2=(O, X), 3=(X, O), 4=(X, X)
+        q1 = [("A", True, 10), ("A", True, 20), ("B", False, 30), ("C", False, 40)]
+        q2 = [("A", True, 15), ("B", False, 15), ("A", True, 15), ("B", False, 15)]
+        for result_id in range(1, 5):
+            self._answer(db, result_id, 1, *q1[result_id - 1])
+            self._answer(db, result_id, 2, *q2[result_id - 1])
+            self._answer(db, result_id, 3, "A", True)
+
+    def test_refresh_computes_item_statistics(self, service, repository, answers):
+        """정답률, 점이연 변별도, 선택 비율, 풀이 시간 중앙값"""
+        result = service.refresh()
+
+        assert (result['mode'], result['questions'], result['answers'], result['last_answer_id']) == (
+            'incremental', 3, 12, 12
+        )
+        q1 = repository.find_by_question_id(1)
+        assert (q1['responses'], q1['correct_count'], q1['p_value']) == (4, 2, 0.5)
+        assert q1['discrimination'] == pytest.approx(0.7071, abs=1e-4)
+        assert q1['median_time_seconds'] == 25.0
+        assert q1['choice_rates'] == {'A': 0.5, 'B': 0.25, 'C': 0.25}
+        assert repository.find_by_question_id(2)['discrimination'] == pytest.approx(0.7071, abs=1e-4)
+        # 모두 정답이면 변별도를 정의할 수 없음
+        q3 = repository.find_by_question_id(3)
+        assert (q3['p_value'], q3['discrimination']) == (1.0, None)
+
+    def test_refresh_is_incremental(self, db, service, repository, answers):
+        """새 답안이 생긴 문제만 다시 계산하고, 새 답안이 없으면 아무것도 하지 않음"""
+        service.refresh()
+        q1_before = repository.find_by_question_id(1)
+
+        self._answer(db, 5, 2, "A", True)
+        result = service.refresh()
+
+        assert (result['questions'], result['answers'], result['last_answer_id']) == (1, 5, 13)
+        assert repository.find_by_question_id(2)['responses'] == 5
+        assert repository.find_by_question_id(1) == q1_before
+        assert service.refresh()['questions'] == 0
+
+    def test_full_refresh_replaces_stale_rows(self, db, service, repository, answers):
+        """전체 재계산은 답안이 없어진 문제의 통계를 지움"""
+        service.refresh()
+        with db.get_connection() as conn:
+            conn.execute("DELETE FROM answer_details WHERE question_id = 3")
+            conn.commit()
+
+        result = service.refresh(full=True)
+
+        assert (result['mode'], result['questions']) == ('full', 2)
+        assert repository.find_by_question_id(3) is None
+
+    def test_compute_item_stats_single_response(self):
+        """응답이 하나면 변별도는 None, 중앙값은 그 시간"""
+        stats = ItemAnalysisService.compute_item_stats(
+            np.array([7]), np.array([1.0]), np.array([12.0]), ["A"], np.array([1.0]), np.array([1])
+        )
+
+        assert stats == [{
+            'question_id': 7,
+            'responses': 1,
+            'correct_count': 1,
+            'p_value': 1.0,
+            'discrimination': None,
+            'median_time_seconds': 12.0,
+            'choice_rates': {'A': 1.0},
+            'last_answer_id': 1
+        }]
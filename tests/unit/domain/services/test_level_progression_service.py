@@ -0,0 +1,88 @@
+"""
+LevelProgressionService 테스트
+LTTB 다운샘플링, 일별 최고 점수 추이, 입력 검증
+"""
+
+import pytest
+from datetime import date, timedelta
+import numpy as np
+from backend.domain.services.level_progression_service import LevelProgressionService
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.level_score_repository import SqliteLevelScoreRepository
+
+
+class TestLevelProgressionService:
+    """LevelProgressionService 테스트"""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        """레벨별 점수 이력 Repository 생성"""
+        return SqliteLevelScoreRepository(Database(db_path=str(tmp_path / "test.db")))
+
+    @pytest.fixture
+    def service(self, repository):
+        """LevelProgressionService 인스턴스 생성"""
+        return LevelProgressionService(repository)
+
+    def test_lttb_keeps_endpoints_and_peaks(self):
+        """첫/마지막 점과 튀는 값은 유지하고 threshold개만 남김"""
+        x = np.arange(100, dtype=np.float64)
+        y = np.full(100, 50.0)
+        y[37] = 100.0
+        y[71] = 0.0
+
+        selected = LevelProgressionService.lttb(x, y, 10)
+
+        assert len(selected) == 10
+        assert selected[0] == 0 and selected[-1] == 99
+        assert np.all(np.diff(selected) > 0)
+        assert 37 in selected and 71 in selected
+
+    def test_lttb_returns_all_points_under_threshold(self):
+        """점 개수가 threshold 이하면 그대로"""
+        x = np.arange(5, dtype=np.float64)
+
+        assert LevelProgressionService.lttb(x, x, 10).tolist() == [0, 1, 2, 3, 4]
+
+    def test_get_progression_downsamples_each_level(self, repository, service):
+        """레벨마다 max_points개 이하로 줄이고 원래 점 개수를 같이 반환"""
+        start = date(2025, 1, 1)
+        repository.add_all(
+            (1, 'N5', (start + timedelta(days=day)).isoformat(), float(day % 100), None)
+            for day in range(50)
+        )
+        repository.add(1, 'N4', start, 70.0)
+
+        progression = service.get_progression(1, start_date=start, end_date=date(2025, 12, 31), max_points=20)
+
+        assert progression['method'] == 'lttb'
+        assert set(progression['levels']) == {'N4', 'N5'}
+        n5 = progression['levels']['N5']
+        assert (len(n5['points']), n5['total_points'], n5['downsampled']) == (20, 50, True)
+        assert n5['points'][0] == {'date': '2025-01-01', 'score': 0.0}
+        assert n5['points'][-1] == {'date': '2025-02-19', 'score': 49.0}
+        assert progression['levels']['N4'] == {
+            'points': [{'date': '2025-01-01', 'score': 70.0}],
+            'total_points': 1,
+            'downsampled': False
+        }
+
+    def test_get_progression_daily_max(self, repository, service):
+        """daily_max는 일별 최고 점수로 묶음"""
+        repository.add(1, 'N5', date(2025, 1, 1), 60.0)
+        repository.add(1, 'N5', date(2025, 1, 1), 80.0)
+
+        progression = service.get_progression(
+            1, level='N5', start_date=date(2025, 1, 1), end_date=date(2025, 1, 31), method='daily_max'
+        )
+
+        assert progression['levels']['N5']['points'] == [{'date': '2025-01-01', 'score': 80.0, 'tests': 2}]
+
+    def test_invalid_arguments(self, service):
+        """잘못된 방식, max_points, 날짜 순서는 ValueError"""
+        with pytest.raises(ValueError):
+            service.get_progression(1, method='average')
+        with pytest.raises(ValueError):
+            service.get_progression(1, max_points=2)
+        with pytest.raises(ValueError):
+            service.get_progression(1, start_date=date(2025, 2, 1), end_date=date(2025, 1, 1))
@@ -211,3 +211,25 @@ class TestQuestionGeneratorService:
         for question in questions:
             assert question.question_type == QuestionType.LISTENING
 
+    
+    def test_generate_reading_questions_by_difficulty(self):
+        """난이도를 지정하면 해당 난이도의 독해 문제만 생성"""
+        questions = QuestionGeneratorService.generate_reading_questions(
+            level=JLPTLevel.N5,
+            count=5,
+            difficulty=3
+        )
+        
+        assert len(questions) == 5
+        assert all(q.difficulty == 3 for q in questions)
+    
+    def test_generate_questions_with_unavailable_difficulty(self):
+        """해당 난이도의 샘플이 없으면 빈 목록"""
+        questions = QuestionGeneratorService.generate_questions(
+            level=JLPTLevel.N5,
+            question_type=QuestionType.VOCABULARY,
+            count=5,
+            difficulty=5
+        )
+        
+        assert questions == []
@@ -0,0 +1,144 @@
+"""
+ReviewForecastService 테스트
+"""
+
+import pytest
+from datetime import date
+from unittest.mock import MagicMock
+from backend.domain.entities.user_vocabulary import UserVocabulary
+from backend.domain.services.review_forecast_service import ReviewForecastService
+from backend.domain.services.spaced_repetition_service import SpacedRepetitionService
+
+
+class TestReviewForecastService:
+    """ReviewForecastService 테스트"""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """테스트 간 캐시 공유 방지"""
+        ReviewForecastService.invalidate()
+        yield
+        ReviewForecastService.invalidate()
+
+    @pytest.fixture
+    def repo(self):
+        """히스토그램을 반환하는 모의 Repository"""
+        return MagicMock()
+
+    def test_scheduled_counts_from_histogram(self, repo):
+        """히스토그램 기반 일별 예정 복습 수 (밀린 복습은 첫날 포함)"""
+        # Given
+        repo.find_review_schedule_histogram.return_value = [
+            (None, 0, 2.5, 2),
+            ("2024-12-30", 5, 2.5, 3),
+            ("2025-01-03", 10, 2.5, 4),
+        ]
+        service = ReviewForecastService(
+            repo, outcome_probabilities={"easy": 0.0, "normal": 1.0, "hard": 0.0}
+        )
+
+        # When
+        result = service.forecast(days=5, user_id=1, today=date(2025, 1, 1))
+
+        # Then
+        repo.find_review_schedule_histogram.assert_called_once_with("2025-01-05", user_id=1)
+        assert [d['scheduled'] for d in result['forecast']] == [5, 0, 4, 0, 0]
+        assert result['total_scheduled'] == 9
+        assert result['forecast'][0]['date'] == "2025-01-01"
+
+    def test_expected_matches_deterministic_simulation(self, repo):
+        """난이도가 하나로 고정되면 스칼라 SRS로 카드별 시뮬레이션한 결과와 일치"""
+        # Given
+        histogram = [(None, 0, 2.5, 3), ("2025-01-02", 1, 1.3, 2), ("2025-01-04", 4, 2.0, 1)]
+        repo.find_review_schedule_histogram.return_value = histogram
+        service = ReviewForecastService(
+            repo, outcome_probabilities={"easy": 0.0, "normal": 0.0, "hard": 1.0}
+        )
+        days = 20
+        today = date(2025, 1, 1)
+
+        # When
+        result = service.forecast(days=days, today=today)
+
+        # Then
+        srs = SpacedRepetitionService()
+        expected = [0] * days
+        for next_review, interval, ease, count in histogram:
+            card = UserVocabulary(
+                id=None, user_id=1, vocabulary_id=1,
+                interval_days=interval, ease_factor=ease,
+                next_review_date=date.fromisoformat(next_review) if next_review else today
+            )
+            while (card.next_review_date - today).days < days:
+                review_day = card.next_review_date
+                expected[(review_day - today).days] += count
+                srs.calculate_next_review(card, "hard", today=review_day)
+        assert [d['expected'] for d in result['forecast']] == expected
+
+    def test_expected_splits_by_outcome_probabilities(self, repo):
+        """난이도 분포에 따라 기대 복습 수가 분할됨"""
+        # Given
+        repo.find_review_schedule_histogram.return_value = [("2025-01-01", 0, 2.5, 10)]
+        service = ReviewForecastService(
+            repo, outcome_probabilities={"easy": 0.5, "normal": 0.25, "hard": 0.25}
+        )
+
+        # When
+        result = service.forecast(days=3, today=date(2025, 1, 1))
+
+        # Then (첫 복습 후 모두 1일 뒤, 이후 easy/normal은 2일 이상, hard는 1일 뒤)
+        expected = [d['expected'] for d in result['forecast']]
+        assert expected[0] == 10
+        assert expected[1] == 10
+        assert expected[2] == 2.5
+        assert result['total_expected'] == 22.5
+
+    def test_forecast_is_cached_until_invalidated(self, repo):
+        """같은 조건의 예측은 캐시되고, 무효화 후 다시 계산됨"""
+        repo.find_review_schedule_histogram.return_value = []
+        service = ReviewForecastService(repo)
+
+        service.forecast(days=7, user_id=1, today=date(2025, 1, 1))
+        service.forecast(days=7, user_id=1, today=date(2025, 1, 1))
+        assert repo.find_review_schedule_histogram.call_count == 1
+
+        ReviewForecastService.invalidate(1)
+        service.forecast(days=7, user_id=1, today=date(2025, 1, 1))
+        assert repo.find_review_schedule_histogram.call_count == 2
+
+    def test_cache_is_bounded(self, repo, monkeypatch):
+        """만료된 항목은 저장 시 제거되고, 최대 항목 수를 넘으면 오래된 항목부터 제거됨"""
+        repo.find_review_schedule_histogram.return_value = []
+        service = ReviewForecastService(repo)
+        monkeypatch.setattr(ReviewForecastService, "MAX_CACHE_ENTRIES", 3)
+
+        for user_id in range(1, 6):
+            service.forecast(days=7, user_id=user_id, today=date(2025, 1, 1))
+
+        assert [key[0] for key in ReviewForecastService._cache] == [3, 4, 5]
+
+        monkeypatch.setattr(ReviewForecastService, "CACHE_TTL_SECONDS", 0)
+        service.forecast(days=7, user_id=6, today=date(2025, 1, 1))
+        assert [key[0] for key in ReviewForecastService._cache] == [6]
+
+    def test_invalidate_user_keeps_other_users(self, repo):
+        """사용자 캐시 무효화는 다른 사용자 캐시를 유지"""
+        repo.find_review_schedule_histogram.return_value = []
+        service = ReviewForecastService(repo)
+        service.forecast(days=7, user_id=2, today=date(2025, 1, 1))
+
+        ReviewForecastService.invalidate(1)
+        service.forecast(days=7, user_id=2, today=date(2025, 1, 1))
+
+        assert repo.find_review_schedule_histogram.call_count == 1
+
+    def test_invalid_arguments(self, repo):
+        """잘못된 예측 기간과 난이도 분포는 ValueError 발생"""
+        with pytest.raises(ValueError):
+            ReviewForecastService(repo).forecast(days=0)
+        with pytest.raises(ValueError):
+            ReviewForecastService(repo).forecast(days=ReviewForecastService.MAX_DAYS + 1)
+        with pytest.raises(ValueError):
+            ReviewForecastService(repo, outcome_probabilities={"easy": 0.5, "normal": 0.2, "hard": 0.2})
+        with pytest.raises(ValueError):
+            ReviewForecastService(repo, outcome_probabilities={"easy": 1.0})
@@ -0,0 +1,99 @@
+"""
+StudyStreakService 테스트
+벡터화된 연속 구간 계산, 조회 시점 기준 현재 연속 일수, 전체 재계산 검증
+"""
+
+import pytest
+from datetime import date
+import numpy as np
+from backend.domain.services.study_streak_service import StudyStreakService
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.user_daily_rollup_repository import SqliteUserDailyRollupRepository
+from backend.infrastructure.repositories.user_streak_repository import SqliteUserStreakRepository
+
+
+def to_days(*dates: str) -> np.ndarray:
+    """ISO 날짜 문자열을 일 단위 정수 배열로 변환"""
+    return np.array(dates, dtype='datetime64[D]').astype(np.int64)
+
+
+class TestStudyStreakService:
+    """StudyStreakService 테스트"""
+
+    @pytest.fixture
+    def db(self, tmp_path):
+        """Database 인스턴스 생성"""
+        return Database(db_path=str(tmp_path / "test.db"))
+
+    @pytest.fixture
+    def service(self, db):
+        """StudyStreakService 인스턴스 생성"""
+        return StudyStreakService(SqliteUserStreakRepository(db))
+
+    def _study(self, db, user_id, *study_dates):
+        """학습 모드 문제 풀이처럼 롤업에 학습 활동 기록"""
+        with db.get_connection() as conn:
+            for study_date in study_dates:
+                SqliteUserDailyRollupRepository.apply(conn, user_id, study_date, {'questions_answered': 5})
+            conn.commit()
+
+    def test_compute_streaks(self):
+        """사용자별 최장 구간과 기준일까지 이어진 마지막 구간 길이"""
+        user_ids = np.array([1, 1, 1, 1, 1, 2, 2, 3], dtype=np.int64)
+        days = to_days(
+            '2025-01-01', '2025-01-02', '2025-01-03', '2025-01-06', '2025-01-07',
+            '2025-01-07', '2025-01-08',
+            '2025-01-05'
+        )
+
+        result = StudyStreakService.compute_streaks(user_ids, days, to_days('2025-01-08')[0])
+
+        assert result['user_id'].tolist() == [1, 2, 3]
+        assert result['longest_streak'].tolist() == [3, 2, 1]
+        # 사용자 1은 어제까지 이어짐, 사용자 3은 끊김
+        assert result['current_streak'].tolist() == [2, 2, 0]
+        assert result['last_day'].tolist() == to_days('2025-01-07', '2025-01-08', '2025-01-05').tolist()
+
+    def test_compute_streaks_empty(self):
+        """학습 기록이 없으면 빈 배열"""
+        empty = np.array([], dtype=np.int64)
+
+        result = StudyStreakService.compute_streaks(empty, empty, 0)
+
+        assert len(result['user_id']) == 0
+
+    def test_get_streak_without_activity(self, service):
+        """학습 기록이 없으면 0"""
+        assert service.get_streak(1, today=date(2025, 1, 1)) == {
+            'current_streak': 0,
+            'longest_streak': 0,
+            'last_study_date': None,
+            'studied_today': False
+        }
+
+    def test_get_streak_breaks_after_missed_day(self, db, service):
+        """어제까지 학습했으면 연속 기록 유지, 하루를 건너뛰면 0"""
+        self._study(db, 1, '2025-01-01', '2025-01-02', '2025-01-03')
+
+        assert service.get_streak(1, today=date(2025, 1, 3))['studied_today'] is True
+        assert service.get_streak(1, today=date(2025, 1, 4))['current_streak'] == 3
+        assert service.get_streak(1, today=date(2025, 1, 5)) == {
+            'current_streak': 0,
+            'longest_streak': 3,
+            'last_study_date': '2025-01-03',
+            'studied_today': False
+        }
+
+    def test_recompute_all_matches_incremental_and_fixes_backfill(self, db, service):
+        """재계산은 과거 날짜로 채워진 빈 날을 반영하고 끊긴 기록은 0으로 저장"""
+        self._study(db, 1, '2025-01-01', '2025-01-03')
+        self._study(db, 1, '2025-01-02')  # 과거 날짜 활동은 즉시 반영되지 않음
+        self._study(db, 2, '2025-01-01')
+        assert service.get_streak(1, today=date(2025, 1, 3))['current_streak'] == 1
+
+        result = service.recompute_all(today=date(2025, 1, 3))
+
+        assert result == {'users': 2, 'active_streaks': 1}
+        assert service.get_streak(1, today=date(2025, 1, 3))['current_streak'] == 3
+        assert service.get_streak(1, today=date(2025, 1, 3))['longest_streak'] == 3
+        assert SqliteUserStreakRepository(db).find_by_user_id(2)['current_streak'] == 0
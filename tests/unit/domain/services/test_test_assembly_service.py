@@ -0,0 +1,174 @@
+"""
+TestAssemblyService 테스트
+출제 계획(유형별 문제 수, 난이도 분포, 최대 노출률) 충족과 노출 횟수 기록 검증
+"""
+
+import pytest
+from collections import Counter
+import numpy as np
+from backend.domain.entities.question import Question
+from backend.domain.entities.test import Test
+from backend.domain.services.test_assembly_service import AssemblyIndex, TestAssemblyService, TestBlueprint
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+from backend.infrastructure.repositories.test_repository import SqliteTestRepository
+
+
+class TestTestBlueprint:
+    """TestBlueprint 테스트"""
+
+    def test_difficulty_targets(self):
+        """난이도 분포를 최대 잔여 방식으로 정수 문제 수로 나눔"""
+        blueprint = TestBlueprint(question_count=10, difficulty_distribution={1: 1, 2: 1, 3: 1})
+
+        assert blueprint.difficulty_targets(10) == {1: 4, 2: 3, 3: 3}
+        assert TestBlueprint(question_count=5).difficulty_targets(5) == {0: 5}
+
+    def test_invalid_blueprint(self):
+        """잘못된 문제 수, 난이도, 비율, 노출률은 ValueError"""
+        with pytest.raises(ValueError):
+            TestBlueprint(type_counts={QuestionType.VOCABULARY: 0})
+        with pytest.raises(ValueError):
+            TestBlueprint(difficulty_distribution={6: 1.0})
+        with pytest.raises(ValueError):
+            TestBlueprint(difficulty_distribution={1: 0.0})
+        with pytest.raises(ValueError):
+            TestBlueprint(max_exposure_rate=1.5)
+
+
+class TestTestAssemblyService:
+    """TestAssemblyService 테스트"""
+
+    @staticmethod
+    def _index(rows, tests_assembled=0, exposure=None):
+        return AssemblyIndex(rows, tests_assembled, exposure or {})
+
+    def test_select_satisfies_type_counts_and_difficulty_distribution(self):
+        """유형별 문제 수와 유형 안의 난이도 분포를 정확히 맞춤"""
+        rows = [(i, "vocabulary", i % 5 + 1) for i in range(100, 150)]
+        rows += [(i, "grammar", i % 5 + 1) for i in range(200, 250)]
+        index = self._index(rows)
+        blueprint = TestBlueprint(
+            type_counts={QuestionType.VOCABULARY: 10, QuestionType.GRAMMAR: 4},
+            difficulty_distribution={1: 0.5, 3: 0.5}
+        )
+
+        positions = TestAssemblyService.select(index, blueprint, np.random.default_rng(0))
+
+        assert len(set(positions.tolist())) == 14
+        selected = Counter(
+            (int(index.type_codes[p]), int(index.difficulty[p])) for p in positions
+        )
+        vocabulary, grammar = (list(QuestionType).index(t) for t in (QuestionType.VOCABULARY, QuestionType.GRAMMAR))
+        assert selected == {(vocabulary, 1): 5, (vocabulary, 3): 5, (grammar, 1): 2, (grammar, 3): 2}
+
+    def test_select_fills_short_difficulty_from_nearest(self):
+        """난이도 칸이 부족하면 같은 유형의 가까운 난이도에서 채움"""
+        rows = [(1, "vocabulary", 1), (2, "vocabulary", 2), (3, "vocabulary", 2), (4, "vocabulary", 5)]
+        blueprint = TestBlueprint(type_counts={QuestionType.VOCABULARY: 3}, difficulty_distribution={1: 1.0})
+
+        positions = TestAssemblyService.select(self._index(rows), blueprint, np.random.default_rng(0))
+
+        assert sorted(self._index(rows).question_ids[positions].tolist()) == [1, 2, 3]
+
+    def test_select_prefers_items_under_exposure_limit(self):
+        """노출률을 넘게 될 문제는 다른 문제가 부족할 때만, 노출이 적은 순으로 사용"""
+        rows = [(i, "grammar", 3) for i in range(1, 7)]
+        index = self._index(rows, tests_assembled=10, exposure={1: 5, 2: 4, 3: 1, 4: 0, 5: 9, 6: 2})
+        blueprint = TestBlueprint(question_count=4, max_exposure_rate=0.3)
+
+        positions = TestAssemblyService.select(index, blueprint, np.random.default_rng(0))
+
+        assert sorted(index.question_ids[positions].tolist()) == [2, 3, 4, 6]
+
+    def test_select_insufficient_questions(self):
+        """유형의 전체 문제가 부족하면 ValueError"""
+        rows = [(1, "vocabulary", 1), (2, "grammar", 1)]
+        blueprint = TestBlueprint(type_counts={QuestionType.VOCABULARY: 2})
+
+        with pytest.raises(ValueError, match="문제 수 부족"):
+            TestAssemblyService.select(self._index(rows), blueprint, np.random.default_rng(0))
+
+    def test_select_filters_question_types(self):
+        """유형별 문제 수 없이 question_types로 유형만 제한"""
+        rows = [(1, "vocabulary", 1), (2, "grammar", 1), (3, "reading", 1)]
+        blueprint = TestBlueprint(question_count=2, question_types=[QuestionType.GRAMMAR, QuestionType.READING])
+
+        positions = TestAssemblyService.select(self._index(rows), blueprint, np.random.default_rng(0))
+
+        assert sorted(self._index(rows).question_ids[positions].tolist()) == [2, 3]
+
+    def test_assemble_spreads_exposure(self, tmp_path):
+        """연속 조립 시 노출 횟수를 누적해 같은 문제의 반복 출제를 피함 (저장된 시험에서 초기화)"""
+        db = Database(db_path=str(tmp_path / "test.db"))
+        question_repo = SqliteQuestionRepository(db=db)
+        test_repo = SqliteTestRepository(db=db)
+        questions = []
+        for i in range(20):
+            questions.append(question_repo.save(Question(
+                id=0, level=JLPTLevel.N5, question_type=QuestionType.VOCABULARY,
+                question_text=f"問題{i}", choices=["A", "B"], correct_answer="A",
+                explanation="해설", difficulty=i % 5 + 1
+            )))
+        test_repo.save(Test(id=0, title="T", level=JLPTLevel.N5, questions=questions[:5], time_limit_minutes=60))
+
+        TestAssemblyService.invalidate()
+        try:
+            service = TestAssemblyService(question_repo, test_repo, rng=np.random.default_rng(0))
+            blueprint = TestBlueprint(question_count=5, max_exposure_rate=0.25)
+
+            assembled = [service.assemble(JLPTLevel.N5, blueprint) for _ in range(3)]
+
+            ids = [q.id for test_questions in assembled for q in test_questions]
+            assert all(isinstance(q, Question) for q in assembled[0])
+            assert len(set(ids)) == 15
+            assert not set(ids) & {q.id for q in questions[:5]}
+            index = service.get_index(JLPTLevel.N5)
+            assert index.tests_assembled == 4
+            assert index.exposure.dtype == np.int32
+            assert int(index.exposure.sum()) == 20
+        finally:
+            TestAssemblyService.invalidate()
+
+    def test_question_writes_invalidate_index(self, tmp_path):
+        """색인을 만든 뒤 추가/수정/삭제한 문제가 다음 조립에 바로 반영됨"""
+        db = Database(db_path=str(tmp_path / "test.db"))
+        question_repo = SqliteQuestionRepository(db=db)
+        test_repo = SqliteTestRepository(db=db)
+
+        def make_question(text: str, question_type: QuestionType) -> Question:
+            return Question(
+                id=0, level=JLPTLevel.N5, question_type=question_type,
+                question_text=text, choices=["A", "B"], correct_answer="A",
+                explanation="해설", difficulty=1
+            )
+
+        old = question_repo.save(make_question("問題0", QuestionType.VOCABULARY))
+        TestAssemblyService.invalidate()
+        try:
+            service = TestAssemblyService(question_repo, test_repo, rng=np.random.default_rng(0))
+            assert [q.id for q in service.assemble(JLPTLevel.N5, TestBlueprint(question_count=1))] == [old.id]
+
+            # 새 문제 추가 (단건 저장, 일괄 저장)
+            new = question_repo.save(make_question("問題1", QuestionType.GRAMMAR))
+            grammar = TestBlueprint(type_counts={QuestionType.GRAMMAR: 1})
+            assert [q.id for q in service.assemble(JLPTLevel.N5, grammar)] == [new.id]
+            imported = make_question("問題2", QuestionType.READING)
+            question_repo.save_all([imported])
+            reading = TestBlueprint(type_counts={QuestionType.READING: 1})
+            assert [q.id for q in service.assemble(JLPTLevel.N5, reading)] == [imported.id]
+
+            # 유형 수정
+            old.question_type = QuestionType.LISTENING
+            question_repo.save(old)
+            listening = TestBlueprint(type_counts={QuestionType.LISTENING: 1})
+            assert [q.id for q in service.assemble(JLPTLevel.N5, listening)] == [old.id]
+            with pytest.raises(ValueError):
+                service.assemble(JLPTLevel.N5, TestBlueprint(type_counts={QuestionType.VOCABULARY: 1}))
+
+            # 삭제
+            question_repo.delete(new)
+            assert len(service.get_index(JLPTLevel.N5)) == 2
+        finally:
+            TestAssemblyService.invalidate()
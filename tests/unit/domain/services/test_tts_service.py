@@ -152,3 +152,17 @@ class TestTTSService:
         file_path = backend_dir / "static" / audio_url.lstrip("/static/")
         # 테스트 환경에서는 파일이 생성되지 않을 수 있으므로 경로만 확인
 
+    
+    def test_generate_audio_with_stub_engine(self, tmp_path, monkeypatch):
+        """엔진을 교체하면 네트워크 없이 생성되고 임시 파일이 남지 않음"""
+        from backend.infrastructure.adapters.tts_engine import StubTTSEngine
+        
+        engine = StubTTSEngine()
+        monkeypatch.setattr(TTSService, "engine", engine)
+        
+        audio_url = TTSService.generate_audio("おはよう", output_dir=str(tmp_path))
+        TTSService.generate_audio("おはよう", output_dir=str(tmp_path))
+        
+        assert audio_url == f"/static/audio/tts/{TTSService.audio_filename('おはよう')}"
+        assert [p.name for p in tmp_path.iterdir()] == [audio_url.split("/")[-1]]
+        assert len(engine.calls) == 1
@@ -0,0 +1,77 @@
+"""
+오디오 메타데이터 어댑터 테스트
+MP3 프레임 헤더 기반 재생 시간, 콘텐츠 해시 ETag, 정적 파일 경로 변환 검증
+"""
+
+import hashlib
+from backend.infrastructure.adapters.audio_metadata import (
+    AudioMetadata,
+    mp3_duration_ms,
+    resolve_static_path,
+)
+
+
+def mp3_frames(header: bytes, frame_length: int, count: int) -> bytes:
+    """헤더 + 0으로 채운 프레임 count개"""
+    return (header + b"\x00" * (frame_length - len(header))) * count
+
+
+# MPEG-1 Layer III, 128kbps, 44.1kHz: 프레임 417바이트, 1152샘플 (약 26.12ms)
+MPEG1_128K = bytes([0xFF, 0xFB, 0x90, 0x00])
+# MPEG-2 Layer III, 32kbps, 24kHz (gTTS 출력 형식): 프레임 96바이트, 576샘플 (24ms)
+MPEG2_32K = bytes([0xFF, 0xF3, 0x44, 0x00])
+
+
+class TestMp3Duration:
+    """mp3_duration_ms 테스트"""
+
+    def test_cbr_frames(self):
+        """프레임 수 x 프레임당 샘플 수 / 샘플레이트"""
+        assert mp3_duration_ms(mp3_frames(MPEG1_128K, 417, 100)) == 2612
+        assert mp3_duration_ms(mp3_frames(MPEG2_32K, 96, 125)) == 3000
+
+    def test_skips_id3_tag_and_leading_garbage(self):
+        """ID3v2 태그와 첫 프레임 앞의 쓰레기 바이트는 건너뜀"""
+        tag_body = b"\x00" * 300
+        id3 = b"ID3\x04\x00\x00" + bytes([0, 0, 2, 44]) + tag_body  # syncsafe 300
+        data = id3 + b"\x00\x01" + mp3_frames(MPEG2_32K, 96, 50) + b"TAG" + b"\x00" * 125
+
+        assert mp3_duration_ms(data) == 1200
+
+    def test_not_mp3(self):
+        """MP3 프레임이 없으면 None"""
+        assert mp3_duration_ms(b"JLPTSTUB" + b"\x00" * 100) is None
+        assert mp3_duration_ms(b"") is None
+
+
+class TestAudioMetadata:
+    """AudioMetadata 테스트"""
+
+    def test_from_bytes(self):
+        """크기, 재생 시간, 콘텐츠 SHA-256 ETag 계산"""
+        data = mp3_frames(MPEG2_32K, 96, 125)
+
+        metadata = AudioMetadata.from_bytes(data)
+
+        assert metadata == AudioMetadata(
+            size_bytes=len(data), duration_ms=3000, etag=hashlib.sha256(data).hexdigest()
+        )
+        assert metadata.to_dict() == {
+            'audio_size_bytes': len(data),
+            'audio_duration_ms': 3000,
+            'audio_etag': metadata.etag,
+        }
+
+    def test_from_file_missing(self, tmp_path):
+        """파일이 없으면 None"""
+        assert AudioMetadata.from_file(tmp_path / "missing.mp3") is None
+
+    def test_resolve_static_path(self, tmp_path):
+        """/static/ URL만 변환하고 정적 디렉토리 밖을 가리키는 경로는 거부"""
+        assert resolve_static_path("/static/audio/tts/a.mp3", tmp_path) == (
+            tmp_path.resolve() / "audio" / "tts" / "a.mp3"
+        )
+        assert resolve_static_path("/static/../secret.txt", tmp_path) is None
+        assert resolve_static_path("/static/", tmp_path) is None
+        assert resolve_static_path("https://example.com/a.mp3", tmp_path) is None
+        assert resolve_static_path(None, tmp_path) is None
@@ -0,0 +1,147 @@
+"""
+백그라운드 임포트 작업 실행기 테스트
+작업 등록, 체크포인트 기록, 중단된 작업 재개 및 실패 처리 검증
+"""
+
+import io
+import json
+import os
+import tempfile
+from datetime import datetime, timedelta
+import pytest
+from backend.domain.value_objects.jlpt import ImportJobStatus, ImportJobType
+from backend.infrastructure.adapters.import_job_runner import ImportJobRunner
+from backend.infrastructure.adapters.streaming_question_importer import StreamingQuestionImporter
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+
+
+class WorkerCrash(BaseException):
+    """워커 프로세스 비정상 종료 시뮬레이션 (except Exception으로 잡히지 않음)"""
+
+
+def _questions_file(count):
+    """테스트용 문제 JSON 업로드 스트림"""
+    records = [
+        {
+            "level": "N5",
+            "question_type": "vocabulary",
+            "question_text": f"問題{i}",
+            "choices": ["選択肢1", "選択肢2", "選択肢3", "選択肢4"],
+            "correct_answer": "選択肢1",
+            "explanation": "説明",
+            "difficulty": 1
+        }
+        for i in range(count)
+    ]
+    return io.BytesIO(json.dumps(records, ensure_ascii=False).encode("utf-8"))
+
+
+class TestImportJobRunner:
+    """ImportJobRunner 단위 테스트"""
+
+    @pytest.fixture
+    def db(self):
+        """임시 디렉토리의 데이터베이스 (업로드 보관 디렉토리도 같은 곳에 생성)"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            yield Database(db_path=os.path.join(tmp_dir, "jlpt.db"))
+
+    @pytest.fixture
+    def runner(self, db):
+        """배치 크기 2의 실행기"""
+        return ImportJobRunner(db, batch_size=2)
+
+    def test_create_job_spools_upload(self, runner):
+        """업로드 파일을 보관하고 대기 중 작업을 생성"""
+        job = runner.create_job(ImportJobType.QUESTIONS, _questions_file(1), "questions.json", created_by=1)
+
+        assert job.id is not None
+        assert job.status == ImportJobStatus.PENDING
+        assert job.file_type == "json"
+        assert os.path.dirname(job.file_path) == runner.upload_dir
+        assert os.path.exists(job.file_path)
+
+        with pytest.raises(ValueError):
+            runner.create_job(ImportJobType.QUESTIONS, io.BytesIO(b"x"), "questions.txt")
+
+    def test_run_completes_and_records_progress(self, runner, db):
+        """실행 완료 시 누적 건수 기록 및 업로드 파일 삭제"""
+        job = runner.create_job(ImportJobType.QUESTIONS, _questions_file(5), "questions.json")
+
+        result = runner.run(job.id)
+
+        assert result.status == ImportJobStatus.COMPLETED
+        assert result.rows_processed == 5
+        assert result.rows_imported == 5
+        assert result.attempts == 1
+        assert not os.path.exists(job.file_path)
+        assert len(SqliteQuestionRepository(db).find_all()) == 5
+
+        # 완료된 작업은 다시 실행하지 않음
+        assert runner.run(job.id) is None
+
+    def test_crashed_job_resumes_from_checkpoint(self, runner, db, monkeypatch):
+        """중단된 작업은 마지막 체크포인트 이후 레코드부터 재개"""
+        job = runner.create_job(ImportJobType.QUESTIONS, _questions_file(5), "questions.json")
+
+        original_save_all = SqliteQuestionRepository.save_all
+        batches = []
+
+        def crashing_save_all(repo, questions):
+            if len(batches) == 1:
+                raise WorkerCrash()
+            batches.append(len(questions))
+            return original_save_all(repo, questions)
+
+        monkeypatch.setattr(SqliteQuestionRepository, "save_all", crashing_save_all)
+        with pytest.raises(WorkerCrash):
+            runner.run(job.id)
+        monkeypatch.setattr(SqliteQuestionRepository, "save_all", original_save_all)
+
+        crashed = runner.job_repo.find_by_id(job.id)
+        assert crashed.status == ImportJobStatus.RUNNING
+        assert crashed.rows_processed == 2
+
+        # 진행 기록이 남아 있는 동안에는 다른 워커가 가져가지 않음
+        assert runner.run_pending() == []
+
+        later = datetime.now() + ImportJobRunner.STALE_TIMEOUT + timedelta(seconds=1)
+        resumed = runner.run_pending(now=later)
+
+        assert [j.id for j in resumed] == [job.id]
+        assert resumed[0].status == ImportJobStatus.COMPLETED
+        assert resumed[0].rows_processed == 5
+        assert resumed[0].rows_imported == 5
+        assert resumed[0].attempts == 2
+        assert len(SqliteQuestionRepository(db).find_all()) == 5
+
+    def test_structural_error_fails_job(self, runner):
+        """파일 구조 오류는 재시도 없이 실패 처리"""
+        job = runner.create_job(
+            ImportJobType.QUESTIONS, io.BytesIO(b'{"not": "array"}'), "questions.json"
+        )
+
+        result = runner.run(job.id)
+
+        assert result.status == ImportJobStatus.FAILED
+        assert result.error_message
+        assert not os.path.exists(job.file_path)
+
+    def test_unexpected_error_releases_then_fails_after_max_attempts(self, runner, monkeypatch):
+        """예기치 않은 오류는 재시도 대기로 돌리고, 최대 시도 횟수를 넘으면 실패 처리"""
+        job = runner.create_job(ImportJobType.QUESTIONS, _questions_file(3), "questions.json")
+
+        def failing_import_file(importer, *args, **kwargs):
+            raise RuntimeError("database is locked")
+
+        monkeypatch.setattr(StreamingQuestionImporter, "import_file", failing_import_file)
+
+        for attempt in range(1, ImportJobRunner.MAX_ATTEMPTS):
+            result = runner.run(job.id)
+            assert result.status == ImportJobStatus.PENDING
+            assert result.attempts == attempt
+
+        result = runner.run(job.id)
+        assert result.status == ImportJobStatus.FAILED
+        assert result.error_message == "database is locked"
+        assert not os.path.exists(job.file_path)
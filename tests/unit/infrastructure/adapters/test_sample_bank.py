@@ -0,0 +1,121 @@
+"""
+샘플 문제 뱅크 테스트
+스냅샷 컴파일/메모리 매핑 왕복, 지연 로드, 난이도별 추출, 원본 변경 감지 검증
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+import numpy as np
+import pytest
+from backend.domain.value_objects.jlpt import JLPTLevel
+from backend.infrastructure.adapters.sample_bank import SampleBank, StaleSampleBankError
+
+
+class TestSampleBank:
+    """SampleBank 단위 테스트"""
+
+    @pytest.fixture
+    def data_dir(self):
+        """샘플 JSON 파일이 있는 임시 데이터 디렉토리"""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_dir = Path(tmp_dir)
+            reading = {
+                "N5": [
+                    {"passage": f"文章{i}", "question": "質問", "choices": ["A", "B"],
+                     "correct_answer": "A", "explanation": "説明", "difficulty": 1 + i % 3}
+                    for i in range(9)
+                ],
+                "N4": [
+                    {"passage": "文章", "question": "質問", "choices": ["A", "B"],
+                     "correct_answer": "A", "explanation": "説明"}
+                ],
+            }
+            vocabulary = {
+                "N5": [
+                    {"word": f"単語{i}", "reading": f"たんご{i}", "meaning": f"단어{i}"}
+                    for i in range(4)
+                ],
+            }
+            with open(data_dir / SampleBank.SOURCES['reading'], 'w', encoding='utf-8') as f:
+                json.dump(reading, f, ensure_ascii=False)
+            with open(data_dir / SampleBank.SOURCES['vocabulary'], 'w', encoding='utf-8') as f:
+                json.dump(vocabulary, f, ensure_ascii=False)
+            yield data_dir
+
+    def test_build_and_open_round_trip(self, data_dir):
+        """컴파일한 스냅샷을 열면 JSON과 같은 샘플/인덱스"""
+        built = SampleBank.build(data_dir)
+        bank = SampleBank.open(data_dir / SampleBank.SNAPSHOT_NAME, data_dir=data_dir)
+
+        assert bank.is_snapshot
+        assert set(bank.levels('reading')) == {JLPTLevel.N5, JLPTLevel.N4}
+        assert bank.records('reading', JLPTLevel.N5) == built.records('reading', JLPTLevel.N5)
+        assert bank.difficulties('reading', JLPTLevel.N5) == [1, 2, 3]
+        assert bank.indices('reading', JLPTLevel.N5, 2).tolist() == [1, 4, 7]
+        assert bank.difficulties('vocabulary', JLPTLevel.N5) == [1]
+        assert bank.records('grammar', JLPTLevel.N5) == []
+
+    def test_snapshot_loads_records_lazily(self, data_dir):
+        """스냅샷을 열 때는 샘플을 로드하지 않고, 접근한 레벨만 역직렬화"""
+        SampleBank.build(data_dir)
+        bank = SampleBank.open(data_dir / SampleBank.SNAPSHOT_NAME)
+
+        assert bank._records == {}
+        assert len(bank.by_level('reading')[JLPTLevel.N4]) == 1
+        assert list(bank._records) == [('reading', 'N4')]
+
+    def test_snapshot_indices_are_memory_mapped(self, data_dir):
+        """난이도 인덱스는 복사 없이 메모리 매핑된 읽기 전용 배열"""
+        SampleBank.build(data_dir)
+        bank = SampleBank.open(data_dir / SampleBank.SNAPSHOT_NAME)
+
+        indices = bank.indices('reading', JLPTLevel.N5, 3)
+
+        assert indices.dtype == np.dtype('<i4')
+        assert not indices.flags.writeable
+        assert not indices.flags.owndata
+
+    def test_sample_by_difficulty(self, data_dir):
+        """choice/sample은 지정한 난이도의 샘플만 중복 없이 선택"""
+        SampleBank.build(data_dir)
+        bank = SampleBank.open(data_dir / SampleBank.SNAPSHOT_NAME)
+
+        picked = bank.sample('reading', JLPTLevel.N5, 10, difficulty=3)
+
+        assert len(picked) == 3
+        assert {item['passage'] for item in picked} == {"文章2", "文章5", "文章8"}
+        assert bank.choice('reading', JLPTLevel.N5, difficulty=1)['difficulty'] == 1
+        assert bank.choice('reading', JLPTLevel.N5, difficulty=5) is None
+        assert bank.sample('listening', JLPTLevel.N5, 3) == []
+
+    def test_load_falls_back_to_json_when_sources_change(self, data_dir):
+        """원본 JSON이 스냅샷 이후 변경되면 스냅샷 대신 JSON에서 구성"""
+        SampleBank.build(data_dir)
+        assert SampleBank.load(data_dir).is_snapshot
+
+        vocabulary_file = data_dir / SampleBank.SOURCES['vocabulary']
+        with open(vocabulary_file, 'w', encoding='utf-8') as f:
+            json.dump({"N5": [{"word": "新", "reading": "しん", "meaning": "새"}]}, f)
+        stat = vocabulary_file.stat()
+        os.utime(vocabulary_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        with pytest.raises(StaleSampleBankError):
+            SampleBank.open(data_dir / SampleBank.SNAPSHOT_NAME, data_dir=data_dir)
+        bank = SampleBank.load(data_dir)
+        assert not bank.is_snapshot
+        assert bank.records('vocabulary', JLPTLevel.N5)[0]['word'] == "新"
+
+    def test_open_rejects_corrupt_snapshot(self, data_dir):
+        """형식이 올바르지 않은 스냅샷은 StaleSampleBankError"""
+        snapshot_path = data_dir / SampleBank.SNAPSHOT_NAME
+        snapshot_path.write_bytes(b"not a snapshot")
+
+        with pytest.raises(StaleSampleBankError):
+            SampleBank.open(snapshot_path)
+        assert not SampleBank.load(data_dir).is_snapshot
+
+        snapshot_path.write_bytes(SampleBank.MAGIC + b"\xff\xff\x00\x00{")
+        with pytest.raises(StaleSampleBankError):
+            SampleBank.open(snapshot_path)
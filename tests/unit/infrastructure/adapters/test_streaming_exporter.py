@@ -0,0 +1,139 @@
+"""
+스트리밍 데이터 내보내기 어댑터 테스트
+키셋 페이지네이션, NDJSON/CSV 변환, gzip 압축, 재임포트 호환성 검증
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+import pytest
+from backend.domain.entities.question import Question
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.adapters.streaming_exporter import StreamingExporter
+from backend.infrastructure.adapters.streaming_question_importer import StreamingQuestionImporter
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+
+
+class TestStreamingExporter:
+    """StreamingExporter 단위 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def db(self, temp_db):
+        """문제 5개가 저장된 데이터베이스"""
+        db = Database(db_path=temp_db)
+        SqliteQuestionRepository(db).save_all([
+            Question(
+                id=0,
+                level=JLPTLevel.N5,
+                question_type=QuestionType.VOCABULARY,
+                question_text=f"問題{i}",
+                choices=["選択肢1", "選択肢2", "選択肢3", "選択肢4"],
+                correct_answer="選択肢1",
+                explanation="説明",
+                difficulty=1
+            )
+            for i in range(5)
+        ])
+        return db
+
+    def test_iter_rows_pages_by_id(self, db):
+        """batch_size보다 많은 행을 ID 순으로 빠짐없이 조회"""
+        exporter = StreamingExporter(db, batch_size=2)
+
+        rows = list(exporter.iter_rows("questions"))
+
+        assert [row["id"] for row in rows] == [1, 2, 3, 4, 5]
+        assert rows[0]["choices"] == ["選択肢1", "選択肢2", "選択肢3", "選択肢4"]
+        assert "content_hash" not in rows[0]
+
+    def test_export_ndjson(self, db):
+        """NDJSON은 행마다 JSON 한 줄"""
+        exporter = StreamingExporter(db, batch_size=2)
+
+        output = io.BytesIO()
+        count = exporter.export_to_stream(output, "questions", "ndjson")
+
+        lines = output.getvalue().decode("utf-8").splitlines()
+        assert count == 5
+        assert len(lines) == 5
+        assert json.loads(lines[4])["question_text"] == "問題4"
+
+    def test_export_csv_can_be_reimported(self, db, temp_db):
+        """CSV 내보내기 결과를 파일 임포트 형식으로 다시 읽을 수 있음"""
+        exporter = StreamingExporter(db, batch_size=2)
+        content = b"".join(exporter.iter_export("questions", "csv")).decode("utf-8")
+
+        rows = list(csv.DictReader(io.StringIO(content)))
+        assert len(rows) == 5
+        assert rows[0]["choices"] == "選択肢1,選択肢2,選択肢3,選択肢4"
+
+        # 같은 내용을 다시 임포트하면 모두 중복으로 집계
+        importer = StreamingQuestionImporter(SqliteQuestionRepository(db))
+        summary = importer.import_stream(io.StringIO(content), "csv")
+        assert (summary["imported"], summary["duplicates"], summary["rejected"]) == (0, 5, 0)
+
+    def test_export_gzip(self, db):
+        """gzip 압축 스트림은 압축 해제하면 원본과 같음"""
+        exporter = StreamingExporter(db, batch_size=2)
+
+        plain = b"".join(exporter.iter_export("questions", "ndjson"))
+        compressed = b"".join(exporter.iter_export("questions", "ndjson", compress=True))
+
+        assert gzip.decompress(compressed) == plain
+
+    def test_export_answer_details_and_results(self, db):
+        """답안 상세의 불리언 컬럼과 결과의 JSON 컬럼 변환"""
+        with db.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO results (test_id, user_id, score, assessed_level, recommended_level,
+                                     correct_answers_count, total_questions_count, time_taken_minutes,
+                                     question_type_analysis)
+                VALUES (1, 1, 50.0, 'N5', 'N5', 1, 2, 10, ?)
+            """, (json.dumps({"vocabulary": {"correct": 1, "total": 2}}),))
+            conn.executemany("""
+                INSERT INTO answer_details (result_id, question_id, user_answer, correct_answer,
+                                            is_correct, time_spent_seconds, difficulty, question_type)
+                VALUES (1, ?, ?, '選択肢1', ?, 30, 1, 'vocabulary')
+            """, [(1, "選択肢1", 1), (2, "選択肢2", 0)])
+            conn.commit()
+
+        exporter = StreamingExporter(db)
+        details = list(exporter.iter_rows("answer_details"))
+        results = list(exporter.iter_rows("results"))
+
+        assert [d["is_correct"] for d in details] == [True, False]
+        assert results[0]["question_type_analysis"] == {"vocabulary": {"correct": 1, "total": 2}}
+
+        content = b"".join(exporter.iter_export("results", "csv")).decode("utf-8")
+        row = next(csv.DictReader(io.StringIO(content)))
+        assert json.loads(row["question_type_analysis"]) == {"vocabulary": {"correct": 1, "total": 2}}
+
+    def test_missing_table_exports_nothing(self, db):
+        """아직 생성되지 않은 테이블은 빈 결과 (CSV는 헤더만)"""
+        exporter = StreamingExporter(db)
+
+        assert list(exporter.iter_rows("vocabulary")) == []
+        content = b"".join(exporter.iter_export("vocabulary", "csv")).decode("utf-8")
+        assert content == "id,word,reading,meaning,level,example_sentence\n"
+
+    def test_invalid_table_or_format(self, db):
+        """지원하지 않는 테이블/형식"""
+        exporter = StreamingExporter(db)
+
+        with pytest.raises(ValueError):
+            exporter.iter_export("users", "ndjson")
+        with pytest.raises(ValueError):
+            exporter.iter_export("questions", "xml")
@@ -0,0 +1,215 @@
+"""
+스트리밍 기출문제 임포트 어댑터 테스트
+점진적 JSON 파싱, CSV 읽기, 배치 저장 및 오류 보고 검증
+"""
+
+import csv
+import io
+import json
+import os
+import tempfile
+import pytest
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.adapters.streaming_question_importer import StreamingQuestionImporter
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+
+
+def _question_record(i, **overrides):
+    """테스트용 문제 레코드 생성"""
+    record = {
+        "level": "N5",
+        "question_type": "vocabulary",
+        "question_text": f"問題{i}",
+        "choices": ["選択肢1", "選択肢2", "選択肢3", "選択肢4"],
+        "correct_answer": "選択肢1",
+        "explanation": "説明",
+        "difficulty": 2
+    }
+    record.update(overrides)
+    return record
+
+
+class TestStreamingQuestionImporter:
+    """StreamingQuestionImporter 단위 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def repo(self, temp_db):
+        return SqliteQuestionRepository(db=Database(db_path=temp_db))
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 64 * 1024])
+    def test_iter_json_array_across_chunk_boundaries(self, monkeypatch, chunk_size):
+        """청크 경계와 관계없이 배열 원소를 순서대로 파싱"""
+        monkeypatch.setattr(StreamingQuestionImporter, "READ_CHUNK_SIZE", chunk_size)
+        data = [_question_record(1), 12345, 3.5, "文字列", [1, 2], None, {"nested": {"a": [1]}}]
+
+        result = list(StreamingQuestionImporter.iter_json_array(
+            io.StringIO(json.dumps(data, ensure_ascii=False, indent=2))
+        ))
+
+        assert result == data
+
+    @pytest.mark.parametrize("content", ['{"a": 1}', "[1,]", "[1 2]", "[1", "", "[]x", "[1]]", "[1] [2]"])
+    def test_iter_json_array_invalid(self, content):
+        """잘못된 JSON 구조는 ValueError 발생"""
+        with pytest.raises(ValueError):
+            list(StreamingQuestionImporter.iter_json_array(io.StringIO(content)))
+
+    @pytest.mark.parametrize("content", ["[]", "[1] \n", " [ 1 , 2 ]\t"])
+    def test_iter_json_array_allows_trailing_whitespace(self, monkeypatch, content):
+        """배열 뒤의 공백은 허용 (청크 경계에서도)"""
+        monkeypatch.setattr(StreamingQuestionImporter, "READ_CHUNK_SIZE", 1)
+
+        assert list(StreamingQuestionImporter.iter_json_array(io.StringIO(content))) == json.loads(content)
+
+    def test_subclass_without_parse_record_cannot_be_created(self, repo):
+        """parse_record를 구현하지 않은 하위 클래스는 생성 시점에 TypeError"""
+        from backend.infrastructure.adapters.streaming_importer import StreamingImporter
+
+        class IncompleteImporter(StreamingImporter):
+            pass
+
+        with pytest.raises(TypeError):
+            IncompleteImporter(repo)
+
+    def test_import_records_in_batches_with_error_report(self, repo):
+        """배치 단위로 저장하고 잘못된 레코드는 오류 보고서에 기록"""
+        # Given
+        records = [_question_record(i) for i in range(7)]
+        records[2] = _question_record(2, level="N9")
+        records[5] = "문제가 아님"
+        saved_batches = []
+        original_save_all = repo.save_all
+
+        def tracking_save_all(questions):
+            saved_batches.append(len(questions))
+            return original_save_all(questions)
+
+        repo.save_all = tracking_save_all
+        importer = StreamingQuestionImporter(repo, batch_size=2)
+
+        # When
+        summary = importer.import_records(records)
+
+        # Then
+        assert summary['total'] == 7
+        assert summary['imported'] == 5
+        assert summary['rejected'] == 2
+        assert [e['row'] for e in summary['errors']] == [3, 6]
+        assert summary['errors_truncated'] is False
+        assert saved_batches == [2, 2, 1]
+        assert len(repo.find_all()) == 5
+
+    def test_import_records_truncates_error_report(self, repo):
+        """오류 보고서는 max_errors개까지만 포함"""
+        importer = StreamingQuestionImporter(repo, max_errors=2)
+
+        summary = importer.import_records([{"question_text": ""}] * 5)
+
+        assert summary['rejected'] == 5
+        assert len(summary['errors']) == 2
+        assert summary['errors_truncated'] is True
+
+    def test_import_records_batch_failure_rejects_batch(self, repo):
+        """배치 저장이 실패하면 해당 배치의 레코드를 모두 거부"""
+        def failing_save_all(questions):
+            raise RuntimeError("database is locked")
+
+        repo.save_all = failing_save_all
+        importer = StreamingQuestionImporter(repo, batch_size=10)
+
+        summary = importer.import_records([_question_record(i) for i in range(3)])
+
+        assert summary['imported'] == 0
+        assert summary['rejected'] == 3
+        assert summary['errors'][0] == {'row': 1, 'error': "database is locked"}
+
+    def test_import_file_json(self, repo, monkeypatch):
+        """JSON 파일을 스트리밍으로 임포트"""
+        monkeypatch.setattr(StreamingQuestionImporter, "READ_CHUNK_SIZE", 16)
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, encoding='utf-8') as f:
+            json.dump([_question_record(i) for i in range(25)], f, ensure_ascii=False)
+            tmp_file = f.name
+
+        try:
+            summary = StreamingQuestionImporter(repo, batch_size=10).import_file(tmp_file)
+        finally:
+            os.unlink(tmp_file)
+
+        assert summary['imported'] == 25
+        questions = repo.find_all()
+        assert {q.question_text for q in questions} == {f"問題{i}" for i in range(25)}
+
+    def test_import_binary_stream_csv(self, repo):
+        """CSV 업로드 스트림 임포트 (쉼표 구분 선택지, 문자열 난이도)"""
+        # Given
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=[
+            "level", "question_type", "question_text", "choices",
+            "correct_answer", "explanation", "difficulty", "audio_url"
+        ])
+        writer.writeheader()
+        writer.writerow({
+            "level": "N4", "question_type": "grammar", "question_text": "文法問題",
+            "choices": "A,B,C", "correct_answer": "B", "explanation": "説明",
+            "difficulty": "3", "audio_url": ""
+        })
+        writer.writerow({
+            "level": "N4", "question_type": "grammar", "question_text": "文法問題2",
+            "choices": "A,B", "correct_answer": "Z", "explanation": "説明",
+            "difficulty": "1", "audio_url": ""
+        })
+        stream = io.BytesIO(buffer.getvalue().encode('utf-8'))
+
+        # When
+        summary = StreamingQuestionImporter(repo).import_binary_stream(stream, 'csv')
+
+        # Then
+        assert summary['imported'] == 1
+        assert summary['rejected'] == 1
+        assert summary['errors'][0]['row'] == 2
+        question = repo.find_all()[0]
+        assert question.level == JLPTLevel.N4
+        assert question.question_type == QuestionType.GRAMMAR
+        assert question.choices == ["A", "B", "C"]
+        assert question.difficulty == 3
+        assert question.audio_url is None
+        assert not stream.closed
+
+    def test_import_records_structure_error_keeps_saved_batches(self, repo):
+        """파일 구조 오류 시 직전까지의 레코드를 저장하고 ValueError 발생"""
+        content = json.dumps([_question_record(i) for i in range(3)], ensure_ascii=False)[:-1] + ", oops]"
+        importer = StreamingQuestionImporter(repo, batch_size=2)
+
+        with pytest.raises(ValueError, match="3개 저장 후 중단"):
+            importer.import_stream(io.StringIO(content), 'json')
+
+        assert len(repo.find_all()) == 3
+
+    def test_detect_file_type(self):
+        """확장자로 파일 형식 감지"""
+        assert StreamingQuestionImporter.detect_file_type("questions.JSON") == 'json'
+        assert StreamingQuestionImporter.detect_file_type("questions.csv") == 'csv'
+        with pytest.raises(ValueError):
+            StreamingQuestionImporter.detect_file_type("questions.xlsx")
+
+    def test_import_records_is_idempotent(self, repo):
+        """같은 레코드를 다시 임포트하면 중복으로 집계되고 새 행이 생기지 않음"""
+        importer = StreamingQuestionImporter(repo, batch_size=3)
+        records = [_question_record(i) for i in range(5)]
+
+        first = importer.import_records(records)
+        second = importer.import_records(records + [_question_record(5)])
+
+        assert (first['imported'], first['duplicates']) == (5, 0)
+        assert (second['imported'], second['duplicates']) == (1, 5)
+        assert len(repo.find_all()) == 6
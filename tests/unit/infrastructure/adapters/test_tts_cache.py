@@ -0,0 +1,170 @@
+"""
+TTS 캐시 관리 어댑터 테스트
+매니페스트 기록, 적중률, 참조 기반 LRU 제거, 고아 정리 검증
+"""
+
+import os
+import tempfile
+from datetime import datetime, timedelta
+import pytest
+from backend.domain.entities.question import Question
+from backend.domain.services.tts_service import TTSService
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.adapters.tts_cache import TTSCacheManager
+from backend.infrastructure.adapters.tts_engine import StubTTSEngine
+from backend.infrastructure.adapters.tts_render_pool import TTSRenderPool
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+
+
+class TestTTSCacheManager:
+    """TTSCacheManager 단위 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def db(self, temp_db):
+        return Database(db_path=temp_db)
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        return tmp_path / "tts"
+
+    def write_file(self, cache_dir, name, size, age_seconds=0):
+        """캐시 디렉토리에 파일 생성 (age_seconds만큼 이전에 수정된 것으로)"""
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        path = cache_dir / name
+        path.write_bytes(b"x" * size)
+        mtime = (datetime.now() - timedelta(seconds=age_seconds)).timestamp()
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def reference(self, db, name):
+        """name 파일을 참조하는 청해 문제 저장"""
+        question = Question(
+            id=0,
+            level=JLPTLevel.N5,
+            question_type=QuestionType.LISTENING,
+            question_text=f"会話 {name}",
+            choices=["A", "B"],
+            correct_answer="A",
+            explanation="説明",
+            difficulty=1,
+            audio_url=f"/static/audio/tts/{name}"
+        )
+        SqliteQuestionRepository(db).save_all([question])
+        return question
+
+    def test_store_hit_and_stats(self, db, cache_dir):
+        """생성/적중/미스를 기록하고 적중률과 참조 여부를 통계로 제공"""
+        cache = TTSCacheManager(db, cache_dir=cache_dir)
+        self.write_file(cache_dir, "tts_a.mp3", 100)
+        self.write_file(cache_dir, "tts_b.mp3", 50)
+
+        cache.miss()
+        cache.store("tts_a.mp3", 100)
+        cache.miss()
+        cache.store("tts_b.mp3", 50)
+        cache.hit("tts_a.mp3")
+        cache.hit("tts_a.mp3")
+        question = self.reference(db, "tts_a.mp3")
+
+        stats = cache.stats()
+        assert stats['entries'] == 2
+        assert stats['total_bytes'] == 150
+        assert stats['total_hit_count'] == 2
+        assert stats['unreferenced_entries'] == 1
+        assert stats['unreferenced_bytes'] == 50
+        assert (stats['hits'], stats['misses'], stats['hit_rate']) == (2, 2, 0.5)
+        assert cache.find_entry("tts_a.mp3")['referenced_by'] == [question.id]
+
+    def test_hit_registers_untracked_file(self, db, cache_dir):
+        """매니페스트 도입 전에 만들어진 파일은 적중 시 등록"""
+        cache = TTSCacheManager(db, cache_dir=cache_dir)
+        self.write_file(cache_dir, "tts_old.mp3", 70)
+
+        cache.hit("tts_old.mp3")
+
+        entry = cache.find_entry("tts_old.mp3")
+        assert (entry['size_bytes'], entry['hit_count']) == (70, 1)
+
+    def test_store_evicts_least_recently_used_unreferenced_files(self, db, cache_dir):
+        """예산을 넘으면 참조되지 않는 파일을 오래 전에 접근한 순으로 제거"""
+        cache = TTSCacheManager(db, cache_dir=cache_dir, max_bytes=250)
+        old = datetime.now() - timedelta(days=1)
+        for i, name in enumerate(["tts_1.mp3", "tts_2.mp3", "tts_3.mp3"]):
+            self.write_file(cache_dir, name, 100)
+            cache.store(name, 100, now=old + timedelta(minutes=i))
+        assert not (cache_dir / "tts_1.mp3").exists()
+
+        self.reference(db, "tts_2.mp3")
+        cache.hit("tts_3.mp3", now=old + timedelta(hours=1))
+        self.write_file(cache_dir, "tts_4.mp3", 100)
+        cache.store("tts_4.mp3", 100, now=old + timedelta(hours=2))
+
+        # tts_2는 참조 중이라 더 오래됐어도 남고, 그 다음으로 오래된 tts_3이 제거됨
+        assert sorted(p.name for p in cache_dir.iterdir()) == ["tts_2.mp3", "tts_4.mp3"]
+        assert cache.total_bytes() == 200
+        assert cache.find_entry("tts_3.mp3") is None
+
+    def test_evict_keeps_referenced_and_recent_files(self, db, cache_dir):
+        """참조 중이거나 최근에 접근한 파일은 예산을 넘어도 제거하지 않음"""
+        cache = TTSCacheManager(db, cache_dir=cache_dir)
+        self.write_file(cache_dir, "tts_ref.mp3", 100)
+        self.write_file(cache_dir, "tts_new.mp3", 100)
+        cache.store("tts_ref.mp3", 100, now=datetime.now() - timedelta(days=1))
+        cache.store("tts_new.mp3", 100)
+        self.reference(db, "tts_ref.mp3")
+
+        result = cache.evict(max_bytes=0)
+
+        assert result == {'evicted': 0, 'freed_bytes': 0, 'total_bytes': 200}
+        assert len(list(cache_dir.iterdir())) == 2
+
+    def test_sweep_orphans(self, db, cache_dir):
+        """추적되지 않고 참조도 없는 오래된 파일, 없어진 파일의 행, 임시 파일 정리"""
+        cache = TTSCacheManager(db, cache_dir=cache_dir)
+        self.write_file(cache_dir, "tts_orphan.mp3", 40, age_seconds=7200)
+        self.write_file(cache_dir, "tts_fresh.mp3", 40)
+        self.write_file(cache_dir, "tts_used.mp3", 30, age_seconds=7200)
+        self.write_file(cache_dir, ".tts_crashed.tmp", 10, age_seconds=7200)
+        self.reference(db, "tts_used.mp3")
+        cache.store("tts_gone.mp3", 20)
+
+        summary = cache.sweep_orphans(grace_seconds=3600)
+
+        assert summary == {
+            'removed_files': 1,
+            'removed_temp_files': 1,
+            'removed_entries': 1,
+            'adopted': 1,
+            'freed_bytes': 40,
+        }
+        assert sorted(p.name for p in cache_dir.iterdir()) == ["tts_fresh.mp3", "tts_used.mp3"]
+        assert cache.find_entry("tts_used.mp3")['size_bytes'] == 30
+        assert cache.find_entry("tts_gone.mp3") is None
+
+    def test_tts_service_and_pool_record_to_cache(self, db, cache_dir, monkeypatch):
+        """TTSService/TTSRenderPool은 캐시 관리자가 있으면 적중/미스/생성을 기록"""
+        cache = TTSCacheManager(db, cache_dir=cache_dir)
+        monkeypatch.setattr(TTSService, "engine", StubTTSEngine())
+        monkeypatch.setattr(TTSService, "cache", cache)
+        monkeypatch.setattr(TTSService, "default_output_dir", staticmethod(lambda: cache_dir))
+
+        audio_url = TTSService.generate_audio("おはよう")
+        TTSService.generate_audio("おはよう")
+        TTSRenderPool().render(["おはよう", "こんばんは"])
+
+        stats = cache.stats()
+        assert (stats['hits'], stats['misses'], stats['entries']) == (2, 2, 2)
+
+        assert TTSService.delete_audio(audio_url) is True
+        assert cache.find_entry(audio_url.split("/")[-1]) is None
+        assert TTSService.delete_audio("/other/path.mp3") is False
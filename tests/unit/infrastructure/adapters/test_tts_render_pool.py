@@ -0,0 +1,160 @@
+"""
+TTS 일괄 렌더링 풀 테스트
+중복 제거, 캐시, 재시도/백오프, 원자적 저장, 동시 실행 수 제한 검증
+"""
+
+import threading
+import time
+import pytest
+from backend.domain.services.tts_service import TTSService
+from backend.infrastructure.adapters.tts_engine import StubTTSEngine, get_tts_engine
+from backend.infrastructure.adapters.tts_render_pool import TTSRenderPool
+
+
+class FlakyEngine(StubTTSEngine):
+    """텍스트마다 처음 failures번은 실패하는 엔진"""
+
+    def __init__(self, failures: int):
+        super().__init__()
+        self.failures = failures
+        self._failed = {}
+
+    def synthesize(self, text, language='ja', slow=False):
+        with self._lock:
+            self._failed[text] = self._failed.get(text, 0) + 1
+            should_fail = self._failed[text] <= self.failures
+        if should_fail:
+            raise ConnectionError("429 Too Many Requests")
+        return super().synthesize(text, language, slow)
+
+
+class ConcurrencyTrackingEngine(StubTTSEngine):
+    """동시에 실행 중인 합성 수의 최댓값 기록"""
+
+    def __init__(self):
+        super().__init__(delay=0.01)
+        self.active = 0
+        self.max_active = 0
+
+    def synthesize(self, text, language='ja', slow=False):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            return super().synthesize(text, language, slow)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+
+class TestTTSRenderPool:
+    """TTSRenderPool 단위 테스트"""
+
+    def test_render_deduplicates_texts(self, tmp_path):
+        """같은 텍스트는 한 번만 합성하고 TTSService와 같은 파일명으로 저장"""
+        engine = StubTTSEngine()
+        pool = TTSRenderPool(engine=engine, output_dir=tmp_path, max_workers=2)
+
+        results = pool.render(["おはよう", "こんにちは", "おはよう", "こんにちは", "おはよう"])
+
+        assert sorted(call[0] for call in engine.calls) == ["おはよう", "こんにちは"]
+        assert set(results) == {"おはよう", "こんにちは"}
+        filename = TTSService.audio_filename("おはよう")
+        assert results["おはよう"].audio_url == f"/static/audio/tts/{filename}"
+        assert (tmp_path / filename).read_bytes().startswith(StubTTSEngine.MAGIC)
+        assert TTSRenderPool.summarize(results) == {
+            'total': 2, 'rendered': 2, 'cached': 0, 'failed': 0, 'retried': 0
+        }
+
+    def test_render_skips_existing_files(self, tmp_path):
+        """이미 파일이 있는 텍스트는 엔진을 호출하지 않음"""
+        engine = StubTTSEngine()
+        TTSRenderPool(engine=engine, output_dir=tmp_path).render(["おはよう"])
+
+        results = TTSRenderPool(engine=engine, output_dir=tmp_path).render(["おはよう", "さようなら"])
+
+        assert results["おはよう"].cached
+        assert not results["さようなら"].cached
+        assert [call[0] for call in engine.calls] == ["おはよう", "さようなら"]
+
+    def test_render_retries_with_backoff(self, tmp_path):
+        """일시적인 실패는 지수 백오프 후 재시도"""
+        delays = []
+        pool = TTSRenderPool(
+            engine=FlakyEngine(failures=2),
+            output_dir=tmp_path,
+            max_workers=1,
+            max_retries=3,
+            backoff=1.0,
+            sleep=delays.append
+        )
+
+        result = pool.render(["おはよう"])["おはよう"]
+
+        assert result.ok
+        assert result.attempts == 3
+        assert len(delays) == 2
+        assert 0.5 <= delays[0] <= 1.0
+        assert 1.0 <= delays[1] <= 2.0
+
+    def test_render_gives_up_after_max_retries(self, tmp_path):
+        """재시도를 모두 실패하면 오류를 기록하고 파일을 남기지 않음"""
+        delays = []
+        pool = TTSRenderPool(
+            engine=FlakyEngine(failures=10),
+            output_dir=tmp_path,
+            max_retries=2,
+            sleep=delays.append
+        )
+
+        results = pool.render(["おはよう", "   "])
+
+        assert not results["おはよう"].ok
+        assert results["おはよう"].attempts == 3
+        assert "429" in results["おはよう"].error
+        assert len(delays) == 2
+        assert results["   "].error == "텍스트는 비어있을 수 없습니다"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_failed_write_leaves_no_partial_file(self, tmp_path, monkeypatch):
+        """저장 중 실패하면 임시 파일을 지우고 최종 파일을 만들지 않음"""
+        def fail_replace(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("backend.domain.services.tts_service.os.replace", fail_replace)
+        pool = TTSRenderPool(engine=StubTTSEngine(), output_dir=tmp_path, max_retries=0)
+
+        result = pool.render(["おはよう"])["おはよう"]
+
+        assert "disk full" in result.error
+        assert list(tmp_path.iterdir()) == []
+
+    def test_render_bounds_concurrency(self, tmp_path):
+        """동시에 실행되는 합성 수는 max_workers 이하이고, 스레드 수만큼 병렬로 실행"""
+        engine = ConcurrencyTrackingEngine()
+        pool = TTSRenderPool(engine=engine, output_dir=tmp_path, max_workers=4)
+        texts = (f"文{i}" for i in range(40))
+
+        started = time.monotonic()
+        results = pool.render(texts)
+        elapsed = time.monotonic() - started
+
+        assert len(results) == 40
+        assert all(r.ok for r in results.values())
+        assert 1 < engine.max_active <= 4
+        assert elapsed < 40 * engine.delay
+
+    def test_on_result_runs_in_calling_thread(self, tmp_path):
+        """on_result 콜백은 호출한 스레드에서 결과마다 한 번씩 실행"""
+        threads = []
+        pool = TTSRenderPool(engine=StubTTSEngine(), output_dir=tmp_path, max_workers=3)
+
+        pool.render(["a", "b", "c", "a"], on_result=lambda r: threads.append(threading.current_thread()))
+
+        assert threads == [threading.current_thread()] * 3
+
+    def test_get_tts_engine(self):
+        """이름으로 엔진 생성, 지원하지 않는 엔진은 ValueError"""
+        assert isinstance(get_tts_engine("stub"), StubTTSEngine)
+        with pytest.raises(ValueError, match="지원하지 않는 TTS 엔진"):
+            get_tts_engine("unknown")
@@ -0,0 +1,94 @@
+"""
+적응형 시험 세션 Repository 테스트
+세션 생성, 응답 추가 저장, 현재 문제 compare-and-swap, 완료 시각 기록 검증
+"""
+
+import pytest
+import os
+import sqlite3
+import tempfile
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.adaptive_test_repository import (
+    SqliteAdaptiveTestRepository,
+    StaleAdaptiveSessionError,
+)
+
+
+class TestAdaptiveTestRepository:
+    """적응형 시험 세션 Repository 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        # 테스트 후 정리
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def repository(self, temp_db):
+        """적응형 시험 세션 Repository 인스턴스 생성"""
+        return SqliteAdaptiveTestRepository(db=Database(db_path=temp_db))
+
+    def test_create_and_find(self, repository):
+        """생성한 세션은 진행 중 상태와 빈 응답 목록으로 조회"""
+        session = repository.create(1, 'N5', 0.5, 1.0, 42, 20, 0.3)
+
+        assert session['status'] == 'in_progress'
+        assert session['current_question_id'] == 42
+        assert session['responses'] == []
+        assert session['completed_at'] is None
+        assert repository.find_by_id(session['id']) == session
+        assert repository.find_by_id(999) is None
+
+    def test_save_progress_and_completion(self, repository):
+        """응답 목록과 능력치를 저장하고, 완료 시에만 완료 시각을 기록"""
+        session = repository.create(1, 'N5', 0.0, 1.0, 42, 20, 0.3)
+        response = {'question_id': 42, 'answer': 'A', 'correct': True, 'discrimination': 1.2, 'difficulty': -0.5}
+
+        session = repository.save(dict(session, responses=[response], theta=0.4, theta_se=0.8, current_question_id=7))
+        assert session['responses'] == [response]
+        assert (session['theta'], session['theta_se'], session['current_question_id']) == (0.4, 0.8, 7)
+        assert session['completed_at'] is None
+
+        session = repository.save(dict(
+            session, status='completed', current_question_id=None, estimated_score=82.5, recommended_level='N5'
+        ))
+        assert session['status'] == 'completed'
+        assert session['estimated_score'] == 82.5
+        assert session['completed_at'] is not None
+
+    def test_save_appends_only_new_responses(self, temp_db, repository):
+        """저장할 때마다 이미 저장된 응답 뒤의 새 응답만 한 행씩 추가"""
+        session = repository.create(1, 'N5', 0.0, 1.0, 42, 20, 0.3)
+        first = {'question_id': 42, 'answer': 'A', 'correct': True, 'discrimination': 1.2, 'difficulty': -0.5}
+        second = {'question_id': 7, 'answer': 'B', 'correct': False, 'discrimination': 0.8, 'difficulty': 0.3}
+
+        session = repository.save(dict(session, responses=[first]))
+        session = repository.save(dict(session, responses=session['responses'] + [second]))
+        session = repository.save(dict(session, theta=0.1))
+
+        assert session['responses'] == [first, second]
+        with sqlite3.connect(temp_db) as conn:
+            rows = conn.execute(
+                "SELECT position, question_id FROM adaptive_test_responses WHERE session_id = ? ORDER BY position",
+                (session['id'],)
+            ).fetchall()
+        assert rows == [(0, 42), (1, 7)]
+
+    def test_save_with_stale_question_raises(self, repository):
+        """현재 문제가 이미 바뀐 세션 스냅샷으로 저장하면 아무것도 반영하지 않고 StaleAdaptiveSessionError"""
+        stale = repository.create(1, 'N5', 0.0, 1.0, 42, 20, 0.3)
+        response = {'question_id': 42, 'answer': 'A', 'correct': True, 'discrimination': 1.2, 'difficulty': -0.5}
+
+        saved = repository.save(dict(stale, responses=[response], current_question_id=7), expected_question_id=42)
+        assert saved['current_question_id'] == 7
+
+        with pytest.raises(StaleAdaptiveSessionError):
+            repository.save(
+                dict(stale, responses=[dict(response, answer='B')], theta=0.9, current_question_id=8),
+                expected_question_id=42
+            )
+        assert repository.find_by_id(stale['id']) == saved
@@ -0,0 +1,115 @@
+"""
+ImportJob Repository 테스트
+"""
+
+import pytest
+import os
+import tempfile
+from datetime import datetime, timedelta
+from backend.domain.entities.import_job import ImportJob
+from backend.domain.value_objects.jlpt import ImportJobStatus, ImportJobType
+from backend.infrastructure.repositories.import_job_repository import SqliteImportJobRepository
+from backend.infrastructure.config.database import Database
+
+
+class TestImportJobRepository:
+    """ImportJob Repository 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        # 테스트 후 정리
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def repository(self, temp_db):
+        """Repository 인스턴스 생성"""
+        db = Database(db_path=temp_db)
+        return SqliteImportJobRepository(db=db)
+
+    @pytest.fixture
+    def sample_job(self):
+        """샘플 ImportJob 생성"""
+        return ImportJob(
+            id=None,
+            job_type=ImportJobType.VOCABULARY,
+            file_path="/tmp/vocabulary.csv",
+            file_type="csv",
+            original_filename="vocabulary.csv",
+            created_by=1
+        )
+
+    def test_save_and_find_by_id(self, repository, sample_job):
+        """작업 저장 및 조회 테스트"""
+        saved = repository.save(sample_job)
+        assert saved.id is not None
+
+        found = repository.find_by_id(saved.id)
+        assert found.job_type == ImportJobType.VOCABULARY
+        assert found.status == ImportJobStatus.PENDING
+        assert found.original_filename == "vocabulary.csv"
+        assert found.created_by == 1
+        assert repository.find_by_id(9999) is None
+
+    def test_save_progress(self, repository, sample_job):
+        """진행 상황 업데이트가 그대로 복원됨"""
+        job = repository.save(sample_job)
+        job.start()
+        job.record_progress(
+            rows_processed=2000, rows_imported=1500, rows_duplicates=400, rows_rejected=100,
+            errors=[{"row": 7, "error": "단어는 필수 항목입니다"}], elapsed_seconds=1.25
+        )
+        repository.save(job)
+
+        found = repository.find_by_id(job.id)
+        assert found.status == ImportJobStatus.RUNNING
+        assert found.rows_processed == 2000
+        assert found.rows_imported == 1500
+        assert found.rows_duplicates == 400
+        assert found.rows_rejected == 100
+        assert found.errors == [{"row": 7, "error": "단어는 필수 항목입니다"}]
+        assert found.elapsed_seconds == 1.25
+        assert found.attempts == 1
+        assert found.heartbeat_at == job.heartbeat_at
+
+    def test_claim_is_compare_and_swap(self, repository, sample_job):
+        """같은 스냅샷으로 두 번 실행 권한을 얻을 수 없음"""
+        repository.save(sample_job)
+        previous = repository.find_by_id(sample_job.id)
+
+        first = repository.find_by_id(sample_job.id)
+        first.start(datetime(2024, 1, 1, 10, 0))
+        second = repository.find_by_id(sample_job.id)
+        second.start(datetime(2024, 1, 1, 10, 0, 1))
+
+        assert repository.claim(first, previous) is True
+        assert repository.claim(second, previous) is False
+
+        found = repository.find_by_id(sample_job.id)
+        assert found.status == ImportJobStatus.RUNNING
+        assert found.heartbeat_at == datetime(2024, 1, 1, 10, 0)
+
+    def test_find_unfinished_and_recent(self, repository):
+        """대기/진행 중 작업 조회 및 최근 작업 조회"""
+        jobs = []
+        for i in range(3):
+            job = ImportJob(
+                id=None,
+                job_type=ImportJobType.QUESTIONS,
+                file_path=f"/tmp/questions{i}.json",
+                file_type="json"
+            )
+            jobs.append(repository.save(job))
+
+        jobs[0].start()
+        jobs[0].complete()
+        repository.save(jobs[0])
+        jobs[1].start(datetime.now() - timedelta(hours=1))
+        repository.save(jobs[1])
+
+        assert [j.id for j in repository.find_unfinished()] == [jobs[1].id, jobs[2].id]
+        assert [j.id for j in repository.find_recent(limit=2)] == [jobs[2].id, jobs[1].id]
@@ -0,0 +1,83 @@
+"""
+IRT 모수 Repository 테스트
+응답 청크 조회, 보정 결과 저장(교체/유지), 조회, 적응형 시험 문제 은행 조회 검증
+"""
+
+import pytest
+import os
+import tempfile
+from backend.domain.entities.question import Question
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+from backend.infrastructure.repositories.irt_parameter_repository import SqliteIrtParameterRepository
+
+
+class TestIrtParameterRepository:
+    """IRT 모수 Repository 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        # 테스트 후 정리
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def db(self, temp_db):
+        """Database 인스턴스 생성"""
+        return Database(db_path=temp_db)
+
+    @pytest.fixture
+    def repository(self, db):
+        """IRT 모수 Repository 인스턴스 생성"""
+        return SqliteIrtParameterRepository(db=db)
+
+    def test_iter_responses_in_chunks(self, db, repository):
+        """결과의 사용자 ID와 함께 청크 단위로 반환"""
+        with db.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO results (id, test_id, user_id, score, assessed_level, recommended_level,
+                                     correct_answers_count, total_questions_count, time_taken_minutes)
+                VALUES (10, 1, 7, 0, 'N5', 'N5', 0, 0, 1)
+            """)
+            for question_id, is_correct in [(1, 1), (2, 0), (3, 1)]:
+                conn.execute("""
+                    INSERT INTO answer_details (result_id, question_id, user_answer, correct_answer, is_correct,
+                                                time_spent_seconds, difficulty, question_type)
+                    VALUES (10, ?, 'A', 'A', ?, 30, 1, 'vocabulary')
+                """, (question_id, is_correct))
+            conn.commit()
+
+        chunks = list(repository.iter_responses(chunk_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert sorted(row for chunk in chunks for row in chunk) == [(7, 1, 1), (7, 2, 0), (7, 3, 1)]
+
+    def test_save_calibration_upserts_and_keeps_others(self, repository):
+        """같은 문항/사용자는 교체하고 이번 보정에 없는 값은 유지"""
+        repository.save_calibration('2pl', [(1, 1.2, -0.5, 0.3, 40), (2, 0.8, 1.0, 0.4, 30)], [(5, 0.7, 0.2, 20)])
+        repository.save_calibration('1pl', [(1, 1.0, -0.4, 0.3, 45)], [])
+
+        assert repository.find_item_params() == {1: (1.0, -0.4), 2: (0.8, 1.0)}
+        assert repository.find_user_abilities() == {5: 0.7}
+        assert repository.find_by_question_id(1)['model'] == '1pl'
+        assert set(repository.find_by_question_ids([1, 2, 3])) == {1, 2}
+        assert repository.find_by_user_id(5)['responses'] == 20
+        assert repository.find_by_user_id(6) is None
+
+    def test_find_item_pool(self, db, repository):
+        """레벨의 모든 문제를 보정 모수와 함께 반환 (보정되지 않은 문제는 None)"""
+        question_repo = SqliteQuestionRepository(db=db)
+        for i, (level, difficulty) in enumerate([(JLPTLevel.N5, 2), (JLPTLevel.N5, 4), (JLPTLevel.N4, 1)]):
+            question_repo.save(Question(
+                id=0, level=level, question_type=QuestionType.VOCABULARY,
+                question_text=f"問題{i}", choices=["はい", "いいえ"], correct_answer="はい",
+                explanation="해설", difficulty=difficulty
+            ))
+        repository.save_calibration('2pl', [(1, 1.3, -0.7, 0.2, 50)], [])
+
+        assert sorted(repository.find_item_pool('N5')) == [(1, 1.3, -0.7, 2), (2, None, None, 4)]
@@ -347,3 +347,27 @@ class TestSqliteLearningHistoryRepository:
         date_histories = repo.find_by_study_date(date(2024, 1, 1))
         assert len(date_histories) == 2
         assert all(h.study_date == date(2024, 1, 1) for h in date_histories)
+
+    def test_learning_history_repository_aggregate_by_hour(self, temp_db):
+        """기간 내 사용자의 이력만 학습 시간대별로 합산"""
+        from backend.infrastructure.repositories.learning_history_repository import SqliteLearningHistoryRepository
+        from backend.infrastructure.config.database import Database
+
+        repo = SqliteLearningHistoryRepository(db=Database(db_path=temp_db))
+        for user_id, study_date, hour in [
+            (1, date(2024, 1, 1), 9),
+            (1, date(2024, 1, 2), 9),
+            (1, date(2024, 1, 2), 21),
+            (1, date(2024, 2, 1), 9),
+            (2, date(2024, 1, 1), 9),
+        ]:
+            repo.save(LearningHistory(
+                id=None, user_id=user_id, test_id=1, result_id=1,
+                study_date=study_date, study_hour=hour,
+                total_questions=10, correct_count=8, time_spent_minutes=15
+            ))
+
+        assert repo.aggregate_by_hour(1, date(2024, 1, 1), date(2024, 1, 31)) == [
+            {'study_hour': 9, 'sessions': 2, 'total_questions': 20, 'correct_count': 16, 'time_spent_minutes': 30},
+            {'study_hour': 21, 'sessions': 1, 'total_questions': 10, 'correct_count': 8, 'time_spent_minutes': 15},
+        ]
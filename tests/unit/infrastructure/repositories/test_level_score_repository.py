@@ -0,0 +1,58 @@
+"""
+레벨별 점수 이력 Repository 테스트
+추가, 일괄 추가, 기간/레벨별 조회, 일별 최고 점수 집계 검증
+"""
+
+import pytest
+import os
+import tempfile
+from datetime import date
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.level_score_repository import SqliteLevelScoreRepository
+
+
+class TestLevelScoreRepository:
+    """레벨별 점수 이력 Repository 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        # 테스트 후 정리
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def repository(self, temp_db):
+        """레벨별 점수 이력 Repository 인스턴스 생성"""
+        return SqliteLevelScoreRepository(db=Database(db_path=temp_db))
+
+    def test_find_series_filters_by_user_level_and_period(self, repository):
+        """사용자/레벨/기간으로 걸러 시험 순서대로 반환"""
+        repository.add(1, 'N5', date(2025, 1, 2), 70.0, result_id=2)
+        repository.add(1, 'N5', date(2025, 1, 1), 60.0, result_id=1)
+        repository.add(1, 'N5', date(2025, 1, 2), 80.0, result_id=3)
+        repository.add(1, 'N4', date(2025, 1, 2), 50.0)
+        repository.add(2, 'N5', date(2025, 1, 2), 100.0)
+        repository.add(1, 'N5', date(2025, 2, 1), 90.0)
+
+        series = repository.find_series(1, 'N5', date(2025, 1, 1), date(2025, 1, 31))
+
+        assert series == [('2025-01-01', 60.0), ('2025-01-02', 70.0), ('2025-01-02', 80.0)]
+        assert repository.find_levels(1) == ['N4', 'N5']
+
+    def test_find_daily_max(self, repository):
+        """일별 최고 점수와 그날 시험 수"""
+        assert repository.add_all([
+            (1, 'N5', '2025-01-01', 60.0, None),
+            (1, 'N5', '2025-01-01', 75.0, None),
+            (1, 'N5', '2025-01-03', 40.0, None),
+        ]) == 3
+
+        assert repository.find_daily_max(1, 'N5', date(2025, 1, 1), date(2025, 1, 31)) == [
+            {'date': '2025-01-01', 'score': 75.0, 'tests': 2},
+            {'date': '2025-01-03', 'score': 40.0, 'tests': 1},
+        ]
+        assert repository.add_all([]) == 0
@@ -9,6 +9,7 @@ import json
 import tempfile
 from backend.domain.entities.question import Question
 from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.repositories.content_hash import DuplicateContentError
 
 
 class TestSqliteQuestionRepository:
@@ -548,3 +549,195 @@ class TestSqliteQuestionRepository:
         )
         assert len(questions) == 0
 
+
+    def test_question_repository_save_all(self, temp_db):
+        """QuestionRepository 일괄 저장 시 ID가 설정되는지 테스트"""
+        from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        repo = SqliteQuestionRepository(db=db)
+
+        questions = [
+            Question(
+                id=0, level=JLPTLevel.N4, question_type=QuestionType.GRAMMAR,
+                question_text=f"Q{i}", choices=["A", "B", "C"], correct_answer="B",
+                explanation=f"E{i}", difficulty=2
+            )
+            for i in range(5)
+        ]
+
+        inserted = repo.save_all(questions)
+
+        assert inserted == 5
+        assert len({q.id for q in questions}) == 5
+        for question in questions:
+            found = repo.find_by_id(question.id)
+            assert found.question_text == question.question_text
+            assert found.choices == ["A", "B", "C"]
+        assert repo.save_all([]) == 0
+
+    def test_question_repository_find_by_ids_and_assembly_index(self, temp_db):
+        """ID 목록 순서대로 조회(없는 ID 제외)하고, 조립 색인은 레벨의 (ID, 유형, 난이도)만 반환"""
+        from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        repo = SqliteQuestionRepository(db=db)
+        questions = [
+            Question(
+                id=0, level=level, question_type=question_type,
+                question_text=f"Q{i}", choices=["A", "B"], correct_answer="A",
+                explanation=f"E{i}", difficulty=i + 1
+            )
+            for i, (level, question_type) in enumerate([
+                (JLPTLevel.N5, QuestionType.VOCABULARY),
+                (JLPTLevel.N5, QuestionType.GRAMMAR),
+                (JLPTLevel.N4, QuestionType.READING),
+            ])
+        ]
+        repo.save_all(questions)
+        ids = [q.id for q in questions]
+
+        found = repo.find_by_ids([ids[2], 999, ids[0]])
+        assert [q.id for q in found] == [ids[2], ids[0]]
+        assert repo.find_by_ids([]) == []
+        assert sorted(repo.find_assembly_index(JLPTLevel.N5)) == [
+            (ids[0], "vocabulary", 1), (ids[1], "grammar", 2)
+        ]
+
+    def test_question_repository_save_all_deduplicates_by_content(self, temp_db):
+        """같은 내용의 문제는 다시 저장해도 중복 생성되지 않고 해설/난이도만 갱신"""
+        from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        repo = SqliteQuestionRepository(db=db)
+
+        def make(text, choices, explanation="E", difficulty=1):
+            return Question(
+                id=0, level=JLPTLevel.N5, question_type=QuestionType.VOCABULARY,
+                question_text=text, choices=choices, correct_answer="A",
+                explanation=explanation, difficulty=difficulty
+            )
+
+        original = repo.save(make("問題", ["A", "B"]))
+
+        # 공백/전각 차이와 선택지 순서는 같은 내용으로 취급, 배치 내부 중복도 하나로 저장
+        batch = [
+            make(" 問題 ", ["B", "A"], explanation="新しい説明", difficulty=3),
+            make("別の問題", ["A", "B"]),
+            make("別の問題", ["A", "B"]),
+            make("問題", ["A", "C"]),
+        ]
+        inserted = repo.save_all(batch)
+
+        assert inserted == 2
+        assert batch[0].id == original.id
+        assert batch[1].id == batch[2].id
+        assert len(repo.find_all()) == 3
+        updated = repo.find_by_id(original.id)
+        assert updated.explanation == "新しい説明"
+        assert updated.difficulty == 3
+        assert updated.question_text == "問題"
+
+        # 단건 저장은 같은 내용이면 기존 문제를 갱신하지 않고 기존 ID와 함께 오류
+        with pytest.raises(DuplicateContentError) as exc_info:
+            repo.save(make("問題", ["A", "B"], explanation="다른 설명"))
+        assert exc_info.value.existing_id == original.id
+        assert len(repo.find_all()) == 3
+        assert repo.find_by_id(original.id).explanation == "新しい説明"
+
+    def test_question_repository_update_to_duplicate_content(self, temp_db):
+        """기존 문제를 다른 문제와 같은 내용으로 수정해도 고유 인덱스 오류가 발생하지 않음"""
+        from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        repo = SqliteQuestionRepository(db=db)
+        first = repo.save(Question(
+            id=0, level=JLPTLevel.N5, question_type=QuestionType.VOCABULARY,
+            question_text="Q1", choices=["A", "B"], correct_answer="A",
+            explanation="E", difficulty=1
+        ))
+        second = repo.save(Question(
+            id=0, level=JLPTLevel.N5, question_type=QuestionType.VOCABULARY,
+            question_text="Q2", choices=["A", "B"], correct_answer="A",
+            explanation="E", difficulty=1
+        ))
+
+        second.question_text = "Q1"
+        repo.save(second)
+
+        assert repo.find_by_id(second.id).question_text == "Q1"
+        assert repo.find_by_id(first.id).question_text == "Q1"
+
+    def test_question_repository_backfills_content_hash(self, temp_db):
+        """해시가 없는 기존 문제를 백필하고, 기존 중복 행은 삭제하지 않음"""
+        from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        with db.get_connection() as conn:
+            for _ in range(2):
+                conn.execute("""
+                    INSERT INTO questions (level, question_type, question_text,
+                                         choices, correct_answer, explanation, difficulty)
+                    VALUES ('N5', 'vocabulary', 'レガシー', ?, 'A', 'E', 1)
+                """, (json.dumps(["A", "B"]),))
+            conn.commit()
+
+        repo = SqliteQuestionRepository(db=db)
+
+        with db.get_connection() as conn:
+            hashes = [row[0] for row in conn.execute("SELECT content_hash FROM questions ORDER BY id")]
+        assert all(hashes)
+        assert len(set(hashes)) == 2
+        assert len(repo.find_all()) == 2
+
+        # 새 임포트는 첫 번째 행과 중복으로 처리됨
+        inserted = repo.save_all([Question(
+            id=0, level=JLPTLevel.N5, question_type=QuestionType.VOCABULARY,
+            question_text="レガシー", choices=["A", "B"], correct_answer="A",
+            explanation="E", difficulty=1
+        )])
+        assert inserted == 0
+        assert len(repo.find_all()) == 2
+
+    def test_question_repository_audio_metadata(self, temp_db):
+        """오디오 메타데이터는 audio_url과 함께 저장되고, URL이 같으면 재임포트해도 유지"""
+        from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+        from backend.infrastructure.config.database import Database
+        from backend.infrastructure.adapters.audio_metadata import AudioMetadata
+
+        db = Database(db_path=temp_db)
+        repo = SqliteQuestionRepository(db=db)
+
+        def make(audio_url=None):
+            return Question(
+                id=0, level=JLPTLevel.N5, question_type=QuestionType.LISTENING,
+                question_text="会話", choices=["A", "B"], correct_answer="A",
+                explanation="E", difficulty=1, audio_url=audio_url
+            )
+
+        question = make()
+        question.attach_audio("/static/audio/tts/a.mp3", 1200, 3000, "etag-a")
+        saved = repo.save(question)
+        found = repo.find_by_id(saved.id)
+        assert (found.audio_size_bytes, found.audio_duration_ms, found.audio_etag) == (1200, 3000, "etag-a")
+
+        # 같은 URL로 메타데이터 없이 다시 임포트해도 유지, 오디오 없이 임포트해도 유지
+        repo.save_all([make("/static/audio/tts/a.mp3"), make()])
+        assert repo.find_by_id(saved.id).audio_etag == "etag-a"
+
+        # URL이 바뀌면 메타데이터도 교체
+        repo.save_all([make("/static/audio/b.mp3")])
+        found = repo.find_by_id(saved.id)
+        assert (found.audio_url, found.audio_etag) == ("/static/audio/b.mp3", None)
+
+        # 같은 오디오를 쓰는 문제를 URL 단위로 백필
+        assert repo.find_audio_urls_missing_metadata() == ["/static/audio/b.mp3"]
+        metadata = AudioMetadata(size_bytes=10, duration_ms=None, etag="etag-b")
+        assert repo.update_audio_metadata({"/static/audio/b.mp3": metadata}) == 1
+        assert repo.find_by_id(saved.id).audio_size_bytes == 10
+        assert repo.find_audio_urls_missing_metadata() == []
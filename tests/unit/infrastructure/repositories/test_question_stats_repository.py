@@ -0,0 +1,97 @@
+"""
+문항 분석 통계 Repository 테스트
+저장(교체), 기준 답안 ID, 레벨/유형/응답 수 필터와 정렬 검증
+"""
+
+import pytest
+import os
+import tempfile
+from backend.domain.entities.question import Question
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+from backend.infrastructure.repositories.question_stats_repository import SqliteQuestionStatsRepository
+
+
+class TestQuestionStatsRepository:
+    """문항 분석 통계 Repository 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        # 테스트 후 정리
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def db(self, temp_db):
+        """Database 인스턴스 생성"""
+        return Database(db_path=temp_db)
+
+    @pytest.fixture
+    def repository(self, db):
+        """문항 분석 통계 Repository 인스턴스 생성"""
+        return SqliteQuestionStatsRepository(db=db)
+
+    def _stats(self, question_id, responses, p_value, discrimination, last_answer_id):
+        """저장용 통계 딕셔너리"""
+        return {
+            'question_id': question_id,
+            'responses': responses,
+            'correct_count': round(responses * p_value),
+            'p_value': p_value,
+            'discrimination': discrimination,
+            'median_time_seconds': 30.0,
+            'choice_rates': {'はい': p_value},
+            'last_answer_id': last_answer_id
+        }
+
+    @pytest.fixture
+    def stats(self, db, repository):
+        """N5 어휘 2문제, N4 문법 1문제의 통계"""
+        question_repo = SqliteQuestionRepository(db=db)
+        for i, (level, question_type) in enumerate([
+            (JLPTLevel.N5, QuestionType.VOCABULARY),
+            (JLPTLevel.N5, QuestionType.VOCABULARY),
+            (JLPTLevel.N4, QuestionType.GRAMMAR),
+        ]):
+            question_repo.save(Question(
+                id=0, level=level, question_type=question_type,
+                question_text=f"問題{i}", choices=["はい", "いいえ"], correct_answer="はい",
+                explanation="해설", difficulty=1
+            ))
+        repository.save_all([
+            self._stats(1, 10, 0.9, 0.1, 30),
+            self._stats(2, 3, 0.5, None, 12),
+            self._stats(3, 20, 0.4, 0.6, 45),
+        ])
+
+    def test_find_by_question_id(self, repository, stats):
+        """문제 정보와 함께 조회하고, 통계가 없으면 None"""
+        found = repository.find_by_question_id(1)
+
+        assert (found['level'], found['question_type'], found['p_value']) == ('N5', 'vocabulary', 0.9)
+        assert found['choice_rates'] == {'はい': 0.9}
+        assert repository.find_by_question_id(99) is None
+        assert repository.find_watermark() == 45
+
+    def test_find_all_filters_and_sorts(self, repository, stats):
+        """변별도 낮은 순(None은 마지막), 레벨/유형/최소 응답 수 필터"""
+        assert [item['question_id'] for item in repository.find_all()] == [1, 3, 2]
+        assert [item['question_id'] for item in repository.find_all(sort='responses')] == [3, 1, 2]
+        assert [item['question_id'] for item in repository.find_all(level='N5', min_responses=5)] == [1]
+        assert [item['question_id'] for item in repository.find_all(question_type='grammar')] == [3]
+        with pytest.raises(ValueError):
+            repository.find_all(sort='unknown')
+
+    def test_save_all_upserts_or_replaces(self, repository, stats):
+        """같은 문제는 교체되고, replace면 나머지 통계는 지워짐"""
+        repository.save_all([self._stats(1, 11, 1.0, None, 50)])
+        assert repository.find_by_question_id(1)['responses'] == 11
+        assert repository.find_by_question_id(3) is not None
+
+        repository.save_all([self._stats(2, 4, 0.5, 0.2, 51)], replace=True)
+        assert [item['question_id'] for item in repository.find_all()] == [2]
@@ -131,3 +131,75 @@ class TestSqliteStudySessionRepository:
             for col in expected_columns:
                 assert col in column_names
 
+
+    def test_study_session_question_links(self, temp_db):
+        """문제 ID는 study_session_questions에 순서대로 저장하고 문제 ID로 세션을 역조회"""
+        from backend.infrastructure.repositories.study_session_repository import SqliteStudySessionRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        repo = SqliteStudySessionRepository(db=db)
+
+        session = repo.save(StudySession(
+            id=None, user_id=1, study_date=date(2025, 1, 4), study_hour=10,
+            total_questions=3, correct_count=2, time_spent_minutes=5, question_ids=[30, 10, 20]
+        ))
+        repo.save(StudySession(
+            id=None, user_id=1, study_date=date(2025, 1, 5), study_hour=10,
+            total_questions=1, correct_count=1, time_spent_minutes=1, question_ids=[10]
+        ))
+
+        assert repo.find_by_id(session.id).question_ids == [30, 10, 20]
+        assert repo.find_session_ids_by_question_id(10) == [session.id, session.id + 1]
+
+        # 문제 목록을 바꿔 저장하면 교체
+        session.question_ids = [20]
+        repo.save(session)
+        assert repo.find_by_id(session.id).question_ids == [20]
+        assert repo.find_session_ids_by_question_id(30) == []
+
+    def test_study_session_backfill_question_links(self, temp_db):
+        """JSON만 있는 기존 세션을 이관 (dry-run은 되돌리고, 다시 실행하면 건너뜀)"""
+        from backend.infrastructure.repositories.study_session_repository import SqliteStudySessionRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        repo = SqliteStudySessionRepository(db=db)
+        with db.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO study_sessions (user_id, study_date, study_hour, total_questions, correct_count,
+                                            time_spent_minutes, question_ids)
+                VALUES (1, '2025-01-04', 10, 2, 1, 5, '[7, 5]'), (1, '2025-01-04', 11, 1, 1, 1, NULL)
+            """)
+            conn.commit()
+
+        # 이관 전에도 문제 목록은 JSON으로 조회
+        assert repo.find_session_ids_by_question_id(7) == []
+        assert repo.find_by_id(1).question_ids == [7, 5]
+
+        assert repo.backfill_question_links(dry_run=True) == (1, 2)
+        assert repo.find_session_ids_by_question_id(7) == []
+        assert repo.backfill_question_links() == (1, 2)
+        assert repo.find_session_ids_by_question_id(7) == [1]
+        assert repo.find_by_id(1).question_ids == [7, 5]
+        assert repo.find_by_id(2).question_ids is None
+        assert repo.backfill_question_links() == (0, 0)
+
+    def test_study_session_question_links_backfilled_on_database_init(self, temp_db):
+        """Database 초기화 시 JSON만 있는 세션을 자동 이관"""
+        from backend.infrastructure.repositories.study_session_repository import SqliteStudySessionRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        SqliteStudySessionRepository(db=db)
+        with db.get_connection() as conn:
+            conn.execute("""
+                INSERT INTO study_sessions (user_id, study_date, study_hour, total_questions, correct_count,
+                                            time_spent_minutes, question_ids)
+                VALUES (1, '2025-01-04', 10, 2, 1, 5, '[7, 5]')
+            """)
+            conn.commit()
+
+        repo = SqliteStudySessionRepository(db=Database(db_path=temp_db))
+        assert repo.find_session_ids_by_question_id(7) == [1]
+        assert repo.backfill_question_links() == (0, 0)
@@ -308,6 +308,96 @@ class TestSqliteTestRepository:
         assert len(n5_tests) == 2
         assert all(t.level == JLPTLevel.N5 for t in n5_tests)
 
+    def test_test_repository_find_question_exposure(self, temp_db, saved_questions):
+        """레벨별 시험 수와 문제별 출제 횟수"""
+        from backend.infrastructure.repositories.test_repository import SqliteTestRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        repo = SqliteTestRepository(db=db)
+
+        repo.save(Test(id=0, title="T1", level=JLPTLevel.N5, questions=saved_questions, time_limit_minutes=60))
+        repo.save(Test(id=0, title="T2", level=JLPTLevel.N5, questions=saved_questions[:1], time_limit_minutes=60))
+        repo.save(Test(id=0, title="T3", level=JLPTLevel.N4, questions=saved_questions, time_limit_minutes=60))
+
+        tests_count, exposure = repo.find_question_exposure(JLPTLevel.N5)
+        assert tests_count == 2
+        assert exposure == {saved_questions[0].id: 2, saved_questions[1].id: 1}
+        assert repo.find_question_exposure(JLPTLevel.N1) == (0, {})
+
+    def test_test_repository_question_links(self, temp_db, saved_questions):
+        """문제 목록은 test_questions에 순서대로 저장하고 문제 ID로 시험을 역조회"""
+        from backend.infrastructure.repositories.test_repository import SqliteTestRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        repo = SqliteTestRepository(db=db)
+        q1, q2 = saved_questions
+
+        test = repo.save(Test(id=0, title="T1", level=JLPTLevel.N5, questions=[q2, q1], time_limit_minutes=60))
+        other = repo.save(Test(id=0, title="T2", level=JLPTLevel.N5, questions=[q1], time_limit_minutes=60))
+
+        with db.get_connection() as conn:
+            links = conn.execute(
+                "SELECT position, question_id FROM test_questions WHERE test_id = ? ORDER BY position", (test.id,)
+            ).fetchall()
+        assert [tuple(link) for link in links] == [(0, q2.id), (1, q1.id)]
+        assert [q.id for q in repo.find_by_id(test.id).questions] == [q2.id, q1.id]
+        assert repo.find_test_ids_by_question_id(q1.id) == [test.id, other.id]
+
+        # 문제 목록을 바꿔 저장하면 교체, 삭제하면 함께 삭제
+        test.questions = [q1]
+        repo.save(test)
+        assert repo.find_test_ids_by_question_id(q2.id) == []
+        repo.delete(other)
+        assert repo.find_test_ids_by_question_id(q1.id) == [test.id]
+
+    def test_test_repository_backfill_question_links(self, temp_db, saved_questions):
+        """JSON만 있는 기존 시험을 이관 (이관 전에는 문제만 JSON으로 조회, 다시 실행하면 건너뜀)"""
+        from backend.infrastructure.repositories.test_repository import SqliteTestRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        repo = SqliteTestRepository(db=db)
+        q1, q2 = saved_questions
+        with db.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO tests (id, title, level, question_ids, time_limit_minutes) VALUES (1, 'T', 'N5', ?, 60)",
+                (json.dumps([q2.id, q1.id]),)
+            )
+            conn.commit()
+
+        assert [q.id for q in repo.find_by_id(1).questions] == [q2.id, q1.id]
+        assert repo.find_test_ids_by_question_id(q1.id) == []
+
+        assert repo.backfill_question_links(dry_run=True) == (1, 2)
+        assert repo.find_test_ids_by_question_id(q1.id) == []
+        assert repo.backfill_question_links() == (1, 2)
+        assert repo.find_test_ids_by_question_id(q1.id) == [1]
+        assert [q.id for q in repo.find_by_id(1).questions] == [q2.id, q1.id]
+        assert repo.backfill_question_links() == (0, 0)
+
+    def test_question_links_backfilled_on_database_init(self, temp_db, saved_questions):
+        """Database 초기화 시 JSON만 있는 시험을 자동 이관해 역조회/노출 집계가 연결 테이블만으로 동작"""
+        from backend.infrastructure.repositories.test_repository import SqliteTestRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        q1, q2 = saved_questions
+        with db.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO tests (id, title, level, question_ids, time_limit_minutes) VALUES (1, 'T', 'N5', ?, 60)",
+                (json.dumps([q2.id, q1.id]),)
+            )
+            conn.commit()
+
+        repo = SqliteTestRepository(db=Database(db_path=temp_db))
+        linked = repo.save(Test(id=0, title="T2", level=JLPTLevel.N5, questions=[q1], time_limit_minutes=60))
+
+        assert repo.find_test_ids_by_question_id(q1.id) == [1, linked.id]
+        assert repo.find_question_exposure(JLPTLevel.N5) == (2, {q1.id: 2, q2.id: 1})
+        assert repo.backfill_question_links() == (0, 0)
+
     def test_test_repository_find_by_status(self, temp_db, sample_questions):
         """TestRepository find_by_status 기능 테스트"""
         from backend.infrastructure.repositories.test_repository import SqliteTestRepository
@@ -0,0 +1,240 @@
+"""
+사용자 일별 학습 롤업 Repository 테스트
+쓰기 시점 갱신(학습 이력/학습 세션/단어 복습), 기간 조회, 재구성 검증
+"""
+
+import pytest
+import os
+import tempfile
+from datetime import date
+from backend.domain.entities.answer_detail import AnswerDetail
+from backend.domain.entities.learning_history import LearningHistory
+from backend.domain.entities.study_session import StudySession
+from backend.domain.entities.user_vocabulary import UserVocabulary
+from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.answer_detail_repository import SqliteAnswerDetailRepository
+from backend.infrastructure.repositories.learning_history_repository import SqliteLearningHistoryRepository
+from backend.infrastructure.repositories.study_session_repository import SqliteStudySessionRepository
+from backend.infrastructure.repositories.user_daily_rollup_repository import SqliteUserDailyRollupRepository
+from backend.infrastructure.repositories.user_vocabulary_repository import SqliteUserVocabularyRepository
+
+
+class TestUserDailyRollupRepository:
+    """사용자 일별 학습 롤업 Repository 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        # 테스트 후 정리
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def db(self, temp_db):
+        """Database 인스턴스 생성"""
+        return Database(db_path=temp_db)
+
+    @pytest.fixture
+    def repository(self, db):
+        """롤업 Repository 인스턴스 생성"""
+        return SqliteUserDailyRollupRepository(db=db)
+
+    def _save_test(self, db, user_id, result_id, study_date, answers):
+        """시험 제출처럼 답안 상세 저장 후 학습 이력 저장 (answers: (문제 유형, 정답 여부) 목록)"""
+        answer_repo = SqliteAnswerDetailRepository(db=db)
+        for index, (question_type, is_correct) in enumerate(answers, start=1):
+            answer_repo.save(AnswerDetail(
+                id=None, result_id=result_id, question_id=index,
+                user_answer="A", correct_answer="A" if is_correct else "B",
+                is_correct=is_correct, time_spent_seconds=30, difficulty=1,
+                question_type=question_type
+            ))
+        return SqliteLearningHistoryRepository(db=db).save(LearningHistory(
+            id=None, user_id=user_id, test_id=1, result_id=result_id,
+            study_date=study_date, study_hour=9,
+            total_questions=len(answers),
+            correct_count=sum(1 for _, is_correct in answers if is_correct),
+            time_spent_minutes=10
+        ))
+
+    def _save_study_session(self, db, user_id, study_date):
+        """학습 모드 세션 저장 (10문제 중 8개 정답, 15분)"""
+        return SqliteStudySessionRepository(db=db).save(StudySession(
+            id=None, user_id=user_id, study_date=study_date, study_hour=20,
+            total_questions=10, correct_count=8, time_spent_minutes=15,
+            level=JLPTLevel.N5, question_types=[QuestionType.VOCABULARY]
+        ))
+
+    def test_empty_day_returns_zeros(self, repository):
+        """기록이 없는 날은 모든 카운터가 0"""
+        rollup = repository.find_by_user_and_date(1, date(2025, 1, 1))
+
+        assert rollup['date'] == '2025-01-01'
+        assert rollup['questions_answered'] == 0
+        assert rollup['study_sessions'] == 0
+        assert rollup['question_types']['grammar'] == {'total': 0, 'correct': 0}
+
+    def test_test_submission_updates_rollup(self, db, repository):
+        """학습 이력 저장 시 시험 수와 answer_details 기준 유형별 집계가 같이 갱신됨"""
+        self._save_test(db, 1, 1, date(2025, 1, 1), [
+            (QuestionType.VOCABULARY, True),
+            (QuestionType.VOCABULARY, False),
+            (QuestionType.GRAMMAR, True),
+        ])
+        self._save_study_session(db, 1, date(2025, 1, 1))
+
+        rollup = repository.find_by_user_and_date(1, date(2025, 1, 1))
+
+        assert rollup['questions_answered'] == 13
+        assert rollup['correct_count'] == 10
+        assert rollup['time_spent_minutes'] == 25
+        assert rollup['tests_completed'] == 1
+        assert rollup['study_sessions'] == 1
+        assert rollup['question_types']['vocabulary'] == {'total': 2, 'correct': 1}
+        assert rollup['question_types']['grammar'] == {'total': 1, 'correct': 1}
+        assert rollup['question_types']['reading'] == {'total': 0, 'correct': 0}
+
+    def test_update_and_delete_adjust_rollup(self, db, repository):
+        """수정하면 이전 값을 빼고 새 값을 더하며, 삭제하면 빼기 (날짜가 바뀌면 두 날 모두 반영)"""
+        history_repo = SqliteLearningHistoryRepository(db=db)
+        history = self._save_test(db, 1, 1, date(2025, 1, 1), [(QuestionType.READING, True)])
+
+        history.study_date = date(2025, 1, 2)
+        history_repo.save(history)
+        assert repository.find_by_user_and_date(1, date(2025, 1, 1))['questions_answered'] == 0
+        moved = repository.find_by_user_and_date(1, date(2025, 1, 2))
+        assert moved['tests_completed'] == 1
+        assert moved['question_types']['reading'] == {'total': 1, 'correct': 1}
+
+        history_repo.delete(history)
+        deleted = repository.find_by_user_and_date(1, date(2025, 1, 2))
+        assert deleted['tests_completed'] == 0
+        assert deleted['question_types']['reading'] == {'total': 0, 'correct': 0}
+
+    def test_vocabulary_reviews_counted_on_review_date(self, db, repository):
+        """단어 복습은 review_count 증가분을 복습 날짜에 더함 (단건/일괄 저장)"""
+        user_vocab_repo = SqliteUserVocabularyRepository(db=db)
+        saved = user_vocab_repo.save(UserVocabulary(
+            id=None, user_id=1, vocabulary_id=1,
+            review_count=1, last_review_date=date(2025, 1, 1)
+        ))
+        saved.review_count = 2
+        saved.last_review_date = date(2025, 1, 2)
+        user_vocab_repo.save(saved)
+        user_vocab_repo.save_all([
+            UserVocabulary(id=None, user_id=1, vocabulary_id=1, review_count=3, last_review_date=date(2025, 1, 2)),
+            UserVocabulary(id=None, user_id=1, vocabulary_id=2, review_count=1, last_review_date=date(2025, 1, 2)),
+        ])
+
+        assert repository.find_by_user_and_date(1, date(2025, 1, 1))['vocabulary_reviews'] == 1
+        assert repository.find_by_user_and_date(1, date(2025, 1, 2))['vocabulary_reviews'] == 3
+
+    def test_find_by_user_and_period(self, db, repository):
+        """기간 조회는 해당 사용자의 기록이 있는 날만 날짜 순으로 반환"""
+        self._save_study_session(db, 1, date(2025, 1, 3))
+        self._save_study_session(db, 1, date(2025, 1, 1))
+        self._save_study_session(db, 1, date(2025, 1, 10))
+        self._save_study_session(db, 2, date(2025, 1, 2))
+
+        rollups = repository.find_by_user_and_period(1, date(2025, 1, 1), date(2025, 1, 7))
+
+        assert [rollup['date'] for rollup in rollups] == ['2025-01-01', '2025-01-03']
+
+    def test_aggregate_by_period(self, db, repository):
+        """주(월요일 시작)/월 단위로 묶은 합계와 학습한 날 수"""
+        # 2025-01-05(일)은 12/30 주, 2025-01-06(월)과 2025-02-01은 각각 새 주
+        for study_date in (date(2024, 12, 31), date(2025, 1, 5), date(2025, 1, 6), date(2025, 2, 1)):
+            self._save_study_session(db, 1, study_date)
+        self._save_study_session(db, 2, date(2025, 1, 6))
+
+        weeks = repository.aggregate_by_period(1, date(2024, 12, 1), date(2025, 1, 31), 'week')
+        months = repository.aggregate_by_period(1, date(2024, 12, 1), date(2025, 2, 28), 'month')
+
+        assert [(row['period_start'], row['questions_answered'], row['active_days']) for row in weeks] == [
+            ('2024-12-30', 20, 2), ('2025-01-06', 10, 1)
+        ]
+        assert [(row['period_start'], row['study_sessions']) for row in months] == [
+            ('2024-12-01', 1), ('2025-01-01', 2), ('2025-02-01', 1)
+        ]
+        with pytest.raises(ValueError):
+            repository.aggregate_by_period(1, date(2025, 1, 1), date(2025, 1, 31), 'year')
+
+    def test_rebuild_matches_incremental_rollup(self, db, repository):
+        """재구성 결과가 쓰기 시점 갱신 결과와 같고, 단어 복습 횟수는 유지됨"""
+        self._save_test(db, 1, 1, date(2025, 1, 1), [(QuestionType.LISTENING, False), (QuestionType.GRAMMAR, True)])
+        self._save_test(db, 1, 2, date(2025, 1, 1), [(QuestionType.LISTENING, True)])
+        self._save_study_session(db, 1, date(2025, 1, 2))
+        self._save_test(db, 2, 3, date(2025, 1, 1), [(QuestionType.READING, True)])
+        SqliteUserVocabularyRepository(db=db).save(UserVocabulary(
+            id=None, user_id=1, vocabulary_id=1, review_count=2, last_review_date=date(2025, 1, 3)
+        ))
+        expected = repository.find_by_user_and_period(1, date(2025, 1, 1), date(2025, 1, 31))
+
+        with db.get_connection() as conn:
+            conn.execute(
+                "UPDATE user_daily_rollup SET questions_answered = 999, listening_total = 999"
+            )
+            conn.commit()
+        result = repository.rebuild()
+
+        assert result == {'rows': 4, 'streak_users': 2}
+        assert repository.find_by_user_and_period(1, date(2025, 1, 1), date(2025, 1, 31)) == expected
+        assert expected[0]['question_types']['listening'] == {'total': 2, 'correct': 1}
+        assert expected[2]['vocabulary_reviews'] == 2
+
+    def test_rebuild_single_user(self, db, repository):
+        """사용자를 지정하면 그 사용자의 롤업만 재구성"""
+        self._save_study_session(db, 1, date(2025, 1, 1))
+        self._save_study_session(db, 2, date(2025, 1, 1))
+        with db.get_connection() as conn:
+            conn.execute("UPDATE user_daily_rollup SET questions_answered = 0")
+            conn.commit()
+
+        assert repository.rebuild(user_id=1) == {'rows': 1, 'streak_users': 2}
+
+        assert repository.find_by_user_and_date(1, date(2025, 1, 1))['questions_answered'] == 10
+        assert repository.find_by_user_and_date(2, date(2025, 1, 1))['questions_answered'] == 0
+
+    def test_rebuild_recomputes_streaks(self, db, repository):
+        """재구성은 apply를 거치지 않으므로 끝난 뒤 연속 학습 일수를 롤업에서 다시 계산"""
+        from backend.infrastructure.repositories.user_streak_repository import SqliteUserStreakRepository
+
+        for day in (1, 2, 3):
+            self._save_study_session(db, 1, date(2025, 1, day))
+        with db.get_connection() as conn:
+            conn.execute("DELETE FROM user_streaks")
+            conn.commit()
+
+        repository.rebuild(today=date(2025, 1, 3))
+
+        assert SqliteUserStreakRepository(db=db).find_by_user_id(1) == {
+            'user_id': 1, 'current_streak': 3, 'longest_streak': 3, 'last_study_date': '2025-01-03'
+        }
+
+    def test_backfill_on_database_init(self, db, temp_db):
+        """롤업이 비어 있고 원본 이력이 있으면 Database 초기화 시 자동으로 재구성 (채워져 있으면 건너뜀)"""
+        self._save_test(db, 1, 1, date(2025, 1, 1), [(QuestionType.GRAMMAR, True)])
+        self._save_study_session(db, 1, date(2025, 1, 2))
+        with db.get_connection() as conn:
+            conn.execute("DELETE FROM user_daily_rollup")
+            conn.commit()
+
+        reopened = Database(db_path=temp_db)
+        rows = SqliteUserDailyRollupRepository(db=reopened).find_by_user_and_period(
+            1, date(2025, 1, 1), date(2025, 1, 31)
+        )
+
+        assert [(row['date'], row['questions_answered']) for row in rows] == [
+            ('2025-01-01', 1), ('2025-01-02', 10)
+        ]
+        assert SqliteUserDailyRollupRepository(db=reopened).backfill_if_empty() is None
+
+    def test_apply_rejects_unknown_counter(self, db):
+        """알 수 없는 카운터 이름은 거부"""
+        with db.get_connection() as conn:
+            with pytest.raises(ValueError):
+                SqliteUserDailyRollupRepository.apply(conn, 1, '2025-01-01', {'unknown': 1})
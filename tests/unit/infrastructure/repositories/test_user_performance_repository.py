@@ -7,6 +7,7 @@ import pytest
 import os
 import tempfile
 import json
+import sqlite3
 from datetime import datetime, date
 from backend.domain.entities.user_performance import UserPerformance
 
@@ -307,3 +308,46 @@ class TestSqliteUserPerformanceRepository:
         user_performances = repo.find_by_user_id(1)
         assert len(user_performances) == 2
         assert all(p.user_id == 1 for p in user_performances)
+
+    def test_save_with_level_scores_is_atomic(self, temp_db):
+        """성능 데이터와 레벨별 점수는 한 트랜잭션으로 저장되어, 실패하면 둘 다 반영되지 않음"""
+        from backend.infrastructure.repositories.user_performance_repository import SqliteUserPerformanceRepository
+        from backend.infrastructure.repositories.level_score_repository import SqliteLevelScoreRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        repo = SqliteUserPerformanceRepository(db=db)
+        level_score_repo = SqliteLevelScoreRepository(db=db)
+        user_performance = UserPerformance(
+            id=None,
+            user_id=1,
+            analysis_period_start=date(2024, 1, 1),
+            analysis_period_end=date(2024, 1, 31),
+            level_progression={"N5": [{"date": "2024-01-02", "score": 60.0}, {"date": "2024-01-03", "score": 80.0}]}
+        )
+        saved = repo.save(user_performance)
+
+        # 요약 저장이 실패하면 이관한 점수도 롤백
+        legacy = saved.compact_level_progression()
+        rows = SqliteLevelScoreRepository.legacy_rows(1, legacy)
+        with db.get_connection() as conn:
+            conn.execute("""
+                CREATE TRIGGER fail_update BEFORE UPDATE ON user_performance
+                BEGIN SELECT RAISE(ABORT, 'update failed'); END
+            """)
+            conn.commit()
+        with pytest.raises(sqlite3.IntegrityError):
+            repo.save(saved, level_scores=rows)
+        assert level_score_repo.find_series(1, 'N5', date(2024, 1, 1), date(2024, 1, 31)) == []
+        with db.get_connection() as conn:
+            conn.execute("DROP TRIGGER fail_update")
+            conn.commit()
+
+        # 성공하면 점수와 요약이 함께 저장
+        found = repo.find_by_user_id(1)[0]
+        legacy = found.compact_level_progression()
+        repo.save(found, level_scores=SqliteLevelScoreRepository.legacy_rows(1, legacy))
+        assert level_score_repo.find_series(1, 'N5', date(2024, 1, 1), date(2024, 1, 31)) == [
+            ('2024-01-02', 60.0), ('2024-01-03', 80.0)
+        ]
+        assert repo.find_by_user_id(1)[0].level_progression == {"N5": {"tests": 2, "average_score": 70.0}}
@@ -0,0 +1,102 @@
+"""
+사용자 연속 학습 일수 Repository 테스트
+학습 활동 시 O(1) 갱신, users.study_streak 동기화, 일괄 교체 검증
+"""
+
+import pytest
+import os
+import tempfile
+from datetime import date
+from backend.domain.entities.study_session import StudySession
+from backend.domain.entities.user import User
+from backend.domain.value_objects.jlpt import JLPTLevel
+from backend.infrastructure.config.database import Database
+from backend.infrastructure.repositories.study_session_repository import SqliteStudySessionRepository
+from backend.infrastructure.repositories.user_repository import SqliteUserRepository
+from backend.infrastructure.repositories.user_streak_repository import SqliteUserStreakRepository
+
+
+class TestUserStreakRepository:
+    """사용자 연속 학습 일수 Repository 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        # 테스트 후 정리
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def db(self, temp_db):
+        """Database 인스턴스 생성"""
+        return Database(db_path=temp_db)
+
+    @pytest.fixture
+    def repository(self, db):
+        """연속 학습 일수 Repository 인스턴스 생성"""
+        return SqliteUserStreakRepository(db=db)
+
+    @pytest.fixture
+    def user(self, db):
+        """테스트용 사용자"""
+        return SqliteUserRepository(db=db).save(
+            User(id=None, email="streak@example.com", username="streak", target_level=JLPTLevel.N5)
+        )
+
+    def _record(self, db, user_id, *study_dates):
+        """학습 활동 기록"""
+        with db.get_connection() as conn:
+            for study_date in study_dates:
+                SqliteUserStreakRepository.record_activity(conn, user_id, study_date)
+            conn.commit()
+
+    def test_record_activity_transitions(self, db, repository, user):
+        """다음 날이면 1 증가, 같은 날/과거 날짜는 그대로, 하루 이상 비면 1부터"""
+        self._record(db, user.id, '2025-01-01', '2025-01-02', '2025-01-02', '2025-01-03', '2024-12-31')
+        assert repository.find_by_user_id(user.id) == {
+            'user_id': user.id, 'current_streak': 3, 'longest_streak': 3, 'last_study_date': '2025-01-03'
+        }
+
+        self._record(db, user.id, '2025-01-05')
+        streak = repository.find_by_user_id(user.id)
+        assert (streak['current_streak'], streak['longest_streak']) == (1, 3)
+        assert SqliteUserRepository(db=db).find_by_id(user.id).study_streak == 1
+
+    def test_study_session_save_updates_streak(self, db, repository, user):
+        """학습 세션 저장 시 같은 트랜잭션에서 연속 학습 일수 갱신"""
+        session_repo = SqliteStudySessionRepository(db=db)
+        for day in (1, 2):
+            session_repo.save(StudySession(
+                id=None, user_id=user.id, study_date=date(2025, 1, day), study_hour=9,
+                total_questions=5, correct_count=3, time_spent_minutes=10, level=JLPTLevel.N5
+            ))
+
+        assert repository.find_by_user_id(user.id)['current_streak'] == 2
+        assert SqliteUserRepository(db=db).find_by_id(user.id).study_streak == 2
+
+    def test_replace_all_syncs_users(self, db, repository, user):
+        """일괄 교체 시 목록에 없는 사용자의 study_streak는 0"""
+        self._record(db, user.id, '2025-01-01')
+
+        repository.replace_all([(999, 4, 7, '2025-01-03')])
+
+        assert repository.find_by_user_id(user.id) is None
+        assert repository.find_by_user_id(999)['longest_streak'] == 7
+        assert SqliteUserRepository(db=db).find_by_id(user.id).study_streak == 0
+
+    def test_find_active_days(self, db, repository):
+        """활동이 있는 롤업 날짜만 사용자/날짜 순으로 반환"""
+        with db.get_connection() as conn:
+            conn.execute(
+                "INSERT INTO user_daily_rollup (user_id, study_date, vocabulary_reviews) VALUES (2, '2025-01-01', 3)"
+            )
+            conn.execute(
+                "INSERT INTO user_daily_rollup (user_id, study_date, questions_answered) VALUES (1, '2025-01-02', 5)"
+            )
+            conn.execute("INSERT INTO user_daily_rollup (user_id, study_date) VALUES (1, '2025-01-01')")
+            conn.commit()
+
+        assert repository.find_active_days() == [(1, '2025-01-02'), (2, '2025-01-01')]
@@ -0,0 +1,391 @@
+"""
+UserVocabulary Repository 테스트
+"""
+
+import pytest
+import os
+import tempfile
+from datetime import date
+from backend.domain.entities.user_vocabulary import UserVocabulary
+from backend.domain.entities.vocabulary import Vocabulary
+from backend.domain.value_objects.jlpt import JLPTLevel, MemorizationStatus
+from backend.infrastructure.repositories.user_vocabulary_repository import SqliteUserVocabularyRepository
+from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+from backend.infrastructure.config.database import Database
+
+
+class TestUserVocabularyRepository:
+    """UserVocabulary Repository 테스트"""
+
+    @pytest.fixture
+    def temp_db(self):
+        """임시 데이터베이스 파일 생성"""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            db_path = f.name
+        yield db_path
+        # 테스트 후 정리
+        if os.path.exists(db_path):
+            os.unlink(db_path)
+
+    @pytest.fixture
+    def db(self, temp_db):
+        """Database 인스턴스 생성"""
+        return Database(db_path=temp_db)
+
+    @pytest.fixture
+    def vocab_repo(self, db):
+        """Vocabulary Repository 인스턴스 생성"""
+        return SqliteVocabularyRepository(db=db)
+
+    @pytest.fixture
+    def repository(self, db):
+        """UserVocabulary Repository 인스턴스 생성"""
+        return SqliteUserVocabularyRepository(db=db)
+
+    def _save_vocabulary(self, vocab_repo, word):
+        """테스트용 단어 저장"""
+        return vocab_repo.save(Vocabulary(
+            id=0,
+            word=word,
+            reading=word,
+            meaning=f"{word} 의미",
+            level=JLPTLevel.N5,
+            example_sentence=f"{word}の例文"
+        ))
+
+    def _save_user_vocab(self, repository, user_id, vocabulary_id, next_review_date, **kwargs):
+        """테스트용 사용자 단어 학습 상태 저장"""
+        return repository.save(UserVocabulary(
+            id=None,
+            user_id=user_id,
+            vocabulary_id=vocabulary_id,
+            memorization_status=MemorizationStatus.LEARNING,
+            next_review_date=next_review_date,
+            **kwargs
+        ))
+
+    def test_composite_review_index_created(self, repository, db):
+        """(user_id, next_review_date) 복합 인덱스 생성 테스트"""
+        with db.get_connection() as conn:
+            cursor = conn.execute("PRAGMA index_info(idx_user_vocabulary_user_next_review)")
+            columns = [row[2] for row in cursor.fetchall()]
+
+        assert columns == ['user_id', 'next_review_date']
+
+    def test_find_due_for_review_with_vocabulary(self, repository, vocab_repo):
+        """복습 대상 단어를 단어 정보와 함께 조회하는 테스트"""
+        # Given
+        today = date(2025, 1, 10)
+        v1 = self._save_vocabulary(vocab_repo, "水")
+        v2 = self._save_vocabulary(vocab_repo, "火")
+        v3 = self._save_vocabulary(vocab_repo, "木")
+        self._save_user_vocab(repository, 1, v1.id, date(2025, 1, 9), interval_days=3)
+        self._save_user_vocab(repository, 1, v2.id, date(2025, 1, 8))
+        self._save_user_vocab(repository, 1, v3.id, date(2025, 1, 11))
+        self._save_user_vocab(repository, 2, v1.id, date(2025, 1, 1))
+
+        # When
+        result = repository.find_due_for_review_with_vocabulary(1, today.isoformat())
+
+        # Then
+        assert [vocab.word for _, vocab in result] == ["火", "水"]
+        user_vocab, vocab = result[1]
+        assert user_vocab.user_id == 1
+        assert user_vocab.vocabulary_id == vocab.id == v1.id
+        assert user_vocab.interval_days == 3
+        assert vocab.level == JLPTLevel.N5
+        assert vocab.example_sentence == "水の例文"
+
+    def test_find_due_for_review_with_vocabulary_matches_priority(self, repository, vocab_repo):
+        """JOIN 조회가 기존 find_due_for_review와 같은 순서를 유지하는지 테스트"""
+        # Given
+        today = "2025-01-10"
+        for i, (due, incorrect) in enumerate([
+            (date(2025, 1, 5), 0), (None, 0), (date(2025, 1, 5), 2), (date(2025, 1, 2), 1)
+        ]):
+            vocab = self._save_vocabulary(vocab_repo, f"単語{i}")
+            self._save_user_vocab(
+                repository, 1, vocab.id, due, consecutive_incorrect=incorrect
+            )
+
+        # When
+        joined = repository.find_due_for_review_with_vocabulary(1, today)
+        plain = repository.find_due_for_review(1, today)
+
+        # Then
+        assert [uv.vocabulary_id for uv, _ in joined] == [uv.vocabulary_id for uv in plain]
+
+    def test_find_due_for_review_with_vocabulary_pagination(self, repository, vocab_repo):
+        """복습 대상 단어 페이지네이션 테스트"""
+        # Given
+        for day in range(1, 6):
+            vocab = self._save_vocabulary(vocab_repo, f"単語{day}")
+            self._save_user_vocab(repository, 1, vocab.id, date(2025, 1, day))
+
+        # When
+        first_page = repository.find_due_for_review_with_vocabulary(1, "2025-01-10", limit=2)
+        second_page = repository.find_due_for_review_with_vocabulary(
+            1, "2025-01-10", limit=2, offset=2
+        )
+        rest = repository.find_due_for_review_with_vocabulary(1, "2025-01-10", offset=4)
+
+        # Then
+        assert [v.word for _, v in first_page] == ["単語1", "単語2"]
+        assert [v.word for _, v in second_page] == ["単語3", "単語4"]
+        assert [v.word for _, v in rest] == ["単語5"]
+
+    def test_find_due_for_review_with_vocabulary_pagination_ties(self, repository, vocab_repo):
+        """우선순위가 같은 단어는 ID 순으로 페이지를 나눠 겹치거나 빠지지 않는지 테스트"""
+        # Given
+        saved = []
+        for i in range(7):
+            vocab = self._save_vocabulary(vocab_repo, f"同順{i}")
+            saved.append(self._save_user_vocab(repository, 1, vocab.id, date(2025, 1, 5)).id)
+
+        # When
+        pages = [
+            repository.find_due_for_review_with_vocabulary(1, "2025-01-10", limit=3, offset=offset)
+            for offset in (0, 3, 6)
+        ]
+
+        # Then
+        assert [uv.id for page in pages for uv, _ in page] == sorted(saved)
+
+    def test_save_all_inserts_and_updates(self, repository, vocab_repo):
+        """일괄 upsert 저장 테스트 (신규 생성 + 기존 갱신)"""
+        # Given
+        v1 = self._save_vocabulary(vocab_repo, "水")
+        v2 = self._save_vocabulary(vocab_repo, "火")
+        existing = self._save_user_vocab(repository, 1, v1.id, date(2025, 1, 1))
+        existing.interval_days = 6
+        existing.review_count = 4
+        new_user_vocab = UserVocabulary(
+            id=None,
+            user_id=1,
+            vocabulary_id=v2.id,
+            next_review_date=date(2025, 1, 2),
+            interval_days=1,
+            review_count=1
+        )
+
+        # When
+        repository.save_all([
+            UserVocabulary(
+                id=None,
+                user_id=1,
+                vocabulary_id=v1.id,
+                next_review_date=date(2025, 1, 7),
+                interval_days=existing.interval_days,
+                review_count=existing.review_count
+            ),
+            new_user_vocab
+        ])
+
+        # Then
+        found = {
+            uv.vocabulary_id: uv
+            for uv in repository.find_by_user_and_vocabulary_ids(1, [v1.id, v2.id])
+        }
+        assert len(repository.find_by_user_id(1)) == 2
+        assert found[v1.id].id == existing.id
+        assert found[v1.id].interval_days == 6
+        assert found[v1.id].next_review_date == date(2025, 1, 7)
+        assert found[v2.id].review_count == 1
+
+    def test_save_all_empty(self, repository):
+        """빈 목록 일괄 저장 테스트"""
+        repository.save_all([])
+        assert repository.find_by_user_id(1) == []
+
+    def test_find_by_user_and_vocabulary_ids(self, repository, vocab_repo):
+        """여러 단어 ID로 한 번에 조회 테스트"""
+        # Given
+        v1 = self._save_vocabulary(vocab_repo, "水")
+        v2 = self._save_vocabulary(vocab_repo, "火")
+        self._save_user_vocab(repository, 1, v1.id, date(2025, 1, 1))
+        self._save_user_vocab(repository, 2, v2.id, date(2025, 1, 1))
+
+        # When
+        result = repository.find_by_user_and_vocabulary_ids(1, [v1.id, v2.id])
+
+        # Then
+        assert [uv.vocabulary_id for uv in result] == [v1.id]
+        assert repository.find_by_user_and_vocabulary_ids(1, []) == []
+
+    def test_find_review_schedule_histogram(self, repository, vocab_repo):
+        """복습 예정일 히스토그램 집계 테스트"""
+        # Given
+        for i in range(3):
+            vocab = self._save_vocabulary(vocab_repo, f"単語{i}")
+            self._save_user_vocab(repository, 1, vocab.id, date(2025, 1, 5), interval_days=2)
+        vocab = self._save_vocabulary(vocab_repo, "水")
+        self._save_user_vocab(repository, 1, vocab.id, date(2025, 2, 1), interval_days=30)
+        self._save_user_vocab(repository, 2, vocab.id, date(2025, 1, 5), interval_days=2)
+        self._save_user_vocab(repository, 2, self._save_vocabulary(vocab_repo, "火").id, None)
+
+        # When
+        user_histogram = repository.find_review_schedule_histogram("2025-01-31", user_id=1)
+        global_histogram = repository.find_review_schedule_histogram("2025-01-31")
+
+        # Then
+        assert user_histogram == [("2025-01-05", 2, 2.5, 3)]
+        assert sorted(global_histogram, key=lambda row: row[0] or "") == [
+            (None, 0, 2.5, 1),
+            ("2025-01-05", 2, 2.5, 4),
+        ]
+
+    def test_review_statistics_counter_cache_tracks_writes(self, repository, vocab_repo, db):
+        """카운터 캐시가 save/save_all/delete 이후에도 다시 집계한 값과 일치하는지 테스트"""
+        import random
+        from backend.domain.services.spaced_repetition_service import SpacedRepetitionService
+
+        # Given
+        rng = random.Random(7)
+        srs = SpacedRepetitionService()
+        vocabs = [self._save_vocabulary(vocab_repo, f"単語{i}") for i in range(8)]
+        self._save_user_vocab(repository, 1, vocabs[0].id, None)
+        repository.get_review_statistics(1, "2025-01-01")  # 캐시 생성
+
+        # When / Then
+        for step in range(60):
+            today = date(2025, 1, 1 + step // 6)
+            vocab = rng.choice(vocabs)
+            action = rng.choice(["save", "save_all", "delete"])
+            existing = repository.find_by_user_and_vocabulary(1, vocab.id)
+            if action == "delete":
+                if existing:
+                    repository.delete(existing)
+            elif action == "save":
+                user_vocab = existing or UserVocabulary(id=None, user_id=1, vocabulary_id=vocab.id)
+                srs.calculate_next_review(user_vocab, rng.choice(["easy", "normal", "hard"]), today=today)
+                repository.save(user_vocab)
+            else:
+                batch = []
+                for other in rng.sample(vocabs, 3):
+                    user_vocab = (
+                        repository.find_by_user_and_vocabulary(1, other.id)
+                        or UserVocabulary(id=None, user_id=1, vocabulary_id=other.id)
+                    )
+                    srs.calculate_next_review(user_vocab, rng.choice(["easy", "normal", "hard"]), today=today)
+                    batch.append(user_vocab)
+                repository.save_all(batch)
+
+            cached = repository.get_review_statistics(1, today.isoformat())
+            with db.get_connection() as conn:
+                conn.execute("DELETE FROM user_review_stats WHERE user_id = 1")
+                conn.commit()
+            assert cached == repository.get_review_statistics(1, today.isoformat())
+
+    def test_review_statistics_snapshot_read_inside_write_transaction(self, repository, vocab_repo, db):
+        """다른 연결이 같은 단어를 먼저 저장 중이면 그 커밋 이후의 값을 기준으로 변경분을 반영하는지 테스트"""
+        import threading
+        import time
+
+        # Given
+        vocab = self._save_vocabulary(vocab_repo, "水")
+        user_vocab = self._save_user_vocab(repository, 1, vocab.id, date(2025, 1, 5))
+        repository.get_review_statistics(1, "2025-01-04")  # 캐시 생성
+
+        # 다른 연결이 같은 단어의 첫 복습을 저장하는 중 (쓰기 잠금 보유)
+        other = db.get_connection()
+        conn = other.__enter__()
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute(
+            "UPDATE user_vocabulary SET review_count = 1, last_review_date = '2025-01-04' WHERE id = ?",
+            (user_vocab.id,)
+        )
+        conn.execute(
+            "UPDATE user_review_stats SET total_reviewed = 1, last_review_date = '2025-01-04', "
+            "reviewed_on_last_date = 1 WHERE user_id = 1"
+        )
+
+        # When: 같은 단어를 동시에 저장
+        user_vocab.review_count = 1
+        user_vocab.last_review_date = date(2025, 1, 4)
+        saver = threading.Thread(target=repository.save, args=(user_vocab,))
+        saver.start()
+        time.sleep(0.2)
+        conn.commit()
+        other.__exit__(None, None, None)
+        saver.join()
+
+        # Then
+        stats = repository.get_review_statistics(1, "2025-01-04")
+        assert stats['total_reviewed'] == 1
+        assert stats['reviewed_today'] == 1
+
+    def test_review_statistics_cache_created_lazily(self, repository, vocab_repo, db):
+        """캐시가 없으면 조회 시 집계 쿼리로 생성되는지 테스트 (다른 사용자 기록은 제외)"""
+        # Given
+        vocab = self._save_vocabulary(vocab_repo, "水")
+        self._save_user_vocab(repository, 1, vocab.id, date(2025, 1, 5),
+                              review_count=2, consecutive_correct=2, last_review_date=date(2025, 1, 4))
+
+        self._save_user_vocab(repository, 2, vocab.id, date(2025, 1, 5),
+                              review_count=1, consecutive_correct=2, last_review_date=date(2025, 1, 4))
+
+        # When
+        stats = repository.get_review_statistics(1, "2025-01-04")
+
+        # Then
+        assert stats == {'total_due': 0, 'reviewed_today': 1, 'total_reviewed': 1, 'successful_reviews': 1}
+        assert repository.get_review_statistics(1, "2025-01-05")['reviewed_today'] == 0
+        with db.get_connection() as conn:
+            row = conn.execute("SELECT * FROM user_review_stats WHERE user_id = 1").fetchone()
+        assert row['last_review_date'] == "2025-01-04"
+
+    def test_iter_vocabulary_with_status(self, repository, vocab_repo):
+        """단어 목록을 사용자별 상태와 함께 조회 (학습 기록 없으면 NOT_MEMORIZED)"""
+        # Given
+        water = self._save_vocabulary(vocab_repo, "水")
+        fire = self._save_vocabulary(vocab_repo, "火")
+        repository.upsert(1, water.id, MemorizationStatus.MEMORIZED)
+        repository.upsert(2, fire.id, MemorizationStatus.LEARNING)
+
+        # When
+        result = list(repository.iter_vocabulary_with_status(1))
+
+        # Then
+        assert [(v.word, status) for v, status in result] == [
+            ("火", MemorizationStatus.NOT_MEMORIZED),
+            ("水", MemorizationStatus.MEMORIZED),
+        ]
+
+    def test_iter_vocabulary_with_status_filters(self, repository, vocab_repo):
+        """레벨/상태/검색 필터가 SQL에서 적용되는지 테스트"""
+        # Given
+        water = self._save_vocabulary(vocab_repo, "水")
+        fire = self._save_vocabulary(vocab_repo, "火")
+        tree = vocab_repo.save(Vocabulary(
+            id=0, word="木", reading="き", meaning="나무", level=JLPTLevel.N4
+        ))
+        repository.upsert(1, water.id, MemorizationStatus.LEARNING)
+        repository.upsert(1, tree.id, MemorizationStatus.LEARNING)
+
+        def words(**filters):
+            return [v.word for v, _ in repository.iter_vocabulary_with_status(1, **filters)]
+
+        # Then
+        assert words(level=JLPTLevel.N5) == ["火", "水"]
+        assert words(status=MemorizationStatus.LEARNING) == ["木", "水"]
+        assert words(status=MemorizationStatus.NOT_MEMORIZED) == ["火"]
+        assert words(level=JLPTLevel.N5, status=MemorizationStatus.LEARNING) == ["水"]
+        assert words(search="나무") == ["木"]
+        assert words(search="火") == ["火"]
+
+    def test_iter_vocabulary_with_status_batches_and_pagination(self, repository, vocab_repo):
+        """배치 경계와 limit/offset 페이지네이션 테스트"""
+        # Given
+        saved = [self._save_vocabulary(vocab_repo, f"単語{i}") for i in range(7)]
+        expected = [v.word for v in reversed(saved)]
+
+        def words(**kwargs):
+            return [v.word for v, _ in repository.iter_vocabulary_with_status(1, **kwargs)]
+
+        # Then
+        assert words(batch_size=3) == expected
+        assert words(batch_size=7) == expected
+        assert words(limit=4, batch_size=3) == expected[:4]
+        assert words(limit=4, offset=2, batch_size=3) == expected[2:6]
+        assert words(offset=5, batch_size=2) == expected[5:]
+        assert words(offset=10) == []
@@ -8,6 +8,7 @@ import os
 import tempfile
 from backend.domain.entities.vocabulary import Vocabulary
 from backend.domain.value_objects.jlpt import JLPTLevel
+from backend.infrastructure.repositories.content_hash import DuplicateContentError
 
 
 class TestSqliteVocabularyRepository:
@@ -281,3 +282,88 @@ class TestSqliteVocabularyRepository:
         assert found_vocab.word == "こんにちは"
         assert found_vocab.meaning == "안녕하세요"
 
+
+    def test_vocabulary_find_by_ids(self, temp_db):
+        """여러 ID로 단어 조회 테스트"""
+        from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        repo = SqliteVocabularyRepository(db=db)
+
+        saved = [
+            repo.save(Vocabulary(id=0, word=word, reading=word, meaning="의미", level=JLPTLevel.N5))
+            for word in ["水", "火", "木"]
+        ]
+
+        found = repo.find_by_ids([saved[0].id, saved[2].id, 9999])
+        assert sorted(v.word for v in found) == ["木", "水"]
+        assert repo.find_by_ids([]) == []
+
+    def test_vocabulary_save_all_deduplicates_by_content(self, temp_db):
+        """(단어, 읽기, 레벨)이 같은 단어는 중복 생성되지 않고 의미/예문만 갱신"""
+        from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        repo = SqliteVocabularyRepository(db=db)
+        original = repo.save(Vocabulary(
+            id=0, word="水", reading="みず", meaning="물", level=JLPTLevel.N5,
+            example_sentence="水を飲む。"
+        ))
+
+        batch = [
+            Vocabulary(id=0, word="水", reading="みず", meaning="물 (명사)", level=JLPTLevel.N5),
+            Vocabulary(id=0, word="水", reading="みず", meaning="물", level=JLPTLevel.N4),
+            Vocabulary(id=0, word="火", reading="ひ", meaning="불", level=JLPTLevel.N5),
+        ]
+        inserted = repo.save_all(batch)
+
+        assert inserted == 2
+        assert batch[0].id == original.id
+        assert len(repo.find_all()) == 3
+        updated = repo.find_by_id(original.id)
+        assert updated.meaning == "물 (명사)"
+        assert updated.example_sentence == "水を飲む。"
+
+        # 다시 임포트해도 새 행이 생기지 않음
+        assert repo.save_all([
+            Vocabulary(id=0, word="火", reading="ひ", meaning="불", level=JLPTLevel.N5)
+        ]) == 0
+        assert len(repo.find_all()) == 3
+
+    def test_vocabulary_backfills_content_hash_for_legacy_rows(self, temp_db):
+        """content_hash 컬럼이 없던 기존 테이블을 마이그레이션하고 중복 행은 보존"""
+        import sqlite3
+        from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+        from backend.infrastructure.config.database import Database
+
+        db = Database(db_path=temp_db)
+        with db.get_connection() as conn:
+            conn.execute("DROP TABLE IF EXISTS vocabulary")
+            conn.execute("""
+                CREATE TABLE vocabulary (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    word TEXT NOT NULL,
+                    reading TEXT NOT NULL,
+                    meaning TEXT NOT NULL,
+                    level TEXT NOT NULL,
+                    memorization_status TEXT NOT NULL DEFAULT 'not_memorized',
+                    example_sentence TEXT
+                )
+            """)
+            conn.executemany(
+                "INSERT INTO vocabulary (word, reading, meaning, level) VALUES (?, ?, ?, ?)",
+                [("水", "みず", "물", "N5"), ("水", "みず", "물", "N5")]
+            )
+            conn.commit()
+
+        repo = SqliteVocabularyRepository(db=db)
+
+        assert len(repo.find_all()) == 2
+        repo.save_all([Vocabulary(id=0, word="水", reading="みず", meaning="물", level=JLPTLevel.N5)])
+        assert len(repo.find_all()) == 2
+        with pytest.raises(DuplicateContentError) as exc_info:
+            repo.save(Vocabulary(id=0, word="水", reading="みず", meaning="물", level=JLPTLevel.N5))
+        assert exc_info.value.existing_id == 1
+        assert len(repo.find_all()) == 2
@@ -423,6 +423,25 @@ class TestAdminQuestionsAPI:
             assert data["data"]["question_text"] == "新しい問題"
             assert data["data"]["level"] == "N5"
 
+            # 같은 내용의 문제를 다시 생성하면 기존 문제를 갱신하지 않고 409
+            duplicate = app_client.post(
+                "/api/v1/admin/questions",
+                json={
+                    "level": "N5",
+                    "question_type": "vocabulary",
+                    "question_text": " 新しい問題 ",
+                    "choices": ["選択肢4", "選択肢3", "選択肢2", "選択肢1"],
+                    "correct_answer": "選択肢1",
+                    "explanation": "別の説明",
+                    "difficulty": 3
+                }
+            )
+            assert duplicate.status_code == 409
+            assert f"ID: {data['data']['id']}" in duplicate.json()["detail"]
+            from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+            question = SqliteQuestionRepository(db=db).find_by_id(data["data"]["id"])
+            assert question.explanation == "説明"
+
     def test_get_admin_question_by_id_success(self, app_client, temp_db, admin_user):
         """어드민 특정 문제 조회 성공 테스트"""
         from backend.infrastructure.config.database import Database
@@ -584,6 +603,308 @@ class TestAdminQuestionsAPI:
             assert response.status_code == 404
 
 
+    def test_import_admin_questions_summary(self, app_client, temp_db, admin_user):
+        """어드민 기출문제 임포트 - 요약과 오류 보고서 반환 테스트"""
+        from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+
+        admin, db = admin_user
+
+        with patch('backend.presentation.controllers.admin.get_database') as mock_get_db, \
+             patch('backend.presentation.controllers.auth.get_database') as mock_get_db_auth:
+            mock_get_db.return_value = db
+            mock_get_db_auth.return_value = db
+
+            login_response = app_client.post(
+                "/api/v1/auth/login",
+                json={"email": "admin@example.com"}
+            )
+            assert login_response.status_code == 200
+
+            question = {
+                "level": "N5",
+                "question_type": "vocabulary",
+                "question_text": "問題",
+                "choices": ["選択肢1", "選択肢2"],
+                "correct_answer": "選択肢1",
+                "explanation": "説明",
+                "difficulty": 1
+            }
+            response = app_client.post(
+                "/api/v1/admin/questions/import",
+                json={"questions": [question, {**question, "correct_answer": "없음"}]}
+            )
+            assert response.status_code == 200
+            data = response.json()["data"]
+            assert data["total"] == 2
+            assert data["imported"] == 1
+            assert data["rejected"] == 1
+            assert data["errors"][0]["row"] == 2
+            assert "questions" not in data
+            assert len(SqliteQuestionRepository(db=db).find_all()) == 1
+
+    def test_import_admin_questions_file(self, app_client, temp_db, admin_user):
+        """어드민 기출문제 파일 임포트 - 백그라운드 작업 등록/진행 조회 및 형식 오류 테스트"""
+        import json
+        from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+
+        admin, db = admin_user
+
+        with patch('backend.presentation.controllers.admin.get_database') as mock_get_db, \
+             patch('backend.presentation.controllers.auth.get_database') as mock_get_db_auth:
+            mock_get_db.return_value = db
+            mock_get_db_auth.return_value = db
+
+            login_response = app_client.post(
+                "/api/v1/auth/login",
+                json={"email": "admin@example.com"}
+            )
+            assert login_response.status_code == 200
+
+            questions = [
+                {
+                    "level": "N4",
+                    "question_type": "grammar",
+                    "question_text": f"問題{i}",
+                    "choices": ["A", "B", "C", "D"],
+                    "correct_answer": "A",
+                    "explanation": "説明",
+                    "difficulty": 2
+                }
+                for i in range(3)
+            ]
+            response = app_client.post(
+                "/api/v1/admin/questions/import-file",
+                files={"file": ("questions.json", json.dumps(questions).encode("utf-8"), "application/json")}
+            )
+            assert response.status_code == 202
+            job = response.json()["data"]
+            assert job["job_type"] == "questions"
+            assert job["original_filename"] == "questions.json"
+
+            # TestClient는 응답 전에 백그라운드 작업을 실행함
+            response = app_client.get(f"/api/v1/admin/jobs/{job['id']}")
+            assert response.status_code == 200
+            job = response.json()["data"]
+            assert job["status"] == "completed"
+            assert job["rows_processed"] == 3
+            assert job["rows_imported"] == 3
+            assert job["rows_rejected"] == 0
+            assert job["attempts"] == 1
+            assert job["finished_at"] is not None
+            assert len(SqliteQuestionRepository(db=db).find_all()) == 3
+
+            # 파일 구조 오류는 작업 실패로 기록
+            response = app_client.post(
+                "/api/v1/admin/questions/import-file",
+                files={"file": ("questions.json", b'{"not": "array"}', "application/json")}
+            )
+            assert response.status_code == 202
+            failed = app_client.get(f"/api/v1/admin/jobs/{response.json()['data']['id']}").json()["data"]
+            assert failed["status"] == "failed"
+            assert failed["error_message"]
+
+            response = app_client.post(
+                "/api/v1/admin/questions/import-file",
+                files={"file": ("questions.txt", b"text", "text/plain")}
+            )
+            assert response.status_code == 400
+
+            response = app_client.get("/api/v1/admin/jobs")
+            assert [j["id"] for j in response.json()["data"]] == [failed["id"], job["id"]]
+
+            response = app_client.get("/api/v1/admin/jobs/9999")
+            assert response.status_code == 404
+
+    def test_import_admin_vocabulary_file(self, app_client, temp_db, admin_user):
+        """어드민 기출단어 파일 임포트 - CSV 백그라운드 작업 테스트"""
+        from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+
+        admin, db = admin_user
+
+        with patch('backend.presentation.controllers.admin.get_database') as mock_get_db, \
+             patch('backend.presentation.controllers.auth.get_database') as mock_get_db_auth:
+            mock_get_db.return_value = db
+            mock_get_db_auth.return_value = db
+
+            login_response = app_client.post(
+                "/api/v1/auth/login",
+                json={"email": "admin@example.com"}
+            )
+            assert login_response.status_code == 200
+
+            csv_content = (
+                "word,reading,meaning,level\n"
+                "水,みず,물,N5\n"
+                "火,ひ,불,N5\n"
+                ",,,N5\n"
+            ).encode("utf-8")
+            response = app_client.post(
+                "/api/v1/admin/vocabulary/import-file",
+                files={"file": ("vocabulary.csv", csv_content, "text/csv")}
+            )
+            assert response.status_code == 202
+
+            job = app_client.get(f"/api/v1/admin/jobs/{response.json()['data']['id']}").json()["data"]
+            assert job["job_type"] == "vocabulary"
+            assert job["status"] == "completed"
+            assert (job["rows_processed"], job["rows_imported"], job["rows_rejected"]) == (3, 2, 1)
+            assert job["errors"][0]["row"] == 3
+            assert len(SqliteVocabularyRepository(db=db).find_all()) == 2
+
+
+    def test_import_admin_data_is_idempotent(self, app_client, temp_db, admin_user):
+        """같은 문제/단어를 다시 임포트하면 중복으로 집계되고 새 행이 생기지 않음"""
+        from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+        from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+
+        admin, db = admin_user
+
+        with patch('backend.presentation.controllers.admin.get_database') as mock_get_db, \
+             patch('backend.presentation.controllers.auth.get_database') as mock_get_db_auth:
+            mock_get_db.return_value = db
+            mock_get_db_auth.return_value = db
+
+            login_response = app_client.post(
+                "/api/v1/auth/login",
+                json={"email": "admin@example.com"}
+            )
+            assert login_response.status_code == 200
+
+            questions = {"questions": [{
+                "level": "N5",
+                "question_type": "vocabulary",
+                "question_text": "問題",
+                "choices": ["選択肢1", "選択肢2"],
+                "correct_answer": "選択肢1",
+                "explanation": "説明",
+                "difficulty": 1
+            }]}
+            vocabularies = {"vocabularies": [
+                {"word": "水", "reading": "みず", "meaning": "물", "level": "N5"}
+            ]}
+
+            first = app_client.post("/api/v1/admin/questions/import", json=questions).json()["data"]
+            second = app_client.post("/api/v1/admin/questions/import", json=questions).json()["data"]
+            assert (first["imported"], first["duplicates"]) == (1, 0)
+            assert (second["imported"], second["duplicates"]) == (0, 1)
+            assert len(SqliteQuestionRepository(db=db).find_all()) == 1
+
+            first = app_client.post("/api/v1/admin/vocabulary/import", json=vocabularies).json()["data"]
+            second = app_client.post("/api/v1/admin/vocabulary/import", json=vocabularies).json()["data"]
+            assert (first["imported"], first["duplicates"]) == (1, 0)
+            assert (second["imported"], second["duplicates"]) == (0, 1)
+            assert second["vocabularies"][0]["id"] == first["vocabularies"][0]["id"]
+            assert len(SqliteVocabularyRepository(db=db).find_all()) == 1
+
+    def test_generate_admin_questions_and_vocabulary(self, app_client, temp_db, admin_user):
+        """어드민 문제/단어 대량 생성 - 청크 저장 요약 및 건수 제한 테스트"""
+        from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+
+        admin, db = admin_user
+
+        with patch('backend.presentation.controllers.admin.get_database') as mock_get_db, \
+             patch('backend.presentation.controllers.auth.get_database') as mock_get_db_auth:
+            mock_get_db.return_value = db
+            mock_get_db_auth.return_value = db
+
+            login_response = app_client.post(
+                "/api/v1/auth/login",
+                json={"email": "admin@example.com"}
+            )
+            assert login_response.status_code == 200
+
+            response = app_client.post(
+                "/api/v1/admin/questions/generate",
+                json={"level": "N5", "question_type": "vocabulary", "count": 30}
+            )
+            assert response.status_code == 200
+            data = response.json()["data"]
+            assert data["count"] == 30
+            assert data["by_type"] == {"vocabulary": 30}
+            assert len({q["id"] for q in data["questions"]}) >= 30
+            assert len(SqliteQuestionRepository(db=db).find_all()) == 30
+
+            # 청해 문제 오디오는 응답 후 백그라운드에서 렌더링
+            with patch('backend.domain.services.audio_prerender_service.AudioPrerenderService.run') as mock_run:
+                response = app_client.post(
+                    "/api/v1/admin/questions/generate",
+                    json={"level": "N5", "question_type": "listening", "count": 3}
+                )
+            assert response.status_code == 200
+            assert all(q["audio_url"] is None for q in response.json()["data"]["questions"])
+            from backend.domain.value_objects.jlpt import JLPTLevel
+            mock_run.assert_called_once_with(JLPTLevel.N5)
+
+            response = app_client.post(
+                "/api/v1/admin/vocabulary/generate",
+                json={"level": "N5", "count": 5}
+            )
+            assert response.status_code == 200
+            assert response.json()["data"]["count"] == 5
+            response = app_client.post(
+                "/api/v1/admin/vocabulary/generate",
+                json={"level": "N5", "count": 5}
+            )
+            assert (response.json()["data"]["count"], response.json()["data"]["duplicates"]) == (0, 5)
+
+            response = app_client.post(
+                "/api/v1/admin/questions/generate",
+                json={"level": "N5", "count": 100001}
+            )
+            assert response.status_code == 422
+
+    def test_export_admin_data(self, app_client, temp_db, admin_user):
+        """어드민 데이터 내보내기 - NDJSON/CSV/gzip 스트리밍 및 잘못된 대상 테스트"""
+        import gzip
+        import json
+
+        admin, db = admin_user
+
+        with patch('backend.presentation.controllers.admin.get_database') as mock_get_db, \
+             patch('backend.presentation.controllers.auth.get_database') as mock_get_db_auth:
+            mock_get_db.return_value = db
+            mock_get_db_auth.return_value = db
+
+            login_response = app_client.post(
+                "/api/v1/auth/login",
+                json={"email": "admin@example.com"}
+            )
+            assert login_response.status_code == 200
+
+            questions = {"questions": [
+                {
+                    "level": "N5",
+                    "question_type": "vocabulary",
+                    "question_text": f"問題{i}",
+                    "choices": ["選択肢1", "選択肢2"],
+                    "correct_answer": "選択肢1",
+                    "explanation": "説明",
+                    "difficulty": 1
+                }
+                for i in range(3)
+            ]}
+            app_client.post("/api/v1/admin/questions/import", json=questions)
+
+            response = app_client.get("/api/v1/admin/export/questions")
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            assert 'filename="questions.ndjson"' in response.headers["content-disposition"]
+            lines = response.text.splitlines()
+            assert [json.loads(line)["question_text"] for line in lines] == ["問題0", "問題1", "問題2"]
+
+            response = app_client.get("/api/v1/admin/export/questions?format=csv")
+            assert response.status_code == 200
+            assert response.text.splitlines()[0].startswith("id,level,question_type")
+
+            response = app_client.get("/api/v1/admin/export/answer_details?format=csv&gzip=true")
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/gzip"
+            assert gzip.decompress(response.content).decode("utf-8").startswith("id,result_id")
+
+            assert app_client.get("/api/v1/admin/export/users").status_code == 400
+            assert app_client.get("/api/v1/admin/export/questions?format=xml").status_code == 400
+
+
 class TestAdminStatisticsAPI:
     """Admin Statistics API 엔드포인트 테스트"""
 
@@ -623,6 +944,44 @@ class TestAdminStatisticsAPI:
         saved_admin = user_repo.save(admin)
         return saved_admin, db
 
+    def test_tts_cache_stats_and_cleanup(self, app_client, temp_db, admin_user, tmp_path):
+        """어드민 TTS 캐시 - 통계 조회 및 고아 정리/LRU 제거 테스트"""
+        from backend.infrastructure.adapters.tts_cache import TTSCacheManager
+
+        admin, db = admin_user
+        cache = TTSCacheManager(db, cache_dir=tmp_path)
+        (tmp_path / "tts_orphan.mp3").write_bytes(b"x" * 10)
+        os.utime(tmp_path / "tts_orphan.mp3", (0, 0))
+        (tmp_path / "tts_cached.mp3").write_bytes(b"x" * 20)
+        cache.store("tts_cached.mp3", 20)
+        cache.hit("tts_cached.mp3")
+
+        with patch('backend.presentation.controllers.admin.get_database') as mock_get_db, \
+             patch('backend.presentation.controllers.auth.get_database') as mock_get_db_auth, \
+             patch('backend.presentation.controllers.admin.get_tts_cache_manager') as mock_get_cache:
+            mock_get_db.return_value = db
+            mock_get_db_auth.return_value = db
+            mock_get_cache.return_value = cache
+
+            login_response = app_client.post(
+                "/api/v1/auth/login",
+                json={"email": "admin@example.com"}
+            )
+            assert login_response.status_code == 200
+
+            response = app_client.get("/api/v1/admin/tts-cache")
+            assert response.status_code == 200
+            stats = response.json()["data"]
+            assert (stats["entries"], stats["total_bytes"], stats["hit_rate"]) == (1, 20, 1.0)
+
+            response = app_client.post("/api/v1/admin/tts-cache/cleanup?max_bytes=0")
+            assert response.status_code == 200
+            data = response.json()["data"]
+            assert data["sweep"]["removed_files"] == 1
+            # 방금 접근한 파일은 예산을 넘어도 제거하지 않음
+            assert data["eviction"]["evicted"] == 0
+            assert [p.name for p in tmp_path.iterdir()] == ["tts_cached.mp3"]
+
     def test_get_admin_statistics_success(self, app_client, temp_db, admin_user):
         """어드민 통계 조회 성공 테스트"""
         from backend.infrastructure.config.database import Database
@@ -740,6 +1099,49 @@ class TestAdminStatisticsAPI:
             assert "total_results" in stats["learning_data"]
             assert stats["learning_data"]["total_results"] == 2
 
+    def test_get_admin_review_forecast_success(self, app_client, temp_db, admin_user):
+        """어드민 전체 사용자 복습량 예측 조회 성공 테스트"""
+        from datetime import date
+        from backend.infrastructure.repositories.user_vocabulary_repository import SqliteUserVocabularyRepository
+        from backend.domain.entities.user_vocabulary import UserVocabulary
+        from backend.domain.services.review_forecast_service import ReviewForecastService
+
+        admin, db = admin_user
+        ReviewForecastService.invalidate()
+
+        with patch('backend.presentation.controllers.admin.get_database') as mock_get_db, \
+             patch('backend.presentation.controllers.auth.get_database') as mock_get_db_auth:
+            mock_get_db.return_value = db
+            mock_get_db_auth.return_value = db
+
+            # 두 사용자의 밀린 복습 카드 생성
+            user_vocab_repo = SqliteUserVocabularyRepository(db=db)
+            for user_id in [1, 2]:
+                user_vocab_repo.save(UserVocabulary(
+                    id=None,
+                    user_id=user_id,
+                    vocabulary_id=1,
+                    next_review_date=date(2000, 1, 1),
+                    interval_days=3
+                ))
+
+            login_response = app_client.post(
+                "/api/v1/auth/login",
+                json={"email": "admin@example.com"}
+            )
+            assert login_response.status_code == 200
+
+            try:
+                response = app_client.get("/api/v1/admin/statistics/review-forecast?days=14")
+                assert response.status_code == 200
+                forecast = response.json()["data"]
+                assert forecast["days"] == 14
+                assert forecast["total_scheduled"] == 2
+                assert forecast["forecast"][0]["scheduled"] == 2
+                assert forecast["forecast"][0]["expected"] == 2.0
+            finally:
+                ReviewForecastService.invalidate()
+
     def test_get_admin_statistics_unauthorized(self, app_client, temp_db):
         """어드민 통계 조회 - 인증되지 않은 사용자 테스트"""
         from backend.infrastructure.config.database import Database
@@ -782,3 +1184,50 @@ class TestAdminStatisticsAPI:
             response = app_client.get("/api/v1/admin/statistics")
             assert response.status_code == 403
 
+
+    def test_admin_item_statistics(self, app_client, temp_db, admin_user):
+        """어드민 문항 분석 통계 갱신 및 조회 테스트"""
+        from backend.infrastructure.repositories.answer_detail_repository import SqliteAnswerDetailRepository
+        from backend.domain.entities.answer_detail import AnswerDetail
+        from backend.domain.value_objects.jlpt import QuestionType
+
+        admin, db = admin_user
+
+        with patch('backend.presentation.controllers.admin.get_database') as mock_get_db, \
+             patch('backend.presentation.controllers.auth.get_database') as mock_get_db_auth:
+            mock_get_db.return_value = db
+            mock_get_db_auth.return_value = db
+
+            answer_repo = SqliteAnswerDetailRepository(db=db)
+            for result_id, is_correct in [(1, True), (2, False)]:
+                answer_repo.save(AnswerDetail(
+                    id=None, result_id=result_id, question_id=1,
+                    user_answer="A" if is_correct else "B", correct_answer="A", is_correct=is_correct,
+                    time_spent_seconds=20, difficulty=1, question_type=QuestionType.VOCABULARY
+                ))
+
+            login_response = app_client.post(
+                "/api/v1/auth/login",
+                json={"email": "admin@example.com"}
+            )
+            assert login_response.status_code == 200
+
+            missing = app_client.get("/api/v1/admin/questions/1/stats")
+            assert missing.status_code == 404
+
+            refresh = app_client.post("/api/v1/admin/statistics/items/refresh")
+            assert refresh.status_code == 200
+            assert refresh.json()["data"]["questions"] == 1
+
+            response = app_client.get("/api/v1/admin/statistics/items?sort=p_value")
+            assert response.status_code == 200
+            items = response.json()["data"]
+            assert [item["question_id"] for item in items] == [1]
+            assert items[0]["p_value"] == 0.5
+            assert items[0]["choice_rates"] == {"A": 0.5, "B": 0.5}
+
+            detail = app_client.get("/api/v1/admin/questions/1/stats")
+            assert detail.json()["data"]["responses"] == 2
+
+            invalid = app_client.get("/api/v1/admin/statistics/items?sort=unknown")
+            assert invalid.status_code == 400
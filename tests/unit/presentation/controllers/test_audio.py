@@ -0,0 +1,104 @@
+"""
+오디오 전달 API 테스트
+강한 ETag/304, 캐시 헤더, HTTP Range(206/416) 검증
+"""
+
+import hashlib
+import pytest
+from fastapi.testclient import TestClient
+from unittest.mock import patch
+
+
+class TestAudioDeliveryAPI:
+    """/static/audio 오디오 전달 테스트"""
+
+    TTS_NAME = "tts_" + "0123456789abcdef" * 2 + ".mp3"
+    DATA = bytes(range(256)) * 8
+
+    @pytest.fixture
+    def static_dir(self, tmp_path):
+        """TTS 파일과 업로드 파일이 있는 정적 디렉토리"""
+        (tmp_path / "audio" / "tts").mkdir(parents=True)
+        (tmp_path / "audio" / "tts" / self.TTS_NAME).write_bytes(self.DATA)
+        (tmp_path / "audio" / "question_1_100.mp3").write_bytes(b"uploaded")
+        (tmp_path / "secret.txt").write_text("secret")
+        return tmp_path
+
+    @pytest.fixture
+    def client(self, static_dir):
+        from backend.main import app
+        with patch("backend.presentation.controllers.audio.get_static_dir", return_value=static_dir):
+            yield TestClient(app)
+
+    def test_full_response_headers(self, client):
+        """콘텐츠 SHA-256 강한 ETag, 해시 파일명은 immutable 캐시, Range 지원 표시"""
+        response = client.get(f"/static/audio/tts/{self.TTS_NAME}")
+
+        assert response.status_code == 200
+        assert response.content == self.DATA
+        assert response.headers["etag"] == f'"{hashlib.sha256(self.DATA).hexdigest()}"'
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-type"] == "audio/mpeg"
+
+        uploaded = client.get("/static/audio/question_1_100.mp3")
+        assert uploaded.headers["cache-control"] == "public, no-cache"
+
+    def test_if_none_match_returns_304(self, client):
+        """ETag가 일치하면 본문 없이 304"""
+        etag = client.get(f"/static/audio/tts/{self.TTS_NAME}").headers["etag"]
+
+        response = client.get(f"/static/audio/tts/{self.TTS_NAME}", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        other = client.get(f"/static/audio/tts/{self.TTS_NAME}", headers={"If-None-Match": '"other"'})
+        assert other.status_code == 200
+
+    def test_range_requests(self, client):
+        """단일 범위/접미사 범위는 206, 파일 크기를 넘는 범위는 416"""
+        url = f"/static/audio/tts/{self.TTS_NAME}"
+
+        partial = client.get(url, headers={"Range": "bytes=100-199"})
+        assert partial.status_code == 206
+        assert partial.content == self.DATA[100:200]
+        assert partial.headers["content-range"] == f"bytes 100-199/{len(self.DATA)}"
+
+        suffix = client.get(url, headers={"Range": "bytes=-48"})
+        assert suffix.status_code == 206
+        assert suffix.content == self.DATA[-48:]
+
+        unsatisfiable = client.get(url, headers={"Range": f"bytes={len(self.DATA)}-"})
+        assert unsatisfiable.status_code == 416
+        assert unsatisfiable.headers["content-range"] == f"bytes */{len(self.DATA)}"
+
+    def test_multiple_range_request(self, client):
+        """다중 범위는 multipart/byteranges 206으로 각 부분의 Content-Range와 함께 응답"""
+        url = f"/static/audio/tts/{self.TTS_NAME}"
+
+        response = client.get(url, headers={"Range": "bytes=0-9,500-509"})
+
+        assert response.status_code == 206
+        assert response.headers["content-type"].startswith("multipart/byteranges; boundary=")
+        assert f"Content-Range: bytes 0-9/{len(self.DATA)}".encode() in response.content
+        assert f"Content-Range: bytes 500-509/{len(self.DATA)}".encode() in response.content
+        assert self.DATA[500:510] in response.content
+
+    def test_if_range_with_stale_etag_returns_full_file(self, client):
+        """If-Range의 ETag가 다르면(파일이 바뀜) 범위 대신 전체 파일"""
+        url = f"/static/audio/tts/{self.TTS_NAME}"
+        etag = client.get(url).headers["etag"]
+
+        fresh = client.get(url, headers={"Range": "bytes=0-9", "If-Range": etag})
+        stale = client.get(url, headers={"Range": "bytes=0-9", "If-Range": '"stale"'})
+
+        assert fresh.status_code == 206
+        assert stale.status_code == 200
+        assert stale.content == self.DATA
+
+    def test_missing_or_outside_files_return_404(self, client):
+        """없는 파일, 오디오 디렉토리 밖의 파일은 404"""
+        assert client.get("/static/audio/tts/tts_missing.mp3").status_code == 404
+        assert client.get("/static/audio/%2E%2E/secret.txt").status_code == 404
+        assert client.get("/static/audio/tts").status_code == 404
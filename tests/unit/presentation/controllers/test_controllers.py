@@ -1244,6 +1244,66 @@ class TestTestsController:
             assert grammar_count == 5
             assert reading_count == 5
 
+    def test_create_test_with_blueprint(self, temp_db):
+        """난이도 분포와 최대 노출률을 지정한 시험 생성 테스트"""
+        from backend.presentation.controllers.tests import router
+        from fastapi import FastAPI
+        from backend.infrastructure.config.database import Database
+        from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+        from backend.domain.entities.question import Question
+        from backend.domain.services.test_assembly_service import TestAssemblyService
+        from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+
+        app = FastAPI()
+        app.include_router(router)
+
+        client = TestClient(app)
+
+        with patch('backend.presentation.controllers.tests.get_database') as mock_get_db:
+            db = Database(db_path=temp_db)
+            mock_get_db.return_value = db
+
+            # VOCABULARY 유형 난이도 1~5 각 4개
+            question_repo = SqliteQuestionRepository(db=db)
+            for i in range(20):
+                question_repo.save(Question(
+                    id=0,
+                    level=JLPTLevel.N5,
+                    question_type=QuestionType.VOCABULARY,
+                    question_text=f"Vocab Question {i+1}",
+                    choices=["A", "B", "C", "D"],
+                    correct_answer="A",
+                    explanation=f"Explanation {i+1}",
+                    difficulty=i % 5 + 1
+                ))
+
+            TestAssemblyService.invalidate()
+            try:
+                request = {
+                    "title": "N5 난이도 배분 테스트",
+                    "level": "N5",
+                    "question_type_counts": {"vocabulary": 6},
+                    "difficulty_distribution": {"1": 0.5, "5": 0.5},
+                    "max_exposure_rate": 0.5
+                }
+                response = client.post("/", json=request)
+
+                assert response.status_code == 200
+                first = response.json()["questions"]
+                assert sorted(q["difficulty"] for q in first) == [1, 1, 1, 5, 5, 5]
+
+                # 두 번째 시험은 노출률 제한으로 첫 시험에 쓰지 않은 문제를 먼저 사용 (난이도별 4개 중 1개씩 남음)
+                response = client.post("/", json=request)
+                assert response.status_code == 200
+                second = response.json()["questions"]
+                first_ids = {q["id"] for q in first}
+                assert sorted(q["difficulty"] for q in second if q["id"] not in first_ids) == [1, 5]
+
+                request["difficulty_distribution"] = {"7": 1.0}
+                assert client.post("/", json=request).status_code == 400
+            finally:
+                TestAssemblyService.invalidate()
+
     def test_create_test_with_question_type_counts_insufficient_questions(self, temp_db):
         """유형별 문제 수 조정 시 문제 수 부족 테스트"""
         from backend.presentation.controllers.tests import router
@@ -1522,6 +1582,16 @@ class TestTestsController:
                 test.start_test()
                 saved_test = test_repo_instance.save(test)
 
+                # 이관되지 않은 예전 형식의 레벨별 점수 목록
+                from backend.domain.entities.user_performance import UserPerformance
+                from backend.infrastructure.repositories.user_performance_repository import SqliteUserPerformanceRepository
+                from datetime import date, timedelta
+                SqliteUserPerformanceRepository(db=db).save(UserPerformance(
+                    id=None, user_id=saved_user.id,
+                    analysis_period_start=date.today() - timedelta(days=30), analysis_period_end=date.today(),
+                    level_progression={"N5": [{"date": "2025-01-01", "score": 60.0}]}
+                ))
+
                 # 답안 준비
                 answers = {q.id: "A" for q in questions}
 
@@ -1577,10 +1647,123 @@ class TestTestsController:
                 # UserPerformance는 주기적으로 업데이트되므로, 최소한 하나가 존재하거나 생성되어야 함
                 # (실제 구현에서는 기간별로 생성/업데이트될 수 있음)
                 assert len(user_performances) >= 1, "At least one UserPerformance should be created or updated"
+
+                # 예전 점수 목록은 요약으로 바뀌면서 level_scores로 이관됨
+                assert user_performances[0].level_progression == {"N5": {"tests": 2, "average_score": 80.0}}
+                with db.get_connection() as conn:
+                    rows = conn.execute(
+                        "SELECT study_date, score, result_id FROM level_scores WHERE user_id = ? ORDER BY id",
+                        (saved_user.id,)
+                    ).fetchall()
+                assert [tuple(row) for row in rows] == [
+                    ("2025-01-01", 60.0, None), (date.today().isoformat(), 100.0, result_id)
+                ]
             finally:
                 # dependency override 정리
                 app.dependency_overrides.clear()
 
+    def test_adaptive_test_flow(self, temp_db):
+        """적응형 시험 시작 -> 문제 조회 -> 응답 반복 -> 완료 테스트"""
+        from backend.presentation.controllers.tests import router
+        from fastapi import FastAPI
+        from backend.infrastructure.config.database import Database
+        from backend.infrastructure.repositories.adaptive_test_repository import SqliteAdaptiveTestRepository
+        from backend.infrastructure.repositories.question_repository import SqliteQuestionRepository
+        from backend.infrastructure.repositories.user_repository import SqliteUserRepository
+        from backend.domain.entities.question import Question
+        from backend.domain.entities.user import User
+        from backend.domain.services.adaptive_test_service import AdaptiveTestService
+        from backend.domain.value_objects.jlpt import JLPTLevel, QuestionType
+        from backend.presentation.controllers.auth import get_current_user
+
+        app = FastAPI()
+        app.include_router(router)
+
+        db = Database(db_path=temp_db)
+        client = TestClient(app)
+        AdaptiveTestService.invalidate()
+
+        with patch('backend.presentation.controllers.tests.get_database') as mock_get_db:
+            mock_get_db.return_value = db
+
+            user_repo = SqliteUserRepository(db=db)
+            saved_user = user_repo.save(User(id=None, email="test@example.com", username="testuser", target_level=JLPTLevel.N5))
+            other_user = user_repo.save(User(id=None, email="other@example.com", username="other", target_level=JLPTLevel.N5))
+            current = {"user": saved_user}
+            app.dependency_overrides[get_current_user] = lambda: current["user"]
+
+            try:
+                question_repo = SqliteQuestionRepository(db=db)
+                for i in range(10):
+                    question_repo.save(Question(
+                        id=0, level=JLPTLevel.N5, question_type=QuestionType.VOCABULARY,
+                        question_text=f"Q{i+1}", choices=["A", "B"], correct_answer="A",
+                        explanation=f"E{i+1}", difficulty=i % 5 + 1
+                    ))
+
+                response = client.post("/adaptive/start", json={"level": "N5", "max_questions": 5})
+                assert response.status_code == 200
+                data = response.json()["data"]
+                session_id = data["session_id"]
+                assert data["status"] == "in_progress"
+                assert data["questions_answered"] == 0
+                assert data["question"]["level"] == "N5"
+                assert "correct_answer" not in data["question"]
+
+                response = client.get(f"/adaptive/{session_id}/next")
+                assert response.status_code == 200
+                assert response.json()["data"]["question"]["id"] == data["question"]["id"]
+
+                # 현재 문제가 아닌 문제에 응답
+                other_question_id = next(i for i in range(1, 11) if i != data["question"]["id"])
+                response = client.post(
+                    f"/adaptive/{session_id}/answer", json={"question_id": other_question_id, "answer": "A"}
+                )
+                assert response.status_code == 400
+
+                stale_session = SqliteAdaptiveTestRepository(db=db).find_by_id(session_id)
+                for _ in range(5):
+                    question_id = data["question"]["id"]
+                    response = client.post(
+                        f"/adaptive/{session_id}/answer", json={"question_id": question_id, "answer": "A"}
+                    )
+                    assert response.status_code == 200
+                    data = response.json()["data"]
+                    assert data["answered"] == {"question_id": question_id, "is_correct": True, "correct_answer": "A"}
+
+                    if stale_session is not None:
+                        # 같은 문제에 대한 동시 요청 (첫 요청이 저장되기 전에 세션을 읽은 경우)
+                        with patch(
+                            'backend.presentation.controllers.tests._find_own_adaptive_session',
+                            return_value=stale_session
+                        ):
+                            response = client.post(
+                                f"/adaptive/{session_id}/answer", json={"question_id": question_id, "answer": "A"}
+                            )
+                        assert response.status_code == 409
+                        stale_session = None
+
+                assert data["status"] == "completed"
+                assert data["questions_answered"] == data["correct_count"] == 5
+                assert data["question"] is None
+                assert data["result"]["recommended_level"] in {"N5", "N4"}
+                assert data["result"]["theta"] > 0
+
+                response = client.post(
+                    f"/adaptive/{session_id}/answer", json={"question_id": 1, "answer": "A"}
+                )
+                assert response.status_code == 400
+
+                # 다른 사용자의 세션, 없는 세션, 문제가 없는 레벨
+                current["user"] = other_user
+                assert client.get(f"/adaptive/{session_id}/next").status_code == 403
+                assert client.get("/adaptive/999/next").status_code == 404
+                assert client.post("/adaptive/start", json={"level": "N1"}).status_code == 400
+                assert client.post("/adaptive/start", json={"level": "N5", "max_questions": 2}).status_code == 422
+            finally:
+                app.dependency_overrides.clear()
+                AdaptiveTestService.invalidate()
+
 
 class TestStudyController:
     """Study (학습 모드) 컨트롤러 테스트"""
@@ -2203,16 +2386,354 @@ class TestVocabularyController:
             app.dependency_overrides[get_current_user] = get_current_user_override
 
             try:
-                response = client.post(
-                    f"/{saved_vocab.id}/study",
-                    json={
-                        "memorization_status": "memorized"
-                    }
-                )
+                with patch(
+                    'backend.domain.services.review_forecast_service.ReviewForecastService.invalidate'
+                ) as mock_invalidate:
+                    response = client.post(
+                        f"/{saved_vocab.id}/study",
+                        json={
+                            "memorization_status": "memorized"
+                        }
+                    )
 
                 assert response.status_code == 200
                 data = response.json()
                 assert data["memorization_status"] == "memorized"
+                mock_invalidate.assert_called_once_with(mock_user.id)
+            finally:
+                app.dependency_overrides.clear()
+
+
+    def test_get_review_vocabularies_success(self, temp_db, mock_user):
+        """오늘 복습할 단어 목록 조회 성공 테스트"""
+        from backend.presentation.controllers.vocabulary import router
+        from fastapi import FastAPI
+        from datetime import date, timedelta
+        from backend.infrastructure.config.database import Database
+        from backend.domain.entities.vocabulary import Vocabulary
+        from backend.domain.entities.user_vocabulary import UserVocabulary
+        from backend.domain.value_objects.jlpt import JLPTLevel
+        from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+        from backend.infrastructure.repositories.user_vocabulary_repository import SqliteUserVocabularyRepository
+        from backend.presentation.controllers.auth import get_current_user
+
+        app = FastAPI()
+        app.include_router(router)
+
+        client = TestClient(app)
+
+        with patch('backend.presentation.controllers.vocabulary.get_database') as mock_get_db:
+            db = Database(db_path=temp_db)
+            mock_get_db.return_value = db
+
+            # 테스트 데이터 생성 (복습 대상 2개, 미래 1개)
+            repo = SqliteVocabularyRepository(db=db)
+            user_vocab_repo = SqliteUserVocabularyRepository(db=db)
+            today = date.today()
+            for word, offset_days in [("水", -1), ("火", -2), ("木", 3)]:
+                saved_vocab = repo.save(Vocabulary(
+                    id=0,
+                    word=word,
+                    reading=word,
+                    meaning="의미",
+                    level=JLPTLevel.N5
+                ))
+                user_vocab_repo.save(UserVocabulary(
+                    id=None,
+                    user_id=mock_user.id,
+                    vocabulary_id=saved_vocab.id,
+                    next_review_date=today + timedelta(days=offset_days),
+                    interval_days=1,
+                    review_count=1
+                ))
+
+            def get_current_user_override():
+                return mock_user
+
+            app.dependency_overrides[get_current_user] = get_current_user_override
+
+            try:
+                response = client.get("/review")
+                assert response.status_code == 200
+                data = response.json()
+                assert [item["word"] for item in data] == ["火", "水"]
+                assert data[0]["review_count"] == 1
+
+                response = client.get("/review", params={"limit": 1, "offset": 1})
+                assert response.status_code == 200
+                assert [item["word"] for item in response.json()] == ["水"]
+            finally:
+                app.dependency_overrides.clear()
+
+    def test_review_vocabularies_batch_success(self, temp_db, mock_user):
+        """단어 일괄 복습 성공 테스트 (단건 복습과 같은 SRS 결과)"""
+        from backend.presentation.controllers.vocabulary import router
+        from fastapi import FastAPI
+        from datetime import date
+        from backend.infrastructure.config.database import Database
+        from backend.domain.entities.vocabulary import Vocabulary
+        from backend.domain.entities.user_vocabulary import UserVocabulary
+        from backend.domain.value_objects.jlpt import JLPTLevel
+        from backend.domain.services.spaced_repetition_service import SpacedRepetitionService
+        from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+        from backend.infrastructure.repositories.user_vocabulary_repository import SqliteUserVocabularyRepository
+        from backend.presentation.controllers.auth import get_current_user
+
+        app = FastAPI()
+        app.include_router(router)
+
+        client = TestClient(app)
+
+        with patch('backend.presentation.controllers.vocabulary.get_database') as mock_get_db:
+            db = Database(db_path=temp_db)
+            mock_get_db.return_value = db
+
+            repo = SqliteVocabularyRepository(db=db)
+            user_vocab_repo = SqliteUserVocabularyRepository(db=db)
+            water = repo.save(Vocabulary(id=0, word="水", reading="みず", meaning="물", level=JLPTLevel.N5))
+            fire = repo.save(Vocabulary(id=0, word="火", reading="ひ", meaning="불", level=JLPTLevel.N5))
+            user_vocab_repo.save(UserVocabulary(
+                id=None,
+                user_id=mock_user.id,
+                vocabulary_id=fire.id,
+                next_review_date=date(2025, 1, 1),
+                interval_days=4,
+                review_count=2,
+                consecutive_correct=2
+            ))
+
+            def get_current_user_override():
+                return mock_user
+
+            app.dependency_overrides[get_current_user] = get_current_user_override
+
+            try:
+                response = client.post("/review/batch", json={
+                    "reviews": [
+                        {"vocabulary_id": water.id, "difficulty": "normal", "reviewed_at": "2025-01-01T09:00:00"},
+                        {"vocabulary_id": fire.id, "difficulty": "easy", "reviewed_at": "2025-01-01T09:01:00"},
+                        {"vocabulary_id": water.id, "difficulty": "easy", "reviewed_at": "2025-01-02T09:00:00"}
+                    ]
+                })
+
+                assert response.status_code == 200
+                data = response.json()
+                assert data["reviewed"] == 3
+
+                # 같은 순서로 단건 SRS 계산을 적용한 결과와 비교
+                srs = SpacedRepetitionService()
+                expected_water = srs.initialize_review_schedule(
+                    UserVocabulary(id=None, user_id=1, vocabulary_id=water.id),
+                    today=date(2025, 1, 1)
+                )
+                srs.calculate_next_review(expected_water, "normal", today=date(2025, 1, 1))
+                srs.calculate_next_review(expected_water, "easy", today=date(2025, 1, 2))
+
+                results = {item["id"]: item for item in data["results"]}
+                assert results[water.id]["interval_days"] == expected_water.interval_days
+                assert results[water.id]["next_review_date"] == expected_water.next_review_date.isoformat()
+                assert results[water.id]["review_count"] == 2
+                assert results[fire.id]["review_count"] == 3
+                assert results[fire.id]["memorization_status"] == "memorized"
+
+                saved_water = user_vocab_repo.find_by_user_and_vocabulary(mock_user.id, water.id)
+                assert saved_water.review_count == 2
+                assert saved_water.last_review_date == date(2025, 1, 2)
+                assert len(user_vocab_repo.find_by_user_id(mock_user.id)) == 2
+            finally:
+                app.dependency_overrides.clear()
+
+    def test_review_vocabularies_batch_validation(self, temp_db, mock_user):
+        """단어 일괄 복습 입력 검증 테스트 (잘못된 난이도, 없는 단어)"""
+        from backend.presentation.controllers.vocabulary import router
+        from fastapi import FastAPI
+        from backend.infrastructure.config.database import Database
+        from backend.infrastructure.repositories.user_vocabulary_repository import SqliteUserVocabularyRepository
+        from backend.presentation.controllers.auth import get_current_user
+
+        app = FastAPI()
+        app.include_router(router)
+
+        client = TestClient(app)
+
+        with patch('backend.presentation.controllers.vocabulary.get_database') as mock_get_db:
+            db = Database(db_path=temp_db)
+            mock_get_db.return_value = db
+
+            def get_current_user_override():
+                return mock_user
+
+            app.dependency_overrides[get_current_user] = get_current_user_override
+
+            try:
+                response = client.post("/review/batch", json={
+                    "reviews": [{"vocabulary_id": 1, "difficulty": "impossible"}]
+                })
+                assert response.status_code == 400
+
+                response = client.post("/review/batch", json={
+                    "reviews": [{"vocabulary_id": 9999, "difficulty": "easy"}]
+                })
+                assert response.status_code == 404
+
+                response = client.post("/review/batch", json={"reviews": []})
+                assert response.status_code == 422
+
+                user_vocab_repo = SqliteUserVocabularyRepository(db=db)
+                assert user_vocab_repo.find_by_user_id(mock_user.id) == []
+            finally:
+                app.dependency_overrides.clear()
+
+    def test_get_review_forecast_success(self, temp_db, mock_user):
+        """복습량 예측 조회 성공 테스트"""
+        from backend.presentation.controllers.vocabulary import router
+        from fastapi import FastAPI
+        from datetime import date, timedelta
+        from backend.infrastructure.config.database import Database
+        from backend.domain.entities.vocabulary import Vocabulary
+        from backend.domain.entities.user_vocabulary import UserVocabulary
+        from backend.domain.value_objects.jlpt import JLPTLevel
+        from backend.domain.services.review_forecast_service import ReviewForecastService
+        from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+        from backend.infrastructure.repositories.user_vocabulary_repository import SqliteUserVocabularyRepository
+        from backend.presentation.controllers.auth import get_current_user
+
+        app = FastAPI()
+        app.include_router(router)
+
+        client = TestClient(app)
+        ReviewForecastService.invalidate()
+
+        with patch('backend.presentation.controllers.vocabulary.get_database') as mock_get_db:
+            db = Database(db_path=temp_db)
+            mock_get_db.return_value = db
+
+            vocab = SqliteVocabularyRepository(db=db).save(
+                Vocabulary(id=0, word="水", reading="みず", meaning="물", level=JLPTLevel.N5)
+            )
+            SqliteUserVocabularyRepository(db=db).save(UserVocabulary(
+                id=None,
+                user_id=mock_user.id,
+                vocabulary_id=vocab.id,
+                next_review_date=date.today() + timedelta(days=2),
+                interval_days=5
+            ))
+
+            def get_current_user_override():
+                return mock_user
+
+            app.dependency_overrides[get_current_user] = get_current_user_override
+
+            try:
+                response = client.get("/review/forecast", params={"days": 7})
+                assert response.status_code == 200
+                data = response.json()
+                assert data["days"] == 7
+                assert len(data["forecast"]) == 7
+                assert data["total_scheduled"] == 1
+                assert data["forecast"][2]["scheduled"] == 1
+                assert data["forecast"][2]["expected"] == 1.0
+
+                response = client.get("/review/forecast", params={"days": 0})
+                assert response.status_code == 422
+            finally:
+                app.dependency_overrides.clear()
+                ReviewForecastService.invalidate()
+
+    def test_get_review_statistics_success(self, temp_db, mock_user):
+        """복습 통계 조회 성공 테스트 (복습 제출 후 카운터 캐시 반영)"""
+        from backend.presentation.controllers.vocabulary import router
+        from fastapi import FastAPI
+        from backend.infrastructure.config.database import Database
+        from backend.domain.entities.vocabulary import Vocabulary
+        from backend.domain.value_objects.jlpt import JLPTLevel
+        from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+        from backend.presentation.controllers.auth import get_current_user
+
+        app = FastAPI()
+        app.include_router(router)
+
+        client = TestClient(app)
+
+        with patch('backend.presentation.controllers.vocabulary.get_database') as mock_get_db:
+            db = Database(db_path=temp_db)
+            mock_get_db.return_value = db
+
+            repo = SqliteVocabularyRepository(db=db)
+            water = repo.save(Vocabulary(id=0, word="水", reading="みず", meaning="물", level=JLPTLevel.N5))
+            fire = repo.save(Vocabulary(id=0, word="火", reading="ひ", meaning="불", level=JLPTLevel.N5))
+
+            def get_current_user_override():
+                return mock_user
+
+            app.dependency_overrides[get_current_user] = get_current_user_override
+
+            try:
+                response = client.get("/review/statistics")
+                assert response.status_code == 200
+                assert response.json() == {"total_due": 0, "reviewed_today": 0, "success_rate": 0.0}
+
+                client.post(f"/{water.id}/review", json={"difficulty": "easy"})
+                client.post("/review/batch", json={"reviews": [
+                    {"vocabulary_id": water.id, "difficulty": "easy"},
+                    {"vocabulary_id": fire.id, "difficulty": "hard"}
+                ]})
+
+                response = client.get("/review/statistics")
+                assert response.status_code == 200
+                data = response.json()
+                assert data["total_due"] == 0
+                assert data["reviewed_today"] == 2
+                assert data["success_rate"] == 50.0
             finally:
                 app.dependency_overrides.clear()
 
+    def test_get_vocabularies_with_status_filter_and_pagination(self, temp_db, mock_user):
+        """단어 목록 상태 필터 및 페이지네이션 테스트"""
+        from backend.presentation.controllers.vocabulary import router
+        from fastapi import FastAPI
+        from backend.infrastructure.config.database import Database
+        from backend.domain.entities.vocabulary import Vocabulary
+        from backend.domain.value_objects.jlpt import JLPTLevel, MemorizationStatus
+        from backend.infrastructure.repositories.vocabulary_repository import SqliteVocabularyRepository
+        from backend.infrastructure.repositories.user_vocabulary_repository import SqliteUserVocabularyRepository
+        from backend.presentation.controllers.auth import get_current_user
+
+        app = FastAPI()
+        app.include_router(router)
+
+        client = TestClient(app)
+
+        with patch('backend.presentation.controllers.vocabulary.get_database') as mock_get_db:
+            db = Database(db_path=temp_db)
+            mock_get_db.return_value = db
+
+            repo = SqliteVocabularyRepository(db=db)
+            saved = [
+                repo.save(Vocabulary(id=0, word=word, reading=word, meaning="의미", level=JLPTLevel.N5))
+                for word in ["水", "火", "木"]
+            ]
+            SqliteUserVocabularyRepository(db=db).upsert(
+                mock_user.id, saved[1].id, MemorizationStatus.MEMORIZED
+            )
+
+            def get_current_user_override():
+                return mock_user
+
+            app.dependency_overrides[get_current_user] = get_current_user_override
+
+            try:
+                response = client.get("/", params={"status": "memorized"})
+                assert response.status_code == 200
+                assert [(v["word"], v["memorization_status"]) for v in response.json()] == [
+                    ("火", "memorized")
+                ]
+
+                response = client.get("/", params={"limit": 2, "offset": 1})
+                assert response.status_code == 200
+                assert [v["word"] for v in response.json()] == ["火", "水"]
+
+                response = client.get("/", params={"status": "unknown"})
+                assert response.status_code == 422
+            finally:
+                app.dependency_overrides.clear()
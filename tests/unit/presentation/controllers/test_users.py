@@ -475,3 +475,141 @@ class TestUsersAPI:
             finally:
                 app.dependency_overrides.clear()
 
+
+    def test_get_streak(self, app_client, temp_db):
+        """연속 학습 일수 조회 테스트 (어제까지의 연속 기록 유지)"""
+        from datetime import date, timedelta
+        from backend.main import app
+        from backend.infrastructure.config.database import Database
+        from backend.infrastructure.repositories.user_repository import SqliteUserRepository
+        from backend.infrastructure.repositories.user_daily_rollup_repository import SqliteUserDailyRollupRepository
+        from backend.domain.entities.user import User
+        from backend.domain.value_objects.jlpt import JLPTLevel
+        from backend.presentation.controllers.auth import get_current_user
+
+        with patch('backend.presentation.controllers.users.get_database') as mock_get_db:
+            db = Database(db_path=temp_db)
+            mock_get_db.return_value = db
+
+            user_repo = SqliteUserRepository(db=db)
+            saved_user = user_repo.save(
+                User(id=None, email="test@example.com", username="testuser", target_level=JLPTLevel.N5)
+            )
+            today = date.today()
+            with db.get_connection() as conn:
+                for days_ago in (2, 1):
+                    study_date = (today - timedelta(days=days_ago)).isoformat()
+                    SqliteUserDailyRollupRepository.apply(conn, saved_user.id, study_date, {'vocabulary_reviews': 3})
+                conn.commit()
+
+            def override_get_current_user():
+                return saved_user
+            app.dependency_overrides[get_current_user] = override_get_current_user
+
+            try:
+                response = app_client.get(f"/api/v1/users/{saved_user.id}/streak")
+                assert response.status_code == 200
+                data = response.json()["data"]
+                assert data["current_streak"] == 2
+                assert data["longest_streak"] == 2
+                assert data["last_study_date"] == (today - timedelta(days=1)).isoformat()
+                assert data["studied_today"] is False
+                assert user_repo.find_by_id(saved_user.id).study_streak == 2
+
+                other = app_client.get(f"/api/v1/users/{saved_user.id + 1}/streak")
+                assert other.status_code == 403
+            finally:
+                app.dependency_overrides.clear()
+
+    def test_get_history_summary(self, app_client, temp_db):
+        """학습 이력 요약 조회 테스트 (기간 버킷 + 시간대, 잘못된 단위는 400)"""
+        from datetime import date
+        from backend.main import app
+        from backend.infrastructure.config.database import Database
+        from backend.infrastructure.repositories.user_repository import SqliteUserRepository
+        from backend.infrastructure.repositories.learning_history_repository import SqliteLearningHistoryRepository
+        from backend.domain.entities.user import User
+        from backend.domain.entities.learning_history import LearningHistory
+        from backend.domain.value_objects.jlpt import JLPTLevel
+        from backend.presentation.controllers.auth import get_current_user
+
+        with patch('backend.presentation.controllers.users.get_database') as mock_get_db:
+            db = Database(db_path=temp_db)
+            mock_get_db.return_value = db
+
+            saved_user = SqliteUserRepository(db=db).save(
+                User(id=None, email="test@example.com", username="testuser", target_level=JLPTLevel.N5)
+            )
+            SqliteLearningHistoryRepository(db=db).save(LearningHistory(
+                id=None, user_id=saved_user.id, test_id=1, result_id=1,
+                study_date=date(2025, 1, 15), study_hour=8,
+                total_questions=10, correct_count=7, time_spent_minutes=12
+            ))
+
+            def override_get_current_user():
+                return saved_user
+            app.dependency_overrides[get_current_user] = override_get_current_user
+
+            try:
+                response = app_client.get(
+                    f"/api/v1/users/{saved_user.id}/history/summary",
+                    params={"start_date": "2025-01-01", "end_date": "2025-03-31", "granularity": "month"}
+                )
+                assert response.status_code == 200
+                data = response.json()["data"]
+                assert data["granularity"] == "month"
+                assert [bucket["period_start"] for bucket in data["buckets"]] == [
+                    "2025-01-01", "2025-02-01", "2025-03-01"
+                ]
+                assert data["buckets"][0]["questions_answered"] == 10
+                assert data["hours"][8]["sessions"] == 1
+
+                invalid = app_client.get(
+                    f"/api/v1/users/{saved_user.id}/history/summary", params={"granularity": "year"}
+                )
+                assert invalid.status_code == 400
+            finally:
+                app.dependency_overrides.clear()
+
+    def test_get_level_progression(self, app_client, temp_db):
+        """레벨별 점수 추이 조회 테스트 (다른 사용자는 403, 잘못된 방식은 400)"""
+        from datetime import date
+        from backend.main import app
+        from backend.infrastructure.config.database import Database
+        from backend.infrastructure.repositories.user_repository import SqliteUserRepository
+        from backend.infrastructure.repositories.level_score_repository import SqliteLevelScoreRepository
+        from backend.domain.entities.user import User
+        from backend.domain.value_objects.jlpt import JLPTLevel
+        from backend.presentation.controllers.auth import get_current_user
+
+        with patch('backend.presentation.controllers.users.get_database') as mock_get_db:
+            db = Database(db_path=temp_db)
+            mock_get_db.return_value = db
+
+            saved_user = SqliteUserRepository(db=db).save(
+                User(id=None, email="test@example.com", username="testuser", target_level=JLPTLevel.N5)
+            )
+            SqliteLevelScoreRepository(db=db).add(saved_user.id, "N5", date(2025, 1, 15), 85.0)
+
+            def override_get_current_user():
+                return saved_user
+            app.dependency_overrides[get_current_user] = override_get_current_user
+
+            try:
+                response = app_client.get(
+                    f"/api/v1/users/{saved_user.id}/level-progression",
+                    params={"level": "N5", "start_date": "2025-01-01", "end_date": "2025-01-31"}
+                )
+                assert response.status_code == 200
+                data = response.json()["data"]
+                assert data["levels"]["N5"]["points"] == [{"date": "2025-01-15", "score": 85.0}]
+
+                forbidden = app_client.get(f"/api/v1/users/{saved_user.id + 1}/level-progression")
+                assert forbidden.status_code == 403
+
+                invalid = app_client.get(
+                    f"/api/v1/users/{saved_user.id}/level-progression", params={"method": "average"}
+                )
+                assert invalid.status_code == 400
+            finally:
+                app.dependency_overrides.clear()